@@ -28,41 +28,59 @@ def all_subclasses(cls: type):
 
 
 base_class_to_request_type_mapping = {}
+base_class_to_message_type_value_mapping = {}
 
 
 class BaseRequest(pydantic.BaseModel, abc.ABC):
     message_type: enum.Enum
 
+    @classmethod
+    def models_by_type(cls):
+        for klass in all_subclasses(cls):
+            if not (message_type := klass.model_fields.get("message_type")):
+                continue
+            if not message_type.default:
+                continue
+            yield message_type.default, klass
+
     @classmethod
     def type_to_model(cls, type_: enum.Enum) -> type["BaseRequest"]:
         mapping = base_class_to_request_type_mapping.get(cls)
         if not mapping:
-            mapping = {}
-            for klass in all_subclasses(cls):
-                if not (message_type := klass.model_fields.get("message_type")):
-                    continue
-                if not message_type.default:
-                    continue
-                mapping[message_type.default] = klass
+            mapping = dict(cls.models_by_type())
             base_class_to_request_type_mapping[cls] = mapping
 
         return mapping[type_]
 
     @classmethod
-    def parse(cls, str_: str):
+    def value_to_model(cls, value) -> type["BaseRequest"] | None:
+        """The model of a message by the raw `message_type` value in it, None if there is none"""
+        mapping = base_class_to_message_type_value_mapping.get(cls)
+        if not mapping:
+            mapping = {type_.value: klass for type_, klass in cls.models_by_type()}
+            base_class_to_message_type_value_mapping[cls] = mapping
+
+        if not isinstance(value, str):
+            return None
+        return mapping.get(value)
+
+    @classmethod
+    def parse(cls, str_: str | bytes):
         try:
             json_ = json.loads(str_)
         except json.JSONDecodeError as exc:
             raise ValidationError.from_json_decode_error(exc)
 
-        try:
-            base_model_object = cls.model_validate(json_)
-        except pydantic.ValidationError as exc:
-            raise ValidationError.from_pydantic_validation_error(exc)
-
-        target_model = cls.type_to_model(base_model_object.message_type)
+        # the message type picks the model up front, so that the message is only validated once
+        target_model = (
+            cls.value_to_model(json_.get("message_type")) if isinstance(json_, dict) else None
+        )
 
         try:
+            if target_model is None:
+                # not a message of this protocol, let the base class tell what's wrong with it
+                base_model_object = cls.model_validate(json_)
+                target_model = cls.type_to_model(base_model_object.message_type)
             return target_model.model_validate(json_)
         except pydantic.ValidationError as exc:
             raise ValidationError.from_pydantic_validation_error(exc)
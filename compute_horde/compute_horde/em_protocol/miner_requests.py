@@ -6,6 +6,7 @@ from pydantic import model_validator
 from ..base.output_upload import OutputUpload, OutputUploadType  # noqa
 from ..base.volume import Volume, VolumeType
 from ..base_requests import BaseRequest, JobMixin
+from ..tracing import TraceContext
 
 
 class RequestType(enum.Enum):
@@ -23,6 +24,7 @@ class V0InitialJobRequest(BaseMinerRequest, JobMixin):
     base_docker_image_name: str | None = None
     timeout_seconds: int | None = None
     volume_type: VolumeType | None = None
+    trace_context: TraceContext | None = None
 
 
 class V0JobRequest(BaseMinerRequest, JobMixin):
@@ -33,6 +35,7 @@ class V0JobRequest(BaseMinerRequest, JobMixin):
     docker_run_cmd: list[str]
     volume: Volume | None = None
     output_upload: OutputUpload | None = None
+    trace_context: TraceContext | None = None
 
     @model_validator(mode="after")
     def validate_at_least_docker_image_or_raw_script(self) -> Self:
@@ -54,6 +54,10 @@ class AbstractMinerClient(metaclass=abc.ABCMeta):
         await self.close()
 
     async def close(self):
+        await self.cancel_tasks()
+        await self.transport.stop()
+
+    async def cancel_tasks(self):
         for deferred_send_task in self.deferred_send_tasks:
             if not deferred_send_task.done():
                 deferred_send_task.cancel()
@@ -73,8 +77,6 @@ class AbstractMinerClient(metaclass=abc.ABCMeta):
             except Exception as ex:
                 logger.debug("Exception raised on task cancel: %r", ex)
 
-        await self.transport.stop()
-
     async def send_model(
         self, model: BaseRequest, error_event_callback: ErrorCallback | None = None
     ) -> None:
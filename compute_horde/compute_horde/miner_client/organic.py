@@ -19,6 +19,7 @@ from compute_horde.miner_client.base import (
     ErrorCallback,
     UnsupportedMessageReceived,
 )
+from compute_horde.miner_client.pool import MinerConnectionPool, PooledMinerConnection
 from compute_horde.mv_protocol import miner_requests, validator_requests
 from compute_horde.mv_protocol.miner_requests import (
     BaseMinerRequest,
@@ -42,6 +43,7 @@ from compute_horde.mv_protocol.validator_requests import (
     V0JobRequest,
     V0JobStartedReceiptRequest,
 )
+from compute_horde.tracing import Span, tracer
 from compute_horde.transport import AbstractTransport, TransportConnectionError, WSTransport
 from compute_horde.utils import MachineSpecs, Timer
 
@@ -68,6 +70,9 @@ class OrganicMinerClient(AbstractMinerClient):
 
     Note that the waiting on the response futures should properly be handled with timeouts
     (with ``asyncio.timeout()``, ``asyncio.wait_for()`` etc.).
+
+    With ``connection_pool`` given, the client doesn't open a connection of its own, but runs
+    the job on the pooled connection to the miner, which is left open for the next jobs.
     """
 
     def __init__(
@@ -78,8 +83,16 @@ class OrganicMinerClient(AbstractMinerClient):
         job_uuid: str,
         my_keypair: bittensor.Keypair,
         transport: AbstractTransport | None = None,
+        connection_pool: MinerConnectionPool | None = None,
     ) -> None:
         self.job_uuid = job_uuid
+        self.connection_pool = connection_pool
+        self.connection: PooledMinerConnection | None = None
+        # time.monotonic() of the stages of the job, for tracing
+        self.connect_started_at: float | None = None
+        self.auth_sent_at: float | None = None
+        self.manifest_received_at: float | None = None
+        self.job_accepted_at: float | None = None
 
         self.miner_hotkey = miner_hotkey
         self.miner_address = miner_address
@@ -135,9 +148,44 @@ class OrganicMinerClient(AbstractMinerClient):
     async def notify_send_failure(self, msg: str) -> None:
         """This method is called when sending messages to miner fails"""
 
+    async def notify_job_accepted(self, time_to_accept: float) -> None:
+        """
+        This method is called when miner accepts the job, `time_to_accept` seconds after the client
+        started connecting
+        """
+
+    @property
+    def reused_connection(self) -> bool:
+        """Whether the job runs on a pooled connection opened before for another job"""
+        return (
+            self.connection is not None
+            and self.connection.connected_at is not None
+            and self.connect_started_at is not None
+            and self.connection.connected_at < self.connect_started_at
+        )
+
+    def record_preparation_spans(
+        self, parent: Span, initial_request_sent_at: float, initial_response_received_at: float
+    ) -> None:
+        """
+        Report the stages from connecting to the miner until it responded to the initial job
+        request, timed by the client while receiving the messages
+        """
+        if self.auth_sent_at is not None and self.manifest_received_at is not None:
+            tracer.record_span(
+                "organic_job.auth", self.auth_sent_at, self.manifest_received_at, parent
+            )
+        accepted_at = self.job_accepted_at or initial_response_received_at
+        tracer.record_span("organic_job.accept", initial_request_sent_at, accepted_at, parent)
+        if self.job_accepted_at is not None:
+            tracer.record_span(
+                "organic_job.spin_up", self.job_accepted_at, initial_response_received_at, parent
+            )
+
     async def handle_manifest_request(self, msg: V0ExecutorManifestRequest) -> None:
         try:
             self.miner_manifest.set_result(msg.manifest)
+            self.manifest_received_at = time.monotonic()
         except asyncio.InvalidStateError:
             logger.warning(f"Received manifest from {msg} but future was already set")
 
@@ -167,6 +215,9 @@ class OrganicMinerClient(AbstractMinerClient):
 
         if isinstance(msg, V0AcceptJobRequest):
             logger.info(f"Miner {self.miner_name} accepted job")
+            if self.job_accepted_at is None and self.connect_started_at is not None:
+                self.job_accepted_at = time.monotonic()
+                await self.notify_job_accepted(self.job_accepted_at - self.connect_started_at)
         elif isinstance(
             msg, V0DeclineJobRequest | V0ExecutorFailedRequest | V0ExecutorReadyRequest
         ):
@@ -281,8 +332,25 @@ class OrganicMinerClient(AbstractMinerClient):
         await super().send_model(model, error_event_callback)
 
     async def connect(self) -> None:
-        await super().connect()
-        await self.transport.send(self.generate_authentication_message().model_dump_json())
+        self.connect_started_at = time.monotonic()
+        if self.connection_pool is None:
+            await super().connect()
+            await self.transport.send(self.generate_authentication_message().model_dump_json())
+            self.auth_sent_at = time.monotonic()
+            return
+
+        self.connection = await self.connection_pool.acquire(self)
+        self.transport = self.connection.transport
+        if not self.reused_connection:
+            self.auth_sent_at = self.connection.auth_sent_at
+
+    async def close(self) -> None:
+        if self.connection is None:
+            await super().close()
+            return
+
+        await self.cancel_tasks()
+        self.connection.unregister(self)
 
 
 class FailureReason(enum.Enum):
@@ -341,14 +409,26 @@ async def run_organic_job(
     """
     assert client.job_uuid == job_details.job_uuid
 
+    with tracer.span("organic_job", job_uuid=job_details.job_uuid) as job_span:
+        return await _run_organic_job(client, job_details, wait_timeout, job_span)
+
+
+async def _run_organic_job(
+    client: OrganicMinerClient,
+    job_details: OrganicJobDetails,
+    wait_timeout: int,
+    job_span: Span,
+):
     async with contextlib.AsyncExitStack() as exit_stack:
         try:
-            await exit_stack.enter_async_context(client)
+            with tracer.span("organic_job.connect", job_span):
+                await exit_stack.enter_async_context(client)
         except TransportConnectionError as exc:
             raise OrganicJobError(FailureReason.MINER_CONNECTION_FAILED) from exc
 
         job_timer = Timer(timeout=job_details.total_job_timeout)
 
+        initial_request_sent_at = time.monotonic()
         await client.send_model(
             V0InitialJobRequest(
                 job_uuid=job_details.job_uuid,
@@ -356,6 +436,7 @@ async def run_organic_job(
                 base_docker_image_name=job_details.docker_image,
                 timeout_seconds=job_details.total_job_timeout,
                 volume_type=job_details.volume.volume_type if job_details.volume else None,
+                trace_context=job_span.context,
             ),
         )
 
@@ -366,6 +447,7 @@ async def run_organic_job(
             )
         except TimeoutError as exc:
             raise OrganicJobError(FailureReason.INITIAL_RESPONSE_TIMED_OUT) from exc
+        client.record_preparation_spans(job_span, initial_request_sent_at, time.monotonic())
 
         if isinstance(initial_response, V0DeclineJobRequest):
             raise OrganicJobError(FailureReason.JOB_DECLINED, initial_response)
@@ -378,34 +460,37 @@ async def run_organic_job(
             max_timeout=int(job_timer.time_left()),
         )
 
-        await client.send_model(
-            V0JobRequest(
-                job_uuid=job_details.job_uuid,
-                executor_class=job_details.executor_class,
-                docker_image_name=job_details.docker_image,
-                raw_script=job_details.raw_script,
-                docker_run_options_preset=job_details.docker_run_options_preset,
-                docker_run_cmd=job_details.docker_run_cmd,
-                volume=job_details.volume,
-                output_upload=job_details.output,
+        with tracer.span("organic_job.run", job_span):
+            await client.send_model(
+                V0JobRequest(
+                    job_uuid=job_details.job_uuid,
+                    executor_class=job_details.executor_class,
+                    docker_image_name=job_details.docker_image,
+                    raw_script=job_details.raw_script,
+                    docker_run_options_preset=job_details.docker_run_options_preset,
+                    docker_run_cmd=job_details.docker_run_cmd,
+                    volume=job_details.volume,
+                    output_upload=job_details.output,
+                    trace_context=job_span.context,
+                )
             )
-        )
 
-        try:
-            final_response = await asyncio.wait_for(
-                client.miner_finished_or_failed_future,
-                timeout=job_timer.time_left(),
-            )
-        except TimeoutError as exc:
-            raise OrganicJobError(FailureReason.FINAL_RESPONSE_TIMED_OUT) from exc
+            try:
+                final_response = await asyncio.wait_for(
+                    client.miner_finished_or_failed_future,
+                    timeout=job_timer.time_left(),
+                )
+            except TimeoutError as exc:
+                raise OrganicJobError(FailureReason.FINAL_RESPONSE_TIMED_OUT) from exc
 
         if isinstance(final_response, V0JobFailedRequest):
             raise OrganicJobError(FailureReason.JOB_FAILED, final_response)
 
-        await client.send_job_finished_receipt_message(
-            started_timestamp=job_timer.start_time.timestamp(),
-            time_took_seconds=job_timer.passed_time(),
-            score=0,  # no score for organic jobs (at least right now)
-        )
+        with tracer.span("organic_job.result_delivery", job_span):
+            await client.send_job_finished_receipt_message(
+                started_timestamp=job_timer.start_time.timestamp(),
+                time_took_seconds=job_timer.passed_time(),
+                score=0,  # no score for organic jobs (at least right now)
+            )
 
         return final_response.docker_process_stdout, final_response.docker_process_stderr
@@ -0,0 +1,211 @@
+import asyncio
+import collections
+import logging
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import bittensor
+
+from compute_horde.base_requests import BaseRequest
+from compute_horde.miner_client.base import AbstractMinerClient
+from compute_horde.mv_protocol import miner_requests, validator_requests
+from compute_horde.mv_protocol.miner_requests import BaseMinerRequest, V0ExecutorManifestRequest
+from compute_horde.mv_protocol.validator_requests import (
+    AuthenticationPayload,
+    V0AuthenticateRequest,
+)
+from compute_horde.transport import AbstractTransport, WSTransport
+
+if TYPE_CHECKING:
+    from compute_horde.miner_client.organic import OrganicMinerClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = 300
+EVICTION_PERIOD = 10
+
+ConnectionKey = tuple[str, str, int]
+
+
+class ReauthenticatingWSTransport(WSTransport):
+    """
+    WebSocket transport repeating the authentication after reconnecting,
+    as the miner forgets it along with the previous connection.
+    """
+
+    def __init__(self, name: str, url: str, auth_message: Callable[[], BaseRequest], **kwargs):
+        super().__init__(name, url, **kwargs)
+        self.auth_message = auth_message
+
+    async def connect(self):
+        previous_ws = self._ws
+        await super().connect()
+        if previous_ws is not None and self._ws is not previous_ws:
+            await self._ws.send(self.auth_message().model_dump_json())
+
+
+class PooledMinerConnection(AbstractMinerClient):
+    """
+    An authenticated connection to a miner shared by the organic jobs run on it at the same time.
+    Messages about a job are routed to its client by `job_uuid`, the others go to all of them.
+    """
+
+    def __init__(
+        self,
+        miner_hotkey: str,
+        miner_address: str,
+        miner_port: int,
+        my_keypair: bittensor.Keypair,
+        transport: AbstractTransport | None = None,
+    ) -> None:
+        self.miner_hotkey = miner_hotkey
+        self.miner_address = miner_address
+        self.miner_port = miner_port
+        self.my_keypair = my_keypair
+
+        self.jobs: dict[str, OrganicMinerClient] = {}
+        self.manifest: dict | None = None
+        self.manifest_received_at: float | None = None
+        self.connected_at: float | None = None
+        self.auth_sent_at: float | None = None
+        self.idle_since: float = time.monotonic()
+
+        name = f"{miner_hotkey}({miner_address}:{miner_port})"
+        transport = transport or ReauthenticatingWSTransport(
+            name, self.miner_url(), self.generate_authentication_message
+        )
+        super().__init__(name, transport)
+
+    def miner_url(self) -> str:
+        return (
+            f"ws://{self.miner_address}:{self.miner_port}"
+            f"/v0.1/validator_interface/{self.my_keypair.ss58_address}"
+        )
+
+    def accepted_request_type(self) -> type[BaseRequest]:
+        return BaseMinerRequest
+
+    def incoming_generic_error_class(self) -> type[BaseRequest]:
+        return miner_requests.GenericError
+
+    def outgoing_generic_error_class(self) -> type[BaseRequest]:
+        return validator_requests.GenericError
+
+    @property
+    def is_alive(self) -> bool:
+        return self.read_messages_task is not None and not self.read_messages_task.done()
+
+    def generate_authentication_message(self) -> V0AuthenticateRequest:
+        payload = AuthenticationPayload(
+            validator_hotkey=self.my_keypair.ss58_address,
+            miner_hotkey=self.miner_hotkey,
+            timestamp=int(time.time()),
+        )
+        return V0AuthenticateRequest(
+            payload=payload, signature=f"0x{self.my_keypair.sign(payload.blob_for_signing()).hex()}"
+        )
+
+    async def connect(self) -> None:
+        await super().connect()
+        self.connected_at = time.monotonic()
+        await self.transport.send(self.generate_authentication_message().model_dump_json())
+        self.auth_sent_at = time.monotonic()
+
+    def register(self, client: "OrganicMinerClient") -> None:
+        if client.job_uuid in self.jobs:
+            logger.warning(f"Job {client.job_uuid} is already run on {self.miner_name}, replacing")
+        self.jobs[client.job_uuid] = client
+        if self.manifest is not None and not client.miner_manifest.done():
+            # sent by the miner only once, right after authentication
+            client.miner_manifest.set_result(self.manifest)
+            client.manifest_received_at = self.manifest_received_at
+
+    def unregister(self, client: "OrganicMinerClient") -> None:
+        if self.jobs.get(client.job_uuid) is client:
+            del self.jobs[client.job_uuid]
+        if not self.jobs:
+            self.idle_since = time.monotonic()
+
+    async def handle_message(self, msg: BaseRequest) -> None:
+        if isinstance(msg, V0ExecutorManifestRequest):
+            self.manifest = msg.manifest
+            self.manifest_received_at = time.monotonic()
+
+        job_uuid = getattr(msg, "job_uuid", None)
+        if job_uuid is None:
+            for client in list(self.jobs.values()):
+                await client.handle_message(msg)
+            return
+
+        client = self.jobs.get(str(job_uuid))
+        if client is None:
+            logger.info(f"Received msg from {self.miner_name} for a job not run here: {msg}")
+            return
+        await client.handle_message(msg)
+
+
+class MinerConnectionPool:
+    """
+    Authenticated connections to miners kept open between organic jobs, so that a job doesn't pay
+    for connecting and authenticating when the miner was used recently.
+    A connection unused for `idle_timeout` seconds is closed by `evict_idle()`.
+    """
+
+    def __init__(self, my_keypair: bittensor.Keypair, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.my_keypair = my_keypair
+        self.idle_timeout = idle_timeout
+        self.connections: dict[ConnectionKey, PooledMinerConnection] = {}
+        self._locks: collections.defaultdict[ConnectionKey, asyncio.Lock] = collections.defaultdict(
+            asyncio.Lock
+        )
+
+    def create_connection(
+        self, miner_hotkey: str, miner_address: str, miner_port: int
+    ) -> PooledMinerConnection:
+        return PooledMinerConnection(miner_hotkey, miner_address, miner_port, self.my_keypair)
+
+    async def acquire(self, client: "OrganicMinerClient") -> PooledMinerConnection:
+        """
+        Register the client on a connection to its miner, connecting if there's none alive.
+        The client unregisters itself when closed.
+        Raises TransportConnectionError if connecting fails.
+        """
+        key = (client.miner_hotkey, client.miner_address, client.miner_port)
+        async with self._locks[key]:
+            connection = self.connections.get(key)
+            if connection is None or not connection.is_alive:
+                if connection is not None:
+                    del self.connections[key]
+                    await connection.close()
+                connection = self.create_connection(*key)
+                await connection.connect()
+                self.connections[key] = connection
+            connection.register(client)
+        return connection
+
+    async def evict_idle(self) -> None:
+        threshold = time.monotonic() - self.idle_timeout
+        for key, connection in list(self.connections.items()):
+            if connection.jobs or (connection.is_alive and connection.idle_since > threshold):
+                continue
+            async with self._locks[key]:
+                if self.connections.get(key) is not connection or connection.jobs:
+                    continue
+                del self.connections[key]
+            logger.debug(f"Closing idle connection to {connection.miner_name}")
+            await connection.close()
+
+    async def run_evictions(self, period: float = EVICTION_PERIOD) -> None:
+        while True:
+            await asyncio.sleep(period)
+            try:
+                await self.evict_idle()
+            except Exception:
+                logger.error("Error occurred while closing idle miner connections", exc_info=True)
+
+    async def close(self) -> None:
+        connections = list(self.connections.values())
+        self.connections.clear()
+        for connection in connections:
+            await connection.close()
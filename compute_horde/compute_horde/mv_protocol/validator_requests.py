@@ -11,6 +11,7 @@ from ..base.output_upload import OutputUpload  # noqa
 from ..base.volume import Volume, VolumeType
 from ..base_requests import BaseRequest, JobMixin
 from ..executor_class import ExecutorClass
+from ..tracing import TraceContext
 from ..utils import MachineSpecs, _json_dumps_default
 
 SAFE_DOMAIN_REGEX = re.compile(r".*")
@@ -55,6 +56,7 @@ class V0InitialJobRequest(BaseValidatorRequest, JobMixin):
     base_docker_image_name: str | None = None
     timeout_seconds: int | None = None
     volume_type: VolumeType | None = None
+    trace_context: TraceContext | None = None
 
 
 class V0JobRequest(BaseValidatorRequest, JobMixin):
@@ -66,6 +68,7 @@ class V0JobRequest(BaseValidatorRequest, JobMixin):
     docker_run_cmd: list[str]
     volume: Volume | None = None
     output_upload: OutputUpload | None = None
+    trace_context: TraceContext | None = None
 
     @model_validator(mode="after")
     def validate_at_least_docker_image_or_raw_script(self) -> Self:
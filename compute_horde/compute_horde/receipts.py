@@ -6,13 +6,15 @@ import io
 import logging
 import shutil
 import tempfile
+from collections.abc import Container, Mapping
+from concurrent.futures import Executor
 
-import bittensor
 import pydantic
 import requests
 
 from .executor_class import ExecutorClass
 from .mv_protocol.validator_requests import JobFinishedReceiptPayload, JobStartedReceiptPayload
+from .signatures import SignedData, signature_verifier
 
 logger = logging.getLogger(__name__)
 
@@ -28,24 +30,133 @@ class Receipt(pydantic.BaseModel):
     miner_signature: str
 
     def verify_miner_signature(self):
-        miner_keypair = bittensor.Keypair(ss58_address=self.payload.miner_hotkey)
-        return miner_keypair.verify(self.payload.blob_for_signing(), self.miner_signature)
+        return signature_verifier.verify(
+            self.payload.miner_hotkey, self.payload.blob_for_signing(), self.miner_signature
+        )
 
     def verify_validator_signature(self):
-        validator_keypair = bittensor.Keypair(ss58_address=self.payload.validator_hotkey)
-        return validator_keypair.verify(self.payload.blob_for_signing(), self.validator_signature)
+        return signature_verifier.verify(
+            self.payload.validator_hotkey, self.payload.blob_for_signing(), self.validator_signature
+        )
 
 
 class ReceiptFetchError(Exception):
     pass
 
 
-def get_miner_receipts(hotkey: str, ip: str, port: int) -> list[Receipt]:
-    """Get receipts from a given miner"""
+def _raw_receipt_time(raw_receipt: dict[str, str]) -> datetime.datetime:
+    match ReceiptType(raw_receipt["type"]):
+        case ReceiptType.JobStartedReceipt:
+            return datetime.datetime.fromisoformat(raw_receipt["time_accepted"])
+        case ReceiptType.JobFinishedReceipt:
+            return datetime.datetime.fromisoformat(raw_receipt["time_started"])
+
+
+def _parse_receipt(raw_receipt: dict[str, str]) -> Receipt:
+    receipt_type = ReceiptType(raw_receipt["type"])
+    match receipt_type:
+        case ReceiptType.JobStartedReceipt:
+            payload = JobStartedReceiptPayload(
+                job_uuid=raw_receipt["job_uuid"],
+                miner_hotkey=raw_receipt["miner_hotkey"],
+                validator_hotkey=raw_receipt["validator_hotkey"],
+                executor_class=ExecutorClass(raw_receipt["executor_class"]),
+                time_accepted=datetime.datetime.fromisoformat(raw_receipt["time_accepted"]),
+                max_timeout=int(raw_receipt["max_timeout"]),
+            )
+
+        case ReceiptType.JobFinishedReceipt:
+            payload = JobFinishedReceiptPayload(
+                job_uuid=raw_receipt["job_uuid"],
+                miner_hotkey=raw_receipt["miner_hotkey"],
+                validator_hotkey=raw_receipt["validator_hotkey"],
+                time_started=datetime.datetime.fromisoformat(raw_receipt["time_started"]),
+                time_took_us=int(raw_receipt["time_took_us"]),
+                score_str=raw_receipt["score_str"],
+            )
+
+    return Receipt(
+        payload=payload,
+        validator_signature=raw_receipt["validator_signature"],
+        miner_signature=raw_receipt["miner_signature"],
+    )
+
+
+def parse_receipt_row(
+    hotkey: str,
+    raw_receipt: dict[str, str],
+    cutoffs: dict[ReceiptType, datetime.datetime] | None = None,
+    known_job_uuids: Mapping[ReceiptType, Container[str]] | None = None,
+) -> Receipt | None:
+    """
+    Parse a row of the receipts CSV of the miner `hotkey`, without verifying the signatures.
+    Returns None for an invalid receipt, and, before any parsing, for a receipt of a job in
+    `known_job_uuids` or not newer than the cutoff of its type.
+    """
+    try:
+        receipt_type = ReceiptType(raw_receipt["type"])
+        if known_job_uuids and raw_receipt["job_uuid"] in known_job_uuids.get(receipt_type, ()):
+            return None
+        cutoff = cutoffs.get(receipt_type) if cutoffs else None
+        if cutoff is not None and _raw_receipt_time(raw_receipt) <= cutoff:
+            return None
+        receipt = _parse_receipt(raw_receipt)
+    except (KeyError, ValueError, TypeError, pydantic.ValidationError):
+        logger.warning(f"Miner sent invalid receipt {raw_receipt=}")
+        return None
+
+    if receipt.payload.miner_hotkey != hotkey:
+        logger.warning(f"Miner sent receipt of a different miner {receipt=}")
+        return None
+
+    return receipt
+
+
+def verify_receipts(receipts: list[Receipt], executor: Executor | None = None) -> list[Receipt]:
+    """
+    The receipts with valid miner and validator signatures, verified in a single batch, which is
+    spread over `executor` if given.
+    """
+    signed_data: list[SignedData] = []
+    for receipt in receipts:
+        blob = receipt.payload.blob_for_signing()
+        signed_data.append((receipt.payload.miner_hotkey, blob, receipt.miner_signature))
+        signed_data.append((receipt.payload.validator_hotkey, blob, receipt.validator_signature))
+    results = signature_verifier.verify_many(signed_data, executor=executor)
+
+    valid_receipts = []
+    for receipt, valid_miner_signature, valid_validator_signature in zip(
+        receipts, results[::2], results[1::2]
+    ):
+        if not valid_miner_signature:
+            logger.warning(f"Invalid miner signature of receipt {receipt=}")
+        elif not valid_validator_signature:
+            logger.warning(f"Invalid validator signature of receipt {receipt=}")
+        else:
+            valid_receipts.append(receipt)
+    return valid_receipts
+
+
+def receipts_url(ip: str, port: int, filename: str = "receipts.csv") -> str:
+    return f"http://{ip}:{port}/receipts/{filename}"
+
+
+def segments_since(index: dict, since: datetime.datetime) -> list[str]:
+    """
+    Paths of the segments listed in the receipts `index` of a miner (relative to the receipts
+    url) which were created after `since`
+    """
+    return [
+        f"segments/{segment['name']}"
+        for segment in index["segments"]
+        if datetime.datetime.fromisoformat(segment["created_at"]) > since
+    ]
+
+
+def _read_receipts_csv(hotkey: str, url: str) -> list[Receipt]:
     with contextlib.ExitStack() as exit_stack:
         try:
-            receipts_url = f"http://{ip}:{port}/receipts/receipts.csv"
-            response = exit_stack.enter_context(requests.get(receipts_url, stream=True, timeout=5))
+            response = exit_stack.enter_context(requests.get(url, stream=True, timeout=5))
             response.raise_for_status()
         except requests.RequestException as e:
             raise ReceiptFetchError("failed to get receipts from miner") from e
@@ -58,55 +169,31 @@ def get_miner_receipts(hotkey: str, ip: str, port: int) -> list[Receipt]:
         wrapper = io.TextIOWrapper(temp_file)
         csv_reader = csv.DictReader(wrapper)
         for raw_receipt in csv_reader:
-            try:
-                receipt_type = ReceiptType(raw_receipt["type"])
-                match receipt_type:
-                    case ReceiptType.JobStartedReceipt:
-                        payload = JobStartedReceiptPayload(
-                            job_uuid=raw_receipt["job_uuid"],
-                            miner_hotkey=raw_receipt["miner_hotkey"],
-                            validator_hotkey=raw_receipt["validator_hotkey"],
-                            executor_class=ExecutorClass(raw_receipt["executor_class"]),
-                            time_accepted=datetime.datetime.fromisoformat(
-                                raw_receipt["time_accepted"]
-                            ),
-                            max_timeout=int(raw_receipt["max_timeout"]),
-                        )
-
-                    case ReceiptType.JobFinishedReceipt:
-                        payload = JobFinishedReceiptPayload(
-                            job_uuid=raw_receipt["job_uuid"],
-                            miner_hotkey=raw_receipt["miner_hotkey"],
-                            validator_hotkey=raw_receipt["validator_hotkey"],
-                            time_started=datetime.datetime.fromisoformat(
-                                raw_receipt["time_started"]
-                            ),
-                            time_took_us=int(raw_receipt["time_took_us"]),
-                            score_str=raw_receipt["score_str"],
-                        )
-
-                receipt = Receipt(
-                    payload=payload,
-                    validator_signature=raw_receipt["validator_signature"],
-                    miner_signature=raw_receipt["miner_signature"],
-                )
-
-            except (KeyError, ValueError, pydantic.ValidationError):
-                logger.warning(f"Miner sent invalid receipt {raw_receipt=}")
-                continue
-
-            if receipt.payload.miner_hotkey != hotkey:
-                logger.warning(f"Miner sent receipt of a different miner {receipt=}")
-                continue
-
-            if not receipt.verify_miner_signature():
-                logger.warning(f"Invalid miner signature of receipt {receipt=}")
-                continue
-
-            if not receipt.verify_validator_signature():
-                logger.warning(f"Invalid validator signature of receipt {receipt=}")
-                continue
-
-            receipts.append(receipt)
-
+            receipt = parse_receipt_row(hotkey, raw_receipt)
+            if receipt is not None:
+                receipts.append(receipt)
         return receipts
+
+
+def get_miner_receipts(
+    hotkey: str, ip: str, port: int, since: datetime.datetime | None = None
+) -> list[Receipt]:
+    """
+    Get receipts from a given miner. With `since`, only the segments of receipts the miner
+    stored after it are downloaded, if the miner serves a receipts index.
+    """
+    filenames = ["receipts.csv"]
+    if since is not None:
+        try:
+            response = requests.get(receipts_url(ip, port, "index.json"), timeout=5)
+            response.raise_for_status()
+            filenames = segments_since(response.json(), since)
+        except requests.RequestException:
+            logger.debug(f"Miner does not serve a receipts index {hotkey=}")
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Miner sent invalid receipts index {hotkey=}")
+
+    receipts = []
+    for filename in filenames:
+        receipts += _read_receipts_csv(hotkey, receipts_url(ip, port, filename))
+    return verify_receipts(receipts)
@@ -0,0 +1,93 @@
+import functools
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import Executor
+
+import bittensor
+
+# (ss58 address of the signer, signed data, signature)
+SignedData = tuple[str, str | bytes, str | bytes]
+
+KEYPAIR_CACHE_SIZE = 4096
+SEEN_CACHE_SIZE = 100_000
+CHUNK_SIZE = 256
+
+
+@functools.lru_cache(maxsize=KEYPAIR_CACHE_SIZE)
+def get_keypair(ss58_address: str) -> bittensor.Keypair:
+    """Public keypair of the address, which is decoded only once"""
+    return bittensor.Keypair(ss58_address=ss58_address)
+
+
+def verify_signature(ss58_address: str, data: str | bytes, signature: str | bytes) -> bool:
+    """Whether `signature` of `data` is valid, False also for a malformed address or signature"""
+    try:
+        return get_keypair(ss58_address).verify(data, signature)
+    except (ValueError, TypeError):
+        return False
+
+
+def _verify_chunk(items: list[SignedData]) -> list[bool]:
+    return [verify_signature(*item) for item in items]
+
+
+class SignatureVerifier:
+    """
+    Verifies sr25519 signatures, remembering the last `seen_cache_size` valid ones - a signature
+    seen before isn't verified again for the same data and signer.
+    Batches can be spread over an executor, like a process pool.
+    """
+
+    def __init__(self, seen_cache_size: int = SEEN_CACHE_SIZE):
+        self.seen_cache_size = seen_cache_size
+        self._seen: OrderedDict[bytes, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _seen_key(item: SignedData) -> bytes:
+        return hashlib.blake2b(repr(item).encode(), digest_size=16).digest()
+
+    def verify(self, ss58_address: str, data: str | bytes, signature: str | bytes) -> bool:
+        return self.verify_many([(ss58_address, data, signature)])[0]
+
+    def verify_many(
+        self,
+        items: Sequence[SignedData],
+        executor: Executor | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> list[bool]:
+        """
+        Whether each of the signatures is valid. The ones not seen before are verified in chunks
+        of `chunk_size` on `executor`, if there's more than one chunk of them.
+        """
+        keys = [self._seen_key(item) for item in items]
+        with self._lock:
+            results = [key in self._seen for key in keys]
+            for key, seen in zip(keys, results):
+                if seen:
+                    self._seen.move_to_end(key)
+
+        pending = [i for i, seen in enumerate(results) if not seen]
+        if executor is None or len(pending) <= chunk_size:
+            verified = _verify_chunk([items[i] for i in pending])
+        else:
+            chunks = [
+                [items[i] for i in pending[start : start + chunk_size]]
+                for start in range(0, len(pending), chunk_size)
+            ]
+            verified = list(itertools.chain.from_iterable(executor.map(_verify_chunk, chunks)))
+
+        with self._lock:
+            for i, valid in zip(pending, verified):
+                results[i] = valid
+                if valid:
+                    self._seen[keys[i]] = None
+            while len(self._seen) > self.seen_cache_size:
+                self._seen.popitem(last=False)
+        return results
+
+
+signature_verifier = SignatureVerifier()
@@ -0,0 +1,147 @@
+import contextlib
+import logging
+import secrets
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import pydantic
+
+logger = logging.getLogger(__name__)
+
+
+class TraceContext(pydantic.BaseModel):
+    """Identifies a span to the other parties of a job, so that their spans join its trace"""
+
+    trace_id: str
+    span_id: str
+
+
+@dataclass
+class Span:
+    """
+    A timed stage of a job. Times are in seconds of the clock the span was started with,
+    `time.monotonic()` unless given explicitly.
+    """
+
+    tracer: "Tracer" = field(repr=False)
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time: float
+    end_time: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float | None:
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    @property
+    def context(self) -> TraceContext:
+        return TraceContext(trace_id=self.trace_id, span_id=self.span_id)
+
+    def end(self, end_time: float | None = None) -> None:
+        """Finish the span, now if `end_time` is not given. Ending it again does nothing."""
+        if self.end_time is not None:
+            return
+        self.end_time = time.monotonic() if end_time is None else end_time
+        self.tracer.finish(self)
+
+
+SpanListener = Callable[[Span], None]
+
+
+class Tracer:
+    """
+    Creates spans and passes each finished one to the listeners, e.g. to observe its duration
+    in a histogram. A span continues the trace of its parent, which is either a local span
+    or the context of a remote one received in a message.
+    """
+
+    def __init__(self):
+        self.listeners: list[SpanListener] = []
+
+    def add_listener(self, listener: SpanListener) -> None:
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: SpanListener) -> None:
+        self.listeners.remove(listener)
+
+    def start_span(
+        self,
+        name: str,
+        parent: Span | TraceContext | None = None,
+        start_time: float | None = None,
+        **attributes,
+    ) -> Span:
+        return Span(
+            tracer=self,
+            name=name,
+            trace_id=parent.trace_id if parent is not None else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent is not None else None,
+            start_time=time.monotonic() if start_time is None else start_time,
+            attributes=attributes,
+        )
+
+    def record_span(
+        self,
+        name: str,
+        start_time: float,
+        end_time: float,
+        parent: Span | TraceContext | None = None,
+        **attributes,
+    ) -> Span:
+        """Report a stage whose start and end were only noted down while it was going on"""
+        span = self.start_span(name, parent, start_time=start_time, **attributes)
+        span.end(end_time)
+        return span
+
+    @contextlib.contextmanager
+    def span(
+        self, name: str, parent: Span | TraceContext | None = None, **attributes
+    ) -> Iterator[Span]:
+        span = self.start_span(name, parent, **attributes)
+        try:
+            yield span
+        except BaseException as exc:
+            span.attributes["error"] = type(exc).__name__
+            raise
+        finally:
+            span.end()
+
+    def finish(self, span: Span) -> None:
+        logger.debug(
+            "Span %s took %.6fs (trace_id=%s span_id=%s parent_id=%s %s)",
+            span.name,
+            span.duration,
+            span.trace_id,
+            span.span_id,
+            span.parent_id,
+            span.attributes,
+        )
+        for listener in self.listeners:
+            try:
+                listener(span)
+            except Exception:
+                logger.exception("Span listener %r failed", listener)
+
+
+class _Histogram(Protocol):
+    def labels(self, *args, **kwargs) -> Any: ...
+
+
+def observe_span_durations(histogram: _Histogram) -> SpanListener:
+    """A listener observing the durations in a histogram labelled by `span`, e.g. a prometheus one"""
+
+    def listener(span: Span) -> None:
+        histogram.labels(span=span.name).observe(span.duration)
+
+    return listener
+
+
+tracer = Tracer()
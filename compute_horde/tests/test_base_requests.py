@@ -0,0 +1,49 @@
+import pytest
+
+from compute_horde.base_requests import ValidationError
+from compute_horde.em_protocol import executor_requests
+from compute_horde.mv_protocol import miner_requests
+
+
+@pytest.mark.parametrize(
+    "msg",
+    [
+        miner_requests.V0AcceptJobRequest(job_uuid="1"),
+        miner_requests.V0JobFinishedRequest(
+            job_uuid="1", docker_process_stdout="out", docker_process_stderr="err"
+        ),
+        miner_requests.UnauthorizedError(code=miner_requests.UnauthorizedErrorType.TOKEN_TOO_OLD),
+    ],
+)
+def test_parse(msg):
+    raw = msg.model_dump_json()
+    assert miner_requests.BaseMinerRequest.parse(raw) == msg
+    assert miner_requests.BaseMinerRequest.parse(raw.encode()) == msg
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "not json",
+        "[]",
+        "{}",
+        '{"message_type": ["V0AcceptJobRequest"]}',
+        '{"message_type": "V0Unknown", "job_uuid": "1"}',
+        # a message of another protocol
+        '{"message_type": "V0ReadyRequest", "job_uuid": "1"}',
+        # the right type, but not a valid message of it
+        '{"message_type": "V0JobFinishedRequest", "job_uuid": "1"}',
+    ],
+)
+def test_parse__invalid(raw):
+    with pytest.raises(ValidationError):
+        miner_requests.BaseMinerRequest.parse(raw)
+
+
+def test_value_to_model():
+    assert (
+        executor_requests.BaseExecutorRequest.value_to_model("V0ReadyRequest")
+        is executor_requests.V0ReadyRequest
+    )
+    assert executor_requests.BaseExecutorRequest.value_to_model("V0AcceptJobRequest") is None
+    assert executor_requests.BaseExecutorRequest.value_to_model(None) is None
@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+from compute_horde.miner_client.organic import OrganicMinerClient
+from compute_horde.miner_client.pool import MinerConnectionPool, PooledMinerConnection
+from compute_horde.mv_protocol.miner_requests import (
+    V0AcceptJobRequest,
+    V0ExecutorManifestRequest,
+    V0ExecutorReadyRequest,
+    V0JobFinishedRequest,
+)
+from compute_horde.mv_protocol.validator_requests import (
+    BaseValidatorRequest,
+    V0AuthenticateRequest,
+    V0InitialJobRequest,
+)
+from compute_horde.transport import AbstractTransport
+
+JOB_UUIDS = ["b4793a02-33a2-4a49-b4e2-4a7b903847e7", "3342460e-4a99-438b-8757-795f4cb348dd"]
+
+
+class QueueTransport(AbstractTransport):
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.incoming: asyncio.Queue[str] = asyncio.Queue()
+        self.sent_models = []
+        self.started = False
+
+    async def start(self):
+        self.started = True
+
+    async def stop(self):
+        self.started = False
+
+    async def send(self, data):
+        self.sent_models.append(BaseValidatorRequest.parse(data))
+
+    async def receive(self):
+        return await self.incoming.get()
+
+
+class MockConnectionPool(MinerConnectionPool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.transports: list[QueueTransport] = []
+
+    def create_connection(self, miner_hotkey, miner_address, miner_port):
+        transport = QueueTransport("queue")
+        self.transports.append(transport)
+        return PooledMinerConnection(
+            miner_hotkey, miner_address, miner_port, self.my_keypair, transport=transport
+        )
+
+
+class MinerClient(OrganicMinerClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.times_to_accept = []
+
+    async def notify_job_accepted(self, time_to_accept: float) -> None:
+        self.times_to_accept.append(time_to_accept)
+
+
+def get_miner_client(keypair, pool, job_uuid) -> MinerClient:
+    return MinerClient(
+        miner_hotkey="mock",
+        miner_address="0.0.0.0",
+        miner_port=1234,
+        job_uuid=job_uuid,
+        my_keypair=keypair,
+        connection_pool=pool,
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool__jobs_share_connection(keypair):
+    pool = MockConnectionPool(keypair)
+    clients = [get_miner_client(keypair, pool, job_uuid) for job_uuid in JOB_UUIDS]
+
+    async with clients[0], clients[1]:
+        [transport] = pool.transports
+        for client in clients:
+            await client.send_model(
+                V0InitialJobRequest(
+                    job_uuid=client.job_uuid,
+                    executor_class="spin_up-4min.gpu-24gb",
+                    base_docker_image_name="mock",
+                    timeout_seconds=60,
+                )
+            )
+        for msg in [
+            V0ExecutorManifestRequest(manifest={"executor_classes": []}),
+            V0AcceptJobRequest(job_uuid=JOB_UUIDS[1]),
+            V0ExecutorReadyRequest(job_uuid=JOB_UUIDS[1]),
+            V0JobFinishedRequest(
+                job_uuid=JOB_UUIDS[0], docker_process_stdout="0", docker_process_stderr=""
+            ),
+        ]:
+            transport.incoming.put_nowait(msg.model_dump_json())
+
+        assert await asyncio.wait_for(clients[0].miner_finished_or_failed_future, 1)
+        assert await asyncio.wait_for(clients[1].miner_ready_or_declining_future, 1)
+        assert not clients[0].miner_ready_or_declining_future.done()
+        assert not clients[1].miner_finished_or_failed_future.done()
+        assert clients[0].miner_manifest.done() and clients[1].miner_manifest.done()
+        assert clients[0].times_to_accept == []
+        assert len(clients[1].times_to_accept) == 1
+
+    assert [type(model) for model in transport.sent_models] == [
+        V0AuthenticateRequest,
+        V0InitialJobRequest,
+        V0InitialJobRequest,
+    ]
+    # kept open for the next jobs
+    assert transport.started
+
+    client = get_miner_client(keypair, pool, JOB_UUIDS[0])
+    async with client:
+        assert client.reused_connection
+        assert client.miner_manifest.done()
+    assert len(pool.transports) == 1
+
+    await pool.close()
+    assert not transport.started
+
+
+@pytest.mark.asyncio
+async def test_pool__idle_connection_evicted(keypair):
+    pool = MockConnectionPool(keypair, idle_timeout=60)
+    async with get_miner_client(keypair, pool, JOB_UUIDS[0]):
+        pass
+
+    await pool.evict_idle()
+    assert len(pool.connections) == 1
+
+    pool.idle_timeout = 0
+    async with get_miner_client(keypair, pool, JOB_UUIDS[1]):
+        # in use
+        await pool.evict_idle()
+        assert len(pool.connections) == 1
+
+    await pool.evict_idle()
+    assert pool.connections == {}
+    assert not pool.transports[0].started
+
+    client = get_miner_client(keypair, pool, JOB_UUIDS[0])
+    async with client:
+        assert not client.reused_connection
+    assert len(pool.transports) == 2
+    await pool.close()
@@ -1,4 +1,5 @@
 import csv
+import datetime
 import io
 
 import pytest
@@ -10,7 +11,7 @@ from compute_horde.mv_protocol.validator_requests import (
 from compute_horde.receipts import Receipt, ReceiptFetchError, ReceiptType, get_miner_receipts
 
 
-def receipts_helper(mocked_responses, receipts: list[Receipt], miner_keypair):
+def receipts_csv(receipts: list[Receipt]) -> str:
     payload_fields = set()
     for payload_cls in [JobStartedReceiptPayload, JobFinishedReceiptPayload]:
         payload_fields |= set(payload_cls.model_fields.keys())
@@ -41,8 +42,11 @@ def receipts_helper(mocked_responses, receipts: list[Receipt], miner_keypair):
             | receipt.payload.model_dump()
         )
         csv_writer.writerow(row)
+    return buf.getvalue()
+
 
-    mocked_responses.get("http://127.0.0.1:8000/receipts/receipts.csv", body=buf.getvalue())
+def receipts_helper(mocked_responses, receipts: list[Receipt], miner_keypair):
+    mocked_responses.get("http://127.0.0.1:8000/receipts/receipts.csv", body=receipts_csv(receipts))
     return get_miner_receipts(miner_keypair.ss58_address, "127.0.0.1", 8000)
 
 
@@ -105,3 +109,41 @@ def test__get_miner_receipts__no_receipts(mocked_responses, miner_keypair):
 
     with pytest.raises(ReceiptFetchError):
         get_miner_receipts(miner_keypair.ss58_address, "127.0.0.1", 8001)
+
+
+def test__get_miner_receipts__since__only_new_segments(mocked_responses, receipts, miner_keypair):
+    mocked_responses.get(
+        "http://127.0.0.1:8000/receipts/index.json",
+        json={
+            "segments": [
+                {"name": "1.csv", "created_at": "2024-01-02T01:56:00+00:00", "count": 1},
+                {"name": "2.csv", "created_at": "2024-01-02T01:58:00+00:00", "count": 1},
+            ]
+        },
+    )
+    mocked_responses.get(
+        "http://127.0.0.1:8000/receipts/segments/2.csv", body=receipts_csv(receipts[1:])
+    )
+
+    got_receipts = get_miner_receipts(
+        miner_keypair.ss58_address,
+        "127.0.0.1",
+        8000,
+        since=datetime.datetime(2024, 1, 2, 1, 57, tzinfo=datetime.UTC),
+    )
+
+    assert got_receipts == receipts[1:]
+
+
+def test__get_miner_receipts__since__no_index(mocked_responses, receipts, miner_keypair):
+    mocked_responses.get("http://127.0.0.1:8000/receipts/index.json", status=404)
+    mocked_responses.get("http://127.0.0.1:8000/receipts/receipts.csv", body=receipts_csv(receipts))
+
+    got_receipts = get_miner_receipts(
+        miner_keypair.ss58_address,
+        "127.0.0.1",
+        8000,
+        since=datetime.datetime(2024, 1, 2, 1, 57, tzinfo=datetime.UTC),
+    )
+
+    assert len(got_receipts) == 2
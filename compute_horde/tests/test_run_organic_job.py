@@ -5,7 +5,11 @@ from compute_horde.miner_client.organic import (
     OrganicMinerClient,
     run_organic_job,
 )
-from compute_horde.mv_protocol.miner_requests import V0ExecutorReadyRequest, V0JobFinishedRequest
+from compute_horde.mv_protocol.miner_requests import (
+    V0AcceptJobRequest,
+    V0ExecutorReadyRequest,
+    V0JobFinishedRequest,
+)
 from compute_horde.mv_protocol.validator_requests import (
     BaseValidatorRequest,
     V0AuthenticateRequest,
@@ -14,6 +18,7 @@ from compute_horde.mv_protocol.validator_requests import (
     V0JobRequest,
     V0JobStartedReceiptRequest,
 )
+from compute_horde.tracing import tracer
 from compute_horde.transport import StubTransport
 
 JOB_UUID = "b4793a02-33a2-4a49-b4e2-4a7b903847e7"
@@ -31,9 +36,12 @@ class MinerStubTransport(StubTransport):
 
 @pytest.mark.asyncio
 async def test_run_organic_job__success(keypair):
+    spans = []
+    tracer.add_listener(spans.append)
     mock_transport = MinerStubTransport(
         "mock",
         [
+            V0AcceptJobRequest(job_uuid=JOB_UUID).model_dump_json(),
             V0ExecutorReadyRequest(job_uuid=JOB_UUID).model_dump_json(),
             V0JobFinishedRequest(
                 job_uuid=JOB_UUID,
@@ -65,6 +73,21 @@ async def test_run_organic_job__success(keypair):
         V0JobFinishedReceiptRequest,
     ]
 
+    tracer.remove_listener(spans.append)
+    job_span = spans[-1]
+    assert job_span.name == "organic_job"
+    assert {span.name for span in spans[:-1]} == {
+        "organic_job.connect",
+        "organic_job.accept",
+        "organic_job.spin_up",
+        "organic_job.run",
+        "organic_job.result_delivery",
+    }
+    assert {span.parent_id for span in spans[:-1]} == {job_span.span_id}
+    # the miner continues the trace
+    assert mock_transport.sent_models[1].trace_context == job_span.context
+    assert mock_transport.sent_models[3].trace_context == job_span.context
+
 
 # TODO:
 #   - unhappy path
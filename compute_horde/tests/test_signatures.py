@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from compute_horde import signatures
+from compute_horde.signatures import SignatureVerifier
+
+
+@pytest.fixture
+def signed(keypair):
+    data = '{"job_uuid": "3342460e-4a99-438b-8757-795f4cb348dd"}'
+    return keypair.ss58_address, data, f"0x{keypair.sign(data).hex()}"
+
+
+def test_verify__valid(signed):
+    assert SignatureVerifier().verify(*signed)
+
+
+def test_verify__invalid(signed, validator_keypair):
+    address, data, signature = signed
+    verifier = SignatureVerifier()
+    assert not verifier.verify(validator_keypair.ss58_address, data, signature)
+    assert not verifier.verify(address, data + " ", signature)
+    assert not verifier.verify(address, data, "0xnothex")
+    assert not verifier.verify(address, data, "nothex")
+    assert not verifier.verify("not an address", data, signature)
+
+
+def test_verify__seen_signature_not_verified_again(signed, mocker):
+    verify_signature = mocker.spy(signatures, "verify_signature")
+    verifier = SignatureVerifier()
+
+    assert verifier.verify(*signed)
+    assert verifier.verify(*signed)
+    assert verify_signature.call_count == 1
+
+    # invalid ones aren't remembered
+    address, data, _ = signed
+    assert not verifier.verify(address, data, "0x00")
+    assert not verifier.verify(address, data, "0x00")
+    assert verify_signature.call_count == 3
+
+
+def test_verify__seen_cache_size(keypair, mocker):
+    verify_signature = mocker.spy(signatures, "verify_signature")
+    verifier = SignatureVerifier(seen_cache_size=2)
+    items = [
+        (keypair.ss58_address, data, f"0x{keypair.sign(data).hex()}") for data in ["a", "b", "c"]
+    ]
+
+    assert verifier.verify_many(items) == [True, True, True]
+    # the first one was evicted by the last
+    assert verifier.verify_many(items[::-1]) == [True, True, True]
+    assert verify_signature.call_count == 4
+
+
+def test_verify_many__executor(keypair, validator_keypair):
+    items = []
+    for i in range(10):
+        data = f"data {i}"
+        signer = keypair if i % 3 else validator_keypair
+        items.append((keypair.ss58_address, data, f"0x{signer.sign(data).hex()}"))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = SignatureVerifier().verify_many(items, executor=executor, chunk_size=3)
+
+    assert results == [bool(i % 3) for i in range(10)]
@@ -0,0 +1,69 @@
+import pytest
+
+from compute_horde.tracing import TraceContext, Tracer, observe_span_durations
+
+
+@pytest.fixture
+def tracer():
+    return Tracer()
+
+
+@pytest.fixture
+def finished(tracer):
+    spans = []
+    tracer.add_listener(spans.append)
+    return spans
+
+
+def test_span__trace_continued_by_children(tracer, finished):
+    with tracer.span("job") as root:
+        with tracer.span("job.stage", root) as child:
+            pass
+        # as received by another party
+        context = TraceContext.model_validate_json(child.context.model_dump_json())
+        remote = tracer.record_span("remote.stage", 10.0, 12.5, context)
+
+    assert [span.name for span in finished] == ["job.stage", "remote.stage", "job"]
+    assert {span.trace_id for span in finished} == {root.trace_id}
+    assert root.parent_id is None
+    assert child.parent_id == root.span_id
+    assert remote.parent_id == child.span_id
+    assert remote.duration == 2.5
+    assert root.duration >= child.duration >= 0
+
+
+def test_span__error(tracer, finished):
+    with pytest.raises(ValueError):
+        with tracer.span("job"):
+            raise ValueError()
+
+    [span] = finished
+    assert span.attributes == {"error": "ValueError"}
+
+
+def test_span__ended_once(tracer, finished):
+    span = tracer.start_span("job")
+    span.end(1.0)
+    span.end(2.0)
+
+    assert finished == [span]
+    assert span.end_time == 1.0
+
+
+def test_listener__failure_doesnt_affect_others(tracer, finished):
+    def failing(span):
+        raise RuntimeError()
+
+    tracer.listeners.insert(0, failing)
+    tracer.record_span("job", 0, 1)
+    assert len(finished) == 1
+
+
+def test_observe_span_durations(tracer, mocker):
+    histogram = mocker.MagicMock()
+    tracer.add_listener(observe_span_durations(histogram))
+
+    tracer.record_span("job", 1, 3)
+
+    histogram.labels.assert_called_once_with(span="job")
+    histogram.labels.return_value.observe.assert_called_once_with(2)
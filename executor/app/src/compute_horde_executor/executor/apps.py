@@ -1,5 +1,11 @@
+from compute_horde.tracing import observe_span_durations, tracer
 from django.apps import AppConfig
 
 
 class ExecutorConfig(AppConfig):
     name = "compute_horde_executor.executor"
+
+    def ready(self):
+        from .metrics import EXECUTOR_SPAN_DURATION
+
+        tracer.add_listener(observe_span_durations(EXECUTOR_SPAN_DURATION))
@@ -41,6 +41,7 @@ from compute_horde.miner_client.base import (
     AbstractTransport,
     UnsupportedMessageReceived,
 )
+from compute_horde.tracing import tracer
 from compute_horde.transport import WSTransport
 from compute_horde.utils import MachineSpecs
 from django.conf import settings
@@ -399,7 +400,8 @@ class JobRunner:
             docker_run_options = RunConfigManager.preset_to_docker_run_args(
                 job_request.docker_run_options_preset
             )
-            await self.unpack_volume(job_request)
+            with tracer.span("executor.volume_download", job_request.trace_context):
+                await self.unpack_volume(job_request)
         except JobError as ex:
             return JobResult(
                 success=False,
@@ -451,6 +453,7 @@ class JobRunner:
         )
 
         t1 = time.time()
+        run_span = tracer.start_span("executor.docker_run", job_request.trace_context)
         try:
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(), timeout=self.initial_job_request.timeout_seconds
@@ -471,6 +474,7 @@ class JobRunner:
             stderr = stderr.decode()
             exit_status = process.returncode
             timeout = False
+        run_span.end()
 
         # Save the streams in output volume and truncate them in response.
         with open(self.output_volume_mount_dir / "stdout.txt", "w") as f:
@@ -485,8 +489,9 @@ class JobRunner:
         # upload the output if requested
         if job_request.output_upload:
             try:
-                output_uploader = OutputUploader.for_upload_output(job_request.output_upload)
-                await output_uploader.upload(self.output_volume_mount_dir)
+                with tracer.span("executor.output_upload", job_request.trace_context):
+                    output_uploader = OutputUploader.for_upload_output(job_request.output_upload)
+                    await output_uploader.upload(self.output_volume_mount_dir)
             except OutputUploadFailed as ex:
                 logger.warning(
                     f"Uploading output failed for job {self.initial_job_request.job_uuid} with error: {ex!r}"
@@ -660,8 +665,11 @@ class Command(BaseCommand):
         async with miner_client:
             logger.debug(f"Connected to miner: {settings.MINER_ADDRESS}")
             initial_message: V0InitialJobRequest = await miner_client.initial_msg
+            trace_context = initial_message.trace_context
             logger.debug("Checking for CVE-2022-0492 vulnerability")
-            if not await self.is_system_safe_for_cve_2022_0492():
+            with tracer.span("executor.security_check", trace_context):
+                system_safe = await self.is_system_safe_for_cve_2022_0492()
+            if not system_safe:
                 await miner_client.send_failed_to_prepare()
                 return
 
@@ -669,13 +677,15 @@ class Command(BaseCommand):
             try:
                 logger.debug(f"Preparing for job {initial_message.job_uuid}")
                 try:
-                    await job_runner.prepare()
+                    with tracer.span("executor.prepare", trace_context):
+                        await job_runner.prepare()
                 except JobError:
                     await miner_client.send_failed_to_prepare()
                     return
 
                 logger.debug(f"Scraping hardware specs for job {initial_message.job_uuid}")
-                specs = get_machine_specs()
+                with tracer.span("executor.machine_specs", trace_context):
+                    specs = get_machine_specs()
 
                 await miner_client.send_ready()
                 logger.debug(f"Informed miner that I'm ready for job {initial_message.job_uuid}")
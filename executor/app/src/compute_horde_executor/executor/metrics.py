@@ -2,6 +2,7 @@ import glob
 import os
 
 import prometheus_client
+from django.conf import settings
 from django.http import HttpResponse
 from django_prometheus.exports import ExportToDjangoView
 from prometheus_client import multiprocess
@@ -17,6 +18,15 @@ class RecursiveMultiProcessCollector(multiprocess.MultiProcessCollector):
 
 ENV_VAR_NAME = "PROMETHEUS_MULTIPROC_DIR"
 
+EXECUTOR_SPAN_DURATION = prometheus_client.Histogram(
+    "executor_span_duration",
+    "Duration of the traced stages of the jobs",
+    labelnames=["span"],
+    unit="seconds",
+    # running a job takes minutes
+    buckets=(*settings.PROMETHEUS_LATENCY_BUCKETS[:-1], 128.0, 256.0, 512.0, float("inf")),
+)
+
 
 def metrics_view(request):
     """Exports metrics as a Django view"""
@@ -1,5 +1,6 @@
 import logging
 
+from compute_horde.tracing import observe_span_durations, tracer
 from django.apps import AppConfig
 from django.conf import settings
 from django.db.models.signals import post_migrate
@@ -51,3 +52,7 @@ class MinerConfig(AppConfig):
     def ready(self):
         post_migrate.connect(maybe_create_default_admin, sender=self)
         post_migrate.connect(create_local_miner_validator, sender=self)
+
+        from .metrics import MINER_SPAN_DURATION
+
+        tracer.add_listener(observe_span_durations(MINER_SPAN_DURATION))
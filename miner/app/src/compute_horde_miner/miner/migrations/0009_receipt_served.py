@@ -0,0 +1,22 @@
+# Generated by Django 4.2.15 on 2024-09-20 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("miner", "0008_jobstartedreceipt_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobfinishedreceipt",
+            name="served",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="jobstartedreceipt",
+            name="served",
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -1,8 +1,10 @@
 import logging
+import time
 
 from compute_horde.em_protocol import executor_requests, miner_requests
 from compute_horde.em_protocol.executor_requests import BaseExecutorRequest
 from compute_horde.mv_protocol import validator_requests
+from compute_horde.tracing import TraceContext, tracer
 
 from compute_horde_miner.miner.miner_consumer.base_compute_horde_consumer import (
     BaseConsumer,
@@ -19,6 +21,8 @@ class MinerExecutorConsumer(BaseConsumer, ExecutorInterfaceMixin):
         super().__init__(*a, **kw)
         self.executor_token = ""
         self.job: AcceptedJob | None = None
+        self.trace_context: TraceContext | None = None
+        self.job_request_sent_at: float | None = None
 
     def accepted_request_type(self):
         return BaseExecutorRequest
@@ -66,22 +70,47 @@ class MinerExecutorConsumer(BaseConsumer, ExecutorInterfaceMixin):
                 volume_type=initial_job_details.volume_type.value
                 if initial_job_details.volume_type
                 else None,
+                trace_context=initial_job_details.trace_context,
             ).model_dump_json()
         )
+        self.trace_context = initial_job_details.trace_context
+
+    def record_spin_up_span(self, **attributes):
+        """From accepting the job until the executor is ready, possibly in another process"""
+        tracer.record_span(
+            "miner.spin_up",
+            self.job.created_at.timestamp(),
+            time.time(),
+            self.trace_context,
+            **attributes,
+        )
+
+    def record_run_span(self, **attributes):
+        if self.job_request_sent_at is not None:
+            tracer.record_span(
+                "miner.run",
+                self.job_request_sent_at,
+                time.monotonic(),
+                self.trace_context,
+                **attributes,
+            )
 
     async def handle(self, msg: BaseExecutorRequest):
         if isinstance(msg, executor_requests.V0ReadyRequest):
             self.job.status = AcceptedJob.Status.WAITING_FOR_PAYLOAD
+            self.record_spin_up_span()
             await self.job.asave()
             await self.send_executor_ready(self.executor_token)
         if isinstance(msg, executor_requests.V0FailedToPrepare):
             self.job.status = AcceptedJob.Status.FAILED
+            self.record_spin_up_span(error="V0FailedToPrepare")
             await self.job.asave()
             await self.send_executor_failed_to_prepare(self.executor_token)
         if isinstance(msg, executor_requests.V0FinishedRequest):
             self.job.status = AcceptedJob.Status.FINISHED
             self.job.stderr = msg.docker_process_stderr
             self.job.stdout = msg.docker_process_stdout
+            self.record_run_span()
 
             await self.job.asave()
             await self.send_executor_finished(
@@ -99,6 +128,7 @@ class MinerExecutorConsumer(BaseConsumer, ExecutorInterfaceMixin):
             self.job.stderr = msg.docker_process_stderr
             self.job.stdout = msg.docker_process_stdout
             self.job.exit_status = msg.docker_process_exit_status
+            self.record_run_span(error="V0FailedRequest")
 
             await self.job.asave()
             await self.send_executor_failed(
@@ -110,6 +140,9 @@ class MinerExecutorConsumer(BaseConsumer, ExecutorInterfaceMixin):
             )
 
     async def _miner_job_request(self, msg: JobRequest):
+        if msg.trace_context is not None:
+            self.trace_context = msg.trace_context
+        self.job_request_sent_at = time.monotonic()
         await self.send(
             miner_requests.V0JobRequest(
                 job_uuid=msg.job_uuid,
@@ -119,6 +152,7 @@ class MinerExecutorConsumer(BaseConsumer, ExecutorInterfaceMixin):
                 docker_run_cmd=msg.docker_run_cmd,
                 volume=msg.volume,
                 output_upload=msg.output_upload,
+                trace_context=msg.trace_context,
             ).model_dump_json()
         )
 
@@ -6,6 +6,7 @@ import pydantic
 from channels.generic.websocket import AsyncWebsocketConsumer
 from compute_horde.em_protocol.miner_requests import OutputUpload, Volume
 from compute_horde.mv_protocol import validator_requests
+from compute_horde.tracing import TraceContext
 from compute_horde.utils import MachineSpecs
 from pydantic import model_validator
 
@@ -32,6 +33,7 @@ class JobRequest(pydantic.BaseModel):
     docker_run_cmd: list[str]
     volume: Volume | None = None
     output_upload: OutputUpload | None = None
+    trace_context: TraceContext | None = None
 
     @model_validator(mode="after")
     def validate_at_least_docker_image_or_raw_script(self) -> Self:
@@ -141,6 +143,7 @@ class ValidatorInterfaceMixin(BaseMixin, abc.ABC):
                     docker_run_cmd=job_request.docker_run_cmd,
                     volume=job_request.volume,
                     output_upload=job_request.output_upload,
+                    trace_context=job_request.trace_context,
                 ).model_dump(),
             },
         )
@@ -3,9 +3,10 @@ import logging
 import time
 import uuid
 
-import bittensor
 from compute_horde.mv_protocol import miner_requests, validator_requests
 from compute_horde.mv_protocol.validator_requests import BaseValidatorRequest
+from compute_horde.signatures import signature_verifier
+from compute_horde.tracing import tracer
 from django.conf import settings
 from django.utils import timezone
 
@@ -133,8 +134,7 @@ class MinerValidatorConsumer(BaseConsumer, ValidatorInterfaceMixin):
                 f"wrong validator hotkey ({self.validator_key}!={msg.payload.validator_hotkey})",
             )
 
-        keypair = bittensor.Keypair(ss58_address=self.validator_key)
-        if keypair.verify(msg.blob_for_signing(), msg.signature):
+        if signature_verifier.verify(self.validator_key, msg.blob_for_signing(), msg.signature):
             return True, ""
 
         return False, "Signature mismatches"
@@ -158,8 +158,7 @@ class MinerValidatorConsumer(BaseConsumer, ValidatorInterfaceMixin):
             )
             return False
 
-        keypair = bittensor.Keypair(ss58_address=self.validator_key)
-        if keypair.verify(msg.blob_for_signing(), msg.signature):
+        if signature_verifier.verify(self.validator_key, msg.blob_for_signing(), msg.signature):
             return True
 
         logger.warning(
@@ -250,6 +249,7 @@ class MinerValidatorConsumer(BaseConsumer, ValidatorInterfaceMixin):
             self.msg_queue.append(msg)
             return
         if isinstance(msg, validator_requests.V0InitialJobRequest):
+            accept_span = tracer.start_span("miner.accept", msg.trace_context)
             validator_blacklisted = await ValidatorBlacklist.objects.filter(
                 validator=self.validator
             ).aexists()
@@ -257,6 +257,8 @@ class MinerValidatorConsumer(BaseConsumer, ValidatorInterfaceMixin):
                 logger.info(
                     f"Declining job {msg.job_uuid} from blacklisted validator: {self.validator_key}"
                 )
+                accept_span.attributes["declined"] = True
+                accept_span.end()
                 await self.send(
                     miner_requests.V0DeclineJobRequest(job_uuid=msg.job_uuid).model_dump_json()
                 )
@@ -281,6 +283,8 @@ class MinerValidatorConsumer(BaseConsumer, ValidatorInterfaceMixin):
                     token, msg.executor_class, msg.timeout_seconds
                 )
             except ExecutorUnavailable:
+                accept_span.attributes["declined"] = True
+                accept_span.end()
                 await self.send(
                     miner_requests.V0DeclineJobRequest(job_uuid=msg.job_uuid).model_dump_json()
                 )
@@ -288,6 +292,7 @@ class MinerValidatorConsumer(BaseConsumer, ValidatorInterfaceMixin):
                 await job.adelete()
                 self.pending_jobs.pop(msg.job_uuid)
                 return
+            accept_span.end()
             await self.send(
                 miner_requests.V0AcceptJobRequest(job_uuid=msg.job_uuid).model_dump_json()
             )
@@ -103,6 +103,9 @@ class AbstractReceipt(models.Model):
     miner_hotkey = models.CharField(max_length=256)
     validator_hotkey = models.CharField(max_length=256)
 
+    # whether it's in the receipt store already
+    served = models.BooleanField(default=False)
+
     def __str__(self):
         return f"uuid: {self.job_uuid}"
 
@@ -1,8 +1,14 @@
 import abc
+import datetime
 
 from compute_horde.receipts import Receipt
 
 
 class BaseReceiptStore(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    def store(self, receipts: list[Receipt]) -> None: ...
+    def store(self, receipts: list[Receipt]) -> None:
+        """Serve `receipts` in addition to the already stored ones"""
+
+    @abc.abstractmethod
+    def expire(self, before: datetime.datetime) -> None:
+        """Stop serving the receipts stored before `before`"""
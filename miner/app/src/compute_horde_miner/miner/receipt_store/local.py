@@ -1,8 +1,14 @@
+import contextlib
 import csv
+import datetime
+import fcntl
 import io
+import json
+import os
 import pathlib
 import shutil
 import tempfile
+from collections.abc import Iterator
 
 from compute_horde.mv_protocol.validator_requests import (
     JobFinishedReceiptPayload,
@@ -10,32 +16,95 @@ from compute_horde.mv_protocol.validator_requests import (
 )
 from compute_horde.receipts import Receipt, ReceiptType
 from django.conf import settings
+from django.utils.timezone import now
 
 from compute_horde_miner.miner.receipt_store.base import BaseReceiptStore
 
 FILENAME = "receipts.csv"
+INDEX_FILENAME = "index.json"
+SEGMENTS_DIRECTORY = "segments"
+LOCK_FILENAME = ".lock"
+
+
+def _fieldnames() -> list[str]:
+    payload_fields = set()
+    for payload_cls in [JobStartedReceiptPayload, JobFinishedReceiptPayload]:
+        payload_fields |= set(payload_cls.model_fields.keys())
+    return ["type", "validator_signature", "miner_signature", *sorted(payload_fields)]
 
 
 class LocalReceiptStore(BaseReceiptStore):
+    """
+    Receipts are appended as immutable CSV segments to `LOCAL_RECEIPTS_ROOT/segments/`, listed
+    with their creation time in `index.json`, so that validators download only the segments
+    created since they last fetched. `receipts.csv` with all the segments is kept for the
+    validators not reading the index - new receipts are appended to it, it's only rewritten
+    when segments expire.
+    """
+
+    def __init__(self):
+        self.root = pathlib.Path(settings.LOCAL_RECEIPTS_ROOT)
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive access to the files, for the processes sharing the receipts volume"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / SEGMENTS_DIRECTORY).mkdir(exist_ok=True)
+        with open(self.root / LOCK_FILENAME, "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_file(self, filepath: pathlib.Path, write) -> None:
+        """Replace the file at once, it's served while being written"""
+        with tempfile.NamedTemporaryFile(
+            mode="wt", delete=False, encoding="utf8", newline="", dir=self.root
+        ) as temp_file:
+            write(temp_file)
+        shutil.move(temp_file.name, filepath)
+        filepath.chmod(0o644)
+
+    def _read_index(self) -> list[dict]:
+        try:
+            return json.loads((self.root / INDEX_FILENAME).read_text())["segments"]
+        except FileNotFoundError:
+            return []
+
+    def _write_index(self, segments: list[dict]) -> None:
+        self._write_file(
+            self.root / INDEX_FILENAME,
+            lambda file: json.dump({"segments": segments}, file),
+        )
+
+    def _write_full_file(self, segments: list[dict]) -> None:
+        def write(file):
+            csv.writer(file).writerow(_fieldnames())
+            for segment in segments:
+                with open(self.root / SEGMENTS_DIRECTORY / segment["name"], encoding="utf8") as f:
+                    # without the header
+                    f.readline()
+                    shutil.copyfileobj(f, file)
+
+        self._write_file(self.root / FILENAME, write)
+
+    def _append_to_full_file(self, segments: list[dict], rows: str) -> None:
+        filepath = self.root / FILENAME
+        if not filepath.exists():
+            self._write_full_file(segments)
+            return
+        # in a single write - a row read while being appended is skipped by the validators
+        # as invalid, and read in full on their next fetch
+        with open(filepath, "a", encoding="utf8", newline="") as file:
+            file.write(rows)
+
     def store(self, receipts: list[Receipt]) -> None:
         if not receipts:
             return
 
-        payload_fields = set()
-        for payload_cls in [JobStartedReceiptPayload, JobFinishedReceiptPayload]:
-            payload_fields |= set(payload_cls.model_fields.keys())
-
-        buf = io.StringIO()
-        csv_writer = csv.DictWriter(
-            buf,
-            [
-                "type",
-                "validator_signature",
-                "miner_signature",
-                *payload_fields,
-            ],
-        )
-        csv_writer.writeheader()
+        buffer = io.StringIO(newline="")
+        csv_writer = csv.DictWriter(buffer, _fieldnames())
         for receipt in receipts:
             match receipt.payload:
                 case JobStartedReceiptPayload():
@@ -51,13 +120,36 @@ class LocalReceiptStore(BaseReceiptStore):
                 | receipt.payload.model_dump()
             )
             csv_writer.writerow(row)
+        rows = buffer.getvalue()
 
-        root = pathlib.Path(settings.LOCAL_RECEIPTS_ROOT)
-        root.mkdir(parents=True, exist_ok=True)
-        filepath = root / FILENAME
+        def write(file):
+            csv.writer(file).writerow(_fieldnames())
+            file.write(rows)
 
-        with tempfile.NamedTemporaryFile(mode="wt", delete=False, encoding="utf8") as temp_file:
-            temp_file.write(buf.getvalue())
+        with self._locked():
+            segments = self._read_index()
+            created_at = now()
+            # unique even if the clock goes back
+            name = f"{int(created_at.timestamp() * 1_000_000)}-{len(segments)}-{os.getpid()}.csv"
+            self._write_file(self.root / SEGMENTS_DIRECTORY / name, write)
+            segments.append(
+                {"name": name, "created_at": created_at.isoformat(), "count": len(receipts)}
+            )
+            self._write_index(segments)
+            self._append_to_full_file(segments, rows)
 
-        shutil.move(temp_file.name, filepath)
-        filepath.chmod(0o644)
+    def expire(self, before: datetime.datetime) -> None:
+        with self._locked():
+            segments = self._read_index()
+            expired = [
+                segment
+                for segment in segments
+                if datetime.datetime.fromisoformat(segment["created_at"]) < before
+            ]
+            if not expired:
+                return
+            segments = [segment for segment in segments if segment not in expired]
+            self._write_index(segments)
+            self._write_full_file(segments)
+            for segment in expired:
+                (self.root / SEGMENTS_DIRECTORY / segment["name"]).unlink(missing_ok=True)
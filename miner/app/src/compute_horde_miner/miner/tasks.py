@@ -10,6 +10,7 @@ from compute_horde.receipts import (
 from compute_horde.utils import get_validators
 from constance import config
 from django.conf import settings
+from django.db import transaction
 from django.utils.timezone import now
 
 from compute_horde_miner.celery import app
@@ -67,23 +68,33 @@ def fetch_validators():
 
 @app.task
 def prepare_receipts():
-    receipts = []
-
-    job_started_receipts = JobStartedReceipt.objects.order_by("time_accepted").filter(
-        time_accepted__gt=now() - RECEIPTS_MAX_SERVED_PERIOD
-    )
-    receipts += [jr.to_receipt() for jr in job_started_receipts]
-
-    job_finished_receipts = JobFinishedReceipt.objects.order_by("time_started").filter(
-        time_started__gt=now() - RECEIPTS_MAX_SERVED_PERIOD
-    )
-    receipts += [jr.to_receipt() for jr in job_finished_receipts]
-
-    receipts_store.store(receipts)
+    """Serve the receipts which aren't served yet"""
+    with transaction.atomic():
+        # concurrent runs serve different receipts
+        job_started_receipts = list(
+            JobStartedReceipt.objects.select_for_update(skip_locked=True)
+            .filter(served=False, time_accepted__gt=now() - RECEIPTS_MAX_SERVED_PERIOD)
+            .order_by("time_accepted")
+        )
+        job_finished_receipts = list(
+            JobFinishedReceipt.objects.select_for_update(skip_locked=True)
+            .filter(served=False, time_started__gt=now() - RECEIPTS_MAX_SERVED_PERIOD)
+            .order_by("time_started")
+        )
+        receipts_store.store(
+            [receipt.to_receipt() for receipt in [*job_started_receipts, *job_finished_receipts]]
+        )
+        JobStartedReceipt.objects.filter(id__in=[r.id for r in job_started_receipts]).update(
+            served=True
+        )
+        JobFinishedReceipt.objects.filter(id__in=[r.id for r in job_finished_receipts]).update(
+            served=True
+        )
 
 
 @app.task
 def clear_old_receipts():
+    receipts_store.expire(now() - RECEIPTS_MAX_SERVED_PERIOD)
     JobFinishedReceipt.objects.filter(
         time_started__lt=now() - RECEIPTS_MAX_RETENTION_PERIOD
     ).delete()
@@ -104,7 +115,6 @@ def get_receipts_from_old_miner():
     logger.info("Fetching data from old miner server")
 
     hotkey = settings.BITTENSOR_WALLET().hotkey.ss58_address
-    receipts = get_miner_receipts(hotkey, config.OLD_MINER_IP, config.OLD_MINER_PORT)
 
     tolerance = datetime.timedelta(hours=1)
 
@@ -114,6 +124,21 @@ def get_receipts_from_old_miner():
     job_started_receipt_cutoff_time = (
         latest_job_started_receipt.time_accepted - tolerance if latest_job_started_receipt else None
     )
+    latest_job_finished_receipt = (
+        JobFinishedReceipt.objects.filter(miner_hotkey=hotkey).order_by("-time_started").first()
+    )
+    job_finished_receipt_cutoff_time = (
+        latest_job_finished_receipt.time_started - tolerance
+        if latest_job_finished_receipt
+        else None
+    )
+
+    # only the receipts the old miner stored since the older cutoff, if it can tell
+    since = None
+    if job_started_receipt_cutoff_time and job_finished_receipt_cutoff_time:
+        since = min(job_started_receipt_cutoff_time, job_finished_receipt_cutoff_time)
+    receipts = get_miner_receipts(hotkey, config.OLD_MINER_IP, config.OLD_MINER_PORT, since=since)
+
     job_started_receipt_to_create = [
         JobStartedReceipt(
             job_uuid=receipt.payload.job_uuid,
@@ -133,14 +158,6 @@ def get_receipts_from_old_miner():
     if job_started_receipt_to_create:
         JobStartedReceipt.objects.bulk_create(job_started_receipt_to_create, ignore_conflicts=True)
 
-    latest_job_finished_receipt = (
-        JobFinishedReceipt.objects.filter(miner_hotkey=hotkey).order_by("-time_started").first()
-    )
-    job_finished_receipt_cutoff_time = (
-        latest_job_finished_receipt.time_started - tolerance
-        if latest_job_finished_receipt
-        else None
-    )
     job_finished_receipt_to_create = [
         JobFinishedReceipt(
             job_uuid=receipt.payload.job_uuid,
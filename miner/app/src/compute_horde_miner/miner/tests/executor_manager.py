@@ -21,6 +21,7 @@ async def fake_executor(token):
         "base_docker_image_name": "it's teeeeests",
         "timeout_seconds": 60,
         "volume_type": "inline",
+        "trace_context": None,
     }, response
     await communicator.send_json_to(
         {
@@ -38,6 +39,7 @@ async def fake_executor(token):
         "docker_run_cmd": [],
         "volume": {"volume_type": "inline", "contents": "nonsense", "relative_path": None},
         "output_upload": mock.ANY,
+        "trace_context": None,
     }, response
     await communicator.send_json_to(
         {
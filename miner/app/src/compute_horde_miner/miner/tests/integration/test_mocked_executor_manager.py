@@ -19,9 +19,9 @@ WEBSOCKET_TIMEOUT = 3
 
 
 @pytest.fixture
-def mock_keypair(mocker: MockerFixture):
+def mock_signature_verifier(mocker: MockerFixture):
     return mocker.patch(
-        "compute_horde_miner.miner.miner_consumer.validator_interface.bittensor.Keypair"
+        "compute_horde_miner.miner.miner_consumer.validator_interface.signature_verifier"
     )
 
 
@@ -129,17 +129,19 @@ async def test_main_loop(validator: Validator, job_uuid: str):
     await run_regular_flow_test(validator.public_key, job_uuid)
 
 
-async def test_local_miner(validator: Validator, job_uuid: str, mock_keypair: MagicMock, settings):
+async def test_local_miner(
+    validator: Validator, job_uuid: str, mock_signature_verifier: MagicMock, settings
+):
     settings.IS_LOCAL_MINER = True
     settings.DEBUG_TURN_AUTHENTICATION_OFF = False
 
     await run_regular_flow_test(validator.public_key, job_uuid)
 
-    mock_keypair.assert_called_once_with(ss58_address=validator.public_key)
-    mock_keypair.return_value.verify.assert_called_once()
+    mock_signature_verifier.verify.assert_called_once()
+    assert mock_signature_verifier.verify.call_args.args[0] == validator.public_key
 
 
-async def test_local_miner_unknown_validator(mock_keypair: MagicMock, settings):
+async def test_local_miner_unknown_validator(mock_signature_verifier: MagicMock, settings):
     settings.IS_LOCAL_MINER = True
     settings.DEBUG_TURN_AUTHENTICATION_OFF = False
 
@@ -0,0 +1,114 @@
+import csv
+import datetime
+import json
+import uuid
+
+import pytest
+from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
+from django.utils.timezone import now
+from freezegun import freeze_time
+
+from compute_horde_miner.miner.models import JobFinishedReceipt, JobStartedReceipt
+from compute_horde_miner.miner.receipt_store.local import LocalReceiptStore
+from compute_horde_miner.miner.tasks import clear_old_receipts, prepare_receipts
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def receipts_root(settings, tmp_path, mocker):
+    settings.LOCAL_RECEIPTS_ROOT = tmp_path
+    mocker.patch("compute_horde_miner.miner.tasks.receipts_store", LocalReceiptStore())
+    return tmp_path
+
+
+def create_job_started_receipt():
+    return JobStartedReceipt.objects.create(
+        validator_signature="0xv",
+        miner_signature="0xm",
+        job_uuid=uuid.uuid4(),
+        miner_hotkey="m1",
+        validator_hotkey="v1",
+        executor_class=DEFAULT_EXECUTOR_CLASS,
+        time_accepted=now(),
+        max_timeout=30,
+    )
+
+
+def create_job_finished_receipt():
+    return JobFinishedReceipt.objects.create(
+        validator_signature="0xv",
+        miner_signature="0xm",
+        job_uuid=uuid.uuid4(),
+        miner_hotkey="m1",
+        validator_hotkey="v1",
+        time_started=now(),
+        time_took_us=30_000_000,
+        score_str="1.5",
+    )
+
+
+def read_csv(path) -> list[str]:
+    with open(path) as f:
+        return [row["job_uuid"] for row in csv.DictReader(f)]
+
+
+def read_index(receipts_root) -> list[dict]:
+    return json.loads((receipts_root / "index.json").read_text())["segments"]
+
+
+def test_prepare_receipts__appends_segments(receipts_root):
+    first = [create_job_started_receipt(), create_job_finished_receipt()]
+    prepare_receipts()
+    second = [create_job_finished_receipt()]
+    prepare_receipts()
+    # nothing new
+    prepare_receipts()
+
+    segments = read_index(receipts_root)
+    assert [segment["count"] for segment in segments] == [2, 1]
+    assert read_csv(receipts_root / "segments" / segments[0]["name"]) == [
+        str(receipt.job_uuid) for receipt in first
+    ]
+    assert read_csv(receipts_root / "segments" / segments[1]["name"]) == [str(second[0].job_uuid)]
+    assert read_csv(receipts_root / "receipts.csv") == [
+        str(receipt.job_uuid) for receipt in [*first, *second]
+    ]
+    assert not JobStartedReceipt.objects.filter(served=False).exists()
+    assert not JobFinishedReceipt.objects.filter(served=False).exists()
+
+
+def test_clear_old_receipts__expires_segments(receipts_root):
+    with freeze_time(now() - datetime.timedelta(days=1, minutes=1)):
+        create_job_started_receipt()
+        prepare_receipts()
+    new = create_job_finished_receipt()
+    prepare_receipts()
+
+    clear_old_receipts()
+
+    segments = read_index(receipts_root)
+    assert len(segments) == 1
+    assert [path.name for path in (receipts_root / "segments").iterdir()] == [segments[0]["name"]]
+    assert read_csv(receipts_root / "receipts.csv") == [str(new.job_uuid)]
+
+
+def test_prepare_receipts__appends_to_receipts_csv(receipts_root, mocker):
+    first = create_job_started_receipt()
+    prepare_receipts()
+    write_full_file = mocker.spy(LocalReceiptStore, "_write_full_file")
+    second = create_job_finished_receipt()
+    prepare_receipts()
+
+    assert write_full_file.call_count == 0
+    assert read_csv(receipts_root / "receipts.csv") == [str(first.job_uuid), str(second.job_uuid)]
+
+    # rebuilt from the segments if missing
+    (receipts_root / "receipts.csv").unlink()
+    third = create_job_started_receipt()
+    prepare_receipts()
+
+    assert write_full_file.call_count == 1
+    assert read_csv(receipts_root / "receipts.csv") == [
+        str(receipt.job_uuid) for receipt in [first, second, third]
+    ]
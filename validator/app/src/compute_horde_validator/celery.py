@@ -19,6 +19,7 @@ def route_task(name, args, kwargs, options, task=None, **kw):
         "compute_horde_validator.validator.tasks.fetch_receipts_from_miner",
         "compute_horde_validator.validator.tasks.send_events_to_facilitator",
         "compute_horde_validator.validator.tasks.fetch_dynamic_config",
+        "compute_horde_validator.validator.tasks.fill_synthetic_job_reservoir",
     }
     if name in worker_queue_names:
         return {"queue": "worker"}
@@ -383,6 +383,11 @@ CELERY_BEAT_SCHEDULE = {  # type: ignore
         "schedule": timedelta(minutes=1),
         "options": {},
     },
+    "fill_synthetic_job_reservoir": {
+        "task": "compute_horde_validator.validator.tasks.fill_synthetic_job_reservoir",
+        "schedule": timedelta(minutes=5),
+        "options": {},
+    },
     "send_events_to_facilitator": {
         "task": "compute_horde_validator.validator.tasks.send_events_to_facilitator",
         "schedule": timedelta(minutes=5),
@@ -393,6 +398,11 @@ CELERY_BEAT_SCHEDULE = {  # type: ignore
         "schedule": timedelta(minutes=5),
         "options": {},
     },
+    "maintain_system_event_partitions": {
+        "task": "compute_horde_validator.validator.tasks.maintain_system_event_partitions",
+        "schedule": timedelta(hours=1),
+        "options": {},
+    },
 }
 if env.bool("DEBUG_RUN_BEAT_VERY_OFTEN", default=False):
     CELERY_BEAT_SCHEDULE["run_synthetic_jobs"]["schedule"] = crontab(minute="*")
@@ -509,6 +519,52 @@ DEBUG_OVERRIDE_DYNAMIC_NUMBER_OF_WORKLOADS_TO_TRIGGER_LOCAL_INFERENCE = env.int(
 # we start them from some offset because scheduling takes some time
 SYNTHETIC_JOBS_RUN_OFFSET = env.int("SYNTHETIC_JOBS_RUN_OFFSET", default=24)
 
+# the CPU heavy part of synthetic job generation is done in a pool of this many
+# processes, in chunks of this many jobs; 0 processes generates jobs in the worker process
+SYNTHETIC_JOBS_GENERATION_PROCESSES = env.int("SYNTHETIC_JOBS_GENERATION_PROCESSES", default=4)
+SYNTHETIC_JOBS_GENERATION_CHUNK_SIZE = env.int("SYNTHETIC_JOBS_GENERATION_CHUNK_SIZE", default=32)
+# jobs are generated ahead of time for the executor count of the last batch increased by this fraction
+SYNTHETIC_JOBS_RESERVOIR_MARGIN = env.float("SYNTHETIC_JOBS_RESERVOIR_MARGIN", default=0.2)
+# miner connections of a synthetic jobs batch are split across this many processes,
+# 1 runs the whole batch in the worker process
+SYNTHETIC_JOBS_BATCH_SHARDS = env.int("SYNTHETIC_JOBS_BATCH_SHARDS", default=1)
+# batch results are persisted in the background as they become known, in chunks of this many rows
+SYNTHETIC_JOBS_PERSIST_CHUNK_SIZE = env.int("SYNTHETIC_JOBS_PERSIST_CHUNK_SIZE", default=500)
+# receipts are fetched from this many miners at once, each within this many seconds
+RECEIPTS_FETCH_CONCURRENCY = env.int("RECEIPTS_FETCH_CONCURRENCY", default=64)
+RECEIPTS_FETCH_TIMEOUT = env.int("RECEIPTS_FETCH_TIMEOUT", default=60)
+# signatures of large batches of fetched receipts are verified in a pool of this many processes,
+# 0 verifies them in the worker process
+RECEIPTS_VERIFICATION_PROCESSES = env.int("RECEIPTS_VERIFICATION_PROCESSES", default=2)
+# connections to miners are kept open between organic jobs until unused for this many seconds
+ORGANIC_MINER_CONNECTION_IDLE_TIMEOUT = env.int(
+    "ORGANIC_MINER_CONNECTION_IDLE_TIMEOUT", default=300
+)
+# organic jobs from the facilitator are run at most this many at a time, and this many on one miner,
+# the ones over the limits are queued, the ones over the queue size are rejected
+ORGANIC_JOBS_MAX_IN_FLIGHT = env.int("ORGANIC_JOBS_MAX_IN_FLIGHT", default=256)
+ORGANIC_JOBS_MAX_PER_MINER = env.int("ORGANIC_JOBS_MAX_PER_MINER", default=32)
+ORGANIC_JOBS_MAX_QUEUED = env.int("ORGANIC_JOBS_MAX_QUEUED", default=1024)
+# messages to the facilitator are sent in batches of at most this many, queuing up to this many,
+# not counting the coalesced machine specs and heartbeats
+FACILITATOR_SEND_BATCH_SIZE = env.int("FACILITATOR_SEND_BATCH_SIZE", default=64)
+FACILITATOR_OUTBOX_SIZE = env.int("FACILITATOR_OUTBOX_SIZE", default=4096)
+# unchanged machine specs of the same executors are sent to the facilitator again after this many
+# seconds, with their current readings
+MACHINE_SPECS_RESEND_INTERVAL = env.int("MACHINE_SPECS_RESEND_INTERVAL", default=6 * 60 * 60)
+# system events are written with COPY, one statement per this many bytes of encoded events
+SYSTEM_EVENTS_COPY_FLUSH_BYTES = env.int("SYSTEM_EVENTS_COPY_FLUSH_BYTES", default=4 * 1024 * 1024)
+# system events are partitioned by day, partitions older than the retention are dropped
+SYSTEM_EVENTS_RETENTION_DAYS = env.int("SYSTEM_EVENTS_RETENTION_DAYS", default=30)
+SYSTEM_EVENTS_PARTITIONS_AHEAD_DAYS = env.int("SYSTEM_EVENTS_PARTITIONS_AHEAD_DAYS", default=7)
+# system events are sent to the stats collector in requests of at most this many events
+SYSTEM_EVENTS_SHIPPING_CHUNK_SIZE = env.int("SYSTEM_EVENTS_SHIPPING_CHUNK_SIZE", default=1000)
+# "gzip" to compress the requests to the stats collector, empty to send them uncompressed
+SYSTEM_EVENTS_SHIPPING_COMPRESSION = env.str("SYSTEM_EVENTS_SHIPPING_COMPRESSION", default="")
+# the `run_chain_view` process publishes the current block, block hashes and metagraph here
+CHAIN_VIEW_REDIS_URL = env.str("CHAIN_VIEW_REDIS_URL", default=CELERY_BROKER_URL)
+CHAIN_VIEW_METAGRAPH_REFRESH_BLOCKS = env.int("CHAIN_VIEW_METAGRAPH_REFRESH_BLOCKS", default=10)
+
 PROMPT_JOB_GENERATOR = env.str(
     "PROMPT_JOB_GENERATOR",
     default="compute_horde_validator.validator.cross_validation.generator.v0:PromptJobGenerator",
@@ -1,5 +1,7 @@
 import logging
 
+from compute_horde.tracing import observe_span_durations, tracer
+from constance.signals import config_updated
 from django.apps import AppConfig
 from django.conf import settings
 from django.db.models.signals import post_migrate
@@ -27,8 +29,24 @@ def maybe_create_default_admin(sender, **kwargs):
             )
 
 
+def discard_stale_prepared_synthetic_jobs(sender, key, old_value, new_value, **kwargs):
+    from compute_horde_validator.validator.synthetic_jobs.reservoir import discard_stale_jobs
+
+    if (
+        key == "DYNAMIC_WEIGHTS_VERSION"
+        and old_value != new_value
+        and settings.DEBUG_OVERRIDE_WEIGHTS_VERSION is None
+    ):
+        discard_stale_jobs(new_value)
+
+
 class ValidatorConfig(AppConfig):
     name = "compute_horde_validator.validator"
 
     def ready(self):
         post_migrate.connect(maybe_create_default_admin, sender=self)
+        config_updated.connect(discard_stale_prepared_synthetic_jobs)
+
+        from .metrics import VALIDATOR_SPAN_DURATION
+
+        tracer.add_listener(observe_span_durations(VALIDATOR_SPAN_DURATION))
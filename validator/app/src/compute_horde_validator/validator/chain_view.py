@@ -0,0 +1,233 @@
+import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from math import ceil
+
+import bittensor
+import redis
+from constance import config
+from django.conf import settings
+
+from compute_horde_validator.validator.metagraph_snapshot import MetagraphSnapshot
+
+logger = logging.getLogger(__name__)
+
+# how long the published values are trusted, the block expires soon after the chain view stops
+# following the chain, so that readers don't act on a stale one
+BLOCK_TTL_BLOCKS = 3
+BLOCK_HASH_TTL = timedelta(hours=6)
+METAGRAPH_TTL = timedelta(minutes=10)
+# a snapshot fetched by a reader when none was published is shared for this long
+FETCHED_SNAPSHOT_TTL = timedelta(minutes=5)
+RECONNECT_DELAY = timedelta(seconds=5)
+
+_redis: redis.Redis | None = None
+
+
+def get_redis() -> redis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis.from_url(settings.CHAIN_VIEW_REDIS_URL, socket_timeout=5)
+    return _redis
+
+
+def _key(name: str) -> str:
+    return f"chain_view:{settings.BITTENSOR_NETWORK}:{settings.BITTENSOR_NETUID}:{name}"
+
+
+def _block_ttl() -> timedelta:
+    return settings.BITTENSOR_APPROXIMATE_BLOCK_DURATION * BLOCK_TTL_BLOCKS
+
+
+class ChainViewPublisher:
+    """
+    Follows the new block headers over a single subtensor connection, and publishes the current
+    block, the final block hashes and, every `metagraph_refresh_blocks` blocks, the metagraph
+    to Redis.
+    Every new block is also announced on a pub/sub channel, for `ChainView.wait_for_block`.
+    """
+
+    def __init__(
+        self,
+        subtensor_factory: Callable[[], bittensor.subtensor],
+        redis_client: redis.Redis | None = None,
+        metagraph_refresh_blocks: int | None = None,
+    ):
+        self.subtensor_factory = subtensor_factory
+        self.subtensor: bittensor.subtensor | None = None
+        self.redis = redis_client or get_redis()
+        self.metagraph_refresh_blocks = (
+            metagraph_refresh_blocks or settings.CHAIN_VIEW_METAGRAPH_REFRESH_BLOCKS
+        )
+        self.metagraph_block: int | None = None
+
+    def publish_block(self, block: int) -> None:
+        pipeline = self.redis.pipeline()
+        pipeline.set(_key("block"), block, ex=_block_ttl())
+        pipeline.publish(_key("blocks"), block)
+        pipeline.execute()
+
+    def publish_block_hash(self, block: int, block_hash: str) -> None:
+        self.redis.set(_key(f"block_hash:{block}"), block_hash, ex=BLOCK_HASH_TTL)
+
+    def publish_metagraph(self, block: int) -> None:
+        assert self.subtensor is not None
+        metagraph = self.subtensor.metagraph(netuid=settings.BITTENSOR_NETUID)
+        snapshot = MetagraphSnapshot.from_metagraph(metagraph)
+        self.redis.set(_key("metagraph_snapshot"), snapshot.to_bytes(), ex=METAGRAPH_TTL)
+        self.metagraph_block = block
+
+    def on_block(self, block: int) -> None:
+        assert self.subtensor is not None
+        # only hashes of final blocks, a newer one could still be replaced by another fork - and
+        # they seed the synthetic jobs schedules all the validators must agree on
+        final_block = block - config.DYNAMIC_BLOCK_FINALIZATION_NUMBER
+        self.publish_block_hash(final_block, self.subtensor.get_block_hash(final_block))
+        self.publish_block(block)
+        if (
+            self.metagraph_block is None
+            or block - self.metagraph_block >= self.metagraph_refresh_blocks
+        ):
+            try:
+                self.publish_metagraph(block)
+            except Exception:
+                # the previous one expires in time if this keeps failing
+                logger.warning("Failed to refresh metagraph at block %s", block, exc_info=True)
+
+    def _handle_header(self, header: dict, update_nr: int, subscription_id: str) -> None:
+        self.on_block(header["header"]["number"])
+
+    def run(self) -> None:
+        """Follow the chain until the connection fails"""
+        self.subtensor = self.subtensor_factory()
+        self.on_block(self.subtensor.get_current_block())
+        self.subtensor.substrate.subscribe_block_headers(self._handle_header)
+
+    def run_forever(self) -> None:
+        while True:
+            try:
+                self.run()
+            except Exception:
+                logger.warning("Chain view lost the chain, reconnecting", exc_info=True)
+            self.subtensor = None
+            time.sleep(RECONNECT_DELAY.total_seconds())
+
+
+class ChainView:
+    """
+    What `ChainViewPublisher` keeps in Redis, falling back to asking the chain over a subtensor
+    connection of its own when it's not there - the publisher isn't running, doesn't keep up,
+    or Redis is unavailable. Reads like the few subtensor methods the tasks use.
+    """
+
+    def __init__(
+        self,
+        subtensor_factory: Callable[[], bittensor.subtensor],
+        redis_client: redis.Redis | None = None,
+    ):
+        self._subtensor_factory = subtensor_factory
+        self._subtensor: bittensor.subtensor | None = None
+        self.redis = redis_client or get_redis()
+
+    @property
+    def subtensor(self) -> bittensor.subtensor:
+        """Connected on first use only"""
+        if self._subtensor is None:
+            self._subtensor = self._subtensor_factory()
+        return self._subtensor
+
+    def _get(self, name: str) -> bytes | None:
+        try:
+            return self.redis.get(_key(name))
+        except redis.RedisError as exc:
+            logger.warning("Chain view unavailable: %r", exc)
+            return None
+
+    def _get_block(self) -> int | None:
+        block = self._get("block")
+        return None if block is None else int(block)
+
+    def get_current_block(self) -> int:
+        block = self._get_block()
+        if block is not None:
+            return block
+        return self.subtensor.get_current_block()
+
+    def get_block_hash(self, block_id: int) -> str:
+        block_hash = self._get(f"block_hash:{block_id}")
+        if block_hash is not None:
+            return block_hash.decode()
+        return self.subtensor.get_block_hash(block_id)
+
+    def metagraph(self, netuid: int) -> MetagraphSnapshot:
+        if netuid == settings.BITTENSOR_NETUID:
+            return self.metagraph_snapshot()
+        return MetagraphSnapshot.from_metagraph(self.subtensor.metagraph(netuid=netuid))
+
+    def metagraph_snapshot(self) -> MetagraphSnapshot:
+        """
+        Snapshot of the metagraph of this subnet. One fetched from the chain is shared with the
+        other processes until the next one is published.
+        """
+        blob = self._get("metagraph_snapshot")
+        if blob is not None:
+            return MetagraphSnapshot.from_bytes(blob)
+
+        snapshot = MetagraphSnapshot.from_metagraph(
+            self.subtensor.metagraph(netuid=settings.BITTENSOR_NETUID)
+        )
+        try:
+            self.redis.set(
+                _key("metagraph_snapshot"), snapshot.to_bytes(), ex=FETCHED_SNAPSHOT_TTL, nx=True
+            )
+        except redis.RedisError as exc:
+            logger.warning("Chain view unavailable: %r", exc)
+        return snapshot
+
+    def wait_for_block(
+        self, target_block: int, timeout: timedelta, poll_interval: timedelta
+    ) -> int:
+        """
+        Wait until the chain reaches `target_block` and return the current block, which is below
+        `target_block` if it wasn't reached in `timeout`. Woken up by the publisher on every new
+        block, or polling the chain every `poll_interval` if the publisher isn't there.
+        """
+        deadline = time.monotonic() + timeout.total_seconds()
+        try:
+            with self.redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                # subscribed before reading the current block, not to miss the next one
+                pubsub.subscribe(_key("blocks"))
+                current_block = self._get_block()
+                while current_block is not None and current_block < target_block:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return current_block
+                    message = pubsub.get_message(
+                        timeout=min(remaining, _block_ttl().total_seconds())
+                    )
+                    if message is None:
+                        # no news for a while - the block expires if the publisher is gone
+                        current_block = self._get_block()
+                    else:
+                        current_block = int(message["data"])
+                if current_block is not None:
+                    return current_block
+        except redis.RedisError as exc:
+            logger.warning("Chain view unavailable: %r", exc)
+
+        current_block = None
+        for _ in range(ceil(max(deadline - time.monotonic(), 0) / poll_interval.total_seconds())):
+            current_block = self.subtensor.get_current_block()
+            if current_block >= target_block:
+                return current_block
+            logger.debug(
+                "Waiting for block %s, current block is %s, sleeping for %s",
+                target_block,
+                current_block,
+                poll_interval,
+            )
+            time.sleep(poll_interval.total_seconds())
+        if current_block is None:
+            current_block = self.subtensor.get_current_block()
+        return current_block
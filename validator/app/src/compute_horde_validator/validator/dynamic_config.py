@@ -55,6 +55,12 @@ async def aget_weights_version():
     return await aget_config("DYNAMIC_WEIGHTS_VERSION")
 
 
+def get_weights_version():
+    if settings.DEBUG_OVERRIDE_WEIGHTS_VERSION is not None:
+        return settings.DEBUG_OVERRIDE_WEIGHTS_VERSION
+    return config.DYNAMIC_WEIGHTS_VERSION
+
+
 # this is called from a sync context, and rarely, so we don't need caching
 def get_synthetic_jobs_flow_version():
     if settings.DEBUG_OVERRIDE_SYNTHETIC_JOBS_FLOW_VERSION is not None:
@@ -0,0 +1,121 @@
+import gzip
+import json
+import logging
+import time
+
+import bittensor
+import requests
+from django.conf import settings
+
+from compute_horde_validator.validator.metrics import (
+    VALIDATOR_SYSTEM_EVENTS_BACKLOG,
+    VALIDATOR_SYSTEM_EVENTS_SHIPPED,
+    VALIDATOR_SYSTEM_EVENTS_SHIPPED_BYTES,
+)
+from compute_horde_validator.validator.models import SystemEvent
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIONS = ("", "gzip")
+REQUEST_TIMEOUT = 30
+
+_session: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+    """Session kept for the lifetime of the worker process, reusing the collector connection"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
+class SystemEventShipper:
+    """
+    Sends the unsent SystemEvents to the stats collector, in chunks of `chunk_size` events
+    paged by id, one request per chunk. After each chunk the collector accepted, exactly the
+    events of that chunk are marked as sent, so a failure stops the shipping without losing the
+    progress made, and the next run resumes from the first event that was not acknowledged.
+    """
+
+    def __init__(
+        self,
+        keypair: bittensor.Keypair,
+        using: str = "default",
+        chunk_size: int | None = None,
+        compression: str | None = None,
+    ):
+        self.keypair = keypair
+        self.using = using
+        self.chunk_size = chunk_size or settings.SYSTEM_EVENTS_SHIPPING_CHUNK_SIZE
+        self.compression = (
+            settings.SYSTEM_EVENTS_SHIPPING_COMPRESSION if compression is None else compression
+        )
+        assert self.compression in COMPRESSIONS, self.compression
+        self.url = settings.STATS_COLLECTOR_URL + f"validator/{keypair.ss58_address}/system_events"
+        self.sent_count = 0
+
+    def _unsent(self):
+        # served by the partial index on unsent events, regardless of the size of the history
+        return SystemEvent.objects.using(self.using).filter(sent=False)
+
+    def _headers(self) -> dict[str, str]:
+        signing_timestamp = int(time.time())
+        to_sign = json.dumps(
+            {
+                "signing_timestamp": signing_timestamp,
+                "validator_ss58_address": self.keypair.ss58_address,
+            },
+            sort_keys=True,
+        )
+        headers = {
+            "Content-Type": "application/json",
+            "Validator-Signature": f"0x{self.keypair.sign(to_sign).hex()}",
+            "Validator-Signing-Timestamp": str(signing_timestamp),
+        }
+        if self.compression:
+            headers["Content-Encoding"] = self.compression
+        return headers
+
+    def _encode(self, events: list[SystemEvent]) -> bytes:
+        body = json.dumps([event.to_dict() for event in events]).encode()
+        if self.compression == "gzip":
+            body = gzip.compress(body, compresslevel=5)
+        return body
+
+    def _send_chunk(self, events: list[SystemEvent]) -> bool:
+        body = self._encode(events)
+        try:
+            response = _get_session().post(
+                self.url, data=body, headers=self._headers(), timeout=REQUEST_TIMEOUT
+            )
+        except requests.RequestException as exc:
+            logger.error("Failed to send system events to facilitator: %r", exc)
+            return False
+        if response.status_code != 201:
+            logger.error(f"Failed to send system events to facilitator: {response}")
+            return False
+
+        # only the events of this chunk, not the ones created in the meantime
+        self._unsent().filter(id__in=[event.id for event in events]).update(sent=True)
+        VALIDATOR_SYSTEM_EVENTS_SHIPPED.inc(len(events))
+        VALIDATOR_SYSTEM_EVENTS_SHIPPED_BYTES.inc(len(body))
+        return True
+
+    def ship(self) -> int:
+        """Send the unsent events chunk by chunk, returns how many were sent"""
+        last_id = None
+        while True:
+            unsent = self._unsent()
+            if last_id is not None:
+                unsent = unsent.filter(id__gt=last_id)
+            events = list(unsent.order_by("id")[: self.chunk_size])
+            if not events or not self._send_chunk(events):
+                break
+            self.sent_count += len(events)
+            last_id = events[-1].id
+
+        VALIDATOR_SYSTEM_EVENTS_BACKLOG.set(self._unsent().count())
+        if self.sent_count:
+            logger.info(f"Sent {self.sent_count} system events to facilitator")
+        return self.sent_count
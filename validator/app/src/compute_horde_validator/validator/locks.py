@@ -1,9 +1,13 @@
+import contextlib
+
 from django.db import connection
 
 
 class LockType:
     WEIGHT_SETTING = 1
     VALIDATION_SCHEDULING = 2
+    SYNTHETIC_JOB_RESERVOIR = 3
+    SYSTEM_EVENT_SHIPPING = 4
 
 
 class Locked(Exception):
@@ -21,3 +25,19 @@ def get_advisory_lock(type_: LockType) -> None:
     unlocked = cursor.fetchall()[0][0]
     if not unlocked:
         raise Locked
+
+
+@contextlib.contextmanager
+def session_advisory_lock(type_: LockType):
+    """
+    Hold postgres advisory lock for the duration of the context, independently of transactions - so
+    the work done under it can be committed piece by piece. Throws `Locked` if not able to obtain the lock.
+    """
+    cursor = connection.cursor()
+    cursor.execute("SELECT pg_try_advisory_lock(%s)", [type_])
+    if not cursor.fetchall()[0][0]:
+        raise Locked
+    try:
+        yield
+    finally:
+        cursor.execute("SELECT pg_advisory_unlock(%s)", [type_])
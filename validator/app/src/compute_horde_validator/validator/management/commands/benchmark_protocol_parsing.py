@@ -0,0 +1,232 @@
+import datetime
+import functools
+import json
+import time
+
+import pydantic
+from compute_horde.base.output_upload import ZipAndHttpPutUpload
+from compute_horde.base.volume import InlineVolume, VolumeType
+from compute_horde.base_requests import BaseRequest
+from compute_horde.em_protocol import executor_requests as em_executor
+from compute_horde.em_protocol import miner_requests as em_miner
+from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
+from compute_horde.mv_protocol import miner_requests as mv_miner
+from compute_horde.mv_protocol import validator_requests as mv_validator
+from compute_horde.tracing import TraceContext
+from compute_horde.utils import MachineSpecs
+from django.core.management.base import BaseCommand, CommandError
+
+from compute_horde_validator.validator.organic_jobs.facilitator_api import (
+    JobRequest,
+    Response,
+    V0FacilitatorJobRequest,
+    V1FacilitatorJobRequest,
+    facilitator_message_adapter,
+)
+
+JOB_UUID = "b4793a02-33a2-4a49-b4e2-4a7b903847e7"
+TRACE_CONTEXT = TraceContext(trace_id="0" * 32, span_id="0" * 16)
+SPECS = MachineSpecs(
+    specs={
+        "gpu": {
+            "count": 1,
+            "details": [{"name": "NVIDIA A100", "capacity": "81920", "uuid": "GPU-1"}],
+        },
+        "cpu": {"count": 32, "model": "AMD EPYC", "clocks": [3000.0] * 32},
+        "ram": {"total": 1000, "free": 100, "available": 100, "used": 900},
+        "os": "Ubuntu 22.04",
+    }
+)
+STDOUT = "some output\n" * 100
+
+
+def _sample_messages() -> dict[type[BaseRequest], list[BaseRequest]]:
+    """Messages of each type of the miner-validator and executor-miner protocols"""
+    receipt = {
+        "job_uuid": JOB_UUID,
+        "miner_hotkey": "miner_hotkey",
+        "validator_hotkey": "validator_hotkey",
+    }
+    job = {
+        "job_uuid": JOB_UUID,
+        "docker_image_name": "backenddevelopersltd/compute-horde-job:v0-latest",
+        "docker_run_options_preset": "nvidia_all",
+        "docker_run_cmd": ["--seed", "1234"],
+        "volume": InlineVolume(contents="UEsFBgAAAAAAAAAAAAAAAAAAAAAAAA=="),
+        "output_upload": ZipAndHttpPutUpload(url="http://localhost/output"),
+        "trace_context": TRACE_CONTEXT,
+    }
+    failure = {"docker_process_stdout": STDOUT, "docker_process_stderr": STDOUT}
+    return {
+        mv_miner.BaseMinerRequest: [
+            mv_miner.V0AcceptJobRequest(job_uuid=JOB_UUID),
+            mv_miner.V0DeclineJobRequest(job_uuid=JOB_UUID),
+            mv_miner.V0ExecutorReadyRequest(job_uuid=JOB_UUID),
+            mv_miner.V0ExecutorFailedRequest(job_uuid=JOB_UUID),
+            mv_miner.V0JobFailedRequest(job_uuid=JOB_UUID, docker_process_exit_status=1, **failure),
+            mv_miner.V0JobFinishedRequest(job_uuid=JOB_UUID, **failure),
+            mv_miner.V0MachineSpecsRequest(job_uuid=JOB_UUID, specs=SPECS),
+            mv_miner.V0ExecutorManifestRequest(
+                manifest=mv_miner.ExecutorManifest(
+                    executor_classes=[
+                        mv_miner.ExecutorClassManifest(
+                            executor_class=DEFAULT_EXECUTOR_CLASS, count=8
+                        )
+                    ]
+                )
+            ),
+            mv_miner.GenericError(details="error"),
+            mv_miner.UnauthorizedError(code=mv_miner.UnauthorizedErrorType.TOKEN_TOO_OLD),
+        ],
+        mv_validator.BaseValidatorRequest: [
+            mv_validator.V0AuthenticateRequest(
+                payload=mv_validator.AuthenticationPayload(
+                    validator_hotkey="validator_hotkey", miner_hotkey="miner_hotkey", timestamp=1
+                ),
+                signature="0x" + "00" * 64,
+            ),
+            mv_validator.V0InitialJobRequest(
+                job_uuid=JOB_UUID,
+                executor_class=DEFAULT_EXECUTOR_CLASS,
+                base_docker_image_name="backenddevelopersltd/compute-horde-job:v0-latest",
+                timeout_seconds=60,
+                volume_type=VolumeType.inline,
+                trace_context=TRACE_CONTEXT,
+            ),
+            mv_validator.V0JobRequest(executor_class=DEFAULT_EXECUTOR_CLASS, **job),
+            mv_validator.V0MachineSpecsRequest(job_uuid=JOB_UUID, specs=SPECS),
+            mv_validator.GenericError(details="error"),
+            mv_validator.V0JobFinishedReceiptRequest(
+                payload=mv_validator.JobFinishedReceiptPayload(
+                    **receipt,
+                    time_started=datetime.datetime(2024, 9, 20, tzinfo=datetime.UTC),
+                    time_took_us=30_000_000,
+                    score_str="1.0",
+                ),
+                signature="0x" + "00" * 64,
+            ),
+            mv_validator.V0JobStartedReceiptRequest(
+                payload=mv_validator.JobStartedReceiptPayload(
+                    **receipt,
+                    executor_class=DEFAULT_EXECUTOR_CLASS,
+                    time_accepted=datetime.datetime(2024, 9, 20, tzinfo=datetime.UTC),
+                    max_timeout=60,
+                ),
+                signature="0x" + "00" * 64,
+            ),
+        ],
+        em_miner.BaseMinerRequest: [
+            em_miner.V0InitialJobRequest(
+                job_uuid=JOB_UUID,
+                base_docker_image_name="backenddevelopersltd/compute-horde-job:v0-latest",
+                timeout_seconds=60,
+                volume_type=VolumeType.inline,
+                trace_context=TRACE_CONTEXT,
+            ),
+            em_miner.V0JobRequest(**job),
+            em_miner.GenericError(details="error"),
+        ],
+        em_executor.BaseExecutorRequest: [
+            em_executor.V0ReadyRequest(job_uuid=JOB_UUID),
+            em_executor.V0FailedToPrepare(job_uuid=JOB_UUID),
+            em_executor.V0FailedRequest(
+                job_uuid=JOB_UUID, docker_process_exit_status=1, timeout=False, **failure
+            ),
+            em_executor.V0MachineSpecsRequest(job_uuid=JOB_UUID, specs=SPECS),
+            em_executor.V0FinishedRequest(job_uuid=JOB_UUID, **failure),
+            em_executor.GenericError(details="error"),
+        ],
+    }
+
+
+def _facilitator_messages() -> list[pydantic.BaseModel]:
+    job = {
+        "uuid": JOB_UUID,
+        "miner_hotkey": "miner_hotkey",
+        "docker_image": "backenddevelopersltd/compute-horde-job:v0-latest",
+        "raw_script": "",
+        "args": ["--seed", "1234"],
+        "env": {"KEY": "value"},
+        "use_gpu": True,
+    }
+    return [
+        Response(status="success"),
+        V0FacilitatorJobRequest(
+            **job, input_url="http://localhost/input", output_url="http://localhost/output"
+        ),
+        V1FacilitatorJobRequest(
+            **job,
+            volume=InlineVolume(contents="UEsFBgAAAAAAAAAAAAAAAAAAAAAAAA=="),
+            output_upload=ZipAndHttpPutUpload(url="http://localhost/output"),
+        ),
+    ]
+
+
+def parse_twice(base_class: type[BaseRequest], raw: str) -> BaseRequest:
+    """How messages were parsed before, validating them against the base class first"""
+    json_ = json.loads(raw)
+    message_type = base_class.model_validate(json_).message_type
+    return base_class.type_to_model(message_type).model_validate(json_)
+
+
+def parse_facilitator_message_by_trial(raw: str) -> pydantic.BaseModel:
+    """How facilitator messages were parsed before, trying one model after another"""
+    try:
+        return Response.model_validate_json(raw)
+    except pydantic.ValidationError:
+        return pydantic.TypeAdapter(JobRequest).validate_json(raw)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure how long parsing a message of each type of the miner, executor and facilitator "
+        "protocols takes, compared to how they were parsed before."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations", type=int, default=10_000, help="number of times to parse each message"
+        )
+
+    def _measure(self, parse, raw: str, iterations: int) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            parse(raw)
+        return (time.perf_counter() - start) / iterations
+
+    def _report(self, name: str, reference: float, duration: float):
+        self.stdout.write(
+            f"{name:<60} {reference * 1e6:>10.2f} us {duration * 1e6:>10.2f} us"
+            f" {reference / duration:>6.2f}x"
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        self.stdout.write(f"{'message':<60} {'before':>13} {'now':>13}")
+
+        for base_class, messages in _sample_messages().items():
+            missing = set(dict(base_class.models_by_type()).values()) - {
+                type(msg) for msg in messages
+            }
+            if missing:
+                raise CommandError(f"No sample of {', '.join(m.__name__ for m in missing)}")
+
+            for msg in messages:
+                raw = msg.model_dump_json()
+                if base_class.parse(raw) != parse_twice(base_class, raw):
+                    raise CommandError(f"{type(msg).__name__} parsed differently")
+                self._report(
+                    f"{type(msg).__module__.split('.', 1)[1]}.{type(msg).__name__}",
+                    self._measure(functools.partial(parse_twice, base_class), raw, iterations),
+                    self._measure(base_class.parse, raw, iterations),
+                )
+
+        for msg in _facilitator_messages():
+            raw = msg.model_dump_json()
+            if facilitator_message_adapter.validate_json(raw) != msg:
+                raise CommandError(f"{type(msg).__name__} parsed differently")
+            self._report(
+                f"facilitator.{type(msg).__name__}",
+                self._measure(parse_facilitator_message_by_trial, raw, iterations),
+                self._measure(facilitator_message_adapter.validate_json, raw, iterations),
+            )
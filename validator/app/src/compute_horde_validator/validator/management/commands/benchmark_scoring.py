@@ -0,0 +1,78 @@
+import random
+import time
+
+from compute_horde.executor_class import ExecutorClass
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils.timezone import now
+
+from compute_horde_validator.validator.models import Miner, SyntheticJob, SyntheticJobBatch
+from compute_horde_validator.validator.scoring import (
+    rebuild_batch_scores,
+    score_batch,
+    score_batches,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure how long scoring a batch takes, job by job and from the miner batch scores. "
+        "The batch is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=100_000, help="number of jobs in the batch")
+        parser.add_argument("--miners", type=int, default=256, help="number of miners")
+        parser.add_argument(
+            "--skip-reference", action="store_true", help="only measure the vectorized scoring"
+        )
+
+    def _report(self, name: str, duration: float):
+        self.stdout.write(f"{name:<40} {duration:>10.3f} s")
+
+    def _create_batch(self, jobs: int, miners: int) -> SyntheticJobBatch:
+        rng = random.Random(0)
+        batch = SyntheticJobBatch.objects.create(accepting_results_until=now())
+        miner_objs = Miner.objects.bulk_create(
+            [Miner(hotkey=f"benchmark_miner_{i}") for i in range(miners)]
+        )
+        SyntheticJob.objects.bulk_create(
+            [
+                SyntheticJob(
+                    batch=batch,
+                    miner=rng.choice(miner_objs),
+                    miner_address="127.0.0.1",
+                    miner_address_ip_version=4,
+                    miner_port=8000,
+                    status=SyntheticJob.Status.COMPLETED,
+                    executor_class=ExecutorClass.spin_up_4min__gpu_24gb,
+                    score=rng.uniform(0, 2),
+                )
+                for _ in range(jobs)
+            ],
+            batch_size=5000,
+        )
+        return batch
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            batch = self._create_batch(options["jobs"], options["miners"])
+            # in a batch run, these are written along the jobs
+            start = time.monotonic()
+            rebuild_batch_scores([batch.id])
+            self._report("rebuilding miner batch scores", time.monotonic() - start)
+
+            if not options["skip_reference"]:
+                start = time.monotonic()
+                reference = score_batch(batch)
+                self._report("job by job", time.monotonic() - start)
+
+            start = time.monotonic()
+            scores = score_batches([batch])
+            self._report("from miner batch scores", time.monotonic() - start)
+
+            if not options["skip_reference"]:
+                max_diff = max(abs(scores[hotkey] - reference[hotkey]) for hotkey in reference)
+                self.stdout.write(f"max score difference: {max_diff:.3g}")
+
+            transaction.set_rollback(True)
@@ -0,0 +1,51 @@
+import random
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from compute_horde_validator.validator.synthetic_jobs.generator.gpu_hashcat import (
+    generate_hash_jobs,
+)
+from compute_horde_validator.validator.synthetic_jobs.synthetic_job import (
+    HASHJOB_PARAMS,
+    Algorithm,
+)
+from compute_horde_validator.validator.synthetic_jobs.v1_synthetic_job import V1SyntheticJob
+from compute_horde_validator.validator.utils import single_file_zip
+
+
+class Command(BaseCommand):
+    help = "Measure how many synthetic jobs per second can be generated in a single process"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=1000, help="number of jobs to generate")
+        parser.add_argument("--weights-version", type=int, default=3)
+
+    def _report(self, name: str, jobs: int, duration: float):
+        self.stdout.write(f"{name:<40} {jobs / duration:>10.1f} jobs/s")
+
+    def handle(self, *args, **options):
+        jobs = options["jobs"]
+        weights_version = options["weights_version"]
+        algorithms = Algorithm.get_all_algorithms()
+        params = [HASHJOB_PARAMS[weights_version][algorithm] for algorithm in algorithms]
+
+        start = time.monotonic()
+        for _ in range(jobs):
+            V1SyntheticJob.generate(algorithms, params)
+        self._report("passwords, one job at a time", jobs, time.monotonic() - start)
+
+        start = time.monotonic()
+        V1SyntheticJob.generate_many(jobs, algorithms, params, rng=np.random.default_rng())
+        self._report("passwords, generate_many", jobs, time.monotonic() - start)
+
+        start = time.monotonic()
+        for _ in range(jobs):
+            hash_job = V1SyntheticJob.generate(algorithms, params)
+            _ = hash_job.answer, single_file_zip("payload.txt", hash_job.payload)
+        self._report("full jobs, one job at a time", jobs, time.monotonic() - start)
+
+        start = time.monotonic()
+        generate_hash_jobs(weights_version, random.getrandbits(64), jobs)
+        self._report("full jobs, generate_hash_jobs", jobs, time.monotonic() - start)
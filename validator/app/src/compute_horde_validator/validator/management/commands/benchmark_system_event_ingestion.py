@@ -0,0 +1,71 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from compute_horde_validator.validator.event_sink import SystemEventSink
+from compute_horde_validator.validator.models import SystemEvent
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure how many job telemetry system events per second can be inserted, "
+        "with bulk_create and with COPY. The events are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=10000, help="number of events to insert")
+
+    def _report(self, name: str, events: int, duration: float):
+        self.stdout.write(f"{name:<40} {events / duration:>10.1f} events/s")
+
+    def _events(self, count: int) -> list[SystemEvent]:
+        # shaped like the per job telemetry of a synthetic jobs batch
+        batch_uuid = str(uuid.uuid4())
+        return [
+            SystemEvent(
+                type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+                subtype=SystemEvent.EventSubType.SYNTHETIC_JOB,
+                long_description="job telemetry",
+                data={
+                    "batch_uuid": batch_uuid,
+                    "job_uuid": str(uuid.uuid4()),
+                    "miner_hotkey": f"miner_{i}",
+                    "executor_class": "spin_up-4min.gpu-24gb",
+                    "docker_image_name": "backenddevelopersltd/compute-horde-job:v0-latest",
+                    "timeout_seconds": 60,
+                    "volume_contents_size": 200_000,
+                    "accept_barrier_time": "2024-09-01T00:00:00+00:00",
+                    "accept_send_lateness": 0.0004,
+                    "accept_response": {"message_type": "V0AcceptJobRequest"},
+                    "time_took": 12.5,
+                    "success": True,
+                    "comment": "ok",
+                    "score": 1.0,
+                },
+            )
+            for i in range(count)
+        ]
+
+    def _measure(self, name: str, events: list[SystemEvent], insert):
+        with transaction.atomic():
+            start = time.monotonic()
+            insert(events)
+            self._report(name, len(events), time.monotonic() - start)
+            transaction.set_rollback(True)
+
+    def handle(self, *args, **options):
+        count = options["events"]
+
+        self._measure(
+            "bulk_create",
+            self._events(count),
+            lambda events: SystemEvent.objects.bulk_create(events, ignore_conflicts=True),
+        )
+
+        def copy(events: list[SystemEvent]):
+            with SystemEventSink() as sink:
+                sink.extend(events)
+
+        self._measure("COPY", self._events(count), copy)
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from ...system_event_partitions import (
+    create_partitions,
+    drop_expired_partitions,
+    get_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = "Create the upcoming daily system event partitions and drop the expired ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days-ahead", type=int, default=settings.SYSTEM_EVENTS_PARTITIONS_AHEAD_DAYS
+        )
+        parser.add_argument(
+            "--retention-days", type=int, default=settings.SYSTEM_EVENTS_RETENTION_DAYS
+        )
+        parser.add_argument("--list", action="store_true", help="only list the existing partitions")
+
+    def handle(self, *args, **options):
+        if not options["list"]:
+            for name in create_partitions(options["days_ahead"]):
+                self.stdout.write(f"created {name}")
+            for name in drop_expired_partitions(options["retention_days"]):
+                self.stdout.write(f"dropped {name}")
+
+        for partition in get_partitions():
+            if partition.is_default:
+                bounds = "DEFAULT"
+            else:
+                bounds = f"{partition.start or 'MINVALUE'} - {partition.end or 'MAXVALUE'}"
+            self.stdout.write(f"{partition.name:<40} {bounds}")
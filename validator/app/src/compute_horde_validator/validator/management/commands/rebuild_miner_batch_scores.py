@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.utils.timezone import now
+
+from compute_horde_validator.validator.models import SyntheticJobBatch
+from compute_horde_validator.validator.scoring import check_batch_scores, rebuild_batch_scores
+
+
+class Command(BaseCommand):
+    help = "Recompute the miner batch scores used for setting weights from the synthetic jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-id", type=int, action="append", help="batch to rebuild, can be repeated"
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=1,
+            help="rebuild the batches started in this many last days, unless --batch-id is given",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="only report the differences between the stored and recomputed scores",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_id"]:
+            batch_ids = options["batch_id"]
+        else:
+            batch_ids = list(
+                SyntheticJobBatch.objects.filter(
+                    started_at__gte=now() - timedelta(days=options["days"])
+                ).values_list("id", flat=True)
+            )
+
+        if options["check"]:
+            differences = check_batch_scores(batch_ids)
+            for difference in differences:
+                self.stdout.write(difference)
+            self.stdout.write(f"{len(batch_ids)} batches checked, {len(differences)} differences")
+        else:
+            count = rebuild_batch_scores(batch_ids)
+            self.stdout.write(f"{len(batch_ids)} batches rebuilt, {count} miner batch scores")
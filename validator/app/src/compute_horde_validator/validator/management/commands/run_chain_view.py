@@ -0,0 +1,18 @@
+import bittensor
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from compute_horde_validator.validator.chain_view import ChainViewPublisher
+
+
+class Command(BaseCommand):
+    help = (
+        "Follow the chain and publish the current block, block hashes and metagraph to Redis, "
+        "for the other processes to read instead of connecting to the chain on their own"
+    )
+
+    def handle(self, *args, **options):
+        bittensor.turn_console_off()
+        ChainViewPublisher(
+            lambda: bittensor.subtensor(network=settings.BITTENSOR_NETWORK)
+        ).run_forever()
@@ -0,0 +1,250 @@
+import dataclasses
+import itertools
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import bittensor
+import numpy as np
+from constance import config
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from compute_horde_validator.validator.dynamic_config import get_weights_version
+from compute_horde_validator.validator.models import MinerManifest, SyntheticJobBatch
+from compute_horde_validator.validator.scoring import (
+    EXECUTOR_CLASS_WEIGHTS,
+    Hordes,
+    aggregate_batch_scores,
+    load_hordes,
+    score_hordes,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class ParameterSet:
+    avg_param: float
+    size_param: float
+    central_size_param: float
+    manifest_multiplier: float
+
+    def __str__(self):
+        return (
+            f"avg={self.avg_param:g} size={self.size_param:g} "
+            f"central={self.central_size_param:g} multiplier={self.manifest_multiplier:g}"
+        )
+
+
+@dataclasses.dataclass
+class Simulation:
+    """Everything needed to score the loaded batches under a parameter set"""
+
+    hordes: Hordes
+    # whether each horde got the manifest multiplier of the current config
+    dancing: np.ndarray
+    current_multiplier: float
+    executor_class_weights: dict
+    # uid of each miner of `hordes`, -1 if not in the metagraph
+    miner_uids: np.ndarray
+    neuron_count: int
+
+    def weights(self, parameter_set: ParameterSet) -> np.ndarray:
+        multipliers = np.where(
+            self.dancing, parameter_set.manifest_multiplier / self.current_multiplier, 1.0
+        )
+        miner_scores = score_hordes(
+            dataclasses.replace(self.hordes, score_sums=self.hordes.score_sums * multipliers),
+            self.executor_class_weights,
+            alpha=parameter_set.avg_param,
+            beta=parameter_set.size_param,
+            delta=1 / parameter_set.central_size_param,
+        )
+        in_metagraph = self.miner_uids >= 0
+        weights = np.zeros(self.neuron_count)
+        weights[self.miner_uids[in_metagraph]] = miner_scores[in_metagraph]
+        total = weights.sum()
+        return weights / total if total else weights
+
+
+_simulation: Simulation | None = None
+
+
+def _init_worker(simulation: Simulation) -> None:
+    global _simulation
+    _simulation = simulation
+
+
+def _simulate(parameter_set: ParameterSet) -> np.ndarray:
+    assert _simulation is not None
+    return _simulation.weights(parameter_set)
+
+
+def _ranks(values: np.ndarray) -> np.ndarray:
+    ranks = np.empty(len(values))
+    ranks[np.argsort(values, kind="stable")] = np.arange(len(values))
+    # ties get the average of their ranks
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    return (np.bincount(inverse, weights=ranks) / counts)[inverse]
+
+
+def rank_correlation(a: np.ndarray, b: np.ndarray) -> float:
+    """Spearman's rank correlation coefficient, nan if one of the vectors is constant"""
+    ranks_a, ranks_b = _ranks(a), _ranks(b)
+    if ranks_a.std() == 0 or ranks_b.std() == 0:
+        return float("nan")
+    return float(np.corrcoef(ranks_a, ranks_b)[0, 1])
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-score historical synthetic job batches under a grid of scoring parameters and "
+        "compare the resulting weights with the ones of the current parameters. The weights "
+        "are the normalized sum of the scores of the batches, per uid of the current "
+        "metagraph. The manifest multiplier is re-applied to the miners that got the one of "
+        "the current dynamic config, assuming it was the one in use when they were scored."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batches", type=int, default=10, help="number of latest finalized batches"
+        )
+        parser.add_argument("--avg-param", type=float, nargs="+")
+        parser.add_argument("--size-param", type=float, nargs="+")
+        parser.add_argument("--central-size-param", type=float, nargs="+")
+        parser.add_argument("--manifest-multiplier", type=float, nargs="+")
+        parser.add_argument(
+            "--processes", type=int, default=os.cpu_count(), help="processes scoring in parallel"
+        )
+        parser.add_argument("--top", type=int, default=5, help="top uids to show per result")
+        parser.add_argument("--json", help="write the weights and correlations to this file")
+
+    def _current_parameters(self) -> ParameterSet:
+        return ParameterSet(
+            avg_param=settings.HORDE_SCORE_AVG_PARAM,
+            size_param=settings.HORDE_SCORE_SIZE_PARAM,
+            central_size_param=settings.HORDE_SCORE_CENTRAL_SIZE_PARAM,
+            manifest_multiplier=config.DYNAMIC_MANIFEST_SCORE_MULTIPLIER,
+        )
+
+    def _grid(self, options, current: ParameterSet) -> list[ParameterSet]:
+        fields = [field.name for field in dataclasses.fields(ParameterSet)]
+        values = [options[field] or [getattr(current, field)] for field in fields]
+        return [ParameterSet(*combination) for combination in itertools.product(*values)]
+
+    def _dancing(self, hordes: Hordes) -> np.ndarray:
+        """Same rule as `get_manifest_multiplier`, with the current dynamic config"""
+        dancing = np.zeros(len(hordes.batch_index), dtype=bool)
+        if get_weights_version() < 2:
+            return dancing
+        threshold = config.DYNAMIC_MANIFEST_DANCE_RATIO_THRESHOLD
+
+        previous_batch_ids = {
+            batch_id: SyntheticJobBatch.objects.filter(id__lt=batch_id)
+            .order_by("-id")
+            .values_list("id", flat=True)
+            .first()
+            for batch_id in hordes.batch_ids
+        }
+        online = {
+            (batch_id, hotkey): count
+            for batch_id, hotkey, count in MinerManifest.objects.filter(
+                batch_id__in=[*hordes.batch_ids, *previous_batch_ids.values()]
+            ).values_list("batch_id", "miner__hotkey", "online_executor_count")
+        }
+        for i, (batch_i, miner_i) in enumerate(zip(hordes.batch_index, hordes.miner_index)):
+            batch_id = hordes.batch_ids[batch_i]
+            hotkey = hordes.hotkeys[miner_i]
+            previous = online.get((previous_batch_ids[batch_id], hotkey))
+            current = online.get((batch_id, hotkey), 0)
+            if previous is None:
+                dancing[i] = True
+            else:
+                low, high = sorted([previous, current])
+                dancing[i] = low == 0 or high / low >= threshold
+        return dancing
+
+    def _load(self, batch_count: int) -> Simulation:
+        batch_ids = list(
+            SyntheticJobBatch.objects.filter(accepting_results_until__isnull=False)
+            .order_by("-id")
+            .values_list("id", flat=True)[:batch_count]
+        )
+        # from the jobs, older batches don't have miner batch scores
+        hordes = load_hordes(aggregate_batch_scores(batch_ids))
+        if hordes is None:
+            raise CommandError("No scored jobs in the latest batches")
+
+        metagraph = bittensor.metagraph(
+            netuid=settings.BITTENSOR_NETUID, network=settings.BITTENSOR_NETWORK
+        )
+        hotkey_to_uid = {neuron.hotkey: neuron.uid for neuron in metagraph.neurons}
+        self.stdout.write(
+            f"Loaded {len(hordes.batch_index)} hordes of {len(hordes.hotkeys)} miners "
+            f"from {hordes.batch_count} batches"
+        )
+        return Simulation(
+            hordes=hordes,
+            dancing=self._dancing(hordes),
+            current_multiplier=config.DYNAMIC_MANIFEST_SCORE_MULTIPLIER,
+            executor_class_weights=dict(EXECUTOR_CLASS_WEIGHTS),
+            miner_uids=np.array([hotkey_to_uid.get(hotkey, -1) for hotkey in hordes.hotkeys]),
+            neuron_count=len(metagraph.neurons),
+        )
+
+    def _run(self, simulation: Simulation, parameter_sets: list[ParameterSet], processes: int):
+        if processes <= 1:
+            _init_worker(simulation)
+            return [_simulate(parameter_set) for parameter_set in parameter_sets]
+        # the workers only compute, they must not share the database connections
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(simulation,),
+        ) as executor:
+            return list(executor.map(_simulate, parameter_sets))
+
+    def handle(self, *args, **options):
+        current = self._current_parameters()
+        parameter_sets = [current, *self._grid(options, current)]
+        simulation = self._load(options["batches"])
+
+        current_weights, *grid_weights = self._run(
+            simulation, parameter_sets, min(options["processes"], len(parameter_sets))
+        )
+
+        results = []
+        for parameter_set, weights in zip(parameter_sets[1:], grid_weights):
+            correlation = rank_correlation(current_weights, weights)
+            top = np.argsort(-weights, kind="stable")[: options["top"]]
+            self.stdout.write(
+                f"{parameter_set}  rank correlation {correlation:.4f}  top "
+                + " ".join(f"{uid}:{weights[uid]:.4f}" for uid in top)
+            )
+            if options["verbosity"] > 1:
+                self.stdout.write(f"  weights {weights.round(6).tolist()}")
+            results.append(
+                dict(
+                    parameters=dataclasses.asdict(parameter_set),
+                    rank_correlation=correlation,
+                    weights=weights.tolist(),
+                )
+            )
+
+        if options["json"]:
+            with open(options["json"], "w") as f:
+                json.dump(
+                    dict(
+                        batch_ids=simulation.hordes.batch_ids,
+                        current=dict(
+                            parameters=dataclasses.asdict(current),
+                            weights=current_weights.tolist(),
+                        ),
+                        results=results,
+                    ),
+                    f,
+                    indent=2,
+                )
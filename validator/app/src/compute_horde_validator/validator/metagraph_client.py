@@ -6,6 +6,8 @@ import bittensor
 from asgiref.sync import sync_to_async
 from django.conf import settings
 
+from .chain_view import ChainView
+from .metagraph_snapshot import MetagraphSnapshot
 from .models import SystemEvent
 
 logger = logging.getLogger(__name__)
@@ -14,53 +16,55 @@ logger = logging.getLogger(__name__)
 class AsyncMetagraphClient:
     def __init__(self, cache_time=dt.timedelta(minutes=5)):
         self.cache_time = cache_time
-        self._metagraph_future = None
+        self._snapshot_future = None
         self._future_lock = asyncio.Lock()
-        self._cached_metagraph = None
+        # replaced as a whole on refresh, never modified
+        self._snapshot: MetagraphSnapshot | None = None
         self._cache_timestamp = None
 
-    async def get_metagraph(self, ignore_cache=False):
+    async def get_snapshot(self, ignore_cache=False) -> MetagraphSnapshot:
         future = None
         set_result = False
-        if self._cached_metagraph is not None:
+        if self._snapshot is not None:
             if not ignore_cache and dt.datetime.now() - self._cache_timestamp < self.cache_time:
-                return self._cached_metagraph
+                return self._snapshot
         async with self._future_lock:
-            if self._metagraph_future is None:
+            if self._snapshot_future is None:
                 loop = asyncio.get_running_loop()
-                future = self._metagraph_future = loop.create_future()
+                future = self._snapshot_future = loop.create_future()
                 set_result = True
             else:
-                future = self._metagraph_future
+                future = self._snapshot_future
         if set_result:
             try:
-                result = await self._get_metagraph()
+                result = await self._get_snapshot()
             except Exception as exc:
                 future.set_exception(exc)
                 raise
             else:
                 future.set_result(result)
                 self._cache_timestamp = dt.datetime.now()
-                self._cached_metagraph = result
+                self._snapshot = result
                 return result
             finally:
                 async with self._future_lock:
-                    self._metagraph_future = None
+                    self._snapshot_future = None
         else:
             return await future
 
     @sync_to_async(thread_sensitive=False)
-    def _get_metagraph(self):
-        return bittensor.metagraph(
-            netuid=settings.BITTENSOR_NETUID, network=settings.BITTENSOR_NETWORK
-        )
+    def _get_snapshot(self) -> MetagraphSnapshot:
+        # published by the chain view, or fetched and shared with the other processes
+        return ChainView(
+            lambda: bittensor.subtensor(network=settings.BITTENSOR_NETWORK)
+        ).metagraph_snapshot()
 
     async def periodic_refresh(self, period=None):
         if period is None:
             period = self.cache_time.total_seconds()
         while True:
             try:
-                await self.get_metagraph(ignore_cache=True)
+                await self.get_snapshot(ignore_cache=True)
             except Exception as exc:
                 msg = f"Failed to refresh metagraph: {exc}"
                 await SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).acreate(
@@ -77,11 +81,11 @@ async_metagraph_client = AsyncMetagraphClient()
 
 
 async def get_miner_axon_info(hotkey: str) -> bittensor.AxonInfo:
-    metagraph = await async_metagraph_client.get_metagraph()
-    neurons = [n for n in metagraph.neurons if n.hotkey == hotkey]
-    if not neurons:
+    snapshot = await async_metagraph_client.get_snapshot()
+    axon_info = snapshot.axon_by_hotkey.get(hotkey)
+    if axon_info is None:
         raise ValueError(f"Miner with {hotkey=} not present in this subnetwork")
-    return neurons[0].axon_info
+    return axon_info
 
 
 def create_metagraph_refresh_task(period=None):
@@ -0,0 +1,112 @@
+import dataclasses
+import json
+import zlib
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import bittensor
+import numpy as np
+
+SERIALIZATION_VERSION = 1
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+@dataclasses.dataclass(frozen=True)
+class Neuron:
+    hotkey: str
+    uid: int
+    stake: float
+    axon_info: bittensor.AxonInfo
+
+
+@dataclasses.dataclass(frozen=True)
+class MetagraphSnapshot:
+    """
+    Immutable view of the metagraph at `block`, indexed by hotkey.
+    The arrays and `neurons` are aligned with `hotkeys`.
+    """
+
+    block: int
+    hotkeys: tuple[str, ...]
+    uids: np.ndarray
+    stakes: np.ndarray
+    serving: np.ndarray
+    uid_by_hotkey: Mapping[str, int]
+    axon_by_hotkey: Mapping[str, bittensor.AxonInfo]
+    neurons: tuple[Neuron, ...]
+
+    @classmethod
+    def create(
+        cls, block: int, hotkeys: list[str], uids: list[int], stakes: list[float], axons: list
+    ) -> "MetagraphSnapshot":
+        return cls(
+            block=block,
+            hotkeys=tuple(hotkeys),
+            uids=_read_only(np.array(uids, dtype=np.int64)),
+            stakes=_read_only(np.array(stakes, dtype=np.float64)),
+            serving=_read_only(np.array([axon.is_serving for axon in axons], dtype=bool)),
+            uid_by_hotkey=MappingProxyType(dict(zip(hotkeys, uids))),
+            axon_by_hotkey=MappingProxyType(dict(zip(hotkeys, axons))),
+            neurons=tuple(map(Neuron, hotkeys, uids, stakes, axons)),
+        )
+
+    @property
+    def n(self) -> int:
+        """Number of neurons, read by `process_weights_for_netuid` like off a metagraph"""
+        return len(self.hotkeys)
+
+    @classmethod
+    def from_metagraph(cls, metagraph: bittensor.metagraph) -> "MetagraphSnapshot":
+        neurons = metagraph.neurons
+        return cls.create(
+            block=int(metagraph.block.item()),
+            hotkeys=[neuron.hotkey for neuron in neurons],
+            uids=[neuron.uid for neuron in neurons],
+            stakes=[float(neuron.stake) for neuron in neurons],
+            axons=[neuron.axon_info for neuron in neurons],
+        )
+
+    def to_bytes(self) -> bytes:
+        axons = [self.axon_by_hotkey[hotkey] for hotkey in self.hotkeys]
+        data = {
+            "version": SERIALIZATION_VERSION,
+            "block": self.block,
+            "hotkeys": self.hotkeys,
+            "uids": self.uids.tolist(),
+            "stakes": self.stakes.tolist(),
+            "axons": [
+                [axon.version, axon.ip, axon.port, axon.ip_type, axon.coldkey, axon.protocol]
+                for axon in axons
+            ],
+        }
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "MetagraphSnapshot":
+        data = json.loads(zlib.decompress(blob))
+        if data["version"] != SERIALIZATION_VERSION:
+            raise ValueError(f"Unsupported metagraph snapshot version: {data['version']}")
+        return cls.create(
+            block=data["block"],
+            hotkeys=data["hotkeys"],
+            uids=data["uids"],
+            stakes=data["stakes"],
+            axons=[
+                bittensor.AxonInfo(
+                    version=version,
+                    ip=ip,
+                    port=port,
+                    ip_type=ip_type,
+                    hotkey=hotkey,
+                    coldkey=coldkey,
+                    protocol=protocol,
+                )
+                for hotkey, (version, ip, port, ip_type, coldkey, protocol) in zip(
+                    data["hotkeys"], data["axons"]
+                )
+            ],
+        )
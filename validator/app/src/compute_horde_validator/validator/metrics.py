@@ -2,6 +2,7 @@ import glob
 import os
 
 import prometheus_client
+from django.conf import settings
 from django.http import HttpResponse
 from django_prometheus.exports import ExportToDjangoView
 from prometheus_client import multiprocess
@@ -17,6 +18,86 @@ class RecursiveMultiProcessCollector(multiprocess.MultiProcessCollector):
 
 ENV_VAR_NAME = "PROMETHEUS_MULTIPROC_DIR"
 
+VALIDATOR_SYNTHETIC_JOB_SEND_SKEW = prometheus_client.Histogram(
+    "validator_synthetic_job_send_skew",
+    "Time between the scheduled send instant of a synthetic job request "
+    "and the start of sending it",
+    labelnames=["request_type"],
+    unit="seconds",
+    # the skew is expected to be well below the smallest latency bucket
+    buckets=(0.001, 0.002, 0.004, *settings.PROMETHEUS_LATENCY_BUCKETS),
+)
+
+VALIDATOR_SYSTEM_EVENTS_SHIPPED = prometheus_client.Counter(
+    "validator_system_events_shipped",
+    "Number of system events acknowledged by the stats collector",
+)
+VALIDATOR_SYSTEM_EVENTS_SHIPPED_BYTES = prometheus_client.Counter(
+    "validator_system_events_shipped_bytes",
+    "Size of the request bodies of the system events acknowledged by the stats collector",
+)
+VALIDATOR_SYSTEM_EVENTS_BACKLOG = prometheus_client.Gauge(
+    "validator_system_events_backlog",
+    "Number of system events not yet sent to the stats collector",
+    multiprocess_mode="livemax",
+)
+VALIDATOR_RECEIPTS_FETCH_DURATION = prometheus_client.Histogram(
+    "validator_receipts_fetch_duration",
+    "Wall and CPU time of fetching and storing the receipts of all the miners",
+    labelnames=["clock"],
+    unit="seconds",
+    buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300),
+)
+VALIDATOR_RECEIPTS_STORED = prometheus_client.Counter(
+    "validator_receipts_stored",
+    "Number of new receipts fetched from the miners and stored",
+)
+VALIDATOR_ORGANIC_JOB_TIME_TO_ACCEPT = prometheus_client.Histogram(
+    "validator_organic_job_time_to_accept",
+    "Time from starting to connect to a miner until it accepts the organic job",
+    labelnames=["connection"],
+    unit="seconds",
+    buckets=settings.PROMETHEUS_LATENCY_BUCKETS,
+)
+VALIDATOR_ORGANIC_JOBS_QUEUED = prometheus_client.Gauge(
+    "validator_organic_jobs_queued",
+    "Number of organic jobs waiting to be started",
+    multiprocess_mode="livesum",
+)
+VALIDATOR_ORGANIC_JOBS_IN_FLIGHT = prometheus_client.Gauge(
+    "validator_organic_jobs_in_flight",
+    "Number of organic jobs being run",
+    multiprocess_mode="livesum",
+)
+VALIDATOR_ORGANIC_JOB_ADMISSION_DELAY = prometheus_client.Histogram(
+    "validator_organic_job_admission_delay",
+    "Time an organic job waited in the queue before being started",
+    unit="seconds",
+    buckets=(0.001, 0.002, 0.004, *settings.PROMETHEUS_LATENCY_BUCKETS),
+)
+VALIDATOR_ORGANIC_JOBS_REJECTED = prometheus_client.Counter(
+    "validator_organic_jobs_rejected",
+    "Number of organic jobs rejected because too many were waiting to be started",
+)
+VALIDATOR_MACHINE_SPECS_UNCHANGED = prometheus_client.Counter(
+    "validator_machine_specs_unchanged",
+    "Number of machine specs not sent to the facilitator, as they were sent recently",
+)
+VALIDATOR_FACILITATOR_MESSAGES_QUEUED = prometheus_client.Gauge(
+    "validator_facilitator_messages_queued",
+    "Number of messages waiting to be sent to the facilitator",
+    multiprocess_mode="livesum",
+)
+
+VALIDATOR_SPAN_DURATION = prometheus_client.Histogram(
+    "validator_span_duration",
+    "Duration of the traced stages of the jobs",
+    labelnames=["span"],
+    unit="seconds",
+    # running a job takes minutes
+    buckets=(*settings.PROMETHEUS_LATENCY_BUCKETS[:-1], 128.0, 256.0, 512.0, float("inf")),
+)
+
 
 def metrics_view(request):
     """Exports metrics as a Django view"""
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.15 on 2024-09-13 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0038_alter_systemevent_subtype"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PreparedSyntheticJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("weights_version", models.PositiveSmallIntegerField(db_index=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("data", models.BinaryField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 4.2.15 on 2024-09-16 10:12
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils.timezone import now
+
+COLUMNS = """
+    type varchar(255) NOT NULL,
+    subtype varchar(255) NOT NULL,
+    "timestamp" timestamp with time zone NOT NULL,
+    long_description text NOT NULL,
+    data jsonb NOT NULL,
+    sent boolean NOT NULL
+"""
+
+
+def partition_system_events(apps, schema_editor):
+    """
+    Turn the existing table into the first partition of a table partitioned by timestamp,
+    without copying the events. New events go to daily partitions created ahead of time,
+    see `system_event_partitions`.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    tomorrow = (now() + timedelta(days=1)).date().isoformat()
+    for sql in [
+        "ALTER TABLE validator_systemevent RENAME TO validator_systemevent_legacy",
+        # replaced by the (id, timestamp) primary key of the parent when attached
+        "ALTER TABLE validator_systemevent_legacy DROP CONSTRAINT validator_systemevent_pkey",
+        # partitions can't have their own identity, the parent owns the id sequence
+        "ALTER TABLE validator_systemevent_legacy ALTER COLUMN id DROP IDENTITY",
+        "CREATE SEQUENCE validator_systemevent_id_seq",
+        "SELECT setval('validator_systemevent_id_seq', "
+        "COALESCE((SELECT max(id) FROM validator_systemevent_legacy), 0) + 1, false)",
+        f"""
+        CREATE TABLE validator_systemevent (
+            id bigint NOT NULL DEFAULT nextval('validator_systemevent_id_seq'),
+            {COLUMNS},
+            -- the primary key of a partitioned table has to include the partition key
+            CONSTRAINT validator_systemevent_pkey PRIMARY KEY (id, "timestamp")
+        ) PARTITION BY RANGE ("timestamp")
+        """,
+        "ALTER SEQUENCE validator_systemevent_id_seq OWNED BY validator_systemevent.id",
+        "ALTER TABLE validator_systemevent ATTACH PARTITION validator_systemevent_legacy "
+        f"FOR VALUES FROM (MINVALUE) TO ('{tomorrow}T00:00:00+00:00')",
+        # catches events without a daily partition, instead of failing to insert them
+        "CREATE TABLE validator_systemevent_default PARTITION OF validator_systemevent DEFAULT",
+    ]:
+        schema_editor.execute(sql)
+
+
+def unpartition_system_events(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for sql in [
+        f"""
+        CREATE TABLE validator_systemevent_unpartitioned (
+            id bigint GENERATED BY DEFAULT AS IDENTITY
+                CONSTRAINT validator_systemevent_unpartitioned_pkey PRIMARY KEY,
+            {COLUMNS}
+        )
+        """,
+        "INSERT INTO validator_systemevent_unpartitioned SELECT * FROM validator_systemevent",
+        "SELECT setval(pg_get_serial_sequence('validator_systemevent_unpartitioned', 'id'), "
+        "COALESCE((SELECT max(id) FROM validator_systemevent_unpartitioned), 0) + 1, false)",
+        # drops all the partitions and the id sequence
+        "DROP TABLE validator_systemevent",
+        "ALTER TABLE validator_systemevent_unpartitioned RENAME TO validator_systemevent",
+        "ALTER TABLE validator_systemevent "
+        "RENAME CONSTRAINT validator_systemevent_unpartitioned_pkey TO validator_systemevent_pkey",
+        "ALTER SEQUENCE validator_systemevent_unpartitioned_id_seq "
+        "RENAME TO validator_systemevent_id_seq",
+    ]:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0039_prepared_synthetic_job"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_system_events, unpartition_system_events),
+        migrations.AddIndex(
+            model_name="systemevent",
+            index=models.Index(
+                condition=models.Q(("sent", False)), fields=["id"], name="systemevent_unsent_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.15 on 2024-09-17 14:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def aggregate_unscored_batches(apps, schema_editor):
+    """Batches created before this migration can still be scored, from their aggregates"""
+    MinerBatchScore = apps.get_model("validator", "MinerBatchScore")
+    SyntheticJob = apps.get_model("validator", "SyntheticJob")
+    rows = (
+        SyntheticJob.objects.filter(batch__scored=False)
+        .values("batch_id", "miner_id", "executor_class")
+        .annotate(score_sum=Sum("score"), job_count=Count("id"))
+        .order_by()
+    )
+    MinerBatchScore.objects.bulk_create(
+        [MinerBatchScore(**row) for row in rows.iterator()], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0040_systemevent_partitioning"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MinerBatchScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("executor_class", models.CharField(max_length=255)),
+                ("score_sum", models.FloatField(default=0)),
+                ("job_count", models.PositiveIntegerField(default=0)),
+                (
+                    "batch",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="miner_scores",
+                        to="validator.syntheticjobbatch",
+                    ),
+                ),
+                (
+                    "miner",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="validator.miner"
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="minerbatchscore",
+            constraint=models.UniqueConstraint(
+                fields=("batch", "miner", "executor_class"), name="unique_miner_batch_score"
+            ),
+        ),
+        migrations.RunPython(aggregate_unscored_batches, migrations.RunPython.noop),
+    ]
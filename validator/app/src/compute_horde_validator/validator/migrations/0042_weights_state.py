@@ -0,0 +1,56 @@
+# Generated by Django 4.2.15 on 2024-09-19 10:12
+
+from django.db import migrations, models
+
+
+def set_existing_weights_state(apps, schema_editor):
+    # weights written before the state machine were all committed, some of them revealed
+    Weights = apps.get_model("validator", "Weights")
+    Weights.objects.filter(revealed_at__isnull=False).update(state="REVEALED")
+    Weights.objects.filter(revealed_at__isnull=True).update(state="COMMITTED")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0041_miner_batch_score"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="weights",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="weights",
+            name="commit_reveal",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name="weights",
+            name="next_attempt_at",
+            field=models.DateTimeField(default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="weights",
+            name="state",
+            field=models.CharField(
+                choices=[
+                    ("COMPUTED", "Computed"),
+                    ("COMMITTING", "Committing"),
+                    ("COMMITTED", "Committed"),
+                    ("REVEALING", "Revealing"),
+                    ("REVEALED", "Revealed"),
+                    ("FAILED", "Failed"),
+                ],
+                default="COMPUTED",
+                max_length=16,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="weights",
+            name="block",
+            field=models.BigIntegerField(default=None, null=True),
+        ),
+        migrations.RunPython(set_existing_weights_state, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.15 on 2024-09-20 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("validator", "0042_weights_state"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MachineSpecsDigest",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("miner_hotkey", models.CharField(max_length=255)),
+                ("gpu_set", models.CharField(max_length=64)),
+                ("digest", models.CharField(max_length=64)),
+                ("sent_at", models.DateTimeField(db_index=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="machinespecsdigest",
+            constraint=models.UniqueConstraint(
+                fields=("miner_hotkey", "gpu_set"), name="unique_machine_specs"
+            ),
+        ),
+    ]
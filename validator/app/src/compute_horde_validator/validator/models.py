@@ -7,7 +7,7 @@ from os import urandom
 from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
-from django.db.models import UniqueConstraint
+from django.db.models import Q, UniqueConstraint
 from django.utils.timezone import now
 
 logger = logging.getLogger(__name__)
@@ -67,6 +67,7 @@ class SystemEvent(models.Model):
         UNAUTHORIZED = "UNAUTHORIZED"
         SYNTHETIC_BATCH = "SYNTHETIC_BATCH"
         SYNTHETIC_JOB = "SYNTHETIC_JOB"
+        SYNTHETIC_JOB_GENERATION = "SYNTHETIC_JOB_GENERATION"
         CHECKPOINT = "CHECKPOINT"
         OVERSLEPT = "OVERSLEPT"
         WARNING = "WARNING"
@@ -82,6 +83,13 @@ class SystemEvent(models.Model):
     data = models.JSONField(blank=True)
     sent = models.BooleanField(default=False)
 
+    class Meta:
+        # the table is partitioned by timestamp, see system_event_partitions
+        indexes = [
+            # keeps finding the events to send to the facilitator independent of the table size
+            models.Index(fields=["id"], condition=Q(sent=False), name="systemevent_unsent_idx"),
+        ]
+
     def to_dict(self):
         return {
             "type": self.type,
@@ -165,6 +173,41 @@ class MinerManifest(models.Model):
         ]
 
 
+class MachineSpecsDigest(models.Model):
+    """
+    Digest of the hardware specs last sent to the facilitator for the executors of a miner
+    with a given set of GPUs, so that unchanged specs aren't sent again after every batch.
+    """
+
+    miner_hotkey = models.CharField(max_length=255)
+    # digest of the sorted GPU UUIDs
+    gpu_set = models.CharField(max_length=64)
+    digest = models.CharField(max_length=64)
+    sent_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(fields=["miner_hotkey", "gpu_set"], name="unique_machine_specs"),
+        ]
+
+    def __str__(self):
+        return f"MachineSpecsDigest({self.miner_hotkey}, {self.gpu_set}, {self.digest})"
+
+
+class PreparedSyntheticJob(models.Model):
+    """
+    Synthetic job generated in advance, ready to be sent in a future batch.
+    """
+
+    weights_version = models.PositiveSmallIntegerField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # encrypted, as it contains the expected answer
+    data = models.BinaryField()
+
+    def __str__(self):
+        return f"PreparedSyntheticJob({self.id}, weights_version={self.weights_version})"
+
+
 class JobBase(models.Model):
     class Meta:
         abstract = True
@@ -196,6 +239,33 @@ class SyntheticJob(JobBase):
     score = models.FloatField(default=0)
 
 
+class MinerBatchScore(models.Model):
+    """
+    Scores of the synthetic jobs of a miner in a batch, per executor class,
+    written along the jobs so that scoring doesn't need to go through all the jobs.
+    """
+
+    batch = models.ForeignKey(
+        SyntheticJobBatch, on_delete=models.CASCADE, related_name="miner_scores"
+    )
+    miner = models.ForeignKey(Miner, on_delete=models.CASCADE)
+    executor_class = models.CharField(max_length=255)
+    score_sum = models.FloatField(default=0)
+    job_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["batch", "miner", "executor_class"], name="unique_miner_batch_score"
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"MinerBatchScore(batch={self.batch_id}, miner={self.miner_id}, {self.executor_class})"
+        )
+
+
 class OrganicJob(JobBase):
     stdout = models.TextField(blank=True, default="")
     stderr = models.TextField(blank=True, default="")
@@ -274,15 +344,31 @@ def get_random_salt() -> list[int]:
 
 class Weights(models.Model):
     """
-    Weights set by validator at specific block.
+    Weights computed by the validator and written to the chain step by step.
     This is used to verify the weights revealed by the validator later.
     """
 
+    class State(models.TextChoices):
+        COMPUTED = "COMPUTED"
+        COMMITTING = "COMMITTING"
+        COMMITTED = "COMMITTED"
+        REVEALING = "REVEALING"
+        # also when set directly, without commit-reveal
+        REVEALED = "REVEALED"
+        FAILED = "FAILED"
+
     uids = ArrayField(models.IntegerField())
     weights = ArrayField(models.IntegerField())
     salt = ArrayField(models.IntegerField(), default=get_random_salt)
     version_key = models.IntegerField()
-    block = models.BigIntegerField()
+    commit_reveal = models.BooleanField(default=True)
+    state = models.CharField(max_length=16, choices=State.choices, default=State.COMPUTED)
+    # attempts of the current step, the next one can't start before `next_attempt_at`,
+    # which is also when an attempt in progress (COMMITTING, REVEALING) is considered lost
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, default=None)
+    # block at which the weights were committed or set
+    block = models.BigIntegerField(null=True, default=None)
     created_at = models.DateTimeField(auto_now_add=True)
     revealed_at = models.DateTimeField(null=True, default=None)
 
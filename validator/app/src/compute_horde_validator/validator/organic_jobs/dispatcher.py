@@ -0,0 +1,118 @@
+import asyncio
+import collections
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from compute_horde_validator.validator.metrics import (
+    VALIDATOR_ORGANIC_JOB_ADMISSION_DELAY,
+    VALIDATOR_ORGANIC_JOBS_IN_FLIGHT,
+    VALIDATOR_ORGANIC_JOBS_QUEUED,
+    VALIDATOR_ORGANIC_JOBS_REJECTED,
+)
+from compute_horde_validator.validator.organic_jobs.facilitator_api import JobRequest
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueuedJob:
+    job_request: JobRequest
+    received_at: float = field(default_factory=time.monotonic)
+
+
+class OrganicJobDispatcher:
+    """
+    Runs the organic jobs requested by the facilitator, at most `max_in_flight` at a time and at
+    most `max_per_miner` on a single miner.
+
+    Jobs over the limits wait in a queue of at most `max_queued` jobs and are started in the order
+    they came in, skipping the ones whose miner is at its limit, so that a busy miner doesn't hold
+    up the jobs of the others. A job which has to wait, but doesn't fit in the queue, is rejected
+    right away.
+    """
+
+    def __init__(
+        self,
+        run_job: Callable[[JobRequest], Awaitable[None]],
+        reject_job: Callable[[JobRequest, str], Awaitable[None]],
+        max_in_flight: int,
+        max_per_miner: int,
+        max_queued: int,
+    ):
+        self.run_job = run_job
+        self.reject_job = reject_job
+        self.max_in_flight = max_in_flight
+        self.max_per_miner = max_per_miner
+        self.max_queued = max_queued
+
+        self.queue: collections.deque[QueuedJob] = collections.deque()
+        self.in_flight: dict[asyncio.Task, str] = {}
+        self.in_flight_per_miner: collections.Counter[str] = collections.Counter()
+
+    def _update_gauges(self) -> None:
+        VALIDATOR_ORGANIC_JOBS_QUEUED.set(len(self.queue))
+        VALIDATOR_ORGANIC_JOBS_IN_FLIGHT.set(len(self.in_flight))
+
+    async def submit(self, job_request: JobRequest) -> bool:
+        """Start the job or queue it, False if it was rejected"""
+        queued = QueuedJob(job_request)
+        # the queue only holds jobs which can't start now, so this doesn't jump ahead of any
+        if self._can_start(queued):
+            self._start(queued)
+            self._update_gauges()
+            return True
+
+        if len(self.queue) >= self.max_queued:
+            VALIDATOR_ORGANIC_JOBS_REJECTED.inc()
+            await self.reject_job(
+                job_request,
+                f"Validator is busy: {len(self.in_flight)} jobs running"
+                f" and {len(self.queue)} waiting, try again later",
+            )
+            return False
+
+        self.queue.append(queued)
+        self._update_gauges()
+        return True
+
+    def _can_start(self, queued: QueuedJob) -> bool:
+        return (
+            len(self.in_flight) < self.max_in_flight
+            and self.in_flight_per_miner[queued.job_request.miner_hotkey] < self.max_per_miner
+        )
+
+    def _start(self, queued: QueuedJob) -> None:
+        miner_hotkey = queued.job_request.miner_hotkey
+        VALIDATOR_ORGANIC_JOB_ADMISSION_DELAY.observe(time.monotonic() - queued.received_at)
+        task = asyncio.create_task(self.run_job(queued.job_request))
+        self.in_flight[task] = miner_hotkey
+        self.in_flight_per_miner[miner_hotkey] += 1
+        task.add_done_callback(self._job_done)
+
+    def _start_queued(self) -> None:
+        for queued in list(self.queue):
+            if len(self.in_flight) >= self.max_in_flight:
+                break
+            if not self._can_start(queued):
+                continue
+
+            self.queue.remove(queued)
+            self._start(queued)
+        self._update_gauges()
+
+    def _job_done(self, task: asyncio.Task) -> None:
+        miner_hotkey = self.in_flight.pop(task)
+        self.in_flight_per_miner[miner_hotkey] -= 1
+        if not self.in_flight_per_miner[miner_hotkey]:
+            del self.in_flight_per_miner[miner_hotkey]
+
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.error("Error occurred during driving a miner client", exc_info=exc)
+        self._start_queued()
+
+    async def join(self) -> None:
+        """Wait until all the submitted jobs are done, in whatever order they finish"""
+        while self.in_flight:
+            await asyncio.wait(list(self.in_flight))
@@ -99,6 +99,24 @@ JobRequest = Annotated[
 ]
 
 
+def _facilitator_message_kind(value: Any) -> str:
+    if isinstance(value, dict):
+        return "job_request" if "message_type" in value else "response"
+    return "response" if isinstance(value, Response) else "job_request"
+
+
+# any message from the facilitator, told apart by whether it has a `message_type`
+# so that it's validated in a single pass over the raw message
+FacilitatorMessage = Annotated[
+    Annotated[Response, pydantic.Tag("response")]
+    | Annotated[JobRequest, pydantic.Tag("job_request")],
+    pydantic.Discriminator(_facilitator_message_kind),
+]
+facilitator_message_adapter: pydantic.TypeAdapter[FacilitatorMessage] = pydantic.TypeAdapter(
+    FacilitatorMessage
+)
+
+
 class Heartbeat(BaseModel, extra="forbid"):
     message_type: str = "V0Heartbeat"
 
@@ -1,14 +1,13 @@
 import asyncio
 import logging
 import os
-from collections import deque
 from typing import NoReturn
 
 import bittensor
 import pydantic
-import tenacity
 import websockets
 from channels.layers import get_channel_layer
+from compute_horde.miner_client.pool import MinerConnectionPool
 from django.conf import settings
 from pydantic import BaseModel
 
@@ -17,6 +16,7 @@ from compute_horde_validator.validator.metagraph_client import (
     get_miner_axon_info,
 )
 from compute_horde_validator.validator.models import Miner, OrganicJob, SystemEvent
+from compute_horde_validator.validator.organic_jobs.dispatcher import OrganicJobDispatcher
 from compute_horde_validator.validator.organic_jobs.facilitator_api import (
     AuthenticationRequest,
     Error,
@@ -24,15 +24,29 @@ from compute_horde_validator.validator.organic_jobs.facilitator_api import (
     JobRequest,
     MachineSpecsUpdate,
     Response,
+    facilitator_message_adapter,
 )
 from compute_horde_validator.validator.organic_jobs.miner_client import MinerClient
-from compute_horde_validator.validator.organic_jobs.miner_driver import execute_organic_job
+from compute_horde_validator.validator.organic_jobs.miner_driver import (
+    JobStatusMetadata,
+    JobStatusUpdate,
+    execute_organic_job,
+)
+from compute_horde_validator.validator.organic_jobs.outbox import FacilitatorOutbox
+from compute_horde_validator.validator.synthetic_jobs.machine_specs import (
+    MachineSpecsEntry,
+    mark_specs_sent,
+)
 from compute_horde_validator.validator.utils import MACHINE_SPEC_CHANNEL
 
 logger = logging.getLogger(__name__)
 
 PREPARE_WAIT_TIMEOUT = 300
 TOTAL_JOB_TIMEOUT = 300
+SEND_ERROR_SUBTYPES = {
+    MachineSpecsUpdate: SystemEvent.EventSubType.SPECS_SEND_ERROR,
+    Heartbeat: SystemEvent.EventSubType.HEARTBEAT_ERROR,
+}
 
 
 class AuthenticationError(Exception):
@@ -58,10 +72,22 @@ class FacilitatorClient:
         self.keypair = keypair
         self.ws: websockets.WebSocketClientProtocol | None = None
         self.facilitator_uri = facilitator_uri
-        self.miner_drivers = asyncio.Queue()
-        self.miner_driver_awaiter_task = asyncio.create_task(self.miner_driver_awaiter())
+        self.outbox = FacilitatorOutbox(max_size=settings.FACILITATOR_OUTBOX_SIZE)
+        self.job_dispatcher = OrganicJobDispatcher(
+            run_job=self.miner_driver,
+            reject_job=self.reject_job_request,
+            max_in_flight=settings.ORGANIC_JOBS_MAX_IN_FLIGHT,
+            max_per_miner=settings.ORGANIC_JOBS_MAX_PER_MINER,
+            max_queued=settings.ORGANIC_JOBS_MAX_QUEUED,
+        )
         self.heartbeat_task = asyncio.create_task(self.heartbeat())
         self.refresh_metagraph_task = self.create_metagraph_refresh_task()
+        self.miner_connection_pool = MinerConnectionPool(
+            keypair, idle_timeout=settings.ORGANIC_MINER_CONNECTION_IDLE_TIMEOUT
+        )
+        self.evict_miner_connections_task = asyncio.create_task(
+            self.miner_connection_pool.run_evictions()
+        )
 
     def connect(self):
         """Create an awaitable/async-iterable websockets.connect() object"""
@@ -71,24 +97,13 @@ class FacilitatorClient:
         }
         return websockets.connect(self.facilitator_uri, extra_headers=extra_headers)
 
-    async def miner_driver_awaiter(self):
-        """avoid memory leak by awaiting miner driver tasks"""
-        while True:
-            task = await self.miner_drivers.get()
-            if task is None:
-                return
-
-            try:
-                await task
-            except Exception:
-                logger.error("Error occurred during driving a miner client", exc_info=True)
-
     async def __aenter__(self):
         pass
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.miner_drivers.put(None)
-        await self.miner_driver_awaiter_task
+        await self.job_dispatcher.join()
+        self.evict_miner_connections_task.cancel()
+        await self.miner_connection_pool.close()
 
     def my_hotkey(self) -> str:
         return self.keypair.ss58_address
@@ -143,11 +158,73 @@ class FacilitatorClient:
 
         self.ws = ws
 
+        receiver = asyncio.create_task(self.receive_messages(ws))
+        sender = asyncio.create_task(self.send_messages(ws))
+        try:
+            done, _ = await asyncio.wait([receiver, sender], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            receiver.cancel()
+            sender.cancel()
+            await asyncio.gather(receiver, sender, return_exceptions=True)
+        for task in done:
+            task.result()
+
+    async def receive_messages(self, ws: websockets.WebSocketClientProtocol):
         async for raw_msg in ws:
             await self.handle_message(raw_msg)
 
+    async def send_messages(self, ws: websockets.WebSocketClientProtocol):
+        """
+        the single writer of the connection, sending the queued messages in batches - the ones not
+        sent when the connection is lost stay queued for the next one
+        """
+        while True:
+            batch = await self.outbox.take_batch(settings.FACILITATOR_SEND_BATCH_SIZE)
+            sent = 0
+            try:
+                for message in batch:
+                    await ws.send(message.model_dump_json())
+                    sent += 1
+            except Exception as exc:
+                self.outbox.requeue(batch[sent:])
+                await self.record_sent_specs(batch[:sent])
+                msg = f"Error occurred while sending {type(message).__name__}, will resend: {exc}"
+                logger.warning(msg)
+                await save_facilitator_event(
+                    subtype=SEND_ERROR_SUBTYPES.get(
+                        type(message), SystemEvent.EventSubType.GENERIC_ERROR
+                    ),
+                    long_description=msg,
+                )
+                raise
+            except asyncio.CancelledError:
+                self.outbox.requeue(batch[sent:])
+                raise
+            await self.record_sent_specs(batch)
+            # yield once per batch rather than once per message
+            # Summary: https://github.com/python-websockets/websockets/issues/867
+            # Longer discussion: https://github.com/python-websockets/websockets/issues/865
+            await asyncio.sleep(0)
+
+    async def record_sent_specs(self, messages: list[BaseModel]) -> None:
+        """
+        the specs written to the connection are not sent again by the synthetic job batches until
+        they change or `MACHINE_SPECS_RESEND_INTERVAL` passes
+        """
+        entries = [
+            MachineSpecsEntry.from_specs(msg.miner_hotkey, msg.specs)
+            for msg in messages
+            if isinstance(msg, MachineSpecsUpdate)
+        ]
+        if not entries:
+            return
+        try:
+            await mark_specs_sent(entries)
+        except Exception as exc:
+            # they will be sent again with the next batch
+            logger.warning("Failed to record the sent machine specs: %r", exc)
+
     async def wait_for_specs(self):
-        specs_queue = deque()
         channel_layer = get_channel_layer()
 
         while True:
@@ -164,86 +241,54 @@ class FacilitatorClient:
                     validator_hotkey=validator_hotkey,
                 )
                 logger.debug(f"sending machine specs update to facilitator: {specs}")
-
-                specs_queue.append(specs)
-                if self.ws is not None:
-                    while specs_queue:
-                        spec_to_send = specs_queue.popleft()
-                        try:
-                            await self.send_model(spec_to_send)
-                        except Exception as exc:
-                            specs_queue.appendleft(spec_to_send)
-                            msg = f"Error occurred while sending specs: {exc}"
-                            await save_facilitator_event(
-                                subtype=SystemEvent.EventSubType.SPECS_SEND_ERROR,
-                                long_description=msg,
-                                data={
-                                    "miner_hotkey": spec_to_send.miner_hotkey,
-                                    "batch_id": spec_to_send.batch_id,
-                                },
-                            )
-                            logger.warning(msg)
-                            break
+                await self.send_model(specs)
             except TimeoutError:
                 logger.debug("wait_for_specs still running")
 
     async def heartbeat(self):
         while True:
             if self.ws is not None:
-                try:
-                    await self.send_model(Heartbeat())
-                except Exception as exc:
-                    msg = f"Error occurred while sending heartbeat: {exc}"
-                    logger.warning(msg)
-                    await save_facilitator_event(
-                        subtype=SystemEvent.EventSubType.HEARTBEAT_ERROR,
-                        long_description=msg,
-                    )
+                await self.send_model(Heartbeat())
             await asyncio.sleep(self.HEARTBEAT_PERIOD)
 
     def create_metagraph_refresh_task(self, period=None):
         return create_metagraph_refresh_task(period=period)
 
-    @tenacity.retry(
-        stop=tenacity.stop_after_attempt(7),
-        wait=tenacity.wait_exponential(multiplier=1, exp_base=2, min=1, max=10),
-        retry=tenacity.retry_if_exception_type(websockets.ConnectionClosed),
-    )
     async def send_model(self, msg: BaseModel):
-        if self.ws is None:
-            raise websockets.ConnectionClosed(rcvd=None, sent=None)
-        await self.ws.send(msg.model_dump_json())
-        # Summary: https://github.com/python-websockets/websockets/issues/867
-        # Longer discussion: https://github.com/python-websockets/websockets/issues/865
-        await asyncio.sleep(0)
+        """queue the message to be sent, over the current connection or the next one"""
+        await self.outbox.put(msg)
 
     async def handle_message(self, raw_msg: str | bytes):
         """handle message received from facilitator"""
         try:
-            response = Response.model_validate_json(raw_msg)
-        except pydantic.ValidationError:
-            logger.debug("could not parse raw message as Response")
-        else:
-            if response.status != "success":
-                logger.error("received error response from facilitator: %r", response)
+            msg = facilitator_message_adapter.validate_json(raw_msg)
+        except pydantic.ValidationError as exc:
+            logger.debug("could not parse raw message: %s", exc)
+            logger.error("unsupported message received from facilitator: %s", raw_msg)
             return
 
-        try:
-            job_request = pydantic.TypeAdapter(JobRequest).validate_json(raw_msg)
-        except pydantic.ValidationError as exc:
-            logger.debug("could not parse raw message as JobRequest: %s", exc)
-        else:
-            task = asyncio.create_task(self.miner_driver(job_request))
-            await self.miner_drivers.put(task)
+        if isinstance(msg, Response):
+            if msg.status != "success":
+                logger.error("received error response from facilitator: %r", msg)
             return
 
-        logger.error("unsupported message received from facilitator: %s", raw_msg)
+        await self.job_dispatcher.submit(msg)
 
     async def get_miner_axon_info(self, hotkey: str) -> bittensor.AxonInfo:
         return await get_miner_axon_info(hotkey)
 
+    async def reject_job_request(self, job_request: JobRequest, comment: str):
+        logger.warning(f"Rejecting job {job_request.uuid}: {comment}")
+        await self.send_model(
+            JobStatusUpdate(
+                uuid=job_request.uuid,
+                status="rejected",
+                metadata=JobStatusMetadata(comment=comment),
+            )
+        )
+
     async def miner_driver(self, job_request: JobRequest):
-        """drive a miner client from job start to completion, then close miner connection"""
+        """drive a miner client from job start to completion, on a pooled miner connection"""
         miner, _ = await Miner.objects.aget_or_create(hotkey=job_request.miner_hotkey)
         miner_axon_info = await self.get_miner_axon_info(job_request.miner_hotkey)
         job = await OrganicJob.objects.acreate(
@@ -262,6 +307,7 @@ class FacilitatorClient:
             miner_port=miner_axon_info.port,
             job_uuid=job_request.uuid,
             my_keypair=self.keypair,
+            connection_pool=self.miner_connection_pool,
         )
         await execute_organic_job(
             miner_client,
@@ -5,6 +5,7 @@ from compute_horde.miner_client.organic import OrganicMinerClient
 from compute_horde.mv_protocol.miner_requests import UnauthorizedError
 from django.conf import settings
 
+from compute_horde_validator.validator.metrics import VALIDATOR_ORGANIC_JOB_TIME_TO_ACCEPT
 from compute_horde_validator.validator.models import SystemEvent
 
 logger = logging.getLogger(__name__)
@@ -44,3 +45,8 @@ class MinerClient(OrganicMinerClient):
             long_description=msg,
             data={"job_uuid": self.job_uuid, "miner_hotkey": self.miner_hotkey},
         )
+
+    async def notify_job_accepted(self, time_to_accept: float) -> None:
+        VALIDATOR_ORGANIC_JOB_TIME_TO_ACCEPT.labels(
+            connection="reused" if self.reused_connection else "new"
+        ).observe(time_to_accept)
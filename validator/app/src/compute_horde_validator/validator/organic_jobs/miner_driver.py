@@ -17,6 +17,7 @@ from compute_horde.mv_protocol.miner_requests import (
     V0JobFinishedRequest,
 )
 from compute_horde.mv_protocol.validator_requests import V0InitialJobRequest, V0JobRequest
+from compute_horde.tracing import Span, tracer
 from compute_horde.utils import Timer
 from django.conf import settings
 from pydantic import BaseModel
@@ -94,6 +95,27 @@ async def execute_organic_job(
     total_job_timeout: int = 300,
     wait_timeout: int = 300,
     notify_callback=None,
+):
+    with tracer.span("organic_job", job_uuid=str(job.job_uuid)) as job_span:
+        await _execute_organic_job(
+            miner_client,
+            job,
+            job_request,
+            total_job_timeout,
+            wait_timeout,
+            notify_callback,
+            job_span,
+        )
+
+
+async def _execute_organic_job(
+    miner_client,
+    job,
+    job_request,
+    total_job_timeout: int,
+    wait_timeout: int,
+    notify_callback,
+    job_span: Span,
 ):
     data = {"job_uuid": str(job.job_uuid), "miner_hotkey": miner_client.my_hotkey}
     save_event = partial(save_job_execution_event, data=data)
@@ -103,7 +125,8 @@ async def execute_organic_job(
 
     async with contextlib.AsyncExitStack() as exit_stack:
         try:
-            await exit_stack.enter_async_context(miner_client)
+            with tracer.span("organic_job.connect", job_span):
+                await exit_stack.enter_async_context(miner_client)
         except TransportConnectionError as exc:
             comment = f"Miner connection error: {exc}"
             job.status = OrganicJob.Status.FAILED
@@ -130,6 +153,7 @@ async def execute_organic_job(
         else:
             volume = job_request.volume
 
+        initial_request_sent_at = time.monotonic()
         await miner_client.send_model(
             V0InitialJobRequest(
                 job_uuid=job.job_uuid,
@@ -137,6 +161,7 @@ async def execute_organic_job(
                 base_docker_image_name=job_request.docker_image or None,
                 timeout_seconds=total_job_timeout,
                 volume_type=volume.volume_type.value if volume else None,
+                trace_context=job_span.context,
             ),
             error_event_callback=handle_send_error_event,
         )
@@ -160,6 +185,7 @@ async def execute_organic_job(
             if notify_callback:
                 await notify_callback(JobStatusUpdate.from_job(job, "failed"))
             return
+        miner_client.record_preparation_spans(job_span, initial_request_sent_at, time.monotonic())
 
         if isinstance(msg, V0DeclineJobRequest | V0ExecutorFailedRequest):
             comment = f"Miner {miner_client.miner_name} won't do job: {msg.model_dump_json()}"
@@ -201,6 +227,7 @@ async def execute_organic_job(
         else:
             output_upload = job_request.output_upload
 
+        run_span = tracer.start_span("organic_job.run", job_span)
         await miner_client.send_model(
             V0JobRequest(
                 job_uuid=job.job_uuid,
@@ -211,6 +238,7 @@ async def execute_organic_job(
                 docker_run_cmd=job_request.get_args(),
                 volume=volume,  # TODO: raw scripts
                 output_upload=output_upload,
+                trace_context=job_span.context,
             ),
             error_event_callback=handle_send_error_event,
         )
@@ -220,9 +248,12 @@ async def execute_organic_job(
                 miner_client.miner_finished_or_failed_future,
                 timeout=job_timer.time_left(),
             )
+            run_span.end()
             time_took = miner_client.miner_finished_or_failed_timestamp - full_job_sent
             logger.info(f"Miner took {time_took} seconds to finish {job.job_uuid}")
         except TimeoutError:
+            run_span.attributes["error"] = "TimeoutError"
+            run_span.end()
             comment = f"Miner {miner_client.miner_name} timed out after {total_job_timeout} seconds"
             job.status = OrganicJob.Status.FAILED
             job.comment = comment
@@ -262,15 +293,16 @@ async def execute_organic_job(
             await save_event(
                 subtype=SystemEvent.EventSubType.SUCCESS, long_description=comment, success=True
             )
-            if notify_callback:
-                await notify_callback(
-                    JobStatusUpdate.from_job(job, "completed", msg.message_type.value)
+            with tracer.span("organic_job.result_delivery", job_span):
+                if notify_callback:
+                    await notify_callback(
+                        JobStatusUpdate.from_job(job, "completed", msg.message_type.value)
+                    )
+                await miner_client.send_job_finished_receipt_message(
+                    started_timestamp=job_timer.start_time.timestamp(),
+                    time_took_seconds=job_timer.passed_time(),
+                    score=0,  # no score for organic jobs (at least right now)
                 )
-            await miner_client.send_job_finished_receipt_message(
-                started_timestamp=job_timer.start_time.timestamp(),
-                time_took_seconds=job_timer.passed_time(),
-                score=0,  # no score for organic jobs (at least right now)
-            )
             return
         else:
             comment = f"Unexpected msg from miner {miner_client.miner_name}: {msg}"
@@ -0,0 +1,85 @@
+import asyncio
+import collections
+
+from pydantic import BaseModel
+
+from compute_horde_validator.validator.metrics import VALIDATOR_FACILITATOR_MESSAGES_QUEUED
+from compute_horde_validator.validator.organic_jobs.facilitator_api import (
+    Heartbeat,
+    MachineSpecsUpdate,
+)
+from compute_horde_validator.validator.synthetic_jobs.machine_specs import gpu_set
+
+
+def _machine_key(msg: MachineSpecsUpdate) -> tuple[str, str]:
+    return msg.miner_hotkey, gpu_set(msg.specs)
+
+
+class FacilitatorOutbox:
+    """
+    Messages waiting to be sent to the facilitator, taken in batches by a single writer.
+
+    Job status updates (and any other messages) go first, then machine specs, then the heartbeat.
+    Only the latest specs of a machine are kept and only one heartbeat, so these never wait for room;
+    other messages wait while there are `max_size` of them queued. Messages which could not be
+    sent are put back in front, to be sent first over the next connection.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.messages: collections.deque[BaseModel] = collections.deque()
+        # by miner hotkey and GPUs
+        self.specs: dict[tuple[str, str], MachineSpecsUpdate] = {}
+        self.heartbeat: Heartbeat | None = None
+        self.changed = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self.messages) + len(self.specs) + (self.heartbeat is not None)
+
+    def _update_gauge(self) -> None:
+        VALIDATOR_FACILITATOR_MESSAGES_QUEUED.set(len(self))
+
+    async def put(self, msg: BaseModel) -> None:
+        async with self.changed:
+            if isinstance(msg, Heartbeat):
+                self.heartbeat = msg
+            elif isinstance(msg, MachineSpecsUpdate):
+                # newer specs replace the pending ones in their place in the queue
+                self.specs[_machine_key(msg)] = msg
+            else:
+                await self.changed.wait_for(lambda: len(self.messages) < self.max_size)
+                self.messages.append(msg)
+            self._update_gauge()
+            self.changed.notify_all()
+
+    async def take_batch(self, max_count: int) -> list[BaseModel]:
+        """Wait for messages and take up to `max_count` of them, in the order of priority"""
+        async with self.changed:
+            await self.changed.wait_for(lambda: len(self) > 0)
+            batch = []
+            while self.messages and len(batch) < max_count:
+                batch.append(self.messages.popleft())
+            while self.specs and len(batch) < max_count:
+                batch.append(self.specs.pop(next(iter(self.specs))))
+            if self.heartbeat is not None and len(batch) < max_count:
+                batch.append(self.heartbeat)
+                self.heartbeat = None
+            self._update_gauge()
+            self.changed.notify_all()
+            return batch
+
+    def requeue(self, batch: list[BaseModel]) -> None:
+        """Put back messages taken but not sent, unless superseded in the meantime"""
+        messages = [msg for msg in batch if not isinstance(msg, Heartbeat | MachineSpecsUpdate)]
+        self.messages.extendleft(reversed(messages))
+
+        specs = {
+            _machine_key(msg): msg
+            for msg in batch
+            if isinstance(msg, MachineSpecsUpdate) and _machine_key(msg) not in self.specs
+        }
+        self.specs = {**specs, **self.specs}
+
+        if self.heartbeat is None and any(isinstance(msg, Heartbeat) for msg in batch):
+            self.heartbeat = Heartbeat()
+        self._update_gauge()
@@ -0,0 +1,281 @@
+import asyncio
+import csv
+import dataclasses
+import io
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from datetime import datetime, timedelta
+
+import httpx
+from asgiref.sync import async_to_sync, sync_to_async
+from compute_horde.mv_protocol.validator_requests import (
+    JobFinishedReceiptPayload,
+    JobStartedReceiptPayload,
+)
+from compute_horde.receipts import (
+    Receipt,
+    ReceiptFetchError,
+    ReceiptType,
+    parse_receipt_row,
+    receipts_url,
+    segments_since,
+    verify_receipts,
+)
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Max, Q
+
+from compute_horde_validator.validator.models import JobFinishedReceipt, JobStartedReceipt
+from compute_horde_validator.validator.synthetic_jobs.job_generation import create_process_pool
+
+logger = logging.getLogger(__name__)
+
+# receipts are fetched again from this far back before the latest stored one of the miner,
+# in case the miner stored some of them out of order
+CUTOFF_TOLERANCE = timedelta(hours=1)
+# for connecting, and for each read of the response
+REQUEST_TIMEOUT = timedelta(seconds=5)
+
+_TIME_FIELDS = {
+    JobStartedReceipt: "time_accepted",
+    JobFinishedReceipt: "time_started",
+}
+_RECEIPT_TYPES = {
+    JobStartedReceipt: ReceiptType.JobStartedReceipt,
+    JobFinishedReceipt: ReceiptType.JobFinishedReceipt,
+}
+_COMMON_COLUMNS = ("job_uuid", "miner_hotkey", "validator_hotkey")
+_COLUMNS = {
+    JobStartedReceipt: (*_COMMON_COLUMNS, "executor_class", "time_accepted", "max_timeout"),
+    JobFinishedReceipt: (*_COMMON_COLUMNS, "time_started", "time_took_us", "score_str"),
+}
+# a single COPY per miner, into a table with the columns of both receipt types
+_COPY_TABLE = "receipts_copy"
+_COPY_TABLE_COLUMNS = (
+    "type text",
+    "job_uuid uuid",
+    "miner_hotkey text",
+    "validator_hotkey text",
+    "executor_class text",
+    "time_accepted timestamptz",
+    "max_timeout integer",
+    "time_started timestamptz",
+    "time_took_us bigint",
+    "score_str text",
+)
+
+
+@dataclasses.dataclass
+class MinerReceipts:
+    hotkey: str
+    ip: str
+    port: int
+    # per receipt type, only receipts newer than these are verified and stored
+    cutoffs: dict[ReceiptType, datetime] = dataclasses.field(default_factory=dict)
+    # per receipt type, the jobs of already stored receipts newer than the cutoffs
+    known_job_uuids: dict[ReceiptType, set[str]] = dataclasses.field(
+        default_factory=lambda: defaultdict(set)
+    )
+    stored_count: int = 0
+    error: Exception | None = None
+
+
+def _load_cutoffs(miners: dict[str, MinerReceipts]) -> None:
+    for model, time_field in _TIME_FIELDS.items():
+        receipt_type = _RECEIPT_TYPES[model]
+        latest = (
+            model.objects.filter(miner_hotkey__in=miners.keys())
+            .values("miner_hotkey")
+            .annotate(latest=Max(time_field))
+            .values_list("miner_hotkey", "latest")
+        )
+        condition = Q()
+        for hotkey, latest_time in latest:
+            cutoff = latest_time - CUTOFF_TOLERANCE
+            miners[hotkey].cutoffs[receipt_type] = cutoff
+            condition |= Q(miner_hotkey=hotkey, **{f"{time_field}__gt": cutoff})
+        if condition:
+            for hotkey, job_uuid in model.objects.filter(condition).values_list(
+                "miner_hotkey", "job_uuid"
+            ):
+                miners[hotkey].known_job_uuids[receipt_type].add(str(job_uuid))
+
+
+def _copy_row(receipt: Receipt) -> tuple:
+    payload = receipt.payload
+    common = (payload.job_uuid, payload.miner_hotkey, payload.validator_hotkey)
+    if isinstance(payload, JobStartedReceiptPayload):
+        return (
+            ReceiptType.JobStartedReceipt.value,
+            *common,
+            payload.executor_class,
+            payload.time_accepted.isoformat(),
+            payload.max_timeout,
+            None,
+            None,
+            None,
+        )
+    assert isinstance(payload, JobFinishedReceiptPayload)
+    return (
+        ReceiptType.JobFinishedReceipt.value,
+        *common,
+        None,
+        None,
+        None,
+        payload.time_started.isoformat(),
+        payload.time_took_us,
+        payload.score_str,
+    )
+
+
+def store_receipts(receipts: list[Receipt], using: str = "default") -> int:
+    """
+    Store the receipts of a miner with a single COPY into a temporary table, skipping the ones of
+    jobs already having a receipt. Returns the number of stored receipts.
+    On databases other than PostgreSQL, falls back to `bulk_create`.
+    """
+    if not receipts:
+        return 0
+    if connections[using].vendor != "postgresql":
+        return _bulk_create_receipts(receipts, using)
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(_copy_row(receipt) for receipt in receipts)
+    buffer.seek(0)
+    stored_count = 0
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(f"CREATE TEMPORARY TABLE {_COPY_TABLE} ({', '.join(_COPY_TABLE_COLUMNS)})")
+        # the underlying psycopg2 cursor
+        cursor.cursor.copy_expert(f"COPY {_COPY_TABLE} FROM STDIN WITH (FORMAT csv)", buffer)
+        for model, columns in _COLUMNS.items():
+            cursor.execute(
+                f"INSERT INTO {model._meta.db_table} ({', '.join(columns)}) "
+                f"SELECT {', '.join(columns)} FROM {_COPY_TABLE} WHERE type = %s "
+                "ON CONFLICT DO NOTHING",
+                [_RECEIPT_TYPES[model].value],
+            )
+            stored_count += cursor.rowcount
+        cursor.execute(f"DROP TABLE {_COPY_TABLE}")
+    return stored_count
+
+
+def _bulk_create_receipts(receipts: Iterable[Receipt], using: str) -> int:
+    objects = {model: [] for model in _COLUMNS}
+    for receipt in receipts:
+        model = (
+            JobStartedReceipt
+            if isinstance(receipt.payload, JobStartedReceiptPayload)
+            else JobFinishedReceipt
+        )
+        objects[model].append(
+            model(**{column: getattr(receipt.payload, column) for column in _COLUMNS[model]})
+        )
+    return sum(
+        len(model.objects.using(using).bulk_create(model_objects, ignore_conflicts=True))
+        for model, model_objects in objects.items()
+    )
+
+
+async def _iter_rows(response: httpx.Response):
+    """Rows of the receipts CSV, parsed line by line as the response is streamed"""
+    fieldnames = None
+    async for line in response.aiter_lines():
+        if not line:
+            continue
+        row = next(csv.reader((line,)))
+        if fieldnames is None:
+            fieldnames = row
+        else:
+            yield dict(zip(fieldnames, row))
+
+
+async def _segment_filenames(client: httpx.AsyncClient, miner: MinerReceipts) -> list[str]:
+    """
+    Receipts files of the miner which may have receipts newer than its cutoffs - only the
+    segments created since the older cutoff if the miner serves an index, all of them otherwise
+    """
+    if len(miner.cutoffs) < len(ReceiptType):
+        return ["receipts.csv"]
+    try:
+        response = await client.get(receipts_url(miner.ip, miner.port, "index.json"))
+        response.raise_for_status()
+        return segments_since(response.json(), min(miner.cutoffs.values()))
+    except httpx.HTTPStatusError:
+        logger.debug(f"Miner does not serve a receipts index. {miner.hotkey=}")
+    except (KeyError, TypeError, ValueError):
+        logger.warning(f"Miner sent invalid receipts index. {miner.hotkey=}")
+    return ["receipts.csv"]
+
+
+async def fetch_miner_receipts(client: httpx.AsyncClient, miner: MinerReceipts) -> list[Receipt]:
+    """Receipts of the miner newer than its cutoffs, which aren't stored yet, not verified"""
+    receipts = []
+    try:
+        for filename in await _segment_filenames(client, miner):
+            url = receipts_url(miner.ip, miner.port, filename)
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                async for raw_receipt in _iter_rows(response):
+                    receipt = parse_receipt_row(
+                        miner.hotkey, raw_receipt, miner.cutoffs, miner.known_job_uuids
+                    )
+                    if receipt is not None:
+                        receipts.append(receipt)
+    except httpx.HTTPError as e:
+        raise ReceiptFetchError("failed to get receipts from miner") from e
+    return receipts
+
+
+async def _fetch_and_store(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    pool: Executor | None,
+    miner: MinerReceipts,
+) -> None:
+    try:
+        async with semaphore:
+            async with asyncio.timeout(settings.RECEIPTS_FETCH_TIMEOUT):
+                receipts = await fetch_miner_receipts(client, miner)
+        # in another thread, the other miners keep being fetched meanwhile
+        receipts = await sync_to_async(verify_receipts, thread_sensitive=False)(receipts, pool)
+        miner.stored_count = await sync_to_async(store_receipts)(receipts)
+    except Exception as e:
+        miner.error = e
+    else:
+        logger.debug(
+            f"Stored {miner.stored_count} of {len(receipts)} new receipts. {miner.hotkey=}"
+        )
+
+
+async def _fetch_all(miners: list[MinerReceipts], pool: Executor | None) -> None:
+    concurrency = settings.RECEIPTS_FETCH_CONCURRENCY
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(REQUEST_TIMEOUT.total_seconds()),
+        limits=httpx.Limits(max_connections=concurrency),
+    ) as client:
+        await asyncio.gather(
+            *(_fetch_and_store(client, semaphore, pool, miner) for miner in miners)
+        )
+
+
+def fetch_and_store_receipts(miners: list[tuple[str, str, int]]) -> list[MinerReceipts]:
+    """
+    Fetch the receipts of the (hotkey, ip, port) miners concurrently, and store the new ones of
+    each miner as soon as they're fetched. The signatures of large batches of receipts are verified
+    in a pool of RECEIPTS_VERIFICATION_PROCESSES processes. Must not be called from an event loop.
+    """
+    results = {hotkey: MinerReceipts(hotkey, ip, port) for hotkey, ip, port in miners}
+    _load_cutoffs(results)
+    processes = settings.RECEIPTS_VERIFICATION_PROCESSES
+    # the workers are only started by the first large batch
+    pool = create_process_pool(processes) if processes > 0 else None
+    try:
+        # under `async_to_sync` the stores run in this thread, on its database connection
+        async_to_sync(_fetch_all)(list(results.values()), pool)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return list(results.values())
@@ -1,10 +1,16 @@
 import logging
+import math
 from collections import defaultdict
+from dataclasses import dataclass
 from functools import partial
 
 import numpy as np
 from compute_horde.executor_class import ExecutorClass
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from compute_horde_validator.validator.models import Miner, MinerBatchScore, SyntheticJob
 
 logger = logging.getLogger(__name__)
 
@@ -63,14 +69,8 @@ def score_jobs(jobs, score_aggregation=sum, normalization_weight=1):
     return normalize(score_per_hotkey, weight=normalization_weight)
 
 
-def score_batch(batch):
-    executor_class_jobs = defaultdict(list)
-    for job in batch.synthetic_jobs.all():
-        if job.executor_class in EXECUTOR_CLASS_WEIGHTS:
-            executor_class_jobs[job.executor_class].append(job)
-
-    parametriezed_horde_score = partial(
-        horde_score,
+def _horde_score_params():
+    return dict(
         # scaling factor for avg_score of a horde - best in range [0, 1] (0 means no effect on score)
         alpha=settings.HORDE_SCORE_AVG_PARAM,
         # sigmoid steepnes param - best in range [0, 5] (0 means no effect on score)
@@ -78,6 +78,27 @@ def score_batch(batch):
         # horde size for 0.5 value of sigmoid - sigmoid is for 1 / horde_size
         delta=1 / settings.HORDE_SCORE_CENTRAL_SIZE_PARAM,
     )
+
+
+def horde_scores(sums, counts, alpha=0, beta=0, delta=0):
+    """`horde_score` of many hordes at once, given the sum and the count of benchmarks of each"""
+    inverted_n = 1 / counts
+    avg_benchmark = sums * inverted_n
+    scaled_inverted_n = reversed_sigmoid(inverted_n, beta=10**beta, delta=delta)
+    scaled_avg_benchmark = avg_benchmark**alpha
+    return scaled_avg_benchmark * sums * scaled_inverted_n
+
+
+def score_batch(batch):
+    """
+    Score the jobs of a single batch one by one - the reference implementation of `score_batches`.
+    """
+    executor_class_jobs = defaultdict(list)
+    for job in batch.synthetic_jobs.all():
+        if job.executor_class in EXECUTOR_CLASS_WEIGHTS:
+            executor_class_jobs[job.executor_class].append(job)
+
+    parametriezed_horde_score = partial(horde_score, **_horde_score_params())
     batch_scores = defaultdict(float)
     for executor_class, jobs in executor_class_jobs.items():
         executor_class_weight = EXECUTOR_CLASS_WEIGHTS[executor_class]
@@ -96,10 +117,147 @@ def score_batch(batch):
     return batch_scores
 
 
+def aggregate_batch_scores(batch_ids) -> list[MinerBatchScore]:
+    """`MinerBatchScore`s of the batches, computed from their jobs"""
+    rows = (
+        SyntheticJob.objects.filter(batch_id__in=batch_ids)
+        .values("batch_id", "miner_id", "executor_class")
+        .annotate(score_sum=Sum("score"), job_count=Count("id"))
+        .order_by()
+    )
+    return [MinerBatchScore(**row) for row in rows]
+
+
+def rebuild_batch_scores(batch_ids) -> int:
+    """Replace the `MinerBatchScore`s of the batches with the ones computed from their jobs"""
+    aggregates = aggregate_batch_scores(batch_ids)
+    with transaction.atomic():
+        MinerBatchScore.objects.filter(batch_id__in=batch_ids).delete()
+        MinerBatchScore.objects.bulk_create(aggregates, batch_size=1000)
+    return len(aggregates)
+
+
+def check_batch_scores(batch_ids) -> list[str]:
+    """Differences between the stored `MinerBatchScore`s of the batches and their jobs"""
+
+    def key(aggregate):
+        return aggregate.batch_id, aggregate.miner_id, aggregate.executor_class
+
+    stored = {key(a): a for a in MinerBatchScore.objects.filter(batch_id__in=batch_ids)}
+    expected = {key(a): a for a in aggregate_batch_scores(batch_ids)}
+    differences = []
+    for k in sorted(stored.keys() | expected.keys()):
+        batch_id, miner_id, executor_class = k
+        label = f"batch {batch_id}, miner {miner_id}, {executor_class}"
+        if k not in stored:
+            differences.append(f"{label}: missing")
+        elif k not in expected:
+            differences.append(f"{label}: no jobs")
+        elif stored[k].job_count != expected[k].job_count or not math.isclose(
+            stored[k].score_sum, expected[k].score_sum, rel_tol=1e-9, abs_tol=1e-9
+        ):
+            differences.append(
+                f"{label}: stored {stored[k].score_sum} / {stored[k].job_count} jobs, "
+                f"expected {expected[k].score_sum} / {expected[k].job_count} jobs"
+            )
+    return differences
+
+
+@dataclass
+class Hordes:
+    """
+    Columns of the hordes (jobs of a miner in a batch, per executor class) of some batches,
+    loaded once to be scored without going back to the database.
+    """
+
+    # indexed by `miner_index` and `batch_index`
+    hotkeys: list[str]
+    batch_ids: list[int]
+    batch_index: np.ndarray
+    miner_index: np.ndarray
+    executor_classes: np.ndarray
+    score_sums: np.ndarray
+    job_counts: np.ndarray
+
+    @property
+    def batch_count(self) -> int:
+        return len(self.batch_ids)
+
+
+def load_hordes(miner_batch_scores) -> Hordes | None:
+    """Columns of the given `MinerBatchScore`s, or None if there are none"""
+    rows = [
+        (score.batch_id, score.miner_id, score.executor_class, score.score_sum, score.job_count)
+        for score in miner_batch_scores
+    ]
+    if not rows:
+        return None
+    batch_ids, miner_ids, executor_classes, score_sums, job_counts = zip(*rows)
+    miners, miner_index = np.unique(np.array(miner_ids), return_inverse=True)
+    batches, batch_index = np.unique(np.array(batch_ids), return_inverse=True)
+    hotkeys = dict(Miner.objects.filter(id__in=miners.tolist()).values_list("id", "hotkey"))
+    return Hordes(
+        hotkeys=[hotkeys[miner_id] for miner_id in miners.tolist()],
+        batch_ids=batches.tolist(),
+        batch_index=batch_index,
+        miner_index=miner_index,
+        executor_classes=np.array(executor_classes),
+        score_sums=np.array(score_sums, dtype=np.float64),
+        job_counts=np.array(job_counts, dtype=np.float64),
+    )
+
+
+def score_hordes(hordes: Hordes, executor_class_weights, alpha=0, beta=0, delta=0) -> np.ndarray:
+    """
+    Sum of `score_batch` of the batches of `hordes` for each miner (by `miner_index`):
+    the hordes of each executor class are aggregated at once, normalized per batch
+    with `np.bincount`, and summed per miner.
+    """
+    miner_count = len(hordes.hotkeys)
+    miner_scores = np.zeros(miner_count)
+    for executor_class, executor_class_weight in executor_class_weights.items():
+        in_class = hordes.executor_classes == str(executor_class)
+        if not in_class.any():
+            continue
+        horde_batch = hordes.batch_index[in_class]
+        sums = hordes.score_sums[in_class]
+        if executor_class == ExecutorClass.spin_up_4min__gpu_24gb:
+            horde_totals = horde_scores(
+                sums, hordes.job_counts[in_class], alpha=alpha, beta=beta, delta=delta
+            )
+        else:
+            horde_totals = sums
+
+        # same as `normalize`, the scores of a batch with a zero total are left as they are
+        batch_totals = np.bincount(horde_batch, weights=horde_totals, minlength=hordes.batch_count)
+        totals = batch_totals[horde_batch]
+        normalized = np.divide(
+            executor_class_weight * horde_totals,
+            totals,
+            out=horde_totals.astype(np.float64),
+            where=totals != 0,
+        )
+        miner_scores += np.bincount(
+            hordes.miner_index[in_class], weights=normalized, minlength=miner_count
+        )
+    return miner_scores
+
+
 def score_batches(batches):
+    """
+    Sum of `score_batch` of the batches for each hotkey, computed from the `MinerBatchScore`s
+    written along the jobs, so the cost depends on the number of miners rather than jobs.
+    """
     hotkeys_scores = defaultdict(float)
-    for batch in batches:
-        batch_scores = score_batch(batch)
-        for hotkey, score in batch_scores.items():
-            hotkeys_scores[hotkey] += score
+    executor_class_weights = EXECUTOR_CLASS_WEIGHTS
+    hordes = load_hordes(
+        MinerBatchScore.objects.filter(
+            batch__in=batches, executor_class__in=list(executor_class_weights)
+        )
+    )
+    if hordes is None:
+        return hotkeys_scores
+    miner_scores = score_hordes(hordes, executor_class_weights, **_horde_score_params())
+    for hotkey, score in zip(hordes.hotkeys, miner_scores.tolist()):
+        hotkeys_scores[hotkey] += score
     return hotkeys_scores
@@ -5,10 +5,10 @@ import statistics
 import time
 import uuid
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 import bittensor
 from asgiref.sync import sync_to_async
@@ -50,28 +50,44 @@ from compute_horde.mv_protocol.validator_requests import (
 from compute_horde.transport import AbstractTransport, WSTransport
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Model
 from pydantic import BaseModel
 
+from compute_horde_validator.validator.event_sink import SystemEventSink
+from compute_horde_validator.validator.metrics import (
+    VALIDATOR_MACHINE_SPECS_UNCHANGED,
+    VALIDATOR_SYNTHETIC_JOB_SEND_SKEW,
+)
 from compute_horde_validator.validator.models import (
     JobFinishedReceipt,
     JobStartedReceipt,
     Miner,
+    MinerBatchScore,
     MinerManifest,
     SyntheticJob,
     SyntheticJobBatch,
     SystemEvent,
 )
-from compute_horde_validator.validator.synthetic_jobs.generator import current
+from compute_horde_validator.validator.synthetic_jobs import job_generation, reservoir
 from compute_horde_validator.validator.synthetic_jobs.generator.base import (
     BaseSyntheticJobGenerator,
 )
+from compute_horde_validator.validator.synthetic_jobs.machine_specs import (
+    MachineSpecsEntry,
+    select_changed_specs,
+)
 from compute_horde_validator.validator.synthetic_jobs.scoring import get_manifest_multiplier
+from compute_horde_validator.validator.synthetic_jobs.send_scheduler import SendScheduler
+from compute_horde_validator.validator.synthetic_jobs.volume_arena import ArenaVolume, VolumeArena
+from compute_horde_validator.validator.synthetic_jobs.write_behind import WriteBehindQueue
 from compute_horde_validator.validator.utils import MACHINE_SPEC_CHANNEL
 
 logger = logging.getLogger(__name__)
 
 _GIVE_AVERAGE_JOB_SEND_TIME_BONUS = False
 
+_R = TypeVar("_R")
+
 # always-on executor classes have spin_up_time=0, but realistically
 # we need a bit more for all the back-and-forth messaging, especially
 # when we talk with a lot of executors
@@ -212,6 +228,22 @@ class MinerClient(AbstractMinerClient):
         )
 
 
+class DeadlineBarrier:
+    """
+    Shared send start when the senders are spread across processes.
+
+    `synchronize` agrees with the other processes on a `time.monotonic()` deadline,
+    which is shared by all processes on the machine, the sends are scheduled relative to it.
+    """
+
+    def __init__(self, get_deadline: Callable[[], Awaitable[float]]):
+        self._get_deadline = get_deadline
+        self.deadline: float | None = None
+
+    async def synchronize(self) -> None:
+        self.deadline = await self._get_deadline()
+
+
 @dataclass
 class ExceptionInfo:
     exception: BaseException
@@ -230,7 +262,16 @@ class Job:
     miner_hotkey: str
     executor_class: ExecutorClass
     job_generator: BaseSyntheticJobGenerator
-    volume_contents: str
+    # released after sending the job request
+    volume: ArenaVolume | None
+    volume_size: int
+
+    # request frames, rendered before the sends are scheduled and released after sending,
+    # so that nothing but sending happens between the release and the send
+    initial_job_request_json: str | None = None
+    # the job request is rendered without the volume contents, they are only encoded
+    # into it at send time, so that the requests of all jobs are never held at once
+    job_request_envelope: tuple[str, str] | None = None
 
     # responses
 
@@ -239,7 +280,10 @@ class Job:
     exception_time: datetime | None = None
     exception_stage: str | None = None
 
+    # start of the send schedule, the request itself is scheduled after the stagger wait
     accept_barrier_time: datetime | None = None
+    # seconds between the scheduled instant and the start of sending
+    accept_send_lateness: float | None = None
     accept_before_sent_time: datetime | None = None
     accept_after_sent_time: datetime | None = None
     accept_response: V0AcceptJobRequest | V0DeclineJobRequest | None = None
@@ -251,6 +295,7 @@ class Job:
     executor_response_event: asyncio.Event = field(default_factory=asyncio.Event)
 
     job_barrier_time: datetime | None = None
+    job_send_lateness: float | None = None
     job_before_sent_time: datetime | None = None
     job_after_sent_time: datetime | None = None
     job_response: V0JobFailedRequest | V0JobFinishedRequest | None = None
@@ -347,11 +392,12 @@ class Job:
             docker_image_name=self.job_generator.docker_image_name(),
             docker_run_options_preset=self.job_generator.docker_run_options_preset(),
             timeout_seconds=self.job_generator.timeout_seconds(),
-            volume_contents_size=len(self.volume_contents),
+            volume_contents_size=self.volume_size,
             exception=repr(self.exception) if self.exception is not None else None,
             exception_time=_datetime_dump(self.exception_time),
             exception_stage=self.exception_stage,
             accept_barrier_time=_datetime_dump(self.accept_barrier_time),
+            accept_send_lateness=self.accept_send_lateness,
             accept_before_sent_time=_datetime_dump(self.accept_before_sent_time),
             accept_after_sent_time=_datetime_dump(self.accept_after_sent_time),
             accept_response=_model_dump(self.accept_response),
@@ -359,6 +405,7 @@ class Job:
             executor_response=_model_dump(self.executor_response),
             executor_response_time=_datetime_dump(self.executor_response_time),
             job_barrier_time=_datetime_dump(self.job_barrier_time),
+            job_send_lateness=self.job_send_lateness,
             job_before_sent_time=_datetime_dump(self.job_before_sent_time),
             job_after_sent_time=_datetime_dump(self.job_after_sent_time),
             job_response=_model_dump(self.job_response),
@@ -424,6 +471,14 @@ class BatchContext:
     stage_start_time: dict[str, datetime]
     average_job_send_time: timedelta | None = None
 
+    # decoded volumes of all jobs, released after sending the job requests
+    volume_arena: VolumeArena | None = None
+
+    # write-behind persistence of the results, created with the first queued rows
+    db_writer: WriteBehindQueue | None = None
+    # (model name, key) of the rows already queued in their final state
+    db_queued: set[tuple[str, str]] = field(default_factory=set)
+
     # for tests
     _loop: asyncio.AbstractEventLoop | None = None
 
@@ -761,16 +816,28 @@ async def _close_client(ctx: BatchContext, miner_hotkey: str) -> None:
 
 
 async def _generate_jobs(ctx: BatchContext) -> None:
-    start_time = time.time()
-    generated_job_count = 0
+    executor_classes: list[ExecutorClass] = []
+    for executors in ctx.executors.values():
+        for executor_class, count in executors.items():
+            executor_classes.extend([executor_class] * count)
+
+    prepared_jobs = await reservoir.atake_jobs(len(executor_classes))
+    result = await job_generation.generate_jobs(
+        executor_classes,
+        processes=settings.SYNTHETIC_JOBS_GENERATION_PROCESSES,
+        chunk_size=settings.SYNTHETIC_JOBS_GENERATION_CHUNK_SIZE,
+        prepared_jobs=prepared_jobs,
+    )
+    await reservoir.areturn_jobs(result.unused_prepared_jobs)
 
+    generated_jobs = iter(result.jobs)
     for hotkey, executors in ctx.executors.items():
         miner_name = ctx.names[hotkey]
         for executor_class, count in executors.items():
             job_generators = []
             for _ in range(count):
-                job_generator = await current.synthetic_job_generator_factory.create(executor_class)
-                await job_generator.ainit()
+                generated_job = next(generated_jobs)
+                job_generator = generated_job.job_generator
                 job_uuid = str(job_generator.uuid())
                 ctx.jobs[job_uuid] = Job(
                     ctx=ctx,
@@ -779,33 +846,49 @@ async def _generate_jobs(ctx: BatchContext) -> None:
                     miner_hotkey=hotkey,
                     executor_class=executor_class,
                     job_generator=job_generator,
-                    volume_contents=await job_generator.volume_contents(),
+                    volume=generated_job.volume,
+                    volume_size=generated_job.volume.size,
                 )
                 ctx.job_uuids.append(job_uuid)
                 job_generators.append(job_generator)
-                generated_job_count += 1
             ctx.job_generators[hotkey][executor_class] = job_generators
 
-    duration = time.time() - start_time
-    logger.info("Generated %d jobs in %.2f seconds", generated_job_count, duration)
-
-
-async def _send_initial_job_request(
-    ctx: BatchContext, start_barrier: asyncio.Barrier, max_spin_up_time: int, job_uuid: str
-) -> None:
-    await start_barrier.wait()
-    barrier_time = datetime.now(tz=UTC)
+    ctx.volume_arena = result.volume_arena
+
+    ctx.system_event(
+        type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+        subtype=SystemEvent.EventSubType.SYNTHETIC_JOB_GENERATION,
+        description="job generation telemetry",
+        data=dict(
+            job_count=len(result.jobs),
+            offloaded_job_count=result.offloaded_job_count,
+            prepared_job_count=result.prepared_job_count,
+            chunk_count=result.chunk_count,
+            processes=settings.SYNTHETIC_JOBS_GENERATION_PROCESSES,
+            chunk_size=settings.SYNTHETIC_JOBS_GENERATION_CHUNK_SIZE,
+            volume_arena_size=len(result.volume_arena),
+            timings=dict(result.timings),
+        ),
+    )
+    logger.info(
+        "Generated %d jobs (%d prepared, %d offloaded) in %.2f seconds",
+        len(result.jobs),
+        result.prepared_job_count,
+        result.offloaded_job_count,
+        result.timings["total"],
+    )
 
-    job = ctx.jobs[job_uuid]
-    job.accept_barrier_time = barrier_time
-    client = ctx.clients[job.miner_hotkey]
 
+def _get_stagger_wait_interval(job: Job, max_spin_up_time: int) -> int:
     spin_up_time = EXECUTOR_CLASS[job.executor_class].spin_up_time
     assert spin_up_time is not None
     spin_up_time = max(spin_up_time, _MIN_SPIN_UP_TIME)
     stagger_wait_interval = max_spin_up_time - spin_up_time
     assert stagger_wait_interval >= 0
+    return stagger_wait_interval
 
+
+def _render_initial_job_request(job: Job) -> str:
     request = V0InitialJobRequest(
         job_uuid=job.uuid,
         executor_class=job.executor_class,
@@ -813,17 +896,36 @@ async def _send_initial_job_request(
         timeout_seconds=job.job_generator.timeout_seconds(),
         volume_type=VolumeType.inline,
     )
-    request_json = request.model_dump_json()
+    return request.model_dump_json()
+
+
+async def _send_initial_job_request(
+    ctx: BatchContext,
+    scheduler: SendScheduler,
+    start: float,
+    max_spin_up_time: int,
+    job_uuid: str,
+) -> None:
+    job = ctx.jobs[job_uuid]
+    client = ctx.clients[job.miner_hotkey]
 
-    async with asyncio.timeout(max_spin_up_time):
-        if stagger_wait_interval > 0:
-            await asyncio.sleep(stagger_wait_interval)
+    # rendered by _multi_send_initial_job_request
+    request_json = job.initial_job_request_json
+    assert request_json is not None
+
+    # the spin-up time counts from the start of the schedule
+    async with asyncio.timeout(start - time.monotonic() + max_spin_up_time):
+        # scheduled after the stagger wait by _multi_send_initial_job_request
+        send_at = await scheduler.wait(job_uuid)
 
         # send can block, so take a timestamp
         # on both sides to detect long send times
+        job.accept_send_lateness = time.monotonic() - send_at
         job.accept_before_sent_time = datetime.now(tz=UTC)
         await client.send_check(request_json)
         job.accept_after_sent_time = datetime.now(tz=UTC)
+        job.initial_job_request_json = None
+        del request_json
 
         await job.accept_response_event.wait()
         if isinstance(job.accept_response, V0AcceptJobRequest):
@@ -831,6 +933,8 @@ async def _send_initial_job_request(
 
     # send the receipt from outside the timeout
     if isinstance(job.executor_response, V0ExecutorReadyRequest):
+        # the receipt includes the time the executor became ready,
+        # so unlike the requests it can't be rendered up front
         _generate_job_started_receipt(ctx, job)
         assert job.job_started_receipt is not None
         try:
@@ -847,16 +951,12 @@ async def _send_initial_job_request(
             )
 
 
-async def _send_job_request(
-    ctx: BatchContext, start_barrier: asyncio.Barrier, job_uuid: str
-) -> None:
-    await start_barrier.wait()
-    barrier_time = datetime.now(tz=UTC)
-
-    job = ctx.jobs[job_uuid]
-    job.job_barrier_time = barrier_time
-    client = ctx.clients[job.miner_hotkey]
-
+def _render_job_request_envelope(job: Job) -> tuple[str, str]:
+    """
+    Render the job request JSON with a placeholder instead of the volume contents,
+    and split it around the placeholder.
+    """
+    placeholder = uuid.uuid4().hex
     request = V0JobRequest(
         job_uuid=job.uuid,
         executor_class=job.executor_class,
@@ -864,44 +964,96 @@ async def _send_job_request(
         docker_run_options_preset=job.job_generator.docker_run_options_preset(),
         docker_run_cmd=job.job_generator.docker_run_cmd(),
         raw_script=job.job_generator.raw_script(),
-        volume=InlineVolume(contents=job.volume_contents),
+        volume=InlineVolume(contents=placeholder),
         output_upload=None,
     )
-    request_json = request.model_dump_json()
+    prefix, found, suffix = request.model_dump_json().partition(placeholder)
+    assert found
+    return prefix, suffix
+
+
+def _render_job_request(job: Job) -> str:
+    assert job.job_request_envelope is not None
+    assert job.volume is not None
+    prefix, suffix = job.job_request_envelope
+    return prefix + job.volume.contents + suffix
+
+
+def _release_volumes(ctx: BatchContext) -> None:
+    for job in ctx.jobs.values():
+        job.volume = None
+    ctx.volume_arena = None
+
+
+async def _send_job_request(ctx: BatchContext, scheduler: SendScheduler, job_uuid: str) -> None:
+    job = ctx.jobs[job_uuid]
+    client = ctx.clients[job.miner_hotkey]
+
+    # rendered by _multi_send_job_request
+    assert job.job_request_envelope is not None
+
+    send_at = await scheduler.wait(job_uuid)
 
     timeout = job.job_generator.timeout_seconds() + _JOB_RESPONSE_EXTRA_TIMEOUT
     async with asyncio.timeout(timeout):
         # send can block, so take a timestamp
         # on both sides to detect long send times
+        job.job_send_lateness = time.monotonic() - send_at
         job.job_before_sent_time = datetime.now(tz=UTC)
+        request_json = _render_job_request(job)
         await client.send_check(request_json)
         job.job_after_sent_time = datetime.now(tz=UTC)
+        # don't hold on to the request while waiting for the response
+        job.job_request_envelope = None
+        job.volume = None
+        del request_json
 
         await job.job_response_event.wait()
 
 
-async def _send_job_finished_receipts(ctx: BatchContext) -> None:
+def _render_job_finished_receipts(ctx: BatchContext) -> list[tuple[Job, str]]:
+    # generate and render job finished receipts for all jobs
+    # which returned a response, even if they failed
+    receipts: list[tuple[Job, str]] = []
     for job in ctx.jobs.values():
-        # generate job finished receipts for all jobs
-        # which returned a response, even if they failed
         if job.job_response is not None:
-            client = ctx.clients[job.miner_hotkey]
             try:
                 _generate_job_finished_receipt(ctx, job)
                 assert job.job_finished_receipt is not None
-
-                receipt_json = job.job_finished_receipt.model_dump_json()
-                async with asyncio.timeout(_SEND_RECEIPT_TIMEOUT):
-                    await client.send_check(receipt_json)
-
-            except (Exception, asyncio.CancelledError) as exc:
-                logger.warning("%s failed to send job finished receipt: %r", job.name, exc)
+                receipts.append((job, job.job_finished_receipt.model_dump_json()))
+            except Exception as exc:
+                logger.warning("%s failed to generate job finished receipt: %r", job.name, exc)
                 job.system_event(
                     type=SystemEvent.EventType.RECEIPT_FAILURE,
                     subtype=SystemEvent.EventSubType.RECEIPT_SEND_ERROR,
                     description=repr(exc),
                     func="_send_job_finished_receipts",
                 )
+    return receipts
+
+
+async def _send_rendered_job_finished_receipts(
+    ctx: BatchContext, receipts: list[tuple[Job, str]]
+) -> None:
+    for job, receipt_json in receipts:
+        client = ctx.clients[job.miner_hotkey]
+        try:
+            async with asyncio.timeout(_SEND_RECEIPT_TIMEOUT):
+                await client.send_check(receipt_json)
+        except (Exception, asyncio.CancelledError) as exc:
+            logger.warning("%s failed to send job finished receipt: %r", job.name, exc)
+            job.system_event(
+                type=SystemEvent.EventType.RECEIPT_FAILURE,
+                subtype=SystemEvent.EventSubType.RECEIPT_SEND_ERROR,
+                description=repr(exc),
+                func="_send_job_finished_receipts",
+            )
+
+
+async def _send_job_finished_receipts(ctx: BatchContext) -> None:
+    # render all receipts before sending any of them
+    receipts = _render_job_finished_receipts(ctx)
+    await _send_rendered_job_finished_receipts(ctx, receipts)
 
 
 def _emit_decline_or_failure_events(ctx: BatchContext) -> None:
@@ -926,7 +1078,21 @@ def _emit_decline_or_failure_events(ctx: BatchContext) -> None:
             )
 
 
+def _observe_send_skew(ctx: BatchContext) -> None:
+    for job in ctx.jobs.values():
+        if job.accept_send_lateness is not None:
+            VALIDATOR_SYNTHETIC_JOB_SEND_SKEW.labels(request_type="initial_job_request").observe(
+                job.accept_send_lateness
+            )
+        if job.job_send_lateness is not None:
+            VALIDATOR_SYNTHETIC_JOB_SEND_SKEW.labels(request_type="job_request").observe(
+                job.job_send_lateness
+            )
+
+
 def _emit_telemetry_events(ctx: BatchContext) -> None:
+    _observe_send_skew(ctx)
+
     batch_system_event = ctx.emit_telemetry_event()
     if batch_system_event is not None:
         counts = batch_system_event.data.get("counts")
@@ -943,26 +1109,35 @@ async def _send_machine_specs(ctx: BatchContext) -> None:
     send_exc: BaseException | None = None
     send_exc_count = 0
 
-    for job in ctx.jobs.values():
-        # only take into account machine specs from executors which
-        # finished the job successfully, to prevent fake executors
-        # from pushing specs for non-existing GPUs
-        if job.success and job.machine_specs is not None:
-            try:
-                async with asyncio.timeout(_SEND_MACHINE_SPECS_TIMEOUT):
-                    await channel_layer.send(
-                        MACHINE_SPEC_CHANNEL,
-                        {
-                            "type": "machine.specs",
-                            "batch_id": ctx.uuid,
-                            "miner_hotkey": job.miner_hotkey,
-                            "specs": job.machine_specs.specs.specs,
-                        },
-                    )
-            except (Exception, asyncio.CancelledError) as exc:
-                send_exc = exc
-                send_exc_count += 1
-                logger.warning("%s failed to send machine specs: %r", job.name, exc)
+    # only take into account machine specs from executors which
+    # finished the job successfully, to prevent fake executors
+    # from pushing specs for non-existing GPUs
+    entries = [
+        MachineSpecsEntry.from_specs(job.miner_hotkey, job.machine_specs.specs.specs)
+        for job in ctx.jobs.values()
+        if job.success and job.machine_specs is not None
+    ]
+    # the same hardware reports the same specs batch after batch, only send the changed ones
+    changed = await select_changed_specs(entries)
+    VALIDATOR_MACHINE_SPECS_UNCHANGED.inc(len(entries) - len(changed))
+
+    # recorded as sent by the facilitator client, once actually sent to the facilitator
+    for entry in changed:
+        try:
+            async with asyncio.timeout(_SEND_MACHINE_SPECS_TIMEOUT):
+                await channel_layer.send(
+                    MACHINE_SPEC_CHANNEL,
+                    {
+                        "type": "machine.specs",
+                        "batch_id": ctx.uuid,
+                        "miner_hotkey": entry.miner_hotkey,
+                        "specs": entry.specs,
+                    },
+                )
+        except (Exception, asyncio.CancelledError) as exc:
+            send_exc = exc
+            send_exc_count += 1
+            logger.warning("%s failed to send machine specs: %r", entry.miner_hotkey, exc)
 
     if send_exc_count:
         msg = f"{send_exc_count} exceptions raised when trying to send machine specs. last one: {send_exc!r}"
@@ -1028,27 +1203,102 @@ async def _multi_close_client(ctx: BatchContext) -> None:
             assert result is None
 
 
-async def _multi_send_initial_job_request(ctx: BatchContext) -> None:
-    max_spin_up_time = _get_max_spin_up_time(ctx)
+def _render_requests(
+    ctx: BatchContext, job_uuids: list[str], render: Callable[[Job], _R], stage: str
+) -> tuple[dict[str, _R], list[ExceptionInfo]]:
+    """
+    Render the requests of `job_uuids` up front, so there is no serialization work
+    between the scheduled instant and sending. Jobs whose request can't be rendered are left out.
+    """
+    requests_json: dict[str, _R] = {}
+    exceptions: list[ExceptionInfo] = []
+    for job_uuid in job_uuids:
+        job = ctx.jobs[job_uuid]
+        try:
+            requests_json[job_uuid] = render(job)
+        except Exception as exc:
+            job.exception = exc
+            job.exception_time = datetime.now(tz=UTC)
+            job.exception_stage = stage
+            exceptions.append(
+                ExceptionInfo(
+                    exception=job.exception,
+                    miner_hotkey=job.miner_hotkey,
+                    job_uuid=job.uuid,
+                    stage=job.exception_stage,
+                )
+            )
+    return requests_json, exceptions
+
+
+async def _get_send_start(start_barrier: DeadlineBarrier | None) -> tuple[float, datetime]:
+    """`time.monotonic()` and wall clock time of the start of a send schedule"""
+    if start_barrier is None:
+        return time.monotonic(), datetime.now(tz=UTC)
+    await start_barrier.synchronize()
+    assert start_barrier.deadline is not None
+    delay = start_barrier.deadline - time.monotonic()
+    return start_barrier.deadline, datetime.now(tz=UTC) + timedelta(seconds=delay)
+
+
+async def _run_send_schedule(
+    scheduler: SendScheduler, tasks: list[asyncio.Task]
+) -> list[BaseException | None]:
+    scheduler_task = asyncio.create_task(scheduler.run(), name="SendScheduler.run")
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # only still running if all the senders failed before their release
+        scheduler_task.cancel()
+
+
+async def _multi_send_initial_job_request(
+    ctx: BatchContext,
+    start_barrier: DeadlineBarrier | None = None,
+    max_spin_up_time: int | None = None,
+) -> None:
+    """
+    Each request is scheduled at the start of the schedule plus its stagger wait interval,
+    so that all executors are expected to be ready at the same time.
+
+    A `start_barrier` and the `max_spin_up_time` of the whole batch are passed in
+    when the jobs of the batch are split across processes.
+    """
+    if max_spin_up_time is None:
+        max_spin_up_time = _get_max_spin_up_time(ctx)
     logger.debug("Max spin-up time: %d seconds", max_spin_up_time)
 
-    logger.info("Sending initial job requests for %d jobs", len(ctx.job_uuids))
-    start_barrier = asyncio.Barrier(len(ctx.job_uuids))
+    requests_json, exceptions = _render_requests(
+        ctx, ctx.job_uuids, _render_initial_job_request, "_render_initial_job_request"
+    )
+    job_uuids = list(requests_json)
+    for job_uuid, request_json in requests_json.items():
+        ctx.jobs[job_uuid].initial_job_request_json = request_json
+    del requests_json
+
+    logger.info("Sending initial job requests for %d jobs", len(job_uuids))
+    start, start_time = await _get_send_start(start_barrier)
+    scheduler = SendScheduler()
+    for job_uuid in job_uuids:
+        job = ctx.jobs[job_uuid]
+        job.accept_barrier_time = start_time
+        stagger_wait_interval = _get_stagger_wait_interval(job, max_spin_up_time)
+        scheduler.schedule(job_uuid, start + stagger_wait_interval, group=job.miner_hotkey)
     tasks = [
         asyncio.create_task(
-            _send_initial_job_request(ctx, start_barrier, max_spin_up_time, job_uuid),
+            _send_initial_job_request(ctx, scheduler, start, max_spin_up_time, job_uuid),
             name=f"{job_uuid}._send_initial_job_request",
         )
-        for job_uuid in ctx.job_uuids
+        for job_uuid in job_uuids
     ]
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    results = await _run_send_schedule(scheduler, tasks)
 
-    exceptions: list[ExceptionInfo] = []
     for i, result in enumerate(results):
         if isinstance(result, BaseException):
-            job_uuid = ctx.job_uuids[i]
+            job_uuid = job_uuids[i]
             job = ctx.jobs[job_uuid]
+            job.initial_job_request_json = None
             job.exception = result
             job.exception_time = datetime.now(tz=UTC)
             job.exception_stage = "_send_initial_job_request"
@@ -1065,7 +1315,9 @@ async def _multi_send_initial_job_request(ctx: BatchContext) -> None:
     _handle_exceptions(ctx, exceptions)
 
 
-async def _multi_send_job_request(ctx: BatchContext) -> None:
+async def _multi_send_job_request(
+    ctx: BatchContext, start_barrier: DeadlineBarrier | None = None
+) -> None:
     executor_ready_job_uuids = [
         job.uuid
         for job in ctx.jobs.values()
@@ -1075,23 +1327,40 @@ async def _multi_send_job_request(ctx: BatchContext) -> None:
         # the executor decide to abort the job before the details were sent
         and job.job_response is None
     ]
+
+    envelopes, exceptions = _render_requests(
+        ctx,
+        executor_ready_job_uuids,
+        _render_job_request_envelope,
+        "_render_job_request_envelope",
+    )
+    executor_ready_job_uuids = list(envelopes)
+    for job_uuid, envelope in envelopes.items():
+        ctx.jobs[job_uuid].job_request_envelope = envelope
+    del envelopes
+
     logger.info("Sending job requests for %d ready jobs", len(executor_ready_job_uuids))
-    start_barrier = asyncio.Barrier(len(executor_ready_job_uuids))
+    start, start_time = await _get_send_start(start_barrier)
+    scheduler = SendScheduler()
+    for job_uuid in executor_ready_job_uuids:
+        job = ctx.jobs[job_uuid]
+        job.job_barrier_time = start_time
+        scheduler.schedule(job_uuid, start, group=job.miner_hotkey)
     tasks = [
         asyncio.create_task(
-            _send_job_request(ctx, start_barrier, job_uuid),
+            _send_job_request(ctx, scheduler, job_uuid),
             name=f"{job_uuid}._send_job_request",
         )
         for job_uuid in executor_ready_job_uuids
     ]
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    results = await _run_send_schedule(scheduler, tasks)
 
-    exceptions: list[ExceptionInfo] = []
     for i, result in enumerate(results):
         if isinstance(result, BaseException):
             job_uuid = executor_ready_job_uuids[i]
             job = ctx.jobs[job_uuid]
+            job.job_request_envelope = None
             job.exception = result
             job.exception_time = datetime.now(tz=UTC)
             job.exception_stage = "_send_job_request"
@@ -1105,6 +1374,8 @@ async def _multi_send_job_request(ctx: BatchContext) -> None:
             )
         else:
             assert result is None
+    # the volumes of the jobs not sent
+    _release_volumes(ctx)
     _handle_exceptions(ctx, exceptions)
 
 
@@ -1285,128 +1556,246 @@ def _db_persist_system_events(ctx: BatchContext) -> None:
         return
 
     logger.info("Persisting %d system events", len(ctx.events))
+    sink = SystemEventSink()
     try:
-        # it's possible some events were already inserted during
-        # a previous call, but the operation failed before clearing
-        # the events list, so ignore insert conflicts
-        SystemEvent.objects.bulk_create(ctx.events, ignore_conflicts=True)
-        # we call this function multiple times during a batch,
-        # clear the list to avoid persisting the same event
-        # multiple times
-        ctx.events.clear()
+        with sink:
+            sink.extend(ctx.events)
     except Exception as exc:
         logger.error("Failed to persist system events: %r", exc)
+    finally:
+        # we call this function multiple times during a batch, drop the
+        # events already written to avoid persisting them multiple times
+        del ctx.events[: sink.written_count]
 
 
 # sync_to_async is needed since we use the sync Django ORM
 @sync_to_async
-def _db_persist(ctx: BatchContext) -> None:
-    start_time = time.time()
+def _db_get_or_create_batch(ctx: BatchContext) -> None:
+    if ctx.batch_id is None:
+        batch = SyntheticJobBatch.objects.create(started_at=ctx.stage_start_time["BATCH_BEGIN"])
+        ctx.batch_id = batch.id
 
-    # persist the batch and the jobs in the same transaction, to
-    # prevent a situation where because of a crash only some of
-    # the jobs are saved, which would generate incorrect weights
-    with transaction.atomic():
-        if ctx.batch_id is not None:
-            batch = SyntheticJobBatch.objects.get(id=ctx.batch_id)
-        else:
-            batch = SyntheticJobBatch(
-                started_at=ctx.stage_start_time["BATCH_BEGIN"],
-            )
-        # accepting_results_until is not used anywhere, it doesn't
-        # matter that we pick a somewhat arbitrary time for it
-        now = datetime.now(tz=UTC)
-        batch.accepting_results_until = ctx.stage_start_time.get("_multi_send_job_request", now)
-        batch.save()
 
-        synthetic_jobs: list[SyntheticJob] = []
-        for job in ctx.jobs.values():
-            axon = ctx.axons[job.miner_hotkey]
-            miner = ctx.miners[job.miner_hotkey]
-            status = SyntheticJob.Status.COMPLETED if job.success else SyntheticJob.Status.FAILED
-            synthetic_job = SyntheticJob(
-                job_uuid=job.uuid,
-                batch=batch,
-                miner=miner,
-                miner_address=axon.ip,
-                miner_address_ip_version=axon.ip_type,
-                miner_port=axon.port,
+def _get_db_writer(ctx: BatchContext) -> WriteBehindQueue:
+    if ctx.db_writer is None:
+        ctx.db_writer = WriteBehindQueue(settings.SYNTHETIC_JOBS_PERSIST_CHUNK_SIZE)
+    return ctx.db_writer
+
+
+def _queue_db_rows(
+    ctx: BatchContext, model: type[Model], rows: dict[str, Model], **bulk_create_kwargs
+) -> None:
+    """Queue the final state of `rows` (key -> row), skipping the rows queued before"""
+    objs = []
+    for key, obj in rows.items():
+        if (model.__name__, key) not in ctx.db_queued:
+            ctx.db_queued.add((model.__name__, key))
+            objs.append(obj)
+    if objs:
+        _get_db_writer(ctx).put(model, objs, **bulk_create_kwargs)
+
+
+def _synthetic_job(ctx: BatchContext, job: Job, status: SyntheticJob.Status) -> SyntheticJob:
+    assert ctx.batch_id is not None
+    axon = ctx.axons[job.miner_hotkey]
+    return SyntheticJob(
+        job_uuid=job.uuid,
+        batch_id=ctx.batch_id,
+        miner=ctx.miners[job.miner_hotkey],
+        miner_address=axon.ip,
+        miner_address_ip_version=axon.ip_type,
+        miner_port=axon.port,
+        executor_class=job.executor_class,
+        status=status,
+        comment=job.comment,
+        job_description=job.job_generator.job_description(),
+        score=job.score,
+    )
+
+
+def _queue_synthetic_jobs(ctx: BatchContext) -> None:
+    rows: dict[str, Model] = {}
+    for job in ctx.jobs.values():
+        status = SyntheticJob.Status.COMPLETED if job.success else SyntheticJob.Status.FAILED
+        rows[job.uuid] = _synthetic_job(ctx, job, status)
+    # overwrites the pending rows
+    _queue_db_rows(
+        ctx,
+        SyntheticJob,
+        rows,
+        update_conflicts=True,
+        unique_fields=["job_uuid"],
+        update_fields=["status", "comment", "score"],
+    )
+
+
+def _queue_miner_batch_scores(ctx: BatchContext) -> None:
+    assert ctx.batch_id is not None
+    rows: dict[str, Model] = {}
+    for job in ctx.jobs.values():
+        key = f"{job.miner_hotkey}:{job.executor_class}"
+        if key not in rows:
+            rows[key] = MinerBatchScore(
+                batch_id=ctx.batch_id,
+                miner=ctx.miners[job.miner_hotkey],
                 executor_class=job.executor_class,
-                status=status,
-                comment=job.comment,
-                job_description=job.job_generator.job_description(),
-                score=job.score,
             )
-            synthetic_jobs.append(synthetic_job)
-        SyntheticJob.objects.bulk_create(synthetic_jobs)
+        rows[key].score_sum += job.score
+        rows[key].job_count += 1
+    # queued along the jobs they are computed from, so they are never out of sync
+    _queue_db_rows(
+        ctx,
+        MinerBatchScore,
+        rows,
+        update_conflicts=True,
+        unique_fields=["batch", "miner", "executor_class"],
+        update_fields=["score_sum", "job_count"],
+    )
+
 
-    miner_manifests: list[MinerManifest] = []
+def _queue_miner_manifests(ctx: BatchContext) -> None:
+    assert ctx.batch_id is not None
+    rows: dict[str, Model] = {}
     for miner in ctx.miners.values():
         manifest = ctx.manifests[miner.hotkey]
         if manifest is not None:
-            miner_manifests.append(
-                MinerManifest(
-                    miner=miner,
-                    batch=batch,
-                    executor_count=manifest.total_count,
-                    online_executor_count=ctx.online_executor_count[miner.hotkey],
-                )
+            rows[miner.hotkey] = MinerManifest(
+                miner=miner,
+                batch_id=ctx.batch_id,
+                executor_count=manifest.total_count,
+                online_executor_count=ctx.online_executor_count[miner.hotkey],
             )
-    MinerManifest.objects.bulk_create(miner_manifests)
+    _queue_db_rows(ctx, MinerManifest, rows, ignore_conflicts=True)
+
 
-    job_started_receipts: list[JobStartedReceipt] = []
+def _queue_job_started_receipts(ctx: BatchContext) -> None:
+    rows: dict[str, Model] = {}
     for job in ctx.jobs.values():
         if job.job_started_receipt is not None:
             payload = job.job_started_receipt.payload
-            job_started_receipts.append(
-                JobStartedReceipt(
-                    job_uuid=payload.job_uuid,
-                    miner_hotkey=payload.miner_hotkey,
-                    validator_hotkey=payload.validator_hotkey,
-                    executor_class=payload.executor_class,
-                    time_accepted=payload.time_accepted,
-                    max_timeout=payload.max_timeout,
-                )
+            rows[job.uuid] = JobStartedReceipt(
+                job_uuid=payload.job_uuid,
+                miner_hotkey=payload.miner_hotkey,
+                validator_hotkey=payload.validator_hotkey,
+                executor_class=payload.executor_class,
+                time_accepted=payload.time_accepted,
+                max_timeout=payload.max_timeout,
             )
-    JobStartedReceipt.objects.bulk_create(job_started_receipts)
+    _queue_db_rows(ctx, JobStartedReceipt, rows, ignore_conflicts=True)
+
 
-    job_finished_receipts: list[JobFinishedReceipt] = []
+def _queue_job_finished_receipts(ctx: BatchContext) -> None:
+    rows: dict[str, Model] = {}
     for job in ctx.jobs.values():
         if job.job_finished_receipt is not None:
             payload = job.job_finished_receipt.payload
-            job_finished_receipts.append(
-                JobFinishedReceipt(
-                    job_uuid=payload.job_uuid,
-                    miner_hotkey=payload.miner_hotkey,
-                    validator_hotkey=payload.validator_hotkey,
-                    time_started=payload.time_started,
-                    time_took_us=payload.time_took_us,
-                    score_str=payload.score_str,
-                )
+            rows[job.uuid] = JobFinishedReceipt(
+                job_uuid=payload.job_uuid,
+                miner_hotkey=payload.miner_hotkey,
+                validator_hotkey=payload.validator_hotkey,
+                time_started=payload.time_started,
+                time_took_us=payload.time_took_us,
+                score_str=payload.score_str,
             )
-    JobFinishedReceipt.objects.bulk_create(job_finished_receipts)
+    _queue_db_rows(ctx, JobFinishedReceipt, rows, ignore_conflicts=True)
+
+
+async def _db_persist_pending_jobs(ctx: BatchContext) -> None:
+    """
+    Start persisting the batch in the background as soon as the job responses are in:
+    the jobs, still pending, and their job started receipts.
+    """
+    await _db_get_or_create_batch(ctx)
+    pending_jobs = [
+        _synthetic_job(ctx, job, SyntheticJob.Status.PENDING) for job in ctx.jobs.values()
+    ]
+    # never overwrite the final rows, in case this chunk is retried after them
+    _get_db_writer(ctx).put(SyntheticJob, pending_jobs, ignore_conflicts=True)
+    _queue_job_started_receipts(ctx)
+
+
+async def _db_persist_scored_jobs(ctx: BatchContext) -> None:
+    await _db_get_or_create_batch(ctx)
+    _queue_synthetic_jobs(ctx)
+    _queue_miner_batch_scores(ctx)
+    _queue_miner_manifests(ctx)
+
+
+# sync_to_async is needed since we use the sync Django ORM
+@sync_to_async
+def _db_finalize_batch(ctx: BatchContext) -> None:
+    with transaction.atomic():
+        batch = SyntheticJobBatch.objects.select_for_update().get(id=ctx.batch_id)
+        # setting accepting_results_until marks the batch as complete, set_scores only scores
+        # batches with it in the past - so it's set last, once all the results are persisted
+        now = datetime.now(tz=UTC)
+        batch.accepting_results_until = ctx.stage_start_time.get("_multi_send_job_request", now)
+        batch.save()
+
+
+async def _db_persist(ctx: BatchContext) -> None:
+    """
+    Queue whatever wasn't persisted during the batch, wait for all the queued rows,
+    and only then finalize the batch. Until `accepting_results_until` is set, the batch
+    isn't eligible for scoring, so a crash can leave a partial batch behind for inspection,
+    but it never generates incorrect weights.
+    """
+    start_time = time.time()
+
+    await _db_get_or_create_batch(ctx)
+    _queue_synthetic_jobs(ctx)
+    _queue_miner_batch_scores(ctx)
+    _queue_miner_manifests(ctx)
+    _queue_job_started_receipts(ctx)
+    _queue_job_finished_receipts(ctx)
+
+    writer = _get_db_writer(ctx)
+    try:
+        await writer.drain()
+    finally:
+        writer.close()
+    await _db_finalize_batch(ctx)
 
     duration = time.time() - start_time
-    logger.info("Persisted to database in %.2f seconds", duration)
+    logger.info(
+        "Persisted %d rows to database, finalized in %.2f seconds",
+        writer.flushed_count,
+        duration,
+    )
 
 
-async def execute_synthetic_batch_run(
-    axons: dict[str, bittensor.AxonInfo],
-    serving_miners: list[Miner],
-    batch_id: int | None = None,
-    create_miner_client: Callable | None = None,
-) -> None:
-    if not axons or not serving_miners:
-        logger.warning("No miners provided")
-        return
+class BatchPhases:
+    """
+    The steps of a batch run which talk to the miners, run in this process. Overridden to split
+    them across processes, see `sharded_batch_run`.
+    """
 
-    start_time = datetime.now(tz=UTC)
-    logger.info("Executing synthetic jobs batch for %d miners", len(serving_miners))
+    async def get_miner_manifests(self, ctx: BatchContext) -> None:
+        await _multi_get_miner_manifest(ctx)
 
-    # randomize the order of miners each batch to avoid systemic bias
-    random.shuffle(serving_miners)
+    async def distribute_jobs(self, ctx: BatchContext) -> None:
+        pass
 
-    ctx = _init_context(axons, serving_miners, batch_id, create_miner_client)
+    async def send_initial_job_requests(self, ctx: BatchContext) -> None:
+        await _multi_send_initial_job_request(ctx)
+
+    async def send_job_requests(self, ctx: BatchContext) -> None:
+        await _multi_send_job_request(ctx)
+
+    async def send_job_finished_receipts(self, ctx: BatchContext) -> None:
+        await _send_job_finished_receipts(ctx)
+
+    async def close_clients(self, ctx: BatchContext) -> None:
+        await _multi_close_client(ctx)
+
+
+async def run_batch_phases(
+    ctx: BatchContext, phases: BatchPhases, start_time: datetime, func: str
+) -> None:
+    """
+    Run the batch of `ctx`, talking to the miners through `phases`.
+    A failure of the batch is reported as raised in `func`.
+    """
     await ctx.checkpoint_system_event("BATCH_BEGIN", dt=start_time)
 
     try:
@@ -1414,7 +1803,7 @@ async def execute_synthetic_batch_run(
         await _db_get_previous_online_executor_count(ctx)
 
         await ctx.checkpoint_system_event("_multi_get_miner_manifest")
-        await _multi_get_miner_manifest(ctx)
+        await phases.get_miner_manifests(ctx)
 
         await ctx.checkpoint_system_event("_get_total_executor_count")
         total_executor_count = _get_total_executor_count(ctx)
@@ -1425,20 +1814,22 @@ async def execute_synthetic_batch_run(
 
             # randomize the order of jobs each batch to avoid systemic bias
             random.shuffle(ctx.job_uuids)
+            await phases.distribute_jobs(ctx)
 
             await ctx.checkpoint_system_event("_multi_send_initial_job_request")
-            await _multi_send_initial_job_request(ctx)
+            await phases.send_initial_job_requests(ctx)
 
             if any(
                 isinstance(job.accept_response, V0AcceptJobRequest) for job in ctx.jobs.values()
             ):
                 await ctx.checkpoint_system_event("_multi_send_job_request")
-                await _multi_send_job_request(ctx)
+                await phases.send_job_requests(ctx)
 
                 # don't persist system events before this point, we want to minimize
                 # any extra interactions which could slow down job processing before
                 # we get the responses from the miners
                 await _db_persist_system_events(ctx)
+                await _db_persist_pending_jobs(ctx)
 
                 await ctx.checkpoint_system_event("_compute_average_send_time")
                 _compute_average_send_time(ctx)
@@ -1447,9 +1838,11 @@ async def execute_synthetic_batch_run(
                 await _score_jobs(ctx)
 
                 await _db_persist_system_events(ctx)
+                await _db_persist_scored_jobs(ctx)
 
                 await ctx.checkpoint_system_event("_send_job_finished_receipts")
-                await _send_job_finished_receipts(ctx)
+                await phases.send_job_finished_receipts(ctx)
+                _queue_job_finished_receipts(ctx)
 
             else:
                 logger.warning("No jobs accepted")
@@ -1468,14 +1861,14 @@ async def execute_synthetic_batch_run(
             type=SystemEvent.EventType.VALIDATOR_FAILURE,
             subtype=SystemEvent.EventSubType.GENERIC_ERROR,
             description=repr(exc),
-            func="execute_synthetic_batch_run",
+            func=func,
         )
 
     await _db_persist_system_events(ctx)
 
     await ctx.checkpoint_system_event("_multi_close_client")
     try:
-        await _multi_close_client(ctx)
+        await phases.close_clients(ctx)
     except (Exception, asyncio.CancelledError) as exc:
         logger.error("Synthetic jobs batch failure: %r", exc)
         ctx.system_event(
@@ -1512,3 +1905,23 @@ async def execute_synthetic_batch_run(
     await _db_persist_system_events(ctx)
 
     await ctx.checkpoint_system_event("BATCH_END")
+
+
+async def execute_synthetic_batch_run(
+    axons: dict[str, bittensor.AxonInfo],
+    serving_miners: list[Miner],
+    batch_id: int | None = None,
+    create_miner_client: Callable | None = None,
+) -> None:
+    if not axons or not serving_miners:
+        logger.warning("No miners provided")
+        return
+
+    start_time = datetime.now(tz=UTC)
+    logger.info("Executing synthetic jobs batch for %d miners", len(serving_miners))
+
+    # randomize the order of miners each batch to avoid systemic bias
+    random.shuffle(serving_miners)
+
+    ctx = _init_context(axons, serving_miners, batch_id, create_miner_client)
+    await run_batch_phases(ctx, BatchPhases(), start_time, "execute_synthetic_batch_run")
@@ -1,10 +1,21 @@
 import abc
 import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
 from compute_horde.executor_class import ExecutorClass
 from compute_horde.mv_protocol.miner_requests import V0JobFinishedRequest
 
 
+@dataclass
+class PreparedJob:
+    """Result of the `ainit_offloaded()` function, computed ahead of time"""
+
+    weights_version: int
+    result: Any
+
+
 class BaseSyntheticJobGenerator(abc.ABC):
     def __init__(self):
         self._uuid = uuid.uuid4()
@@ -15,6 +26,27 @@ class BaseSyntheticJobGenerator(abc.ABC):
     async def ainit(self):
         """Allow to initialize generator in asyncio and non blocking"""
 
+    async def ainit_offloaded(self) -> tuple[Callable[..., Any], tuple[Any, ...]] | None:
+        """
+        Alternative to `ainit()`, used when jobs are generated in a process pool.
+
+        Do the non-CPU-bound part of the initialization and return a picklable `(func, args)`
+        pair doing the rest. It is called in a worker process and its result is passed to
+        `init_offloaded()`. Generators returning `None` are initialized with `ainit()` instead.
+        """
+        return None
+
+    def init_offloaded(self, result: Any) -> None:
+        """Finish the initialization with the result of the function returned by `ainit_offloaded()`"""
+        raise NotImplementedError
+
+    def init_prepared(self, prepared_job: PreparedJob) -> bool:
+        """
+        Initialize with a job prepared ahead of time, instead of `ainit()`.
+        Return `False` if the prepared job can't be used by this generator.
+        """
+        return False
+
     def uuid(self) -> uuid.UUID:
         return self._uuid
 
@@ -37,7 +69,11 @@ class BaseSyntheticJobGenerator(abc.ABC):
         return None
 
     @abc.abstractmethod
-    async def volume_contents(self) -> str: ...
+    async def volume_contents(self) -> str:
+        """
+        Base64 encoded zip with the job's inline volume. It is only requested once, when the job
+        is created, so generators don't need to keep the contents around afterwards.
+        """
 
     @abc.abstractmethod
     def verify(self, msg: V0JobFinishedRequest, time_took: float) -> tuple[bool, str, float]: ...
@@ -1,9 +1,14 @@
+import random
+import secrets
+
+import numpy as np
 from asgiref.sync import sync_to_async
 from compute_horde.mv_protocol.miner_requests import V0JobFinishedRequest
 
 from compute_horde_validator.validator.dynamic_config import aget_weights_version
 from compute_horde_validator.validator.synthetic_jobs.generator.base import (
     BaseSyntheticJobGenerator,
+    PreparedJob,
 )
 from compute_horde_validator.validator.synthetic_jobs.synthetic_job import (
     HASHJOB_PARAMS,
@@ -16,6 +21,46 @@ from compute_horde_validator.validator.utils import single_file_zip
 MAX_SCORE = 2
 
 
+def generate_hash_jobs(
+    weights_version: int, seed: int, count: int, algorithm: Algorithm | None = None
+) -> list[tuple[V0SyntheticJob | V1SyntheticJob, str, str]]:
+    """
+    Generate `count` hash jobs, with their answers and volume contents. This is the CPU heavy
+    part of `GPUHashcatSyntheticJobGenerator` initialization, it has to stay a picklable
+    module level function so it can be run in a worker process.
+
+    V0 jobs are for `algorithm`, by default the one of the current hour, shared by the whole
+    batch - only their passwords and salts come from the seed.
+    """
+    if weights_version == 0:
+        if algorithm is None:
+            algorithm = Algorithm.get_random_algorithm()
+        rng = random.Random(seed)
+        hash_jobs = [
+            V0SyntheticJob.generate(algorithm, HASHJOB_PARAMS[weights_version][algorithm], rng=rng)
+            for _ in range(count)
+        ]
+    elif weights_version in [1, 2, 3]:
+        algorithms = Algorithm.get_all_algorithms()
+        params = [HASHJOB_PARAMS[weights_version][algorithm] for algorithm in algorithms]
+        hash_jobs = V1SyntheticJob.generate_many(
+            count, algorithms, params, rng=np.random.default_rng(seed)
+        )
+    else:
+        raise RuntimeError(f"No SyntheticJob for weights_version: {weights_version}")
+
+    return [
+        (hash_job, hash_job.answer, single_file_zip("payload.txt", hash_job.payload))
+        for hash_job in hash_jobs
+    ]
+
+
+def generate_hash_job(
+    weights_version: int, seed: int, algorithm: Algorithm | None = None
+) -> tuple[V0SyntheticJob | V1SyntheticJob, str, str]:
+    return generate_hash_jobs(weights_version, seed, 1, algorithm)[0]
+
+
 class GPUHashcatSyntheticJobGenerator(BaseSyntheticJobGenerator):
     def __init__(self):
         super().__init__()
@@ -23,28 +68,32 @@ class GPUHashcatSyntheticJobGenerator(BaseSyntheticJobGenerator):
         self.weights_version = None
         self.hash_job = None
         self.expected_answer = None
+        self._volume_contents = None
+        # the job is fully determined by the seed and the algorithm, no matter in which process
+        # it is generated, the seed comes from a CSPRNG as the job's answer must not be predictable
+        self.seed = secrets.randbits(64)
+        # V0 jobs of a batch share the algorithm of the hour they are created in
+        self.algorithm = Algorithm.get_random_algorithm()
 
     async def ainit(self):
         """Allow to initialize generator in asyncio and non blocking"""
         self.weights_version = await aget_weights_version()
-        self.hash_job, self.expected_answer = await self._get_hash_job()
+        result = await sync_to_async(generate_hash_job, thread_sensitive=False)(
+            self.weights_version, self.seed, self.algorithm
+        )
+        self.init_offloaded(result)
 
-    @sync_to_async(thread_sensitive=False)
-    def _get_hash_job(self):
-        if self.weights_version == 0:
-            algorithm = Algorithm.get_random_algorithm()
-            hash_job = V0SyntheticJob.generate(
-                algorithm, HASHJOB_PARAMS[self.weights_version][algorithm]
-            )
-        elif self.weights_version in [1, 2, 3]:
-            algorithms = Algorithm.get_all_algorithms()
-            params = [HASHJOB_PARAMS[self.weights_version][algorithm] for algorithm in algorithms]
-            hash_job = V1SyntheticJob.generate(algorithms, params)
-        else:
-            raise RuntimeError(f"No SyntheticJob for weights_version: {self.weights_version}")
+    async def ainit_offloaded(self):
+        self.weights_version = await aget_weights_version()
+        return generate_hash_job, (self.weights_version, self.seed, self.algorithm)
+
+    def init_offloaded(self, result):
+        self.hash_job, self.expected_answer, self._volume_contents = result
 
-        # precompute anwer when already in thread
-        return hash_job, hash_job.answer
+    def init_prepared(self, prepared_job: PreparedJob) -> bool:
+        self.weights_version = prepared_job.weights_version
+        self.init_offloaded(prepared_job.result)
+        return True
 
     def timeout_seconds(self) -> int:
         return self.hash_job.timeout_seconds
@@ -72,9 +121,10 @@ class GPUHashcatSyntheticJobGenerator(BaseSyntheticJobGenerator):
     def raw_script(self) -> str | None:
         return self.hash_job.raw_script()
 
-    @sync_to_async(thread_sensitive=False)
-    def volume_contents(self) -> str:
-        return single_file_zip("payload.txt", self.hash_job.payload)
+    async def volume_contents(self) -> str:
+        # hand the contents over instead of keeping a copy for the whole batch
+        volume_contents, self._volume_contents = self._volume_contents, None
+        return volume_contents
 
     def score(self, time_took: float) -> float:
         if self.weights_version == 0:
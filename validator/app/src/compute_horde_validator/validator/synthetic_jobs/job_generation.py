@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import billiard
+from compute_horde.executor_class import ExecutorClass
+
+from compute_horde_validator.validator.synthetic_jobs.generator import current
+from compute_horde_validator.validator.synthetic_jobs.generator.base import (
+    BaseSyntheticJobGenerator,
+    PreparedJob,
+)
+from compute_horde_validator.validator.synthetic_jobs.volume_arena import ArenaVolume, VolumeArena
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GeneratedJob:
+    job_generator: BaseSyntheticJobGenerator
+    volume: ArenaVolume
+
+
+@dataclass
+class JobGenerationResult:
+    # in the same order as the requested executor classes
+    jobs: list[GeneratedJob] = field(default_factory=list)
+    volume_arena: VolumeArena = field(default_factory=VolumeArena)
+    offloaded_job_count: int = 0
+    prepared_job_count: int = 0
+    # prepared jobs no generator accepted, to be put back into the reservoir
+    unused_prepared_jobs: list[PreparedJob] = field(default_factory=list)
+    chunk_count: int = 0
+    # seconds spent in each phase, summed over all jobs
+    timings: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+
+
+def _run_chunk(calls: list[tuple[Callable[..., Any], tuple[Any, ...]]]) -> list[Any]:
+    return [func(*args) for func, args in calls]
+
+
+def create_process_pool(processes: int) -> ProcessPoolExecutor:
+    # celery prefork workers are daemonic processes, and the standard library
+    # refuses to start child processes from them - billiard's fork context doesn't
+    return ProcessPoolExecutor(max_workers=processes, mp_context=billiard.get_context("fork"))
+
+
+async def generate_jobs(
+    executor_classes: list[ExecutorClass],
+    processes: int,
+    chunk_size: int,
+    prepared_jobs: list[PreparedJob] | None = None,
+) -> JobGenerationResult:
+    """
+    Create and initialize a job generator for each of `executor_classes`.
+
+    The CPU heavy part of the initialization of generators supporting it (see
+    `BaseSyntheticJobGenerator.ainit_offloaded()`) is sent to a pool of `processes`
+    worker processes, in chunks of `chunk_size` jobs. Chunks are submitted while
+    the next generators are still being created, with at most two chunks per process
+    in flight. Generators not supporting it, or all generators if `processes` is 0,
+    are initialized in this process with `ainit()`.
+
+    `prepared_jobs` generated ahead of time are used first, for the generators accepting them.
+    The ones left over are returned in `JobGenerationResult.unused_prepared_jobs`.
+    """
+    start_time = time.monotonic()
+    result = JobGenerationResult()
+    timings = result.timings
+    max_pending_chunks = 2 * processes
+    prepared_jobs = list(prepared_jobs or [])
+
+    loop = asyncio.get_running_loop()
+    pool: ProcessPoolExecutor | None = None
+    pending: dict[asyncio.Future, list[BaseSyntheticJobGenerator]] = {}
+    chunk_generators: list[BaseSyntheticJobGenerator] = []
+    chunk_calls: list[tuple[Callable[..., Any], tuple[Any, ...]]] = []
+
+    def submit_chunk() -> None:
+        nonlocal pool, chunk_generators, chunk_calls
+        if pool is None:
+            pool = create_process_pool(processes)
+        future = loop.run_in_executor(pool, _run_chunk, chunk_calls)
+        pending[future] = chunk_generators
+        result.chunk_count += 1
+        chunk_generators = []
+        chunk_calls = []
+
+    async def collect_chunks(return_when: str) -> None:
+        wait_start = time.monotonic()
+        done, _ = await asyncio.wait(pending.keys(), return_when=return_when)
+        timings["pool_wait"] += time.monotonic() - wait_start
+        for future in done:
+            job_generators = pending.pop(future)
+            for job_generator, init_result in zip(job_generators, future.result()):
+                job_generator.init_offloaded(init_result)
+
+    job_generators: list[BaseSyntheticJobGenerator] = []
+    try:
+        for executor_class in executor_classes:
+            phase_start = time.monotonic()
+            job_generator = await current.synthetic_job_generator_factory.create(executor_class)
+            job_generators.append(job_generator)
+            timings["create"] += time.monotonic() - phase_start
+
+            phase_start = time.monotonic()
+            if prepared_jobs and job_generator.init_prepared(prepared_jobs[-1]):
+                prepared_jobs.pop()
+                result.prepared_job_count += 1
+                timings["init_prepared"] += time.monotonic() - phase_start
+                continue
+
+            call = await job_generator.ainit_offloaded() if processes > 0 else None
+            if call is None:
+                await job_generator.ainit()
+                timings["ainit"] += time.monotonic() - phase_start
+                continue
+            timings["ainit_offloaded"] += time.monotonic() - phase_start
+
+            result.offloaded_job_count += 1
+            chunk_generators.append(job_generator)
+            chunk_calls.append(call)
+            if len(chunk_calls) >= chunk_size:
+                if len(pending) >= max_pending_chunks:
+                    await collect_chunks(asyncio.FIRST_COMPLETED)
+                submit_chunk()
+
+        if chunk_calls:
+            submit_chunk()
+        if pending:
+            await collect_chunks(asyncio.ALL_COMPLETED)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    phase_start = time.monotonic()
+    for job_generator in job_generators:
+        result.jobs.append(
+            GeneratedJob(
+                job_generator=job_generator,
+                volume=result.volume_arena.add(await job_generator.volume_contents()),
+            )
+        )
+    timings["volume_contents"] += time.monotonic() - phase_start
+
+    result.unused_prepared_jobs = prepared_jobs
+    timings["total"] = time.monotonic() - start_time
+    return result
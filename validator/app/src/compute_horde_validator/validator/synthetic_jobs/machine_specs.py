@@ -0,0 +1,113 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils.timezone import now
+
+from compute_horde_validator.validator.models import MachineSpecsDigest
+
+# readings which change from one job to the next on the same hardware, left out of the digest
+_VOLATILE_FIELDS = {
+    "cpu": {"clocks"},
+    "ram": {"available", "free", "used"},
+    "hard_disk": {"used", "free"},
+}
+_VOLATILE_GPU_FIELDS = {"graphics_speed", "memory_speed"}
+
+
+def _sha256(data: str) -> str:
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _gpu_details(specs: dict) -> list[dict]:
+    gpu = specs.get("gpu")
+    if not isinstance(gpu, dict) or not isinstance(gpu.get("details"), list):
+        return []
+    return [details for details in gpu["details"] if isinstance(details, dict)]
+
+
+def gpu_set(specs: dict) -> str:
+    """Identifies the machine among the ones of a miner, by its GPUs"""
+    uuids = sorted(str(details["uuid"]) for details in _gpu_details(specs) if details.get("uuid"))
+    if not uuids:
+        # machines without GPUs can only be told apart by their specs
+        return specs_digest(specs)
+    return _sha256(",".join(uuids))
+
+
+def specs_digest(specs: dict) -> str:
+    """Digest of the hardware described by the specs, not of the momentary readings"""
+    stable = dict(specs)
+    for key, fields in _VOLATILE_FIELDS.items():
+        if isinstance(stable.get(key), dict):
+            stable[key] = {k: v for k, v in stable[key].items() if k not in fields}
+    if isinstance(stable.get("gpu"), dict):
+        stable["gpu"] = {
+            **stable["gpu"],
+            "details": sorted(
+                (
+                    {k: v for k, v in details.items() if k not in _VOLATILE_GPU_FIELDS}
+                    for details in _gpu_details(specs)
+                ),
+                key=lambda details: str(details.get("uuid", "")),
+            ),
+        }
+    return _sha256(json.dumps(stable, sort_keys=True, separators=(",", ":"), default=str))
+
+
+@dataclass
+class MachineSpecsEntry:
+    miner_hotkey: str
+    specs: dict
+    gpu_set: str
+    digest: str
+
+    @classmethod
+    def from_specs(cls, miner_hotkey: str, specs: dict) -> "MachineSpecsEntry":
+        return cls(miner_hotkey, specs, gpu_set(specs), specs_digest(specs))
+
+
+def _resend_cutoff():
+    return now() - timedelta(seconds=settings.MACHINE_SPECS_RESEND_INTERVAL)
+
+
+async def select_changed_specs(entries: list[MachineSpecsEntry]) -> list[MachineSpecsEntry]:
+    """
+    The entries whose specs differ from the ones last sent for the same miner and GPUs, or were
+    sent longer than `MACHINE_SPECS_RESEND_INTERVAL` ago - one per miner and GPUs.
+    """
+    # the ones sent longer ago would be sent again anyway
+    await MachineSpecsDigest.objects.filter(sent_at__lt=_resend_cutoff()).adelete()
+
+    sent = {
+        (row.miner_hotkey, row.gpu_set): row.digest
+        async for row in MachineSpecsDigest.objects.filter(
+            miner_hotkey__in={entry.miner_hotkey for entry in entries}
+        )
+    }
+    changed = {}
+    for entry in entries:
+        key = (entry.miner_hotkey, entry.gpu_set)
+        if key not in changed and sent.get(key) != entry.digest:
+            changed[key] = entry
+    return list(changed.values())
+
+
+async def mark_specs_sent(entries: list[MachineSpecsEntry]) -> None:
+    sent_at = now()
+    await MachineSpecsDigest.objects.abulk_create(
+        [
+            MachineSpecsDigest(
+                miner_hotkey=entry.miner_hotkey,
+                gpu_set=entry.gpu_set,
+                digest=entry.digest,
+                sent_at=sent_at,
+            )
+            for entry in entries
+        ],
+        update_conflicts=True,
+        unique_fields=["miner_hotkey", "gpu_set"],
+        update_fields=["digest", "sent_at"],
+    )
@@ -0,0 +1,159 @@
+import base64
+import hashlib
+import logging
+import pickle
+import secrets
+from collections import defaultdict
+from itertools import repeat
+from math import ceil
+
+from asgiref.sync import sync_to_async
+from cryptography.fernet import Fernet, InvalidToken
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Sum
+
+from compute_horde_validator.validator.dynamic_config import (
+    aget_weights_version,
+    get_weights_version,
+)
+from compute_horde_validator.validator.models import MinerManifest, PreparedSyntheticJob
+from compute_horde_validator.validator.synthetic_jobs.generator.base import PreparedJob
+from compute_horde_validator.validator.synthetic_jobs.generator.gpu_hashcat import (
+    generate_hash_jobs,
+)
+from compute_horde_validator.validator.synthetic_jobs.job_generation import create_process_pool
+
+logger = logging.getLogger(__name__)
+
+_BULK_CREATE_BATCH_SIZE = 100
+
+
+def _fernet() -> Fernet:
+    key = hashlib.sha256(settings.SECRET_KEY.encode("utf-8")).digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def get_target_size() -> int:
+    """
+    Number of jobs to keep in the reservoir - the executor count of the last batch,
+    with some margin for miners growing their hordes in the meantime.
+    """
+    last_batch_id = MinerManifest.objects.aggregate(Max("batch_id"))["batch_id__max"]
+    if last_batch_id is None:
+        return 0
+    executor_count = (
+        MinerManifest.objects.filter(batch_id=last_batch_id).aggregate(Sum("executor_count"))[
+            "executor_count__sum"
+        ]
+        or 0
+    )
+    return ceil(executor_count * (1 + settings.SYNTHETIC_JOBS_RESERVOIR_MARGIN))
+
+
+def discard_stale_jobs(weights_version: int) -> int:
+    deleted, _ = PreparedSyntheticJob.objects.exclude(weights_version=weights_version).delete()
+    if deleted:
+        logger.info("Discarded %d prepared synthetic jobs of other weights versions", deleted)
+    return deleted
+
+
+def fill_reservoir() -> int:
+    """
+    Generate GPU hashcat jobs ahead of time, so batch runs only have to take them out of
+    the reservoir. Return the number of generated jobs.
+    """
+    weights_version = get_weights_version()
+    discard_stale_jobs(weights_version)
+    if weights_version == 0:
+        # V0 jobs of a batch share the algorithm of the current hour, they can't be prepared ahead
+        return 0
+
+    missing = (
+        get_target_size()
+        - PreparedSyntheticJob.objects.filter(weights_version=weights_version).count()
+    )
+    if missing <= 0:
+        return 0
+
+    chunk_size = settings.SYNTHETIC_JOBS_GENERATION_CHUNK_SIZE
+    counts = [min(chunk_size, missing - start) for start in range(0, missing, chunk_size)]
+    seeds = [secrets.randbits(64) for _ in counts]
+    processes = settings.SYNTHETIC_JOBS_GENERATION_PROCESSES
+    if processes > 0:
+        with create_process_pool(processes) as pool:
+            for results in pool.map(generate_hash_jobs, repeat(weights_version), seeds, counts):
+                _store(weights_version, results)
+    else:
+        for results in map(generate_hash_jobs, repeat(weights_version), seeds, counts):
+            _store(weights_version, results)
+
+    logger.info("Prepared %d synthetic jobs for weights version %d", missing, weights_version)
+    return missing
+
+
+def _store(weights_version: int, results: list) -> None:
+    """
+    Store the generated jobs in their own transaction, so they can be taken out of the
+    reservoir while more are still being generated.
+    """
+    fernet = _fernet()
+    batch = [
+        PreparedSyntheticJob(
+            weights_version=weights_version,
+            data=fernet.encrypt(pickle.dumps(result)),
+        )
+        for result in results
+    ]
+    with transaction.atomic():
+        PreparedSyntheticJob.objects.bulk_create(batch, batch_size=_BULK_CREATE_BATCH_SIZE)
+
+
+@sync_to_async
+def _take_jobs(count: int, weights_version: int) -> list[PreparedJob]:
+    with transaction.atomic():
+        entries = list(
+            PreparedSyntheticJob.objects.select_for_update(skip_locked=True)
+            .filter(weights_version=weights_version)
+            .order_by("id")[:count]
+        )
+        PreparedSyntheticJob.objects.filter(id__in=[entry.id for entry in entries]).delete()
+
+    fernet = _fernet()
+    prepared_jobs = []
+    for entry in entries:
+        try:
+            result = pickle.loads(fernet.decrypt(bytes(entry.data)))
+        except InvalidToken:
+            # most likely the SECRET_KEY changed since the job was stored
+            logger.warning("Could not decrypt prepared synthetic job %s", entry.id)
+            continue
+        prepared_jobs.append(PreparedJob(weights_version=weights_version, result=result))
+    return prepared_jobs
+
+
+async def atake_jobs(count: int) -> list[PreparedJob]:
+    """
+    Take up to `count` jobs of the current weights version out of the reservoir.
+    """
+    if count <= 0:
+        return []
+    return await _take_jobs(count, await aget_weights_version())
+
+
+@sync_to_async
+def _return_jobs(prepared_jobs: list[PreparedJob]) -> None:
+    results = defaultdict(list)
+    for prepared_job in prepared_jobs:
+        results[prepared_job.weights_version].append(prepared_job.result)
+    for weights_version, version_results in results.items():
+        _store(weights_version, version_results)
+
+
+async def areturn_jobs(prepared_jobs: list[PreparedJob]) -> None:
+    """
+    Put jobs taken out of the reservoir, but not used, back into it.
+    """
+    if not prepared_jobs:
+        return
+    await _return_jobs(prepared_jobs)
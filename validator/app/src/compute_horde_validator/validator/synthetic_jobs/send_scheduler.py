@@ -0,0 +1,51 @@
+import asyncio
+import heapq
+import time
+from collections import defaultdict
+
+
+class SendScheduler:
+    """
+    Releases sends at their target `time.monotonic()` instants.
+
+    Unlike a barrier, no sender waits for the other senders to be ready: a single timer task
+    pops the earliest target off a heap, sleeps until it and releases the sends that are due.
+    Sends due at the same instant are released round-robin across their groups (miners),
+    so no connection gets its whole burst before the others get their first request.
+    """
+
+    def __init__(self):
+        # (target, rank within the group at that target, insertion order, key)
+        self._heap: list[tuple[float, int, int, str]] = []
+        self._group_ranks: defaultdict[tuple[float, str], int] = defaultdict(int)
+        self._releases: dict[str, asyncio.Future[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, key: str, at: float, group: str = "") -> None:
+        rank = self._group_ranks[at, group]
+        self._group_ranks[at, group] += 1
+        heapq.heappush(self._heap, (at, rank, len(self._releases), key))
+        self._releases[key] = asyncio.get_running_loop().create_future()
+
+    async def wait(self, key: str) -> float:
+        """Wait until the send of `key` is released, return its target instant"""
+        return await self._releases[key]
+
+    async def run(self) -> None:
+        # let the already started senders reach `wait`, so they resume in the release order
+        await asyncio.sleep(0)
+        while self._heap:
+            at = self._heap[0][0]
+            # the event loop may wake up a timer up to its clock resolution early
+            while (delay := at - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                at, _, _, key = heapq.heappop(self._heap)
+                release = self._releases[key]
+                # the sender may have been cancelled in the meantime
+                if not release.done():
+                    release.set_result(at)
@@ -0,0 +1,447 @@
+import asyncio
+import logging
+import pickle
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any, TypeVar
+
+import billiard
+import bittensor
+
+from compute_horde_validator.validator.models import Miner, SystemEvent
+from compute_horde_validator.validator.synthetic_jobs.batch_run import (
+    BatchContext,
+    BatchPhases,
+    DeadlineBarrier,
+    Job,
+    _get_max_spin_up_time,
+    _init_context,
+    _multi_close_client,
+    _multi_get_miner_manifest,
+    _multi_send_initial_job_request,
+    _multi_send_job_request,
+    _release_volumes,
+    _render_job_finished_receipts,
+    _send_rendered_job_finished_receipts,
+    run_batch_phases,
+)
+from compute_horde_validator.validator.synthetic_jobs.volume_arena import VolumeArena
+
+logger = logging.getLogger(__name__)
+
+# time between all shards being ready to send and the shared barrier deadline,
+# enough for the deadline to reach every shard
+_SHARD_BARRIER_DELAY = 0.5
+_SHARD_JOIN_TIMEOUT = 5
+
+_T = TypeVar("_T")
+
+# sent back by the shards after each send phase, everything else is known to the coordinator
+_SHARD_JOB_FIELDS = (
+    "exception",
+    "exception_time",
+    "exception_stage",
+    "accept_barrier_time",
+    "accept_send_lateness",
+    "accept_before_sent_time",
+    "accept_after_sent_time",
+    "accept_response",
+    "accept_response_time",
+    "executor_response",
+    "executor_response_time",
+    "job_barrier_time",
+    "job_send_lateness",
+    "job_before_sent_time",
+    "job_after_sent_time",
+    "job_response",
+    "job_response_time",
+    "machine_specs",
+    "job_started_receipt",
+)
+
+
+class ShardError(Exception):
+    pass
+
+
+class _Channel:
+    """Async wrapper for one end of a pipe between the coordinator and a shard"""
+
+    def __init__(self, name: str, conn):
+        self.name = name
+        self.conn = conn
+
+    async def send(self, *message: Any) -> None:
+        await asyncio.to_thread(self.conn.send, message)
+
+    async def recv_any(self) -> tuple:
+        try:
+            return await asyncio.to_thread(self.conn.recv)
+        except EOFError as exc:
+            raise ShardError(f"{self.name} exited") from exc
+
+    async def recv(self, expected: str) -> tuple:
+        command, *args = await self.recv_any()
+        if command == "error":
+            raise ShardError(f"{self.name} failed: {args[0]}")
+        if command != expected:
+            raise ShardError(f"{self.name} sent {command!r} instead of {expected!r}")
+        return tuple(args)
+
+
+# shard process
+
+
+def _picklable_exception(exc: BaseException | None) -> BaseException | None:
+    if exc is None:
+        return None
+    try:
+        pickle.dumps(exc)
+    except Exception:
+        return ShardError(repr(exc))
+    return exc
+
+
+def _job_results(ctx: BatchContext) -> dict[str, dict[str, Any]]:
+    results = {}
+    for job in ctx.jobs.values():
+        result = {field: getattr(job, field) for field in _SHARD_JOB_FIELDS}
+        result["exception"] = _picklable_exception(job.exception)
+        results[job.uuid] = result
+    return results
+
+
+def _drain_events(ctx: BatchContext) -> list[SystemEvent]:
+    events = ctx.events.copy()
+    ctx.events.clear()
+    return events
+
+
+def _init_shard_jobs(ctx: BatchContext, job_specs: list[tuple]) -> None:
+    ctx.volume_arena = VolumeArena()
+    for job_uuid, name, miner_hotkey, executor_class, job_generator, volume_contents in job_specs:
+        volume = ctx.volume_arena.add(volume_contents)
+        ctx.jobs[job_uuid] = Job(
+            ctx=ctx,
+            uuid=job_uuid,
+            name=name,
+            miner_hotkey=miner_hotkey,
+            executor_class=executor_class,
+            job_generator=job_generator,
+            volume=volume,
+            volume_size=volume.size,
+        )
+        ctx.job_uuids.append(job_uuid)
+
+
+async def _shard_main(
+    channel: _Channel,
+    axons: dict[str, bittensor.AxonInfo],
+    miners: list[Miner],
+    batch_uuid: str,
+    batch_id: int | None,
+    create_miner_client: Callable | None,
+) -> None:
+    """
+    Owns the connections to a subset of the miners of a batch, and runs the send phases
+    for their jobs as instructed by the coordinator. The shard doesn't touch the database,
+    all system events are passed on to the coordinator.
+    """
+
+    async def get_deadline() -> float:
+        await channel.send("ready")
+        (deadline,) = await channel.recv("start")
+        return deadline
+
+    ctx = _init_context(axons, miners, batch_id, create_miner_client)
+    ctx.uuid = batch_uuid
+
+    await _multi_get_miner_manifest(ctx)
+    executors = {hotkey: dict(executors) for hotkey, executors in ctx.executors.items()}
+    await channel.send("manifests", ctx.manifests, executors, _drain_events(ctx))
+
+    while True:
+        command, *args = await channel.recv_any()
+        match command:
+            case "jobs":
+                (job_specs,) = args
+                _init_shard_jobs(ctx, job_specs)
+                await channel.send("jobs")
+
+            case "initial_job_request":
+                (max_spin_up_time,) = args
+                await _multi_send_initial_job_request(
+                    ctx, DeadlineBarrier(get_deadline), max_spin_up_time
+                )
+                await channel.send("results", _job_results(ctx), _drain_events(ctx))
+
+            case "job_request":
+                await _multi_send_job_request(ctx, DeadlineBarrier(get_deadline))
+                await channel.send("results", _job_results(ctx), _drain_events(ctx))
+
+            case "receipts":
+                (rendered_receipts,) = args
+                receipts = [
+                    (ctx.jobs[job_uuid], receipt_json)
+                    for job_uuid, receipt_json in rendered_receipts
+                ]
+                await _send_rendered_job_finished_receipts(ctx, receipts)
+                await channel.send("receipts", _drain_events(ctx))
+
+            case "close":
+                await _multi_close_client(ctx)
+                # machine specs can arrive at any time before the connection is closed
+                machine_specs = {job.uuid: job.machine_specs for job in ctx.jobs.values()}
+                await channel.send("close", machine_specs, _drain_events(ctx))
+                return
+
+            case _:
+                raise ShardError(f"unknown command {command!r}")
+
+
+def _run_shard(conn, *args) -> None:
+    channel = _Channel("coordinator", conn)
+    try:
+        asyncio.run(_shard_main(channel, *args))
+    except BaseException as exc:
+        logger.error("Synthetic jobs batch shard failure: %r", exc)
+        try:
+            conn.send(("error", repr(exc)))
+        except Exception:
+            pass
+    finally:
+        conn.close()
+
+
+# coordinator
+
+
+class _Shard:
+    def __init__(self, index: int, hotkeys: list[str], process, channel: _Channel):
+        self.index = index
+        self.hotkeys = hotkeys
+        self.process = process
+        self.channel = channel
+        self.stopped = False
+
+    def stop(self, terminate: bool = False) -> None:
+        if terminate:
+            # a recv still waiting on the pipe in another thread only ends when the shard exits,
+            # closing our end doesn't interrupt it
+            self.process.terminate()
+        else:
+            self.channel.conn.close()
+        self.process.join(_SHARD_JOIN_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.channel.conn.close()
+        self.stopped = True
+
+
+def _start_shards(
+    ctx: BatchContext, shard_count: int, create_miner_client: Callable | None
+) -> list[_Shard]:
+    # fork, so the shards can be started from within a daemonic Celery worker,
+    # and inherit the Django setup and the miner client factory
+    mp_context = billiard.get_context("fork")
+    shards = []
+    for index in range(shard_count):
+        # ctx.hotkeys is already shuffled
+        hotkeys = ctx.hotkeys[index::shard_count]
+        parent_conn, child_conn = mp_context.Pipe()
+        process = mp_context.Process(
+            target=_run_shard,
+            name=f"synthetic-jobs-shard-{index}",
+            args=(
+                child_conn,
+                {hotkey: ctx.axons[hotkey] for hotkey in hotkeys},
+                [ctx.miners[hotkey] for hotkey in hotkeys],
+                ctx.uuid,
+                ctx.batch_id,
+                create_miner_client,
+            ),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        shards.append(_Shard(index, hotkeys, process, _Channel(f"shard {index}", parent_conn)))
+    return shards
+
+
+def _stop_shards(shards: list[_Shard]) -> None:
+    for shard in shards:
+        if not shard.stopped:
+            shard.stop(terminate=True)
+
+
+async def _gather_shards(shards: list[_Shard], call: Callable[[_Shard], Awaitable[_T]]) -> list[_T]:
+    """
+    Run `call` for all shards at once. If it fails for one of them, all shards are stopped -
+    the calls for the others wait on their pipes in threads, which can't be cancelled.
+    """
+    tasks = [asyncio.create_task(call(shard)) for shard in shards]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        await asyncio.to_thread(_stop_shards, shards)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _merge_events(ctx: BatchContext, events: list[SystemEvent]) -> None:
+    ctx.events.extend(events)
+    ctx.event_count += len(events)
+
+
+def _merge_job_results(ctx: BatchContext, results: dict[str, dict[str, Any]]) -> None:
+    for job_uuid, result in results.items():
+        job = ctx.jobs[job_uuid]
+        for field, value in result.items():
+            setattr(job, field, value)
+
+
+async def _multi_get_shard_miner_manifest(ctx: BatchContext, shards: list[_Shard]) -> None:
+    replies = await _gather_shards(shards, lambda shard: shard.channel.recv("manifests"))
+    for manifests, executors, events in replies:
+        for hotkey, manifest in manifests.items():
+            ctx.manifests[hotkey] = manifest
+            ctx.executors[hotkey].update(executors[hotkey])
+        _merge_events(ctx, events)
+
+
+async def _distribute_jobs(ctx: BatchContext, shards: list[_Shard]) -> None:
+    hotkey_shards = {hotkey: shard for shard in shards for hotkey in shard.hotkeys}
+    job_specs: dict[int, list[tuple]] = {shard.index: [] for shard in shards}
+    # keep the shuffled job order
+    for job_uuid in ctx.job_uuids:
+        job = ctx.jobs[job_uuid]
+        assert job.volume is not None
+        job_specs[hotkey_shards[job.miner_hotkey].index].append(
+            (
+                job.uuid,
+                job.name,
+                job.miner_hotkey,
+                job.executor_class,
+                job.job_generator,
+                job.volume.contents,
+            )
+        )
+
+    await _gather_shards(shards, lambda shard: shard.channel.send("jobs", job_specs[shard.index]))
+    await _gather_shards(shards, lambda shard: shard.channel.recv("jobs"))
+    _release_volumes(ctx)
+
+
+async def _multi_send_shard_request(ctx: BatchContext, shards: list[_Shard], *command) -> None:
+    await _gather_shards(shards, lambda shard: shard.channel.send(*command))
+
+    # all shards rendered their requests, start sending at the same time
+    await _gather_shards(shards, lambda shard: shard.channel.recv("ready"))
+    deadline = time.monotonic() + _SHARD_BARRIER_DELAY
+    await _gather_shards(shards, lambda shard: shard.channel.send("start", deadline))
+
+    replies = await _gather_shards(shards, lambda shard: shard.channel.recv("results"))
+    for results, events in replies:
+        _merge_job_results(ctx, results)
+        _merge_events(ctx, events)
+
+
+async def _send_shard_job_finished_receipts(ctx: BatchContext, shards: list[_Shard]) -> None:
+    # receipts are signed by the coordinator, the shards only send them
+    hotkey_shards = {hotkey: shard for shard in shards for hotkey in shard.hotkeys}
+    rendered_receipts: dict[int, list[tuple[str, str]]] = {shard.index: [] for shard in shards}
+    for job, receipt_json in _render_job_finished_receipts(ctx):
+        rendered_receipts[hotkey_shards[job.miner_hotkey].index].append((job.uuid, receipt_json))
+
+    await _gather_shards(
+        shards, lambda shard: shard.channel.send("receipts", rendered_receipts[shard.index])
+    )
+    for (events,) in await _gather_shards(shards, lambda shard: shard.channel.recv("receipts")):
+        _merge_events(ctx, events)
+
+
+async def _multi_close_shard(ctx: BatchContext, shards: list[_Shard]) -> None:
+    async def close_shard(shard: _Shard) -> None:
+        if shard.stopped:
+            return
+        try:
+            await shard.channel.send("close")
+            machine_specs, events = await shard.channel.recv("close")
+        except (Exception, asyncio.CancelledError) as exc:
+            logger.warning("shard %d failed to close: %r", shard.index, exc)
+        else:
+            for job_uuid, specs in machine_specs.items():
+                ctx.jobs[job_uuid].machine_specs = specs
+            _merge_events(ctx, events)
+        finally:
+            await asyncio.to_thread(shard.stop)
+
+    await asyncio.gather(*[close_shard(shard) for shard in shards])
+
+
+class _ShardedBatchPhases(BatchPhases):
+    def __init__(self, shard_count: int, create_miner_client: Callable | None):
+        self.shard_count = shard_count
+        self.create_miner_client = create_miner_client
+        self.shards: list[_Shard] = []
+
+    async def get_miner_manifests(self, ctx: BatchContext) -> None:
+        self.shards = _start_shards(ctx, self.shard_count, self.create_miner_client)
+        await _multi_get_shard_miner_manifest(ctx, self.shards)
+
+    async def distribute_jobs(self, ctx: BatchContext) -> None:
+        await _distribute_jobs(ctx, self.shards)
+
+    async def send_initial_job_requests(self, ctx: BatchContext) -> None:
+        await _multi_send_shard_request(
+            ctx, self.shards, "initial_job_request", _get_max_spin_up_time(ctx)
+        )
+
+    async def send_job_requests(self, ctx: BatchContext) -> None:
+        await _multi_send_shard_request(ctx, self.shards, "job_request")
+
+    async def send_job_finished_receipts(self, ctx: BatchContext) -> None:
+        await _send_shard_job_finished_receipts(ctx, self.shards)
+
+    async def close_clients(self, ctx: BatchContext) -> None:
+        await _multi_close_shard(ctx, self.shards)
+
+
+async def execute_sharded_synthetic_batch_run(
+    axons: dict[str, bittensor.AxonInfo],
+    serving_miners: list[Miner],
+    shard_count: int,
+    batch_id: int | None = None,
+    create_miner_client: Callable | None = None,
+) -> None:
+    """
+    Same as `execute_synthetic_batch_run`, but with the miner connections and the send phases
+    split across `shard_count` processes. The coordinator generates the jobs, starts the send
+    schedules of all shards at a shared deadline, and scores and
+    persists the merged results.
+    """
+    if not axons or not serving_miners:
+        logger.warning("No miners provided")
+        return
+
+    start_time = datetime.now(tz=UTC)
+    shard_count = min(shard_count, len(serving_miners))
+    logger.info(
+        "Executing synthetic jobs batch for %d miners in %d shards",
+        len(serving_miners),
+        shard_count,
+    )
+
+    # randomize the order of miners each batch to avoid systemic bias
+    random.shuffle(serving_miners)
+
+    ctx = _init_context(axons, serving_miners, batch_id, create_miner_client)
+    await run_batch_phases(
+        ctx,
+        _ShardedBatchPhases(shard_count, create_miner_client),
+        start_time,
+        "execute_sharded_synthetic_batch_run",
+    )
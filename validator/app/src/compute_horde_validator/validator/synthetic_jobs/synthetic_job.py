@@ -28,20 +28,7 @@ class Algorithm(enum.Enum):
 
     @property
     def params(self):
-        return {
-            Algorithm.SHA256: {
-                "hash_function": hashlib.sha256,
-                "hash_type": "1410",
-            },
-            Algorithm.SHA384: {
-                "hash_function": hashlib.sha384,
-                "hash_type": "10810",
-            },
-            Algorithm.SHA512: {
-                "hash_function": hashlib.sha512,
-                "hash_type": "1710",
-            },
-        }
+        return _ALGORITHM_PARAMS
 
     def hash(self, *args, **kwargs):
         return self.params[self]["hash_function"](*args, **kwargs)
@@ -60,6 +47,22 @@ class Algorithm(enum.Enum):
         return list(Algorithm)
 
 
+_ALGORITHM_PARAMS = {
+    Algorithm.SHA256: {
+        "hash_function": hashlib.sha256,
+        "hash_type": "1410",
+    },
+    Algorithm.SHA384: {
+        "hash_function": hashlib.sha384,
+        "hash_type": "10810",
+    },
+    Algorithm.SHA512: {
+        "hash_function": hashlib.sha512,
+        "hash_type": "1710",
+    },
+}
+
+
 @dataclass
 class JobParams:
     timeout: int
@@ -6,8 +6,13 @@ import uvloop
 from asgiref.sync import async_to_sync
 from django.conf import settings
 
+from compute_horde_validator.validator.chain_view import ChainView
+from compute_horde_validator.validator.metagraph_snapshot import MetagraphSnapshot
 from compute_horde_validator.validator.models import Miner, SystemEvent
 from compute_horde_validator.validator.synthetic_jobs.batch_run import execute_synthetic_batch_run
+from compute_horde_validator.validator.synthetic_jobs.sharded_batch_run import (
+    execute_sharded_synthetic_batch_run,
+)
 
 # new synchronized flow waits longer for job responses
 SYNTHETIC_JOBS_SOFT_LIMIT = 20 * 60
@@ -19,8 +24,8 @@ logger = logging.getLogger(__name__)
 def try_to_get_metagraph(netuid, network, tries=3):
     for try_number in range(tries):
         try:
-            subtensor = bittensor.subtensor(network=network)
-            return subtensor.metagraph(netuid)
+            chain_view = ChainView(lambda: bittensor.subtensor(network=network))
+            return chain_view.metagraph(netuid)
         except Exception:
             if try_number == tries - 1:
                 raise
@@ -70,17 +75,22 @@ def create_and_run_synthetic_job_batch(netuid, network, synthetic_jobs_batch_id:
             if miner.hotkey in axons_by_key and axons_by_key[miner.hotkey].is_serving
         ]
 
-    async_to_sync(execute_synthetic_batch_run)(axons_by_key, miners, synthetic_jobs_batch_id)
+    if settings.SYNTHETIC_JOBS_BATCH_SHARDS > 1:
+        async_to_sync(execute_sharded_synthetic_batch_run)(
+            axons_by_key, miners, settings.SYNTHETIC_JOBS_BATCH_SHARDS, synthetic_jobs_batch_id
+        )
+    else:
+        async_to_sync(execute_synthetic_batch_run)(axons_by_key, miners, synthetic_jobs_batch_id)
 
 
-def get_miners(metagraph) -> list[Miner]:
+def get_miners(metagraph: MetagraphSnapshot) -> list[Miner]:
     keys = {n.hotkey for n in metagraph.neurons}
     existing = list(Miner.objects.filter(hotkey__in=keys))
     existing_keys = {m.hotkey for m in existing}
     new_miners = Miner.objects.bulk_create(
         [Miner(hotkey=n.hotkey) for n in metagraph.neurons if n.hotkey not in existing_keys]
     )
-    data = {"block": metagraph.block.item()}
+    data = {"block": metagraph.block}
     if new_miners:
         data["new_miners"] = len(new_miners)
     SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).create(
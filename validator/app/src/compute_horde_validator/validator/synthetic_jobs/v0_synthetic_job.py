@@ -1,3 +1,4 @@
+import random
 import secrets
 import string
 from dataclasses import dataclass
@@ -21,16 +22,25 @@ class V0SyntheticJob(SyntheticJob):
     ALPHABET: ClassVar[str] = string.ascii_letters + string.digits
 
     @classmethod
-    def random_string(cls, length: int) -> str:
-        return "".join(secrets.choice(cls.ALPHABET) for _ in range(length))
+    def random_string(cls, length: int, rng: random.Random | None = None) -> str:
+        choice = rng.choice if rng is not None else secrets.choice
+        return "".join(choice(cls.ALPHABET) for _ in range(length))
 
     @classmethod
-    def generate(cls, algorithm: Algorithm, params: JobParams, salt_length_bytes: int = 8) -> Self:
+    def generate(
+        cls,
+        algorithm: Algorithm,
+        params: JobParams,
+        salt_length_bytes: int = 8,
+        rng: random.Random | None = None,
+    ) -> Self:
         return cls(
             algorithm=algorithm,
-            password=cls.random_string(params.password_length),
+            password=cls.random_string(params.password_length, rng=rng),
             params=params,
-            salt=secrets.token_bytes(salt_length_bytes),
+            salt=rng.randbytes(salt_length_bytes)
+            if rng is not None
+            else secrets.token_bytes(salt_length_bytes),
         )
 
     @property
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar, Self
 
+import numpy as np
 from cryptography.fernet import Fernet
 
 from compute_horde_validator.validator.synthetic_jobs.synthetic_job import (
@@ -27,17 +28,30 @@ class V1SyntheticJob(SyntheticJob):
 
     DIGITS: ClassVar[str] = string.digits
     ALPHABET: ClassVar[str] = string.ascii_letters + DIGITS
+    DIGITS_BYTES: ClassVar[np.ndarray] = np.frombuffer(DIGITS.encode("ascii"), dtype=np.uint8)
+    ALPHABET_BYTES: ClassVar[np.ndarray] = np.frombuffer(ALPHABET.encode("ascii"), dtype=np.uint8)
 
     @classmethod
-    def random_string(cls, num_letters: int, num_digits: int) -> str:
-        return "".join(random.choice(cls.ALPHABET) for _ in range(num_letters)) + "".join(
-            random.choice(cls.DIGITS) for _ in range(num_digits)
+    def random_string(
+        cls, num_letters: int, num_digits: int, rng: random.Random | None = None
+    ) -> str:
+        choice = (rng or random).choice
+        return "".join(choice(cls.ALPHABET) for _ in range(num_letters)) + "".join(
+            choice(cls.DIGITS) for _ in range(num_digits)
         )
 
     @classmethod
     def generate(
-        cls, algorithms: list[Algorithm], params: list[JobParams], salt_length_bytes: int = 8
+        cls,
+        algorithms: list[Algorithm],
+        params: list[JobParams],
+        salt_length_bytes: int = 8,
+        rng: random.Random | None = None,
     ) -> Self:
+        """
+        Generate a job. When `rng` is given, the passwords and salts are drawn from it only,
+        so the same seed always produces the same job, regardless of the process generating it.
+        """
         # generate distinct passwords for each algorithm
         passwords = []
         for _params in params:
@@ -45,7 +59,7 @@ class V1SyntheticJob(SyntheticJob):
             while len(_passwords) < _params.num_hashes:
                 _passwords.add(
                     cls.random_string(
-                        num_letters=_params.num_letters, num_digits=_params.num_digits
+                        num_letters=_params.num_letters, num_digits=_params.num_digits, rng=rng
                     )
                 )
             passwords.append(sorted(list(_passwords)))
@@ -54,9 +68,72 @@ class V1SyntheticJob(SyntheticJob):
             algorithms=algorithms,
             params=params,
             passwords=passwords,
-            salts=[secrets.token_bytes(salt_length_bytes) for _ in range(len(algorithms))],
+            salts=[
+                rng.randbytes(salt_length_bytes)
+                if rng is not None
+                else secrets.token_bytes(salt_length_bytes)
+                for _ in range(len(algorithms))
+            ],
         )
 
+    @classmethod
+    def random_passwords(cls, rng: np.random.Generator, n: int, params: JobParams) -> np.ndarray:
+        """
+        Draw `n` sorted rows of `params.num_hashes` distinct passwords at once.
+        Returns a `(n, num_hashes)` array of fixed width bytes.
+        """
+        length = params.password_length
+        chars = np.empty((n, params.num_hashes, length), dtype=np.uint8)
+        # sorting this view sorts the passwords in `chars`
+        passwords = chars.view(f"S{length}").reshape(n, params.num_hashes)
+        redraw = np.ones((n, params.num_hashes), dtype=bool)
+        while redraw.any():
+            count = np.count_nonzero(redraw)
+            chars[redraw, : params.num_letters] = cls.ALPHABET_BYTES[
+                rng.integers(len(cls.ALPHABET_BYTES), size=(count, params.num_letters))
+            ]
+            chars[redraw, params.num_letters :] = cls.DIGITS_BYTES[
+                rng.integers(len(cls.DIGITS_BYTES), size=(count, params.num_digits))
+            ]
+            passwords.sort(axis=1)
+            # duplicates are adjacent after sorting, redraw all but the first of them
+            redraw[:, 0] = False
+            np.equal(passwords[:, 1:], passwords[:, :-1], out=redraw[:, 1:])
+        return passwords
+
+    @classmethod
+    def generate_many(
+        cls,
+        n: int,
+        algorithms: list[Algorithm],
+        params: list[JobParams],
+        salt_length_bytes: int = 8,
+        rng: np.random.Generator | None = None,
+    ) -> list[Self]:
+        """
+        Generate `n` jobs, drawing the passwords and salts of all of them at once.
+        The same `rng` state always produces the same jobs.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        passwords = [
+            cls.random_passwords(rng, n, _params).astype(str).tolist() for _params in params
+        ]
+        salts = rng.bytes(n * len(algorithms) * salt_length_bytes)
+        salt_offsets = range(0, len(salts), salt_length_bytes)
+        return [
+            cls(
+                algorithms=algorithms,
+                params=params,
+                passwords=[_passwords[i] for _passwords in passwords],
+                salts=[
+                    salts[offset : offset + salt_length_bytes]
+                    for offset in salt_offsets[i * len(algorithms) : (i + 1) * len(algorithms)]
+                ],
+            )
+            for i in range(n)
+        ]
+
     @property
     def timeout_seconds(self) -> int:
         return max([p.timeout for p in self.params])
@@ -65,8 +142,10 @@ class V1SyntheticJob(SyntheticJob):
         return ["?1" * params.num_letters + "?d" * params.num_digits for params in self.params]
 
     def hash_hexes(self, i) -> list[str]:
+        hash_function = self.algorithms[i].params[self.algorithms[i]]["hash_function"]
+        salt = self.salts[i]
         return [
-            self.algorithms[i].hash(password.encode("ascii") + self.salts[i]).hexdigest()
+            hash_function(password.encode("ascii") + salt).hexdigest()
             for password in self.passwords[i]
         ]
 
@@ -78,7 +157,8 @@ class V1SyntheticJob(SyntheticJob):
         return Fernet(key_bytes).encrypt(payload.encode("utf-8")).decode("utf-8")
 
     def _payload(self, i) -> str:
-        return "\n".join([f"{hash_hex}:{self.salts[i].hex()}" for hash_hex in self.hash_hexes(i)])
+        suffix = ":" + self.salts[i].hex()
+        return "\n".join([hash_hex + suffix for hash_hex in self.hash_hexes(i)])
 
     def _payloads(self) -> list[str]:
         payloads = []
@@ -0,0 +1,40 @@
+import base64
+from dataclasses import dataclass
+
+
+class VolumeArena:
+    """
+    Decoded contents of many inline volumes, stored back to back in a single buffer.
+
+    Holding the zip bytes instead of their base64 encoding makes each volume a quarter smaller,
+    and saves the per-object overhead of thousands of large strings.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def add(self, contents: str) -> "ArenaVolume":
+        """Store base64 encoded inline volume `contents`"""
+        offset = len(self._buffer)
+        self._buffer += base64.b64decode(contents)
+        return ArenaVolume(arena=self, offset=offset, size=len(self._buffer) - offset)
+
+    def b64encode(self, offset: int, size: int) -> str:
+        # release the view right away, the buffer can't be resized while it exists
+        with memoryview(self._buffer) as view:
+            return base64.b64encode(view[offset : offset + size]).decode()
+
+
+@dataclass(frozen=True, slots=True)
+class ArenaVolume:
+    arena: VolumeArena
+    offset: int
+    size: int
+
+    @property
+    def contents(self) -> str:
+        """Base64 encoded contents, as sent in `InlineVolume`. Encoded on each access, not cached."""
+        return self.arena.b64encode(self.offset, self.size)
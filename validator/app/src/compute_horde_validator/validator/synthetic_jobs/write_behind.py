@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.db.models import Model
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Chunk:
+    model: type[Model]
+    objs: Sequence[Model]
+    bulk_create_kwargs: dict[str, Any]
+
+    def __str__(self) -> str:
+        return f"{len(self.objs)} {self.model.__name__} rows"
+
+
+@sync_to_async
+def _bulk_create(chunk: _Chunk) -> None:
+    chunk.model.objects.bulk_create(chunk.objs, **chunk.bulk_create_kwargs)
+
+
+class WriteBehindQueue:
+    """
+    Persists model instances from a background task, in `bulk_create` chunks of at most
+    `chunk_size` rows, while the caller carries on.
+
+    Each chunk is committed on its own, so the chunks flushed before a crash stay in the database.
+    Writes have to be idempotent (`ignore_conflicts` or `update_conflicts`), as failed chunks
+    are retried by `drain`, after the chunks queued behind them.
+    """
+
+    def __init__(self, chunk_size: int):
+        assert chunk_size > 0
+        self.chunk_size = chunk_size
+        self.flushed_count = 0
+        self._queue: asyncio.Queue[_Chunk] = asyncio.Queue()
+        self._failed: list[_Chunk] = []
+        self._task: asyncio.Task | None = None
+
+    def put(self, model: type[Model], objs: Sequence[Model], **bulk_create_kwargs) -> None:
+        for i in range(0, len(objs), self.chunk_size):
+            self._queue.put_nowait(_Chunk(model, objs[i : i + self.chunk_size], bulk_create_kwargs))
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="WriteBehindQueue._run")
+
+    async def _run(self) -> None:
+        while True:
+            chunk = await self._queue.get()
+            try:
+                await _bulk_create(chunk)
+                self.flushed_count += len(chunk.objs)
+            except Exception as exc:
+                logger.warning("Failed to persist %s, will retry: %r", chunk, exc)
+                self._failed.append(chunk)
+            finally:
+                self._queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait for the queued chunks, then retry the failed ones - raises if a retry fails"""
+        await self._queue.join()
+        while self._failed:
+            chunk = self._failed[0]
+            await _bulk_create(chunk)
+            self.flushed_count += len(chunk.objs)
+            self._failed.pop(0)
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
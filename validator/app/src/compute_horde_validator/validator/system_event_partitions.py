@@ -0,0 +1,156 @@
+import logging
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+
+from django.db import DatabaseError, connections, transaction
+from django.utils.timezone import now
+
+from compute_horde_validator.validator.models import SystemEvent
+
+logger = logging.getLogger(__name__)
+
+_TABLE = SystemEvent._meta.db_table
+_BOUNDS_RE = re.compile(r"FOR VALUES FROM \((.+)\) TO \((.+)\)")
+
+
+@dataclass
+class Partition:
+    name: str
+    # None for unbounded, both None for the default partition
+    start: datetime | None
+    end: datetime | None
+    is_default: bool = False
+
+
+def _parse_bound(bound: str) -> datetime | None:
+    if bound == "MINVALUE" or bound == "MAXVALUE":
+        return None
+    return datetime.fromisoformat(bound.strip("'"))
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time(), tzinfo=UTC)
+
+
+def get_partitions(using: str = "default") -> list[Partition]:
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = %s::regclass
+            ORDER BY c.relname
+            """,
+            [_TABLE],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bounds in rows:
+        if bounds == "DEFAULT":
+            partitions.append(Partition(name=name, start=None, end=None, is_default=True))
+            continue
+        match = _BOUNDS_RE.fullmatch(bounds)
+        assert match is not None, bounds
+        partitions.append(
+            Partition(name=name, start=_parse_bound(match[1]), end=_parse_bound(match[2]))
+        )
+    return partitions
+
+
+def _is_partitioned(using: str) -> bool:
+    return connections[using].vendor == "postgresql" and any(get_partitions(using))
+
+
+def _create_partition(name: str, day: date, default: str | None, using: str) -> int:
+    """
+    Create the partition of `day`, moving the events of that day out of the `default` partition
+    into it - the partition can't be created while the default one has any. Return the number
+    of events moved.
+    """
+    start = _day_start(day)
+    end = _day_start(day + timedelta(days=1))
+    moved = 0
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        if default is not None:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {name}_moved ON COMMIT DROP AS "
+                f"WITH moved AS (DELETE FROM {default} "
+                f'WHERE "timestamp" >= %s AND "timestamp" < %s RETURNING *) '
+                f"SELECT * FROM moved",
+                [start, end],
+            )
+            moved = cursor.rowcount
+        cursor.execute(
+            f"CREATE TABLE {name} PARTITION OF {_TABLE} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        if moved:
+            cursor.execute(f"INSERT INTO {_TABLE} SELECT * FROM {name}_moved")
+    return moved
+
+
+def create_partitions(days_ahead: int, using: str = "default") -> list[str]:
+    """
+    Create the daily partitions up to `days_ahead` days from today,
+    continuing after the latest existing partition.
+    """
+    if not _is_partitioned(using):
+        return []
+
+    partitions = get_partitions(using)
+    default = next((partition.name for partition in partitions if partition.is_default), None)
+    ends = [partition.end for partition in partitions if partition.end is not None]
+    day = now().date()
+    if ends:
+        day = max(day, max(ends).date())
+    last_day = now().date() + timedelta(days=days_ahead)
+
+    created = []
+    while day <= last_day:
+        name = f"{_TABLE}_p{day:%Y%m%d}"
+        try:
+            moved = _create_partition(name, day, default, using)
+        except DatabaseError as exc:
+            logger.error("Failed to create system event partition %s: %r", name, exc)
+        else:
+            if moved:
+                logger.info("Moved %d system events from %s to %s", moved, default, name)
+            created.append(name)
+        day += timedelta(days=1)
+    return created
+
+
+def drop_expired_partitions(retention_days: int, using: str = "default") -> list[str]:
+    """
+    Drop the partitions with only events older than `retention_days` days,
+    and delete such events from the default partition.
+    """
+    if not _is_partitioned(using):
+        return []
+
+    cutoff = _day_start(now().date() - timedelta(days=retention_days))
+    dropped = []
+    with connections[using].cursor() as cursor:
+        for partition in get_partitions(using):
+            if partition.is_default:
+                cursor.execute(f'DELETE FROM {partition.name} WHERE "timestamp" < %s', [cutoff])
+                if cursor.rowcount:
+                    logger.info(
+                        "Deleted %d expired system events from %s", cursor.rowcount, partition.name
+                    )
+            elif partition.end is not None and partition.end <= cutoff:
+                cursor.execute(f"DROP TABLE {partition.name}")
+                dropped.append(partition.name)
+    return dropped
+
+
+def maintain_partitions(days_ahead: int, retention_days: int, using: str = "default") -> None:
+    created = create_partitions(days_ahead, using)
+    dropped = drop_expired_partitions(retention_days, using)
+    logger.info(
+        "System event partitions: created %s, dropped %s",
+        ", ".join(created) or "none",
+        ", ".join(dropped) or "none",
+    )
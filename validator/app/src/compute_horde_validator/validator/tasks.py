@@ -1,42 +1,46 @@
 import contextlib
-import json
+import functools
 import numbers
 import random
 import time
 import traceback
 import uuid
 from datetime import timedelta
-from math import ceil, floor
+from math import floor
 
 import billiard.exceptions
 import bittensor
-import celery.exceptions
 import numpy as np
-import requests
 from asgiref.sync import async_to_sync
 from bittensor.utils.weight_utils import process_weights_for_netuid
 from celery import shared_task
-from celery.result import allow_join_result
 from celery.utils.log import get_task_logger
 from compute_horde.dynamic_config import sync_dynamic_config
-from compute_horde.receipts import (
-    JobFinishedReceiptPayload,
-    JobStartedReceiptPayload,
-    get_miner_receipts,
-)
 from compute_horde.utils import ValidatorListError, get_validators
 from constance import config
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Q
 from django.utils.timezone import now
 
 from compute_horde_validator.celery import app
+from compute_horde_validator.validator.chain_view import ChainView
 from compute_horde_validator.validator.dynamic_config import (
     get_number_of_prompts_to_validate_from_series,
     get_number_of_workloads_to_trigger_local_inference,
 )
-from compute_horde_validator.validator.locks import Locked, LockType, get_advisory_lock
+from compute_horde_validator.validator.event_shipper import SystemEventShipper
+from compute_horde_validator.validator.locks import (
+    Locked,
+    LockType,
+    get_advisory_lock,
+    session_advisory_lock,
+)
 from compute_horde_validator.validator.metagraph_client import get_miner_axon_info
+from compute_horde_validator.validator.metrics import (
+    VALIDATOR_RECEIPTS_FETCH_DURATION,
+    VALIDATOR_RECEIPTS_STORED,
+)
 from compute_horde_validator.validator.models import (
     Cycle,
     JobFinishedReceipt,
@@ -52,14 +56,17 @@ from compute_horde_validator.validator.models import (
 )
 from compute_horde_validator.validator.organic_jobs.miner_client import MinerClient
 from compute_horde_validator.validator.organic_jobs.miner_driver import execute_organic_job
+from compute_horde_validator.validator.receipts import fetch_and_store_receipts
 from compute_horde_validator.validator.s3 import generate_upload_url, get_prompts_from_s3_url
 from compute_horde_validator.validator.synthetic_jobs.batch_run import (
     SYNTHETIC_JOBS_HARD_LIMIT,
     SYNTHETIC_JOBS_SOFT_LIMIT,
 )
+from compute_horde_validator.validator.synthetic_jobs.reservoir import fill_reservoir
 from compute_horde_validator.validator.synthetic_jobs.utils import (
     create_and_run_synthetic_job_batch,
 )
+from compute_horde_validator.validator.system_event_partitions import maintain_partitions
 
 from .models import AdminJobRequest
 from .scoring import score_batches
@@ -84,7 +91,7 @@ class ScheduleError(Exception):
     pass
 
 
-def when_to_run(subtensor_: bittensor.subtensor, current_cycle) -> int:
+def when_to_run(chain_view: ChainView, current_cycle) -> int:
     """
     Select block when to run validation for a given validator.
     Validators needs to run their jobs temporarily separated from others.
@@ -109,7 +116,7 @@ def when_to_run(subtensor_: bittensor.subtensor, current_cycle) -> int:
         )
 
     try:
-        seed = subtensor_.get_block_hash(
+        seed = chain_view.get_block_hash(
             current_cycle.start - config.DYNAMIC_BLOCK_FINALIZATION_NUMBER
         )
     except Exception as ex:
@@ -203,8 +210,8 @@ def schedule_synthetic_jobs() -> None:
             return
 
         bittensor.turn_console_off()
-        subtensor_ = get_subtensor(network=settings.BITTENSOR_NETWORK)
-        current_block = subtensor_.get_current_block()
+        chain_view = get_chain_view()
+        current_block = chain_view.get_current_block()
         current_cycle = get_cycle_containing_block(
             block=current_block, netuid=settings.BITTENSOR_NETUID
         )
@@ -222,7 +229,7 @@ def schedule_synthetic_jobs() -> None:
             )
             return
 
-        next_run_block = when_to_run(subtensor_, current_cycle)
+        next_run_block = when_to_run(chain_view, current_cycle)
 
         cycle, _ = Cycle.objects.get_or_create(start=current_cycle.start, stop=current_cycle.stop)
         batch = SyntheticJobBatch.objects.create(
@@ -279,8 +286,8 @@ def run_synthetic_jobs(
         seconds=config.DYNAMIC_SYNTHETIC_JOBS_PLANNER_POLL_INTERVAL
     )
 
-    subtensor_ = get_subtensor(network=settings.BITTENSOR_NETWORK)
-    current_block = subtensor_.get_current_block()
+    chain_view = get_chain_view()
+    current_block = chain_view.get_current_block()
 
     with transaction.atomic():
         ongoing_synthetic_job_batches = list(
@@ -331,25 +338,12 @@ def run_synthetic_jobs(
                 batch.block,
             )
         else:
-            for _ in range(
-                ceil(
-                    blocks_to_wait
-                    * settings.BITTENSOR_APPROXIMATE_BLOCK_DURATION
-                    * 2
-                    / poll_interval
-                )
-            ):
-                current_block = subtensor_.get_current_block()
-                if current_block >= target_block:
-                    break
-                logger.debug(
-                    "Waiting for block %s, current block is %s, sleeping for %s",
-                    target_block,
-                    current_block,
-                    poll_interval,
-                )
-                time.sleep(poll_interval.total_seconds())
-            else:
+            current_block = chain_view.wait_for_block(
+                target_block,
+                timeout=blocks_to_wait * settings.BITTENSOR_APPROXIMATE_BLOCK_DURATION * 2,
+                poll_interval=poll_interval,
+            )
+            if current_block < target_block:
                 logger.error(
                     "Failed to wait for target block %s, current block is %s",
                     target_block,
@@ -379,8 +373,7 @@ def check_missed_synthetic_jobs() -> None:
     """
     Check if there are any synthetic jobs that were scheduled to run, but didn't.
     """
-    subtensor_ = get_subtensor(network=settings.BITTENSOR_NETWORK)
-    current_block = subtensor_.get_current_block()
+    current_block = get_chain_view().get_current_block()
 
     with transaction.atomic():
         past_job_batches = SyntheticJobBatch.objects.select_for_update(skip_locked=True).filter(
@@ -404,135 +397,303 @@ def check_missed_synthetic_jobs() -> None:
         past_job_batches.update(is_missed=True)
 
 
+@app.task()
+def fill_synthetic_job_reservoir() -> None:
+    """
+    Generate synthetic jobs for the upcoming batches ahead of time.
+    """
+    try:
+        with session_advisory_lock(LockType.SYNTHETIC_JOB_RESERVOIR):
+            fill_reservoir()
+    except Locked:
+        logger.debug("Another thread already filling the synthetic job reservoir")
+
+
 def _normalize_weights_for_committing(weights: list[numbers.Number], max_: int):
     factor = max_ / max(weights)
     return [round(w * factor) for w in weights]
 
 
-@app.task()
-def do_set_weights(
-    netuid: int,
-    uids: list,
-    weights: list,
-    wait_for_inclusion: bool,
-    wait_for_finalization: bool,
-    version_key: int,
-) -> tuple[bool, str]:
+def _due_for_attempt() -> Q:
+    return Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now())
+
+
+def _claim_weights(
+    weights_id: int,
+    ready_state: str,
+    in_progress_state: str,
+    operation: str,
+    max_attempts: int,
+    lease: int,
+) -> Weights | None:
     """
-    Set weights. To be used in other celery tasks in order to facilitate a timeout,
-     since the multiprocessing version of this doesn't work in celery.
+    Start an attempt of the step from `ready_state` if one is due, and no other worker is making
+    one. Weights still in `in_progress_state` once the lease of their attempt expired were left
+    behind by an attempt that never finished, e.g. killed by the hard time limit.
     """
-    bittensor.turn_console_off()
-    subtensor_ = get_subtensor(network=settings.BITTENSOR_NETWORK)
-    current_block = subtensor_.get_current_block()
-
-    commit_reveal_weights_enabled = config.DYNAMIC_COMMIT_REVEAL_WEIGHTS_ENABLED
-    commit_reveal_weights_interval = config.DYNAMIC_COMMIT_REVEAL_WEIGHTS_INTERVAL
-    max_weight = config.DYNAMIC_MAX_WEIGHT
-
-    def _commit_weights() -> tuple[bool, str]:
-        last_weights = Weights.objects.order_by("-created_at").first()
-        if (
-            last_weights
-            and last_weights.revealed_at is None
-            and last_weights.block >= current_block - commit_reveal_weights_interval * 1.5
-        ):
-            # ___|______________________|______________________|____________________
-            #    ^-commit weights       ^-time to reveal       ^-2x time to reveal
-            #    |_________________________________|_______________________________
-            #     impossible to commit new weights     can commit new weights
-            #     unless last weights are revealed     no matter what
+    with transaction.atomic():
+        weights = (
+            Weights.objects.select_for_update(skip_locked=True)
+            .filter(_due_for_attempt(), id=weights_id, state__in=[ready_state, in_progress_state])
+            .first()
+        )
+        if weights is None:
+            return None
+        if weights.state == in_progress_state:
+            logger.info(f"{operation} weights timed out (attempt #{weights.attempts})")
             save_weight_setting_failure(
-                subtype=SystemEvent.EventSubType.COMMIT_WEIGHTS_UNREVEALED_ERROR,
-                long_description="Cannot commit new weights before revealing old ones",
+                subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_TIMEOUT,
+                long_description=f"{operation} weights did not finish in {lease} seconds",
                 data={
-                    "uncommited_weights_id": last_weights.id,
-                    "created_at": str(last_weights.created_at),
-                    "block": last_weights.block,
-                    "current_block": current_block,
-                    "commit_reveal_weights_interval": commit_reveal_weights_interval,
+                    "try_number": weights.attempts,
+                    "operation": operation,
+                    "weights_id": weights.id,
                 },
             )
-            return False, "Cannot commit new weights before revealing old ones"
-        normalized_weights = _normalize_weights_for_committing(weights, max_weight)
-        weights_in_db = Weights(
-            uids=uids,
-            weights=normalized_weights,
+            if weights.attempts >= max_attempts:
+                _give_up_weights(weights, operation)
+                return None
+
+        weights.state = in_progress_state
+        weights.attempts += 1
+        weights.next_attempt_at = now() + timedelta(seconds=lease)
+        weights.save(update_fields=["state", "attempts", "next_attempt_at"])
+        return weights
+
+
+def _finish_weights_attempt(weights: Weights, in_progress_state: str, **fields) -> bool:
+    """
+    Record the outcome of an attempt, unless the lease expired and another attempt took over
+    """
+    updated = Weights.objects.filter(
+        id=weights.id, state=in_progress_state, attempts=weights.attempts
+    ).update(**fields)
+    if not updated:
+        logger.warning("Attempt #%s of weights %s was taken over", weights.attempts, weights.id)
+        return False
+    for name, value in fields.items():
+        setattr(weights, name, value)
+    return True
+
+
+def _give_up_weights(weights: Weights, operation: str) -> None:
+    Weights.objects.filter(id=weights.id).update(state=Weights.State.FAILED, next_attempt_at=None)
+    msg = f"Failed {operation} weights after {weights.attempts} attempts"
+    logger.warning(msg)
+    save_weight_setting_failure(
+        subtype=SystemEvent.EventSubType.GIVING_UP,
+        long_description=msg,
+        data={"try_number": weights.attempts, "operation": operation, "weights_id": weights.id},
+    )
+
+
+def _weights_attempt_failed(
+    weights: Weights,
+    ready_state: str,
+    in_progress_state: str,
+    operation: str,
+    max_attempts: int,
+    backoff: float,
+) -> bool:
+    """Returns whether the step should be retried after `backoff` seconds"""
+    if weights.attempts >= max_attempts:
+        _give_up_weights(weights, operation)
+        return False
+    return _finish_weights_attempt(
+        weights,
+        in_progress_state,
+        state=ready_state,
+        next_attempt_at=now() + timedelta(seconds=backoff),
+    )
+
+
+def _dispatch_commit_weights(weights_id: int, countdown: float = 0) -> None:
+    commit_weights.apply_async(
+        args=(weights_id,),
+        countdown=countdown,
+        soft_time_limit=WEIGHT_SETTING_TTL,
+        time_limit=WEIGHT_SETTING_HARD_TTL,
+    )
+
+
+def _commit_weights(subtensor_: bittensor.subtensor, weights: Weights) -> bool:
+    current_block = subtensor_.get_current_block()
+    commit_reveal_weights_interval = config.DYNAMIC_COMMIT_REVEAL_WEIGHTS_INTERVAL
+
+    last_weights = (
+        Weights.objects.filter(commit_reveal=True, block__isnull=False)
+        .exclude(id=weights.id)
+        .order_by("-created_at")
+        .first()
+    )
+    if (
+        last_weights
+        and last_weights.revealed_at is None
+        and last_weights.block >= current_block - commit_reveal_weights_interval * 1.5
+    ):
+        # ___|______________________|______________________|____________________
+        #    ^-commit weights       ^-time to reveal       ^-2x time to reveal
+        #    |_________________________________|_______________________________
+        #     impossible to commit new weights     can commit new weights
+        #     unless last weights are revealed     no matter what
+        save_weight_setting_failure(
+            subtype=SystemEvent.EventSubType.COMMIT_WEIGHTS_UNREVEALED_ERROR,
+            long_description="Cannot commit new weights before revealing old ones",
+            data={
+                "uncommited_weights_id": last_weights.id,
+                "created_at": str(last_weights.created_at),
+                "block": last_weights.block,
+                "current_block": current_block,
+                "commit_reveal_weights_interval": commit_reveal_weights_interval,
+            },
+        )
+        return False
+
+    try:
+        is_success, message = subtensor_.commit_weights(
+            wallet=settings.BITTENSOR_WALLET(),
+            netuid=settings.BITTENSOR_NETUID,
+            uids=weights.uids,
+            weights=weights.weights,
+            salt=weights.salt,
+            version_key=weights.version_key,
+            wait_for_inclusion=True,
+            wait_for_finalization=False,
+            max_retries=2,
+        )
+    except billiard.exceptions.SoftTimeLimitExceeded:
+        raise
+    except Exception:
+        is_success = False
+        message = traceback.format_exc()
+
+    if is_success:
+        logger.info("Successfully committed weights!!!")
+        _finish_weights_attempt(
+            weights,
+            Weights.State.COMMITTING,
+            state=Weights.State.COMMITTED,
             block=current_block,
-            version_key=version_key,
+            attempts=0,
+            next_attempt_at=None,
         )
-        try:
-            is_success, message = subtensor_.commit_weights(
-                wallet=settings.BITTENSOR_WALLET(),
-                netuid=netuid,
-                uids=uids,
-                weights=normalized_weights,
-                salt=weights_in_db.salt,
-                version_key=version_key,
-                wait_for_inclusion=wait_for_inclusion,
-                wait_for_finalization=wait_for_finalization,
-                max_retries=2,
-            )
-        except Exception:
-            is_success = False
-            message = traceback.format_exc()
-
-        if is_success:
-            logger.info("Successfully committed weights!!!")
-            weights_in_db.save()
-            save_weight_setting_event(
-                type_=SystemEvent.EventType.WEIGHT_SETTING_SUCCESS,
-                subtype=SystemEvent.EventSubType.COMMIT_WEIGHTS_SUCCESS,
-                long_description=f"message from chain: {message}",
-                data={"weights_id": weights_in_db.id},
-            )
-        else:
-            logger.info("Failed to commit weights due to: %s", message)
-            save_weight_setting_failure(
-                subtype=SystemEvent.EventSubType.COMMIT_WEIGHTS_ERROR,
-                long_description=f"message from chain: {message}",
-                data={"weights_id": weights_in_db.id},
-            )
-        return is_success, message
+        save_weight_setting_event(
+            type_=SystemEvent.EventType.WEIGHT_SETTING_SUCCESS,
+            subtype=SystemEvent.EventSubType.COMMIT_WEIGHTS_SUCCESS,
+            long_description=f"message from chain: {message}",
+            data={"weights_id": weights.id},
+        )
+    else:
+        logger.info("Failed to commit weights due to: %s", message)
+        save_weight_setting_failure(
+            subtype=SystemEvent.EventSubType.COMMIT_WEIGHTS_ERROR,
+            long_description=f"message from chain: {message}",
+            data={"weights_id": weights.id},
+        )
+    return is_success
 
-    def _set_weights() -> tuple[bool, str]:
-        try:
-            is_success, message = subtensor_.set_weights(
-                wallet=settings.BITTENSOR_WALLET(),
-                netuid=netuid,
-                uids=np.int64(uids),
-                weights=np.float32(weights),
-                version_key=version_key,
-                wait_for_inclusion=wait_for_inclusion,
-                wait_for_finalization=wait_for_finalization,
-                max_retries=2,
-            )
-        except Exception:
-            is_success = False
-            message = traceback.format_exc()
-        if is_success:
-            logger.info("Successfully set weights!!!")
-            save_weight_setting_event(
-                type_=SystemEvent.EventType.WEIGHT_SETTING_SUCCESS,
-                subtype=SystemEvent.EventSubType.SET_WEIGHTS_SUCCESS,
-                long_description=message,
-                data={},
-            )
-        else:
-            logger.info(f"Failed to set weights due to {message=}")
-            save_weight_setting_failure(
-                subtype=SystemEvent.EventSubType.SET_WEIGHTS_ERROR,
-                long_description=message,
-                data={},
-            )
-        return is_success, message
 
-    match commit_reveal_weights_enabled:
-        case True:
-            return _commit_weights()
+def _set_weights(subtensor_: bittensor.subtensor, weights: Weights) -> bool:
+    current_block = subtensor_.get_current_block()
+    try:
+        is_success, message = subtensor_.set_weights(
+            wallet=settings.BITTENSOR_WALLET(),
+            netuid=settings.BITTENSOR_NETUID,
+            uids=np.int64(weights.uids),
+            weights=np.float32(weights.weights),
+            version_key=weights.version_key,
+            wait_for_inclusion=True,
+            wait_for_finalization=False,
+            max_retries=2,
+        )
+    except billiard.exceptions.SoftTimeLimitExceeded:
+        raise
+    except Exception:
+        is_success = False
+        message = traceback.format_exc()
+    if is_success:
+        logger.info("Successfully set weights!!!")
+        _finish_weights_attempt(
+            weights,
+            Weights.State.COMMITTING,
+            state=Weights.State.REVEALED,
+            block=current_block,
+            revealed_at=now(),
+            next_attempt_at=None,
+        )
+        save_weight_setting_event(
+            type_=SystemEvent.EventType.WEIGHT_SETTING_SUCCESS,
+            subtype=SystemEvent.EventSubType.SET_WEIGHTS_SUCCESS,
+            long_description=message,
+            data={"weights_id": weights.id},
+        )
+    else:
+        logger.info(f"Failed to set weights due to {message=}")
+        save_weight_setting_failure(
+            subtype=SystemEvent.EventSubType.SET_WEIGHTS_ERROR,
+            long_description=message,
+            data={"weights_id": weights.id},
+        )
+    return is_success
 
-        case False:
-            return _set_weights()
+
+@app.task()
+def commit_weights(weights_id: int) -> None:
+    """
+    Make one attempt at writing the computed weights to the chain - committing them to be revealed
+    later, or setting them directly if commit-reveal was disabled when they were computed.
+    A failed attempt schedules the next one after the backoff instead of waiting for it.
+    """
+    operation = "setting/committing"
+    weights = _claim_weights(
+        weights_id,
+        Weights.State.COMPUTED,
+        Weights.State.COMMITTING,
+        operation=operation,
+        max_attempts=WEIGHT_SETTING_ATTEMPTS,
+        lease=WEIGHT_SETTING_HARD_TTL,
+    )
+    if weights is None:
+        logger.debug("Weights %s are not due for setting/committing", weights_id)
+        return
+
+    logger.debug(
+        f"Setting weights (attempt #{weights.attempts}):\n"
+        f"uids={weights.uids}\nscores={weights.weights}"
+    )
+    bittensor.turn_console_off()
+    try:
+        subtensor_ = get_subtensor(network=settings.BITTENSOR_NETWORK)
+        if weights.commit_reveal:
+            success = _commit_weights(subtensor_, weights)
+        else:
+            success = _set_weights(subtensor_, weights)
+    except billiard.exceptions.SoftTimeLimitExceeded:
+        logger.info(f"Setting weights timed out (attempt #{weights.attempts})")
+        save_weight_setting_failure(
+            subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_TIMEOUT,
+            long_description=traceback.format_exc(),
+            data={"try_number": weights.attempts, "operation": operation, "weights_id": weights.id},
+        )
+        success = False
+    except Exception:
+        logger.warning("Encountered when setting weights: ", exc_info=True)
+        save_weight_setting_failure(
+            subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_GENERIC_ERROR,
+            long_description=traceback.format_exc(),
+            data={"try_number": weights.attempts, "operation": operation, "weights_id": weights.id},
+        )
+        success = False
+
+    if not success and _weights_attempt_failed(
+        weights,
+        Weights.State.COMPUTED,
+        Weights.State.COMMITTING,
+        operation=operation,
+        max_attempts=WEIGHT_SETTING_ATTEMPTS,
+        backoff=WEIGHT_SETTING_FAILURE_BACKOFF,
+    ):
+        _dispatch_commit_weights(weights.id, countdown=WEIGHT_SETTING_FAILURE_BACKOFF)
 
 
 @shared_task
@@ -639,6 +800,10 @@ def get_subtensor(network):
         return bittensor.subtensor(network=network)
 
 
+def get_chain_view() -> ChainView:
+    return ChainView(lambda: get_subtensor(network=settings.BITTENSOR_NETWORK))
+
+
 def get_metagraph(subtensor, netuid):
     with save_event_on_error(SystemEvent.EventSubType.SUBTENSOR_CONNECTIVITY_ERROR):
         return subtensor.metagraph(netuid=netuid)
@@ -657,13 +822,25 @@ def set_scores():
                 logger.warning("Not setting scores, SERVING is disabled in constance config")
                 return
 
-            subtensor = get_subtensor(network=settings.BITTENSOR_NETWORK)
-            metagraph = get_metagraph(subtensor, netuid=settings.BITTENSOR_NETUID)
+            pending_weights = Weights.objects.filter(
+                state__in=[Weights.State.COMPUTED, Weights.State.COMMITTING]
+            )
+            if pending_weights.exists():
+                # one set of weights at a time, new batches wait until the last one is set or failed
+                for weights_id in pending_weights.filter(_due_for_attempt()).values_list(
+                    "id", flat=True
+                ):
+                    transaction.on_commit(functools.partial(_dispatch_commit_weights, weights_id))
+                logger.info("Previous weights are still being set, not scoring new batches")
+                return
+
+            chain_view = get_chain_view()
+            metagraph = get_metagraph(chain_view, netuid=settings.BITTENSOR_NETUID)
             neurons = metagraph.neurons
             hotkey_to_uid = {n.hotkey: n.uid for n in neurons}
             score_per_uid = {}
             batches = list(
-                SyntheticJobBatch.objects.prefetch_related("synthetic_jobs")
+                SyntheticJobBatch.objects.select_related("cycle")
                 .filter(
                     scored=False,
                     started_at__gte=now() - timedelta(days=1),
@@ -682,7 +859,7 @@ def set_scores():
                     batch.save()
                 batches = [batches[-1]]
 
-            if subtensor.get_current_block() <= batches[-1].cycle.stop:
+            if chain_view.get_current_block() <= batches[-1].cycle.stop:
                 logger.debug(
                     "There is a batch ready to be scored but we're "
                     "waiting for the beginning of next cycle to set weights"
@@ -709,7 +886,7 @@ def set_scores():
                 uids,
                 weights,
                 settings.BITTENSOR_NETUID,
-                subtensor,
+                chain_view.subtensor,
                 metagraph,
             )
 
@@ -717,160 +894,80 @@ def set_scores():
                 batch.scored = True
                 batch.save()
 
-            for try_number in range(WEIGHT_SETTING_ATTEMPTS):
-                logger.debug(
-                    f"Setting weights (attempt #{try_number}):\nuids={uids}\nscores={weights}"
-                )
-                success = False
-
-                try:
-                    result = do_set_weights.apply_async(
-                        kwargs=dict(
-                            netuid=settings.BITTENSOR_NETUID,
-                            uids=uids.tolist(),
-                            weights=weights.tolist(),
-                            wait_for_inclusion=True,
-                            wait_for_finalization=False,
-                            version_key=SCORING_ALGO_VERSION,
-                        ),
-                        soft_time_limit=WEIGHT_SETTING_TTL,
-                        time_limit=WEIGHT_SETTING_HARD_TTL,
-                    )
-                    logger.info(f"Setting weights task id: {result.id}")
-                    try:
-                        with allow_join_result():
-                            success, msg = result.get(timeout=WEIGHT_SETTING_TTL)
-                    except (celery.exceptions.TimeoutError, billiard.exceptions.TimeLimitExceeded):
-                        result.revoke(terminate=True)
-                        logger.info(f"Setting weights timed out (attempt #{try_number})")
-                        save_weight_setting_failure(
-                            subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_TIMEOUT,
-                            long_description=traceback.format_exc(),
-                            data={"try_number": try_number, "operation": "setting/committing"},
-                        )
-                        continue
-                except Exception:
-                    logger.warning("Encountered when setting weights: ", exc_info=True)
-                    save_weight_setting_failure(
-                        subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_GENERIC_ERROR,
-                        long_description=traceback.format_exc(),
-                        data={"try_number": try_number, "operation": "setting/committing"},
-                    )
-                    continue
-                if success:
-                    break
-                time.sleep(WEIGHT_SETTING_FAILURE_BACKOFF)
-            else:
-                msg = f"Failed to set weights after {WEIGHT_SETTING_ATTEMPTS} attempts"
-                logger.warning(msg)
-                save_weight_setting_failure(
-                    subtype=SystemEvent.EventSubType.GIVING_UP,
-                    long_description=msg,
-                    data={"try_number": WEIGHT_SETTING_ATTEMPTS, "operation": "setting/committing"},
-                )
+            weights_in_db = Weights.objects.create(
+                uids=uids.tolist(),
+                weights=_normalize_weights_for_committing(
+                    weights.tolist(), config.DYNAMIC_MAX_WEIGHT
+                ),
+                version_key=SCORING_ALGO_VERSION,
+                commit_reveal=config.DYNAMIC_COMMIT_REVEAL_WEIGHTS_ENABLED,
+                next_attempt_at=now(),
+            )
+            logger.debug(f"Computed weights {weights_in_db.id}:\nuids={uids}\nscores={weights}")
+            transaction.on_commit(functools.partial(_dispatch_commit_weights, weights_in_db.id))
 
 
 @app.task()
 def reveal_scores() -> None:
     """
-    Select latest Weights that are older than `commit_reveal_weights_interval`
-    and haven't been revealed yet, and reveal them.
+    Select latest committed Weights that are older than `commit_reveal_weights_interval`
+    and haven't been revealed yet, and dispatch revealing them if an attempt is due.
     """
-    WEIGHT_REVEALING_TTL = config.DYNAMIC_WEIGHT_REVEALING_TTL
-    WEIGHT_REVEALING_HARD_TTL = config.DYNAMIC_WEIGHT_REVEALING_HARD_TTL
-    WEIGHT_REVEALING_ATTEMPTS = config.DYNAMIC_WEIGHT_REVEALING_ATTEMPTS
-    WEIGHT_REVEALING_FAILURE_BACKOFF = config.DYNAMIC_WEIGHT_REVEALING_FAILURE_BACKOFF
-
-    commit_reveal_weights_interval = config.DYNAMIC_COMMIT_REVEAL_WEIGHTS_INTERVAL
-
-    subtensor_ = get_subtensor(network=settings.BITTENSOR_NETWORK)
-    current_block = subtensor_.get_current_block()
-
-    last_weights = Weights.objects.order_by("-created_at").first()
+    last_weights = (
+        Weights.objects.filter(state__in=[Weights.State.COMMITTED, Weights.State.REVEALING])
+        .order_by("-created_at")
+        .first()
+    )
     if not last_weights:
         return
-    if last_weights.revealed_at is not None:
+    if last_weights.next_attempt_at is not None and last_weights.next_attempt_at > now():
+        logger.debug("Weights %s are not due for revealing", last_weights.id)
         return
-    if last_weights.block > current_block - commit_reveal_weights_interval:
+
+    current_block = get_chain_view().get_current_block()
+    if last_weights.block > current_block - config.DYNAMIC_COMMIT_REVEAL_WEIGHTS_INTERVAL:
         return
 
-    weights_id = last_weights.id
-    with transaction.atomic():
-        last_weights = (
-            Weights.objects.filter(id=weights_id, revealed_at=None)
-            .select_for_update(skip_locked=True)
-            .first()
-        )
-        if not last_weights:
-            logger.debug(
-                "Weights have already been revealed or are being revealed at this moment: %s",
-                weights_id,
-            )
-            return
+    _dispatch_reveal_weights(last_weights.id)
 
-        for try_number in range(WEIGHT_REVEALING_ATTEMPTS):
-            logger.debug(f"Revealing weights (attempt #{try_number}): weights_id={weights_id}")
-            success = False
 
-            try:
-                result = do_reveal_weights.apply_async(
-                    kwargs=dict(
-                        weights_id=last_weights.id,
-                    ),
-                    soft_time_limit=WEIGHT_REVEALING_TTL,
-                    time_limit=WEIGHT_REVEALING_HARD_TTL,
-                )
-                logger.info(f"Revealing weights task id: {result.id}")
-                try:
-                    with allow_join_result():
-                        success, msg = result.get(timeout=WEIGHT_REVEALING_TTL)
-                except (celery.exceptions.TimeoutError, billiard.exceptions.TimeLimitExceeded):
-                    result.revoke(terminate=True)
-                    logger.info(f"Revealing weights timed out (attempt #{try_number})")
-                    save_weight_setting_failure(
-                        subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_TIMEOUT,
-                        long_description=traceback.format_exc(),
-                        data={"try_number": try_number, "operation": "revealing"},
-                    )
-                    continue
-            except Exception:
-                logger.warning("Encountered when revealing weights: ")
-                save_weight_setting_failure(
-                    subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_GENERIC_ERROR,
-                    long_description=traceback.format_exc(),
-                    data={"try_number": try_number, "operation": "revealing"},
-                )
-                continue
-            if success:
-                last_weights.revealed_at = now()
-                last_weights.save()
-                break
-            time.sleep(WEIGHT_REVEALING_FAILURE_BACKOFF)
-        else:
-            msg = f"Failed to set weights after {WEIGHT_REVEALING_ATTEMPTS} attempts"
-            logger.warning(msg)
-            save_weight_setting_failure(
-                subtype=SystemEvent.EventSubType.GIVING_UP,
-                long_description=msg,
-                data={"try_number": WEIGHT_REVEALING_ATTEMPTS, "operation": "revealing"},
-            )
+def _dispatch_reveal_weights(weights_id: int, countdown: float = 0) -> None:
+    reveal_weights.apply_async(
+        args=(weights_id,),
+        countdown=countdown,
+        soft_time_limit=config.DYNAMIC_WEIGHT_REVEALING_TTL,
+        time_limit=config.DYNAMIC_WEIGHT_REVEALING_HARD_TTL,
+    )
 
 
 @app.task()
-def do_reveal_weights(weights_id: int) -> tuple[bool, str]:
-    weights = Weights.objects.filter(id=weights_id, revealed_at=None).first()
-    if not weights:
+def reveal_weights(weights_id: int) -> None:
+    """
+    Make one attempt at revealing the committed weights, scheduling the next one after
+    the backoff if it fails.
+    """
+    operation = "revealing"
+    max_attempts = config.DYNAMIC_WEIGHT_REVEALING_ATTEMPTS
+    weights = _claim_weights(
+        weights_id,
+        Weights.State.COMMITTED,
+        Weights.State.REVEALING,
+        operation=operation,
+        max_attempts=max_attempts,
+        lease=config.DYNAMIC_WEIGHT_REVEALING_HARD_TTL,
+    )
+    if weights is None:
         logger.debug(
             "Weights have already been revealed or are being revealed at this moment: %s",
             weights_id,
         )
-        return True, "nothing_to_do"
+        return
 
-    wallet = settings.BITTENSOR_WALLET()
-    subtensor_ = get_subtensor(network=settings.BITTENSOR_NETWORK)
+    logger.debug(f"Revealing weights (attempt #{weights.attempts}): weights_id={weights_id}")
     try:
+        subtensor_ = get_subtensor(network=settings.BITTENSOR_NETWORK)
         is_success, message = subtensor_.reveal_weights(
-            wallet=wallet,
+            wallet=settings.BITTENSOR_WALLET(),
             netuid=settings.BITTENSOR_NETUID,
             uids=weights.uids,
             weights=weights.weights,
@@ -880,95 +977,50 @@ def do_reveal_weights(weights_id: int) -> tuple[bool, str]:
             wait_for_finalization=True,
             max_retries=2,
         )
+    except billiard.exceptions.SoftTimeLimitExceeded:
+        logger.info(f"Revealing weights timed out (attempt #{weights.attempts})")
+        save_weight_setting_failure(
+            subtype=SystemEvent.EventSubType.WRITING_TO_CHAIN_TIMEOUT,
+            long_description=traceback.format_exc(),
+            data={"try_number": weights.attempts, "operation": operation, "weights_id": weights.id},
+        )
+        is_success, message = False, None
     except Exception:
-        logger.warning("Encountered when setting weights: ", exc_info=True)
-        is_success = False
-        message = traceback.format_exc()
+        logger.warning("Encountered when revealing weights: ", exc_info=True)
+        is_success, message = False, traceback.format_exc()
+
     if is_success:
+        _finish_weights_attempt(
+            weights,
+            Weights.State.REVEALING,
+            state=Weights.State.REVEALED,
+            revealed_at=now(),
+            next_attempt_at=None,
+        )
         save_weight_setting_event(
             type_=SystemEvent.EventType.WEIGHT_SETTING_SUCCESS,
             subtype=SystemEvent.EventSubType.REVEAL_WEIGHTS_SUCCESS,
             long_description=message,
             data={"weights_id": weights.id},
         )
-    else:
+        return
+
+    if message is not None:
         save_weight_setting_failure(
             subtype=SystemEvent.EventSubType.REVEAL_WEIGHTS_ERROR,
             long_description=message,
             data={"weights_id": weights.id},
         )
-    return is_success, message
-
-
-@app.task
-def fetch_receipts_from_miner(hotkey: str, ip: str, port: int):
-    logger.debug(f"Fetching receipts from miner. {hotkey=} {ip} {port=}")
-    try:
-        receipts = get_miner_receipts(hotkey, ip, port)
-    except Exception as e:
-        comment = f"Failed to fetch receipts from miner {hotkey} {ip}:{port}: {e!r}"
-        logger.warning(comment)
-        save_receipt_event(
-            subtype=SystemEvent.EventSubType.RECEIPT_FETCH_ERROR,
-            long_description=comment,
-            data={"miner_hotkey": hotkey, "miner_ip": ip, "miner_port": port},
-        )
-        return
-    logger.debug(f"Miner returned {len(receipts)} receipts. {hotkey=}")
-
-    tolerance = timedelta(hours=1)
-
-    latest_job_started_receipt = (
-        JobStartedReceipt.objects.filter(miner_hotkey=hotkey).order_by("-time_accepted").first()
-    )
-    job_started_receipt_cutoff_time = (
-        latest_job_started_receipt.time_accepted - tolerance if latest_job_started_receipt else None
-    )
-    job_started_receipt_to_create = [
-        JobStartedReceipt(
-            job_uuid=receipt.payload.job_uuid,
-            miner_hotkey=receipt.payload.miner_hotkey,
-            validator_hotkey=receipt.payload.validator_hotkey,
-            executor_class=receipt.payload.executor_class,
-            time_accepted=receipt.payload.time_accepted,
-            max_timeout=receipt.payload.max_timeout,
-        )
-        for receipt in receipts
-        if isinstance(receipt.payload, JobStartedReceiptPayload)
-        and (
-            job_started_receipt_cutoff_time is None
-            or receipt.payload.time_accepted > job_started_receipt_cutoff_time
-        )
-    ]
-    logger.debug(f"Creating {len(job_started_receipt_to_create)} JobStartedReceipt. {hotkey=}")
-    JobStartedReceipt.objects.bulk_create(job_started_receipt_to_create, ignore_conflicts=True)
-
-    latest_job_finished_receipt = (
-        JobFinishedReceipt.objects.filter(miner_hotkey=hotkey).order_by("-time_started").first()
-    )
-    job_finished_receipt_cutoff_time = (
-        latest_job_finished_receipt.time_started - tolerance
-        if latest_job_finished_receipt
-        else None
-    )
-    job_finished_receipt_to_create = [
-        JobFinishedReceipt(
-            job_uuid=receipt.payload.job_uuid,
-            miner_hotkey=receipt.payload.miner_hotkey,
-            validator_hotkey=receipt.payload.validator_hotkey,
-            time_started=receipt.payload.time_started,
-            time_took_us=receipt.payload.time_took_us,
-            score_str=receipt.payload.score_str,
-        )
-        for receipt in receipts
-        if isinstance(receipt.payload, JobFinishedReceiptPayload)
-        and (
-            job_finished_receipt_cutoff_time is None
-            or receipt.payload.time_started > job_finished_receipt_cutoff_time
-        )
-    ]
-    logger.debug(f"Creating {len(job_finished_receipt_to_create)} JobFinishedReceipt. {hotkey=}")
-    JobFinishedReceipt.objects.bulk_create(job_finished_receipt_to_create, ignore_conflicts=True)
+    backoff = config.DYNAMIC_WEIGHT_REVEALING_FAILURE_BACKOFF
+    if _weights_attempt_failed(
+        weights,
+        Weights.State.COMMITTED,
+        Weights.State.REVEALING,
+        operation=operation,
+        max_attempts=max_attempts,
+        backoff=backoff,
+    ):
+        _dispatch_reveal_weights(weights.id, countdown=backoff)
 
 
 @app.task
@@ -978,49 +1030,67 @@ def fetch_receipts():
     JobStartedReceipt.objects.filter(time_accepted__lt=now() - timedelta(days=7)).delete()
     JobFinishedReceipt.objects.filter(time_started__lt=now() - timedelta(days=7)).delete()
 
-    metagraph = bittensor.metagraph(
-        netuid=settings.BITTENSOR_NETUID, network=settings.BITTENSOR_NETWORK
+    metagraph = get_chain_view().metagraph(netuid=settings.BITTENSOR_NETUID)
+    miners = [
+        (neuron.hotkey, neuron.axon_info.ip, neuron.axon_info.port)
+        for neuron in metagraph.neurons
+        if neuron.axon_info.is_serving
+    ]
+
+    start_time, start_cpu_time = time.monotonic(), time.process_time()
+    results = fetch_and_store_receipts(miners)
+    wall_time = time.monotonic() - start_time
+    cpu_time = time.process_time() - start_cpu_time
+    VALIDATOR_RECEIPTS_FETCH_DURATION.labels("wall").observe(wall_time)
+    VALIDATOR_RECEIPTS_FETCH_DURATION.labels("cpu").observe(cpu_time)
+
+    for result in results:
+        if result.error is not None:
+            comment = (
+                f"Failed to fetch receipts from miner {result.hotkey} "
+                f"{result.ip}:{result.port}: {result.error!r}"
+            )
+            logger.warning(comment)
+            save_receipt_event(
+                subtype=SystemEvent.EventSubType.RECEIPT_FETCH_ERROR,
+                long_description=comment,
+                data={
+                    "miner_hotkey": result.hotkey,
+                    "miner_ip": result.ip,
+                    "miner_port": result.port,
+                },
+            )
+    stored_count = sum(result.stored_count for result in results)
+    VALIDATOR_RECEIPTS_STORED.inc(stored_count)
+    logger.info(
+        f"Stored {stored_count} receipts from {len(miners)} miners "
+        f"in {wall_time:.2f}s, {cpu_time:.2f}s of CPU time"
     )
-    miners = [neuron for neuron in metagraph.neurons if neuron.axon_info.is_serving]
-    for miner in miners:
-        fetch_receipts_from_miner.delay(miner.hotkey, miner.axon_info.ip, miner.axon_info.port)
 
 
 @shared_task
 def send_events_to_facilitator():
-    events = SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).filter(sent=False)
-    if events.count() == 0:
-        return
-
     if settings.STATS_COLLECTOR_URL == "":
         logger.warning("STATS_COLLECTOR_URL is not set, not sending system events")
         return
 
-    keypair = get_keypair()
-    hotkey = keypair.ss58_address
-    signing_timestamp = int(time.time())
-    to_sign = json.dumps(
-        {"signing_timestamp": signing_timestamp, "validator_ss58_address": hotkey},
-        sort_keys=True,
-    )
-    signature = f"0x{keypair.sign(to_sign).hex()}"
-
-    data = [event.to_dict() for event in events]
-    url = settings.STATS_COLLECTOR_URL + f"validator/{hotkey}/system_events"
-    response = requests.post(
-        url,
-        json=data,
-        headers={
-            "Validator-Signature": signature,
-            "Validator-Signing-Timestamp": str(signing_timestamp),
-        },
-    )
+    try:
+        # overlapping runs would post the same events twice
+        with session_advisory_lock(LockType.SYSTEM_EVENT_SHIPPING):
+            SystemEventShipper(get_keypair(), using=settings.DEFAULT_DB_ALIAS).ship()
+    except Locked:
+        logger.debug("Another thread already sending system events")
 
-    if response.status_code == 201:
-        logger.info(f"Sent {len(data)} system events to facilitator")
-        events.update(sent=True)
-    else:
-        logger.error(f"Failed to send system events to facilitator: {response}")
+
+@app.task
+def maintain_system_event_partitions() -> None:
+    """
+    Create the system event partitions for the upcoming days and drop the expired ones.
+    """
+    maintain_partitions(
+        days_ahead=settings.SYSTEM_EVENTS_PARTITIONS_AHEAD_DAYS,
+        retention_days=settings.SYSTEM_EVENTS_RETENTION_DAYS,
+    )
 
 
 @app.task
@@ -7,6 +7,7 @@ import bittensor
 import pytest
 from compute_horde.executor_class import EXECUTOR_CLASS, ExecutorClass
 
+from ..chain_view import get_redis
 from .helpers import MockNeuron, MockSyntheticMinerClient
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,14 @@ def wallet():
         logger.error(f"Failed to create wallet: {e}")
 
 
+@pytest.fixture(autouse=True)
+def clean_chain_view_snapshot():
+    # a metagraph snapshot fetched in one test would be read by the next ones
+    keys = get_redis().keys("chain_view:*:metagraph_snapshot")
+    if keys:
+        get_redis().delete(*keys)
+
+
 @pytest.fixture
 def override_weights_version_v2(settings):
     settings.DEBUG_OVERRIDE_WEIGHTS_VERSION = 2
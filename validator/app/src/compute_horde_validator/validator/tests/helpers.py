@@ -12,7 +12,7 @@ from unittest import mock
 
 import constance
 import numpy as np
-from bittensor import Balance
+from bittensor import AxonInfo, Balance
 from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
 from compute_horde.mv_protocol.miner_requests import (
     V0ExecutorReadyRequest,
@@ -303,7 +303,14 @@ class MockNeuron:
         self.hotkey = hotkey
         self.uid = uid
         self.stake = Balance((uid + 1) * 1001.0)
-        self.axon_info = MockedAxonInfo(True, f"127.0.0.{uid}", 4, 8000 + uid)
+        self.axon_info = AxonInfo(
+            version=4,
+            ip=f"127.0.0.{uid}",
+            port=8000 + uid,
+            ip_type=4,
+            hotkey=hotkey,
+            coldkey=hotkey,
+        )
 
 
 class MockBlock:
@@ -0,0 +1,94 @@
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from compute_horde_validator.validator.chain_view import ChainView, ChainViewPublisher, get_redis
+
+from .helpers import MockSubtensor
+
+
+@pytest.fixture(autouse=True)
+def clean_chain_view(settings):
+    settings.BITTENSOR_NETWORK = "test_chain_view"
+
+    def clean():
+        keys = get_redis().keys("chain_view:test_chain_view:*")
+        if keys:
+            get_redis().delete(*keys)
+
+    clean()
+    yield
+    clean()
+
+
+def _no_subtensor():
+    raise AssertionError("Read from the chain instead of the chain view")
+
+
+@pytest.mark.django_db
+def test_chain_view__reads_what_was_published():
+    subtensor = MockSubtensor(override_block_number=1000)
+    publisher = ChainViewPublisher(lambda: subtensor, metagraph_refresh_blocks=5)
+    publisher.subtensor = subtensor
+    subtensor.metagraph = MagicMock(wraps=subtensor.metagraph)
+
+    for block in range(1000, 1007):
+        publisher.on_block(block)
+    # at the first block and 5 blocks later
+    assert subtensor.metagraph.call_count == 2
+
+    chain_view = ChainView(_no_subtensor)
+    assert chain_view.get_current_block() == 1006
+    # with the default of 3 blocks to finalization
+    assert chain_view.get_block_hash(1003) == subtensor.block_hash
+    assert chain_view._get("block_hash:1004") is None
+    metagraph = chain_view.metagraph(netuid=12)
+    assert [(neuron.hotkey, neuron.uid) for neuron in metagraph.neurons] == [
+        (neuron.hotkey, neuron.uid) for neuron in subtensor.mocked_metagraph().neurons
+    ]
+    assert metagraph.block == 1000
+    assert metagraph.n == len(metagraph.neurons)
+    assert chain_view.metagraph_snapshot().hotkeys == tuple(
+        neuron.hotkey for neuron in metagraph.neurons
+    )
+    assert get_redis().keys("chain_view:test_chain_view:metagraph") == []
+
+
+def test_chain_view__falls_back_to_the_chain():
+    chain_view = ChainView(lambda: MockSubtensor(override_block_number=1234))
+    assert chain_view.get_current_block() == 1234
+    assert chain_view.get_block_hash(1000) == MockSubtensor().block_hash
+    assert chain_view.metagraph(netuid=12).neurons
+
+
+def test_chain_view__wait_for_block__woken_by_new_blocks():
+    subtensor = MockSubtensor()
+    publisher = ChainViewPublisher(lambda: subtensor)
+    publisher.publish_block(100)
+
+    def produce_blocks():
+        for block in range(101, 104):
+            time.sleep(0.05)
+            publisher.publish_block(block)
+
+    producer = threading.Thread(target=produce_blocks)
+    producer.start()
+    start = time.monotonic()
+    current_block = ChainView(_no_subtensor).wait_for_block(
+        103, timeout=timedelta(seconds=10), poll_interval=timedelta(seconds=10)
+    )
+    producer.join()
+
+    assert current_block == 103
+    assert time.monotonic() - start < 5
+
+
+def test_chain_view__wait_for_block__timeout():
+    ChainViewPublisher(lambda: MockSubtensor()).publish_block(100)
+    current_block = ChainView(_no_subtensor).wait_for_block(
+        101, timeout=timedelta(seconds=0.2), poll_interval=timedelta(seconds=10)
+    )
+    assert current_block == 100
@@ -121,3 +121,12 @@ def test_debug_run_organic_job_command__job_created_but_not_triggered():
     output = buf.getvalue()
     assert "done processing" in output
     assert SystemEvent.objects.count() == 0
+
+
+def test_benchmark_protocol_parsing_command(capsys):
+    management.call_command("benchmark_protocol_parsing", iterations=2)
+
+    output = capsys.readouterr().out
+    assert "mv_protocol.validator_requests.V0JobRequest" in output
+    assert "em_protocol.executor_requests.V0FinishedRequest" in output
+    assert "facilitator.V1FacilitatorJobRequest" in output
@@ -0,0 +1,134 @@
+import gzip
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from django.conf import settings
+from django.db import connections
+from pytest_mock import MockerFixture
+from requests import Response
+
+from compute_horde_validator.validator.event_shipper import SystemEventShipper
+from compute_horde_validator.validator.locks import LockType, session_advisory_lock
+from compute_horde_validator.validator.models import SystemEvent
+from compute_horde_validator.validator.tasks import send_events_to_facilitator
+
+
+def _create_events(count: int) -> list[SystemEvent]:
+    return SystemEvent.objects.bulk_create(
+        [
+            SystemEvent(
+                type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+                subtype=SystemEvent.EventSubType.CHECKPOINT,
+                long_description=f"event {i}",
+                data={"i": i},
+            )
+            for i in range(count)
+        ]
+    )
+
+
+def _response(status: int) -> Response:
+    response = Response()
+    response.status_code = status
+    return response
+
+
+@pytest.fixture
+def session(mocker: MockerFixture) -> MagicMock:
+    session = MagicMock()
+    session.post.return_value = _response(201)
+    mocker.patch(
+        "compute_horde_validator.validator.event_shipper._get_session", return_value=session
+    )
+    return session
+
+
+def _sent_descriptions(call, compressed: bool = False) -> list[str]:
+    body = call.kwargs["data"]
+    if compressed:
+        assert call.kwargs["headers"]["Content-Encoding"] == "gzip"
+        body = gzip.decompress(body)
+    return [event["data"]["description"] for event in json.loads(body)]
+
+
+@pytest.mark.django_db
+def test_event_shipper__chunks(session: MagicMock):
+    _create_events(5)
+
+    sent = SystemEventShipper(settings.BITTENSOR_WALLET().get_hotkey(), chunk_size=2).ship()
+
+    assert sent == 5
+    assert [_sent_descriptions(call) for call in session.post.call_args_list] == [
+        ["event 0", "event 1"],
+        ["event 2", "event 3"],
+        ["event 4"],
+    ]
+    assert not SystemEvent.objects.filter(sent=False).exists()
+
+
+@pytest.mark.django_db
+def test_event_shipper__resumes_after_failure(session: MagicMock):
+    _create_events(5)
+    session.post.side_effect = [_response(201), _response(503)]
+    keypair = settings.BITTENSOR_WALLET().get_hotkey()
+
+    assert SystemEventShipper(keypair, chunk_size=2).ship() == 2
+    # the acknowledged chunk stays sent, the failed one and the rest are left for the next run
+    assert list(
+        SystemEvent.objects.filter(sent=False).order_by("id").values_list("data__i", flat=True)
+    ) == [2, 3, 4]
+
+    session.post.reset_mock(side_effect=True)
+    session.post.return_value = _response(201)
+    assert SystemEventShipper(keypair, chunk_size=2, compression="gzip").ship() == 3
+    assert [_sent_descriptions(call, compressed=True) for call in session.post.call_args_list] == [
+        ["event 2", "event 3"],
+        ["event 4"],
+    ]
+    assert not SystemEvent.objects.filter(sent=False).exists()
+
+
+@pytest.mark.django_db
+def test_event_shipper__does_not_mark_events_created_meanwhile(session: MagicMock):
+    _create_events(2)
+
+    def post(*args, **kwargs):
+        # created while the request was in flight, after the chunk was read
+        SystemEvent.objects.create(
+            type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+            subtype=SystemEvent.EventSubType.CHECKPOINT,
+            data={},
+        )
+        session.post.side_effect = [_response(500)]
+        return _response(201)
+
+    session.post.side_effect = post
+
+    assert SystemEventShipper(settings.BITTENSOR_WALLET().get_hotkey(), chunk_size=10).ship() == 2
+    assert SystemEvent.objects.filter(sent=False).count() == 1
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_send_events_to_facilitator__skips_while_another_run_ships(session: MagicMock):
+    _create_events(2)
+
+    def other_run():
+        # a connection of its own, the advisory lock is reentrant within one
+        try:
+            send_events_to_facilitator()
+        finally:
+            connections.close_all()
+
+    with session_advisory_lock(LockType.SYSTEM_EVENT_SHIPPING):
+        thread = threading.Thread(target=other_run)
+        thread.start()
+        thread.join()
+
+    session.post.assert_not_called()
+    assert SystemEvent.objects.filter(sent=False).count() == 2
+
+    send_events_to_facilitator()
+    assert session.post.call_count == 1
+    assert not SystemEvent.objects.filter(sent=False).exists()
@@ -0,0 +1,62 @@
+import pytest
+from django.core.management import call_command
+
+from compute_horde_validator.validator.event_sink import SystemEventSink
+from compute_horde_validator.validator.models import SystemEvent
+
+
+def _events(count: int) -> list[SystemEvent]:
+    return [
+        SystemEvent(
+            type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+            subtype=SystemEvent.EventSubType.SYNTHETIC_JOB,
+            long_description="" if i % 2 else f'job "{i}",\nwith a comma and a newline',
+            data={"job_uuid": str(i), "score": i / 3, "nested": {"empty": "", "none": None}},
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.django_db
+def test_system_event_sink__round_trip():
+    events = _events(5)
+    events[0].sent = True
+
+    with SystemEventSink() as sink:
+        sink.extend(events)
+
+    assert sink.written_count == 5
+    stored = list(SystemEvent.objects.order_by("id"))
+    assert [
+        (event.type, event.subtype, event.long_description, event.data, event.sent)
+        for event in stored
+    ] == [
+        (event.type, event.subtype, event.long_description, event.data, event.sent)
+        for event in events
+    ]
+    assert all(event.timestamp is not None for event in stored)
+
+
+@pytest.mark.django_db
+def test_system_event_sink__flushes_by_size():
+    sink = SystemEventSink(flush_bytes=1000)
+    sink.extend(_events(20))
+
+    # some events are written as soon as the buffer is big enough, the rest on flush
+    assert 0 < sink.written_count < 20
+    assert SystemEvent.objects.count() == sink.written_count
+
+    sink.flush()
+    assert sink.written_count == 20
+    assert SystemEvent.objects.count() == 20
+
+
+@pytest.mark.django_db
+def test_benchmark_system_event_ingestion_command(capsys):
+    call_command("benchmark_system_event_ingestion", events=50)
+
+    output = capsys.readouterr().out
+    assert "bulk_create" in output
+    assert "COPY" in output
+    # the benchmark doesn't leave its events behind
+    assert SystemEvent.objects.count() == 0
@@ -145,8 +145,8 @@ async def test_facilitator_client(ws_server_cls):
             task = asyncio.create_task(facilitator_client.run_forever())
             await ws_server.condition.wait()
 
-        facilitator_client.miner_driver_awaiter_task.cancel()
         facilitator_client.heartbeat_task.cancel()
+        facilitator_client.evict_miner_connections_task.cancel()
         facilitator_client.specs_task.cancel()
         task.cancel()
         if ws_server.facilitator_error:
@@ -209,7 +209,7 @@ async def test_wait_for_specs(specs_msg: dict):
             task = asyncio.create_task(facilitator_client.run_forever())
             await asyncio.wait_for(ws_server.condition.wait(), timeout=5)
 
-        facilitator_client.miner_driver_awaiter_task.cancel()
         facilitator_client.heartbeat_task.cancel()
+        facilitator_client.evict_miner_connections_task.cancel()
         facilitator_client.specs_task.cancel()
         task.cancel()
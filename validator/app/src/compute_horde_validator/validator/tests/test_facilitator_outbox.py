@@ -0,0 +1,163 @@
+import asyncio
+import uuid
+
+import pytest
+import websockets
+
+from compute_horde_validator.validator.models import MachineSpecsDigest
+from compute_horde_validator.validator.organic_jobs.facilitator_api import (
+    Heartbeat,
+    MachineSpecsUpdate,
+)
+from compute_horde_validator.validator.organic_jobs.facilitator_client import FacilitatorClient
+from compute_horde_validator.validator.organic_jobs.miner_driver import JobStatusUpdate
+from compute_horde_validator.validator.organic_jobs.outbox import FacilitatorOutbox
+from compute_horde_validator.validator.synthetic_jobs.machine_specs import specs_digest
+
+from .helpers import get_keypair
+
+
+def status_update(status="accepted"):
+    return JobStatusUpdate(uuid=str(uuid.uuid4()), status=status)
+
+
+def specs_update(miner_hotkey, cores=1, gpu_uuid="GPU-1"):
+    return MachineSpecsUpdate(
+        miner_hotkey=miner_hotkey,
+        validator_hotkey="validator_hotkey",
+        specs={"gpu": {"count": 1, "details": [{"uuid": gpu_uuid}]}, "cpu": {"cores": cores}},
+        batch_id=str(uuid.uuid4()),
+    )
+
+
+@pytest.mark.asyncio
+async def test_outbox__priorities_and_coalescing():
+    outbox = FacilitatorOutbox(max_size=10)
+    specs_1, specs_2, specs_1_newer = (
+        specs_update("miner_1"),
+        specs_update("miner_2"),
+        specs_update("miner_1", cores=2),
+    )
+    statuses = [status_update(), status_update("completed")]
+
+    await outbox.put(Heartbeat())
+    await outbox.put(specs_1)
+    await outbox.put(statuses[0])
+    await outbox.put(specs_2)
+    await outbox.put(Heartbeat())
+    await outbox.put(specs_1_newer)
+    await outbox.put(statuses[1])
+    assert len(outbox) == 5
+
+    assert await outbox.take_batch(3) == [*statuses, specs_1_newer]
+    assert await outbox.take_batch(3) == [specs_2, Heartbeat()]
+    assert len(outbox) == 0
+
+    # another machine of the same miner
+    other_machine = specs_update("miner_1", gpu_uuid="GPU-2")
+    await outbox.put(specs_1)
+    await outbox.put(other_machine)
+    assert await outbox.take_batch(3) == [specs_1, other_machine]
+
+
+@pytest.mark.asyncio
+async def test_outbox__waits_for_room():
+    outbox = FacilitatorOutbox(max_size=2)
+    statuses = [status_update() for _ in range(3)]
+    specs = specs_update("miner_1")
+    await outbox.put(statuses[0])
+    await outbox.put(statuses[1])
+
+    put = asyncio.create_task(outbox.put(statuses[2]))
+    # coalesced messages don't wait
+    await asyncio.wait_for(outbox.put(specs), timeout=1)
+    await asyncio.sleep(0)
+    assert not put.done()
+
+    assert await outbox.take_batch(1) == [statuses[0]]
+    await asyncio.wait_for(put, timeout=1)
+    assert await outbox.take_batch(5) == [statuses[1], statuses[2], specs]
+
+
+@pytest.mark.asyncio
+async def test_outbox__requeue():
+    outbox = FacilitatorOutbox(max_size=10)
+    status, specs_1, specs_2 = status_update(), specs_update("miner_1"), specs_update("miner_2")
+    for msg in [status, specs_1, specs_2, Heartbeat()]:
+        await outbox.put(msg)
+    batch = await outbox.take_batch(10)
+
+    newer_status, specs_2_newer = status_update(), specs_update("miner_2", cores=2)
+    await outbox.put(newer_status)
+    await outbox.put(specs_2_newer)
+    outbox.requeue(batch)
+
+    # not sent ones go first, unless superseded
+    assert await outbox.take_batch(10) == [
+        status,
+        newer_status,
+        specs_1,
+        specs_2_newer,
+        Heartbeat(),
+    ]
+
+
+class FailingWs:
+    def __init__(self, fail_after: int):
+        self.fail_after = fail_after
+        self.sent = []
+
+    async def send(self, data):
+        if len(self.sent) >= self.fail_after:
+            raise websockets.ConnectionClosed(rcvd=None, sent=None)
+        self.sent.append(data)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+async def test_send_messages__unsent_kept_for_next_connection(settings):
+    settings.FACILITATOR_SEND_BATCH_SIZE = 10
+    client = FacilitatorClient(get_keypair(), "ws://127.0.0.1:0/")
+    try:
+        statuses = [status_update() for _ in range(3)]
+        for msg in statuses:
+            await client.send_model(msg)
+
+        ws = FailingWs(fail_after=1)
+        with pytest.raises(websockets.ConnectionClosed):
+            await asyncio.wait_for(client.send_messages(ws), timeout=1)
+        assert ws.sent == [statuses[0].model_dump_json()]
+
+        ws = FailingWs(fail_after=10)
+        sender = asyncio.create_task(client.send_messages(ws))
+        await asyncio.sleep(0.1)
+        sender.cancel()
+        assert ws.sent == [msg.model_dump_json() for msg in statuses[1:]]
+        assert len(client.outbox) == 0
+    finally:
+        client.heartbeat_task.cancel()
+        client.refresh_metagraph_task.cancel()
+        client.evict_miner_connections_task.cancel()
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+async def test_send_messages__records_only_sent_specs(settings):
+    settings.FACILITATOR_SEND_BATCH_SIZE = 10
+    client = FacilitatorClient(get_keypair(), "ws://127.0.0.1:0/")
+    try:
+        sent_specs = specs_update("miner_1")
+        await client.send_model(sent_specs)
+        await client.send_model(specs_update("miner_2"))
+
+        ws = FailingWs(fail_after=1)
+        with pytest.raises(websockets.ConnectionClosed):
+            await asyncio.wait_for(client.send_messages(ws), timeout=1)
+        assert ws.sent == [sent_specs.model_dump_json()]
+        assert [
+            (row.miner_hotkey, row.digest) async for row in MachineSpecsDigest.objects.all()
+        ] == [("miner_1", specs_digest(sent_specs.specs))]
+    finally:
+        client.heartbeat_task.cancel()
+        client.refresh_metagraph_task.cancel()
+        client.evict_miner_connections_task.cancel()
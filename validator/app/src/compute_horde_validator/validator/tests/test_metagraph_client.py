@@ -0,0 +1,81 @@
+import bittensor
+import numpy as np
+import pytest
+
+from compute_horde_validator.validator.chain_view import _key, get_redis
+from compute_horde_validator.validator.metagraph_client import (
+    AsyncMetagraphClient,
+    get_miner_axon_info,
+)
+from compute_horde_validator.validator.metagraph_snapshot import MetagraphSnapshot
+
+from .helpers import MockMetagraph, MockSubtensor
+
+
+@pytest.fixture(autouse=True)
+def clean_chain_view(settings):
+    settings.BITTENSOR_NETWORK = "test_metagraph_client"
+
+    def clean():
+        keys = get_redis().keys("chain_view:test_metagraph_client:*")
+        if keys:
+            get_redis().delete(*keys)
+
+    clean()
+    yield
+    clean()
+
+
+def test_metagraph_snapshot():
+    snapshot = MetagraphSnapshot.from_metagraph(MockMetagraph())
+
+    assert snapshot.block == 1000
+    assert snapshot.uid_by_hotkey["hotkey_2"] == 2
+    assert snapshot.axon_by_hotkey["hotkey_2"].ip == "127.0.0.2"
+    assert snapshot.stakes.tolist() == [1001.0 * (uid + 1) for uid in range(len(snapshot.hotkeys))]
+    assert snapshot.serving.all()
+    with pytest.raises(ValueError):
+        snapshot.stakes[0] = 0
+    with pytest.raises(TypeError):
+        snapshot.uid_by_hotkey["hotkey_2"] = 3
+
+    restored = MetagraphSnapshot.from_bytes(snapshot.to_bytes())
+    assert restored.hotkeys == snapshot.hotkeys
+    assert restored.uid_by_hotkey == snapshot.uid_by_hotkey
+    assert np.array_equal(restored.stakes, snapshot.stakes)
+    assert np.array_equal(restored.serving, snapshot.serving)
+    assert restored.axon_by_hotkey["hotkey_3"] == snapshot.axon_by_hotkey["hotkey_3"]
+
+
+@pytest.mark.asyncio
+async def test_metagraph_client__shares_fetched_snapshot(monkeypatch):
+    monkeypatch.setattr("bittensor.subtensor", lambda *args, **kwargs: MockSubtensor())
+    snapshot = await AsyncMetagraphClient().get_snapshot()
+    assert snapshot.uid_by_hotkey["hotkey_1"] == 1
+
+    # another process reads the shared one, without connecting to the chain
+    def no_subtensor(*args, **kwargs):
+        raise AssertionError("Fetched the metagraph again")
+
+    monkeypatch.setattr("bittensor.subtensor", no_subtensor)
+    shared = await AsyncMetagraphClient().get_snapshot()
+    assert shared.hotkeys == snapshot.hotkeys
+
+
+@pytest.mark.asyncio
+async def test_get_miner_axon_info(monkeypatch):
+    axon = bittensor.AxonInfo(
+        version=4, ip="10.0.0.1", port=8000, ip_type=4, hotkey="miner", coldkey="cold"
+    )
+    snapshot = MetagraphSnapshot.create(
+        block=1, hotkeys=["miner"], uids=[7], stakes=[1.0], axons=[axon]
+    )
+    get_redis().set(_key("metagraph_snapshot"), snapshot.to_bytes())
+    monkeypatch.setattr(
+        "compute_horde_validator.validator.metagraph_client.async_metagraph_client",
+        AsyncMetagraphClient(),
+    )
+
+    assert await get_miner_axon_info("miner") == axon
+    with pytest.raises(ValueError):
+        await get_miner_axon_info("unknown")
@@ -0,0 +1,138 @@
+import asyncio
+import uuid
+
+import pytest
+
+from compute_horde_validator.validator.organic_jobs.dispatcher import OrganicJobDispatcher
+
+from .helpers import get_dummy_job_request_v0
+
+
+def job_request(miner_hotkey: str):
+    request = get_dummy_job_request_v0(str(uuid.uuid4()))
+    request.miner_hotkey = miner_hotkey
+    return request
+
+
+async def settle():
+    """let the started and finished tasks run their steps"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class JobRunner:
+    def __init__(self):
+        self.started = []
+        self.rejected = []
+        self.finish_events: dict[str, asyncio.Event] = {}
+
+    async def run_job(self, request):
+        self.started.append(request.uuid)
+        event = self.finish_events.setdefault(request.uuid, asyncio.Event())
+        await event.wait()
+        if request.miner_hotkey == "failing":
+            raise RuntimeError("miner driver failed")
+
+    async def reject_job(self, request, comment):
+        self.rejected.append(request.uuid)
+
+    def finish(self, request):
+        self.finish_events.setdefault(request.uuid, asyncio.Event()).set()
+
+
+@pytest.fixture
+def runner():
+    return JobRunner()
+
+
+@pytest.fixture
+def dispatcher(runner):
+    return OrganicJobDispatcher(
+        run_job=runner.run_job,
+        reject_job=runner.reject_job,
+        max_in_flight=3,
+        max_per_miner=2,
+        max_queued=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatcher__limits(dispatcher, runner):
+    requests = [
+        job_request("miner_1"),
+        job_request("miner_1"),
+        # over the miner's limit
+        job_request("miner_1"),
+        job_request("miner_2"),
+        # over the global limit
+        job_request("miner_2"),
+        # over the queue size
+        job_request("miner_3"),
+    ]
+    results = [await dispatcher.submit(request) for request in requests]
+    await settle()
+
+    assert results == [True, True, True, True, True, False]
+    assert runner.started == [requests[i].uuid for i in [0, 1, 3]]
+    assert runner.rejected == [requests[5].uuid]
+    assert len(dispatcher.queue) == 2
+
+    # a job of another miner finishing frees a slot for the first runnable queued job
+    runner.finish(requests[3])
+    await settle()
+    assert runner.started[3:] == [requests[4].uuid]
+
+    for request in requests:
+        runner.finish(request)
+    await asyncio.wait_for(dispatcher.join(), timeout=1)
+    assert runner.started[4:] == [requests[2].uuid]
+    assert dispatcher.in_flight == {}
+    assert not dispatcher.in_flight_per_miner
+
+
+@pytest.mark.asyncio
+async def test_dispatcher__jobs_finish_in_any_order(dispatcher, runner):
+    failing, slow, fast = job_request("failing"), job_request("miner_1"), job_request("miner_2")
+    for request in [failing, slow, fast]:
+        await dispatcher.submit(request)
+    await settle()
+
+    runner.finish(fast)
+    runner.finish(failing)
+    await settle()
+    assert list(dispatcher.in_flight.values()) == ["miner_1"]
+
+    runner.finish(slow)
+    await asyncio.wait_for(dispatcher.join(), timeout=1)
+    assert dispatcher.in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_dispatcher__full_queue_doesnt_block_idle_miners(dispatcher, runner):
+    busy = [job_request("miner_1") for _ in range(4)]
+    idle = job_request("miner_2")
+    for request in busy:
+        assert await dispatcher.submit(request)
+    assert len(dispatcher.queue) == 2
+
+    assert await dispatcher.submit(idle)
+    await settle()
+    assert runner.started == [busy[0].uuid, busy[1].uuid, idle.uuid]
+    assert runner.rejected == []
+
+
+@pytest.mark.asyncio
+async def test_dispatcher__without_queue(runner):
+    dispatcher = OrganicJobDispatcher(
+        run_job=runner.run_job,
+        reject_job=runner.reject_job,
+        max_in_flight=3,
+        max_per_miner=1,
+        max_queued=0,
+    )
+    first, second = job_request("miner_1"), job_request("miner_1")
+    assert await dispatcher.submit(first)
+    assert not await dispatcher.submit(second)
+    await settle()
+    assert runner.started == [first.uuid]
+    assert runner.rejected == [second.uuid]
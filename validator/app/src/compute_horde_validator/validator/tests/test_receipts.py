@@ -1,13 +1,18 @@
+import csv
+import io
 import uuid
-from typing import NamedTuple
+from datetime import timedelta
 
+import bittensor
+import httpx
 import pytest
+from compute_horde import signatures
 from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
 from compute_horde.mv_protocol.validator_requests import (
     JobFinishedReceiptPayload,
     JobStartedReceiptPayload,
 )
-from compute_horde.receipts import Receipt
+from compute_horde.receipts import Receipt, ReceiptType
 from django.utils.timezone import now
 
 from compute_horde_validator.validator.models import (
@@ -17,81 +22,243 @@ from compute_horde_validator.validator.models import (
 )
 from compute_horde_validator.validator.tasks import fetch_receipts
 
-from .helpers import MockedAxonInfo, check_system_events, throw_error
+from .helpers import MockMetagraph, MockNeuron, MockSubtensor, check_system_events
 
-
-class MockedNeuron(NamedTuple):
-    hotkey: str
-    axon_info: MockedAxonInfo
+VALIDATOR_KEYPAIR = bittensor.Keypair.create_from_mnemonic(
+    "slot excuse valid grief praise rifle spoil auction weasel glove pen share"
+)
+MINER_KEYPAIRS = [
+    bittensor.Keypair.create_from_mnemonic(
+        "almost fatigue race slim picnic mass better clog deal solve already champion"
+    ),
+    bittensor.Keypair.create_from_mnemonic(
+        "edit evoke caught tunnel harsh plug august group enact cable govern immense"
+    ),
+]
 
 
-class MockedMetagraph:
+class MockedMetagraph(MockMetagraph):
     def __init__(self, *args, **kwargs):
-        self.neurons = [
-            MockedNeuron(
-                hotkey="5G9qWBzLPVVu2fCPPvg3QgPPK5JaJmJKaJha95TPHH9NZWuL",
-                axon_info=MockedAxonInfo(is_serving=True, ip="127.0.0.1", ip_type=4, port=8000),
-            ),
-            MockedNeuron(
-                hotkey="5CPhGRp4cdEG4KSui7VQixHhvN5eBUSnMYeUF5thdxm4sKtz",
-                axon_info=MockedAxonInfo(is_serving=True, ip="127.0.0.2", ip_type=4, port=8000),
-            ),
-        ]
-
-
-def mocked_get_miner_receipts(hotkey: str, ip: str, port: int) -> list[Receipt]:
-    if hotkey == "5G9qWBzLPVVu2fCPPvg3QgPPK5JaJmJKaJha95TPHH9NZWuL":
-        return [
-            Receipt(
-                payload=JobStartedReceiptPayload(
-                    job_uuid=str(uuid.uuid4()),
-                    miner_hotkey="5G9qWBzLPVVu2fCPPvg3QgPPK5JaJmJKaJha95TPHH9NZWuL",
-                    validator_hotkey="v1",
-                    executor_class=DEFAULT_EXECUTOR_CLASS,
-                    time_accepted=now(),
-                    max_timeout=30,
-                ),
-                validator_signature="0xv1",
-                miner_signature="0xm1",
-            )
-        ]
-    elif hotkey == "5CPhGRp4cdEG4KSui7VQixHhvN5eBUSnMYeUF5thdxm4sKtz":
-        return [
-            Receipt(
-                payload=JobFinishedReceiptPayload(
-                    job_uuid=str(uuid.uuid4()),
-                    miner_hotkey="5CPhGRp4cdEG4KSui7VQixHhvN5eBUSnMYeUF5thdxm4sKtz",
-                    validator_hotkey="v1",
-                    time_started=now(),
-                    time_took_us=30_000_000,
-                    score_str="123.45",
-                ),
-                validator_signature="0xv1",
-                miner_signature="0xm1",
+        super().__init__(
+            neurons=[
+                MockNeuron(keypair.ss58_address, i + 1) for i, keypair in enumerate(MINER_KEYPAIRS)
+            ],
+            num_neurons=None,
+        )
+
+
+@pytest.fixture(autouse=True)
+def mocked_subtensor(monkeypatch):
+    monkeypatch.setattr(
+        "bittensor.subtensor",
+        lambda *args, **kwargs: MockSubtensor(mocked_metagraph=MockedMetagraph),
+    )
+
+
+def _receipt(payload, miner_keypair) -> Receipt:
+    return Receipt(
+        payload=payload,
+        validator_signature=f"0x{VALIDATOR_KEYPAIR.sign(payload.blob_for_signing()).hex()}",
+        miner_signature=f"0x{miner_keypair.sign(payload.blob_for_signing()).hex()}",
+    )
+
+
+def job_started_receipt(miner_keypair, time_accepted=None) -> Receipt:
+    return _receipt(
+        JobStartedReceiptPayload(
+            job_uuid=str(uuid.uuid4()),
+            miner_hotkey=miner_keypair.ss58_address,
+            validator_hotkey=VALIDATOR_KEYPAIR.ss58_address,
+            executor_class=DEFAULT_EXECUTOR_CLASS,
+            time_accepted=time_accepted or now(),
+            max_timeout=30,
+        ),
+        miner_keypair,
+    )
+
+
+def job_finished_receipt(miner_keypair, job_uuid=None) -> Receipt:
+    return _receipt(
+        JobFinishedReceiptPayload(
+            job_uuid=job_uuid or str(uuid.uuid4()),
+            miner_hotkey=miner_keypair.ss58_address,
+            validator_hotkey=VALIDATOR_KEYPAIR.ss58_address,
+            time_started=now(),
+            time_took_us=30_000_000,
+            score_str="123.45",
+        ),
+        miner_keypair,
+    )
+
+
+def receipts_csv(receipts: list[Receipt]) -> bytes:
+    payload_fields = set()
+    for payload_cls in [JobStartedReceiptPayload, JobFinishedReceiptPayload]:
+        payload_fields |= set(payload_cls.model_fields.keys())
+
+    buf = io.StringIO()
+    csv_writer = csv.DictWriter(
+        buf, ["type", "validator_signature", "miner_signature", *payload_fields]
+    )
+    csv_writer.writeheader()
+    for receipt in receipts:
+        receipt_type = (
+            ReceiptType.JobStartedReceipt
+            if isinstance(receipt.payload, JobStartedReceiptPayload)
+            else ReceiptType.JobFinishedReceipt
+        )
+        csv_writer.writerow(
+            dict(
+                type=receipt_type.value,
+                validator_signature=receipt.validator_signature,
+                miner_signature=receipt.miner_signature,
             )
-        ]
-    else:
-        return []
+            | receipt.payload.model_dump()
+        )
+    return buf.getvalue().encode()
+
+
+def receipts_url(miner_index: int) -> str:
+    # the ports of `MockNeuron` axons follow the uids
+    return f"http://127.0.0.{miner_index + 1}:{8001 + miner_index}/receipts/receipts.csv"
 
 
 @pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
-def test_fetch_receipts__success(monkeypatch):
-    monkeypatch.setattr("bittensor.metagraph", MockedMetagraph)
-    monkeypatch.setattr(
-        "compute_horde_validator.validator.tasks.get_miner_receipts", mocked_get_miner_receipts
+def test_fetch_receipts__success(httpx_mock):
+    started = job_started_receipt(MINER_KEYPAIRS[0])
+    finished = job_finished_receipt(MINER_KEYPAIRS[1])
+    httpx_mock.add_response(url=receipts_url(0), content=receipts_csv([started]))
+    httpx_mock.add_response(url=receipts_url(1), content=receipts_csv([finished]))
+
+    fetch_receipts()
+
+    assert list(JobStartedReceipt.objects.values_list("job_uuid", flat=True)) == [
+        uuid.UUID(started.payload.job_uuid)
+    ]
+    job_finished = JobFinishedReceipt.objects.get()
+    assert str(job_finished.job_uuid) == finished.payload.job_uuid
+    assert job_finished.time_took_us == 30_000_000
+    assert job_finished.score_str == "123.45"
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_fetch_receipts__skips_stored_and_old_receipts(httpx_mock, mocker):
+    miner_keypair = MINER_KEYPAIRS[0]
+    stored = job_started_receipt(miner_keypair, time_accepted=now() - timedelta(minutes=10))
+    JobStartedReceipt.objects.create(
+        job_uuid=stored.payload.job_uuid,
+        miner_hotkey=stored.payload.miner_hotkey,
+        validator_hotkey=stored.payload.validator_hotkey,
+        time_accepted=stored.payload.time_accepted,
+        max_timeout=stored.payload.max_timeout,
     )
+    # older than the cutoff, not verified, so its signature doesn't matter
+    old = job_started_receipt(miner_keypair, time_accepted=now() - timedelta(hours=2))
+    old.miner_signature = "0xbad"
+    new = job_started_receipt(miner_keypair)
+    httpx_mock.add_response(url=receipts_url(0), content=receipts_csv([stored, old, new]))
+    httpx_mock.add_response(url=receipts_url(1), content=receipts_csv([]))
+    verify_signature = mocker.spy(signatures, "verify_signature")
+
+    fetch_receipts()
+
+    # the miner and validator signatures of the new receipt only
+    assert verify_signature.call_count == 2
+    assert set(JobStartedReceipt.objects.values_list("job_uuid", flat=True)) == {
+        uuid.UUID(stored.payload.job_uuid),
+        uuid.UUID(new.payload.job_uuid),
+    }
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_fetch_receipts__finished_receipt_of_stored_started_job(httpx_mock):
+    miner_keypair = MINER_KEYPAIRS[0]
+    started = job_started_receipt(miner_keypair)
+    httpx_mock.add_response(url=receipts_url(0), content=receipts_csv([started]))
+    httpx_mock.add_response(url=receipts_url(1), content=receipts_csv([]))
     fetch_receipts()
     assert JobStartedReceipt.objects.count() == 1
-    assert JobFinishedReceipt.objects.count() == 1
+
+    # the job finished before the next fetch
+    finished = job_finished_receipt(miner_keypair, job_uuid=started.payload.job_uuid)
+    httpx_mock.add_response(url=receipts_url(0), content=receipts_csv([started, finished]))
+    httpx_mock.add_response(url=receipts_url(1), content=receipts_csv([]))
+    fetch_receipts()
+
+    assert JobStartedReceipt.objects.count() == 1
+    assert str(JobFinishedReceipt.objects.get().job_uuid) == started.payload.job_uuid
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_fetch_receipts__invalid_receipts_skipped(httpx_mock):
+    other_miners_receipt = job_started_receipt(MINER_KEYPAIRS[1])
+    invalid_signature = job_started_receipt(MINER_KEYPAIRS[0])
+    invalid_signature.validator_signature = "0xbad"
+    valid = job_finished_receipt(MINER_KEYPAIRS[0])
+    httpx_mock.add_response(
+        url=receipts_url(0),
+        content=receipts_csv([other_miners_receipt, invalid_signature, valid])
+        + b"JobStartedReceipt,garbage\n",
+    )
+    httpx_mock.add_response(url=receipts_url(1), status_code=404)
+
+    fetch_receipts()
+
+    assert JobStartedReceipt.objects.count() == 0
+    assert str(JobFinishedReceipt.objects.get().job_uuid) == valid.payload.job_uuid
+    check_system_events(
+        SystemEvent.EventType.RECEIPT_FAILURE, SystemEvent.EventSubType.RECEIPT_FETCH_ERROR, 1
+    )
 
 
 @pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
-def test_fetch_receipts__fail(monkeypatch):
-    monkeypatch.setattr("bittensor.metagraph", MockedMetagraph)
-    monkeypatch.setattr("compute_horde_validator.validator.tasks.get_miner_receipts", throw_error)
+def test_fetch_receipts__fail(httpx_mock):
+    httpx_mock.add_exception(httpx.ConnectError("refused"), url=receipts_url(0))
+    httpx_mock.add_exception(httpx.ReadTimeout("timed out"), url=receipts_url(1))
+
     fetch_receipts()
+
     assert JobStartedReceipt.objects.count() == 0
     assert JobFinishedReceipt.objects.count() == 0
     check_system_events(
         SystemEvent.EventType.RECEIPT_FAILURE, SystemEvent.EventSubType.RECEIPT_FETCH_ERROR, 2
     )
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_fetch_receipts__only_new_segments(httpx_mock):
+    miner_keypair = MINER_KEYPAIRS[0]
+    stored_started = job_started_receipt(miner_keypair, time_accepted=now() - timedelta(hours=3))
+    JobStartedReceipt.objects.create(
+        job_uuid=stored_started.payload.job_uuid,
+        miner_hotkey=stored_started.payload.miner_hotkey,
+        validator_hotkey=stored_started.payload.validator_hotkey,
+        time_accepted=stored_started.payload.time_accepted,
+        max_timeout=stored_started.payload.max_timeout,
+    )
+    stored_finished = job_finished_receipt(miner_keypair)
+    JobFinishedReceipt.objects.create(
+        job_uuid=stored_finished.payload.job_uuid,
+        miner_hotkey=stored_finished.payload.miner_hotkey,
+        validator_hotkey=stored_finished.payload.validator_hotkey,
+        time_started=stored_finished.payload.time_started - timedelta(hours=2),
+        time_took_us=stored_finished.payload.time_took_us,
+        score_str=stored_finished.payload.score_str,
+    )
+    new = job_started_receipt(miner_keypair)
+    base_url = receipts_url(0).removesuffix("receipts.csv")
+    httpx_mock.add_response(
+        url=f"{base_url}index.json",
+        json={
+            "segments": [
+                {"name": "old.csv", "created_at": (now() - timedelta(hours=5)).isoformat()},
+                {"name": "new.csv", "created_at": now().isoformat()},
+            ]
+        },
+    )
+    httpx_mock.add_response(url=f"{base_url}segments/new.csv", content=receipts_csv([new]))
+    httpx_mock.add_response(url=receipts_url(1), content=receipts_csv([]))
+
+    fetch_receipts()
+
+    assert JobStartedReceipt.objects.filter(job_uuid=new.payload.job_uuid).exists()
@@ -1,11 +1,32 @@
+import json
+import random
+from collections import defaultdict
 from datetime import timedelta
 from unittest.mock import patch
 
+import numpy as np
 import pytest
+from django.core.management import call_command
 from django.utils import timezone
 
-from compute_horde_validator.validator.models import Miner, SyntheticJob, SyntheticJobBatch
-from compute_horde_validator.validator.scoring import ExecutorClass, score_batches
+from compute_horde_validator.validator.management.commands.simulate_scoring import (
+    rank_correlation,
+)
+from compute_horde_validator.validator.models import (
+    Miner,
+    MinerBatchScore,
+    MinerManifest,
+    SyntheticJob,
+    SyntheticJobBatch,
+)
+from compute_horde_validator.validator.scoring import (
+    ExecutorClass,
+    rebuild_batch_scores,
+    score_batch,
+    score_batches,
+)
+
+from .helpers import NUM_NEURONS, MockMetagraph
 
 
 @pytest.fixture
@@ -69,6 +90,7 @@ def setup_data():
             **common_params,
         )
 
+    rebuild_batch_scores([batch.id])
     return batch
 
 
@@ -162,8 +184,171 @@ def test_score_batches_executor_classes_weights(mocked_executor_class_weights):
     SyntheticJob.objects.create(
         miner=miner2, executor_class=ExecutorClass.always_on__gpu_24gb, score=120, **common_params
     )
+    rebuild_batch_scores([batch.id])
 
     scores = score_batches([batch])
     total = scores["hotkey1"] + scores["hotkey2"]
     assert 0.8 - 0.01 < scores["hotkey1"] / total < 0.8 + 0.01
     assert 0.2 - 0.01 < scores["hotkey2"] / total < 0.2 + 0.01
+
+
+def _reference_scores(batches):
+    scores = defaultdict(float)
+    for batch in batches:
+        for hotkey, score in score_batch(batch).items():
+            scores[hotkey] += score
+    return scores
+
+
+def _create_random_batch(rng: random.Random, miners: list[Miner], zero_scores: bool = False):
+    batch = SyntheticJobBatch.objects.create(
+        accepting_results_until=timezone.now() + timedelta(hours=1)
+    )
+    SyntheticJob.objects.bulk_create(
+        [
+            SyntheticJob(
+                batch=batch,
+                miner=miner,
+                miner_address="127.0.0.1",
+                miner_address_ip_version=4,
+                miner_port=8080,
+                status=SyntheticJob.Status.COMPLETED,
+                executor_class=rng.choice(list(ExecutorClass)),
+                score=0 if zero_scores else rng.choice([0, rng.uniform(0, 20)]),
+            )
+            for miner in rng.sample(miners, rng.randint(1, len(miners)))
+            for _ in range(rng.randint(1, 12))
+        ]
+    )
+    rebuild_batch_scores([batch.id])
+    return batch
+
+
+@pytest.mark.parametrize(
+    ("avg_param", "size_param", "central_size_param"),
+    [(0, 0, 1), (2, 0, 1), (0, 1.75, 20), (0.5, 1.25, 4.5)],
+)
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_score_batches__parity_with_reference(
+    settings, mocked_executor_class_weights, avg_param, size_param, central_size_param
+):
+    settings.HORDE_SCORE_AVG_PARAM = avg_param
+    settings.HORDE_SCORE_SIZE_PARAM = size_param
+    settings.HORDE_SCORE_CENTRAL_SIZE_PARAM = central_size_param
+    rng = random.Random(f"{avg_param}-{size_param}-{central_size_param}")
+    miners = [Miner.objects.create(hotkey=f"hotkey{i}") for i in range(20)]
+    batches = [_create_random_batch(rng, miners) for _ in range(3)]
+    batches.append(_create_random_batch(rng, miners, zero_scores=True))
+
+    scores = score_batches(batches)
+    reference = _reference_scores(batches)
+
+    assert scores.keys() == reference.keys()
+    for hotkey, score in reference.items():
+        assert scores[hotkey] == pytest.approx(score, rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_score_batches__parity_with_reference__setup_data(setup_data):
+    assert score_batches([setup_data]) == pytest.approx(_reference_scores([setup_data]))
+    assert score_batches([]) == {}
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_benchmark_scoring_command(capsys):
+    call_command("benchmark_scoring", jobs=200, miners=10)
+
+    output = capsys.readouterr().out
+    assert "job by job" in output
+    assert "from miner batch scores" in output
+    # the benchmark doesn't leave its batch behind
+    assert not SyntheticJob.objects.exists()
+    assert not Miner.objects.exists()
+
+
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_rebuild_miner_batch_scores_command(setup_data, capsys):
+    batch = setup_data
+    miner_score = MinerBatchScore.objects.get(
+        batch=batch, miner__hotkey="hotkey2", executor_class=ExecutorClass.spin_up_4min__gpu_24gb
+    )
+    assert (miner_score.score_sum, miner_score.job_count) == (60, 5)
+    expected_scores = score_batches([batch])
+
+    miner_score.score_sum = 0
+    miner_score.save()
+    MinerBatchScore.objects.filter(miner__hotkey="hotkey4").delete()
+
+    call_command("rebuild_miner_batch_scores", batch_id=[batch.id], check=True)
+    output = capsys.readouterr().out
+    assert f"batch {batch.id}, miner {miner_score.miner_id}" in output
+    assert "expected 60.0 / 5 jobs" in output
+    assert "1 batches checked, 2 differences" in output
+
+    # the batches of the last day by default
+    SyntheticJobBatch.objects.filter(id=batch.id).update(started_at=timezone.now())
+    call_command("rebuild_miner_batch_scores")
+    assert "1 batches rebuilt, 5 miner batch scores" in capsys.readouterr().out
+    call_command("rebuild_miner_batch_scores", check=True)
+    assert "1 batches checked, 0 differences" in capsys.readouterr().out
+    assert score_batches([batch]) == pytest.approx(expected_scores)
+
+
+def test_rank_correlation():
+    assert rank_correlation(np.array([1, 2, 3]), np.array([10, 20, 30])) == pytest.approx(1)
+    assert rank_correlation(np.array([1, 2, 3]), np.array([3, 2, 1])) == pytest.approx(-1)
+    # ties share the average rank
+    assert rank_correlation(np.array([0, 0, 1]), np.array([0, 1, 2])) == pytest.approx(0.8660254)
+    assert np.isnan(rank_correlation(np.array([1, 1]), np.array([1, 2])))
+
+
+@pytest.mark.override_config(DYNAMIC_WEIGHTS_VERSION=2, DYNAMIC_MANIFEST_SCORE_MULTIPLIER=1.05)
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+def test_simulate_scoring_command(mocker, capsys, tmp_path):
+    mocker.patch("bittensor.metagraph", return_value=MockMetagraph())
+    miners = [Miner.objects.create(hotkey=f"hotkey_{i}") for i in range(3)]
+    previous_batch = SyntheticJobBatch.objects.create(accepting_results_until=timezone.now())
+    batch = SyntheticJobBatch.objects.create(accepting_results_until=timezone.now())
+    for miner, previous_online, online in [(miners[0], 2, 2), (miners[1], 2, 4)]:
+        MinerManifest.objects.create(
+            miner=miner, batch=previous_batch, online_executor_count=previous_online
+        )
+        MinerManifest.objects.create(miner=miner, batch=batch, online_executor_count=online)
+    # joined in this batch
+    MinerManifest.objects.create(miner=miners[2], batch=batch, online_executor_count=1)
+    # the scores of the dancing miners include the current manifest multiplier
+    for miner, scores in [(miners[0], [1, 1]), (miners[1], [1.05, 1.05]), (miners[2], [1.05])]:
+        for score in scores:
+            SyntheticJob.objects.create(
+                batch=batch,
+                miner=miner,
+                miner_address="127.0.0.1",
+                miner_address_ip_version=4,
+                miner_port=8080,
+                executor_class=ExecutorClass.spin_up_4min__gpu_24gb,
+                status=SyntheticJob.Status.COMPLETED,
+                score=score,
+            )
+
+    json_path = tmp_path / "simulation.json"
+    call_command(
+        "simulate_scoring",
+        batches=1,
+        manifest_multiplier=[1, 1.05, 2],
+        processes=2,
+        json=str(json_path),
+    )
+
+    output = capsys.readouterr().out
+    assert "Loaded 3 hordes of 3 miners from 1 batches" in output
+    assert "multiplier=1.05  rank correlation 1.0000" in output
+    simulation = json.loads(json_path.read_text())
+    assert simulation["batch_ids"] == [batch.id]
+    assert simulation["current"]["weights"] == pytest.approx(simulation["results"][1]["weights"])
+    without_multiplier, _, doubled = (result["weights"] for result in simulation["results"])
+    assert len(without_multiplier) == NUM_NEURONS
+    assert sum(without_multiplier) == pytest.approx(1)
+    assert without_multiplier[0] == pytest.approx(without_multiplier[1])
+    assert doubled[1] == pytest.approx(2 * doubled[0])
+    assert doubled[2] > without_multiplier[2]
+    assert without_multiplier[3:] == [0, 0]
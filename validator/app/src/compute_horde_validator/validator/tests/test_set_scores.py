@@ -1,5 +1,7 @@
 import asyncio
+import time
 import uuid
+from datetime import timedelta
 from unittest.mock import patch
 
 import pytest
@@ -18,8 +20,10 @@ from compute_horde_validator.validator.models import (
     SystemEvent,
     Weights,
 )
+from compute_horde_validator.validator.scoring import rebuild_batch_scores
 from compute_horde_validator.validator.tasks import (
     _normalize_weights_for_committing,
+    commit_weights,
     reveal_scores,
     set_scores,
 )
@@ -57,6 +61,7 @@ def setup_db(cycle_number=0):
             executor_class=DEFAULT_EXECUTOR_CLASS,
             status=SyntheticJob.Status.COMPLETED,
         )
+    rebuild_batch_scores([job_batch.id])
 
 
 def test_normalize_scores():
@@ -92,19 +97,17 @@ def test_set_scores__set_weight_success(settings):
         setup_db()
         set_scores()
         assert SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).count() == 1
-        assert subtensor_.weights_set == [
-            [
-                0.10000000149011612,
-                0.20000000298023224,
-                0.30000001192092896,
-                0.4000000059604645,
-            ]
-        ]
+        # normalized like committed weights, the chain only keeps their proportions
+        assert subtensor_.weights_set == [[16384.0, 32768.0, 49151.0, 65535.0]]
         check_system_events(
             SystemEvent.EventType.WEIGHT_SETTING_SUCCESS,
             SystemEvent.EventSubType.SET_WEIGHTS_SUCCESS,
             1,
         )
+        weights = Weights.objects.get()
+        assert weights.state == Weights.State.REVEALED
+        assert weights.block == 723
+        assert weights.revealed_at is not None
 
 
 @patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_ATTEMPTS", 1)
@@ -216,14 +219,20 @@ def test_set_scores__set_weight__commit__exception(settings):
 
 
 @patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_ATTEMPTS", 1)
-@patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_FAILURE_BACKOFF", 0)
-@patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_HARD_TTL", 1)
-@patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_TTL", 1)
 @patch("bittensor.subtensor", lambda *args, **kwargs: MockSubtensor(override_block_number=723))
 @pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
 @patch_constance({"DYNAMIC_COMMIT_REVEAL_WEIGHTS_ENABLED": False})
 def test_set_scores__set_weight_timeout(settings):
-    settings.CELERY_TASK_ALWAYS_EAGER = False  # to make it timeout
+    # left behind by an attempt killed before it finished
+    weights = Weights.objects.create(
+        uids=[0, 1],
+        weights=[1, 2],
+        version_key=2,
+        commit_reveal=False,
+        state=Weights.State.COMMITTING,
+        attempts=1,
+        next_attempt_at=now() - timedelta(seconds=1),
+    )
     setup_db()
     set_scores()
     assert SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).count() == 2
@@ -236,6 +245,50 @@ def test_set_scores__set_weight_timeout(settings):
     check_system_events(
         SystemEvent.EventType.WEIGHT_SETTING_FAILURE, SystemEvent.EventSubType.GIVING_UP, 1
     )
+    weights.refresh_from_db()
+    assert weights.state == Weights.State.FAILED
+    # the batch is scored by the next run, once the previous weights are done with
+    assert SyntheticJobBatch.objects.filter(scored=False).count() == 1
+
+
+@patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_ATTEMPTS", 3)
+@patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_FAILURE_BACKOFF", 30)
+@patch(
+    "bittensor.subtensor",
+    lambda *args, **kwargs: MockSubtensor(
+        mocked_set_weights=lambda: (False, "error"), override_block_number=723
+    ),
+)
+@pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
+@patch_constance({"DYNAMIC_COMMIT_REVEAL_WEIGHTS_ENABLED": False})
+def test_set_scores__set_weight_failure__retry_scheduled(settings):
+    setup_db()
+    with patch("compute_horde_validator.validator.tasks.commit_weights.apply_async") as dispatch:
+        set_scores()
+        weights = Weights.objects.get()
+        assert weights.state == Weights.State.COMPUTED
+        dispatch.assert_called_once()
+        assert dispatch.call_args.kwargs["args"] == (weights.id,)
+
+        dispatch.reset_mock()
+        commit_weights(weights.id)
+        weights.refresh_from_db()
+        assert weights.state == Weights.State.COMPUTED
+        assert weights.attempts == 1
+        assert weights.next_attempt_at > now() + timedelta(seconds=20)
+        dispatch.assert_called_once()
+        assert dispatch.call_args.kwargs["countdown"] == 30
+
+        # not due yet, nothing happens
+        commit_weights(weights.id)
+        weights.refresh_from_db()
+        assert weights.attempts == 1
+
+    check_system_events(
+        SystemEvent.EventType.WEIGHT_SETTING_FAILURE,
+        SystemEvent.EventSubType.SET_WEIGHTS_ERROR,
+        1,
+    )
 
 
 @patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_ATTEMPTS", 1)
@@ -270,7 +323,9 @@ def test_set_scores__set_weight__commit(settings):
             SystemEvent.EventSubType.COMMIT_WEIGHTS_SUCCESS,
             1,
         )
-        assert Weights.objects.count() == 1
+        weights = Weights.objects.get()
+        assert weights.state == Weights.State.COMMITTED
+        assert weights.block == 723
 
 
 @patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_ATTEMPTS", 1)
@@ -296,7 +351,10 @@ def test_set_scores__set_weight__double_commit_failure(settings):
     setup_db(cycle_number=1)
 
     set_scores()
-    assert Weights.objects.count() == 1
+    assert list(Weights.objects.order_by("id").values_list("state", flat=True)) == [
+        Weights.State.COMMITTED,
+        Weights.State.FAILED,
+    ]
     check_system_events(
         SystemEvent.EventType.WEIGHT_SETTING_FAILURE,
         SystemEvent.EventSubType.COMMIT_WEIGHTS_UNREVEALED_ERROR,
@@ -367,12 +425,17 @@ def test_set_scores__set_weight__reveal__in_time(settings):
         ]
         last_weights.refresh_from_db()
         assert last_weights.revealed_at is not None
+        assert last_weights.state == Weights.State.REVEALED
         check_system_events(
             SystemEvent.EventType.WEIGHT_SETTING_SUCCESS,
             SystemEvent.EventSubType.REVEAL_WEIGHTS_SUCCESS,
             1,
         )
 
+        # nothing left to reveal
+        reveal_scores()
+        assert len(subtensor_.weights_revealed) == 1
+
 
 @pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
 @patch_constance({"DYNAMIC_COMMIT_REVEAL_WEIGHTS_INTERVAL": 20})
@@ -398,9 +461,12 @@ def test_set_scores__set_weight__reveal__timeout(settings, run_uuid):
 
         with override_settings(CELERY_TASK_ALWAYS_EAGER=False):
             with Celery("compute_horde_validator.validator.tests.mock_subtensor_config", run_uuid):
-                result = reveal_scores.apply_async()
-                result.get(timeout=120)
-        last_weights.refresh_from_db()
+                reveal_scores.apply_async().get(timeout=10)
+                # the attempts are scheduled one after another by the worker
+                deadline = time.monotonic() + 120
+                while last_weights.revealed_at is None and time.monotonic() < deadline:
+                    time.sleep(1)
+                    last_weights.refresh_from_db()
         assert last_weights.revealed_at is not None
         system_events = list(
             SystemEvent.objects.filter(id__gt=max_system_event_id_before or 0)
@@ -435,10 +501,6 @@ def test_set_scores__set_weight__reveal__timeout(settings, run_uuid):
 
 # ! This test is the last because otherwise it breaks other tests
 # ! (probably it doesn't release lock properly, so other tests cannot set scores)
-@patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_ATTEMPTS", 1)
-@patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_FAILURE_BACKOFF", 0)
-@patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_HARD_TTL", 1)
-@patch("compute_horde_validator.validator.tasks.WEIGHT_SETTING_TTL", 1)
 @patch("bittensor.subtensor", lambda *args, **kwargs: MockSubtensor(override_block_number=723))
 @pytest.mark.django_db(databases=["default", "default_alias"], transaction=True)
 @pytest.mark.asyncio
@@ -452,13 +514,6 @@ async def test_set_scores__multiple_starts(settings):
     tasks = [sync_to_async(set_scores, thread_sensitive=False)() for _ in range(5)]
     await asyncio.gather(*tasks)
 
-    assert await SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).acount() == 2
-    await sync_to_async(check_system_events)(
-        SystemEvent.EventType.WEIGHT_SETTING_FAILURE,
-        SystemEvent.EventSubType.WRITING_TO_CHAIN_TIMEOUT,
-        1,
-    )
-    # end of retries system event
-    await sync_to_async(check_system_events)(
-        SystemEvent.EventType.WEIGHT_SETTING_FAILURE, SystemEvent.EventSubType.GIVING_UP, 1
-    )
+    # computed once, committing is left to a worker
+    assert await Weights.objects.acount() == 1
+    assert await SystemEvent.objects.using(settings.DEFAULT_DB_ALIAS).acount() == 0
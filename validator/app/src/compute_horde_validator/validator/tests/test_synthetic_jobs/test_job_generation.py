@@ -0,0 +1,108 @@
+import base64
+import io
+import pickle
+import random
+import uuid
+import zipfile
+
+import pytest
+from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
+from cryptography.fernet import Fernet
+from pytest_mock import MockerFixture
+
+from compute_horde_validator.validator.synthetic_jobs import job_generation
+from compute_horde_validator.validator.synthetic_jobs.generator.factory import (
+    DefaultSyntheticJobGeneratorFactory,
+)
+from compute_horde_validator.validator.synthetic_jobs.generator.gpu_hashcat import (
+    generate_hash_jobs,
+)
+from compute_horde_validator.validator.synthetic_jobs.synthetic_job import Algorithm
+
+from .mock_generator import MockSyntheticJobGeneratorFactory
+
+pytestmark = [
+    pytest.mark.asyncio,
+]
+
+
+def _decoded_payload(generated_job: job_generation.GeneratedJob) -> dict:
+    """
+    Unpack the volume, decrypting the payloads - Fernet tokens contain a random IV
+    and a timestamp, so only the decrypted contents are reproducible.
+    """
+    zip_contents = base64.b64decode(generated_job.volume.contents)
+    with zipfile.ZipFile(io.BytesIO(zip_contents)) as zipf:
+        data = pickle.loads(zipf.read("payload.txt"))
+
+    hash_job = generated_job.job_generator.hash_job
+    payloads = [data["payloads"][0]]
+    for i, payload in enumerate(data["payloads"][1:], start=1):
+        key = hash_job._hash("\n".join(hash_job.passwords[i - 1]).encode("utf-8"))
+        payloads.append(Fernet(key).decrypt(payload.encode("utf-8")).decode("utf-8"))
+    data["payloads"] = payloads
+    return data
+
+
+@pytest.mark.parametrize("weights_version", [1, 3])
+async def test_generate_jobs__process_pool_matches_in_process(
+    mocker: MockerFixture, settings, weights_version: int
+):
+    settings.DEBUG_OVERRIDE_WEIGHTS_VERSION = weights_version
+    mocker.patch(
+        "compute_horde_validator.validator.synthetic_jobs.generator.current.synthetic_job_generator_factory",
+        DefaultSyntheticJobGeneratorFactory(),
+    )
+    executor_classes = [DEFAULT_EXECUTOR_CLASS] * 7
+
+    seeds = (
+        "compute_horde_validator.validator.synthetic_jobs.generator.gpu_hashcat.secrets.randbits"
+    )
+    mocker.patch(seeds, random.Random(42).getrandbits)
+    in_process = await job_generation.generate_jobs(executor_classes, processes=0, chunk_size=2)
+    mocker.patch(seeds, random.Random(42).getrandbits)
+    pooled = await job_generation.generate_jobs(executor_classes, processes=2, chunk_size=2)
+
+    assert in_process.offloaded_job_count == 0
+    assert pooled.offloaded_job_count == 7
+    assert pooled.chunk_count == 4
+    assert len(in_process.jobs) == len(pooled.jobs) == 7
+
+    for expected, actual in zip(in_process.jobs, pooled.jobs):
+        assert actual.job_generator.seed == expected.job_generator.seed
+        assert actual.job_generator.hash_job == expected.job_generator.hash_job
+        assert actual.job_generator.expected_answer == expected.job_generator.expected_answer
+        assert _decoded_payload(actual) == _decoded_payload(expected)
+
+
+async def test_generate_hash_jobs__v0_determined_by_seed():
+    first = generate_hash_jobs(0, 1234, 3, Algorithm.SHA384)
+    second = generate_hash_jobs(0, 1234, 3, Algorithm.SHA384)
+    assert [job for job, _, _ in first] == [job for job, _, _ in second]
+    assert [answer for _, answer, _ in first] == [answer for _, answer, _ in second]
+
+
+async def test_generate_hash_jobs__v0_algorithm_shared_by_seeds():
+    algorithms = {
+        job.algorithm
+        for seed in range(10)
+        for job, _, _ in generate_hash_jobs(0, seed, 2, Algorithm.SHA256)
+    }
+    assert algorithms == {Algorithm.SHA256}
+
+
+async def test_generate_jobs__in_process_fallback(mocker: MockerFixture):
+    uuids = [uuid.uuid4() for _ in range(3)]
+    mocker.patch(
+        "compute_horde_validator.validator.synthetic_jobs.generator.current.synthetic_job_generator_factory",
+        MockSyntheticJobGeneratorFactory(uuids=uuids.copy()),
+    )
+
+    result = await job_generation.generate_jobs(
+        [DEFAULT_EXECUTOR_CLASS] * 3, processes=2, chunk_size=2
+    )
+
+    assert [job.job_generator.uuid() for job in result.jobs] == uuids
+    assert [job.volume.contents for job in result.jobs] == ["mock"] * 3
+    assert result.offloaded_job_count == 0
+    assert result.chunk_count == 0
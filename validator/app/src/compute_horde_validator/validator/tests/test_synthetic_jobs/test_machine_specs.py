@@ -0,0 +1,109 @@
+import copy
+from datetime import timedelta
+
+import pytest
+from django.utils.timezone import now
+
+from compute_horde_validator.validator.models import MachineSpecsDigest
+from compute_horde_validator.validator.synthetic_jobs.machine_specs import (
+    MachineSpecsEntry,
+    gpu_set,
+    mark_specs_sent,
+    select_changed_specs,
+    specs_digest,
+)
+
+
+def make_specs(gpu_uuids=("GPU-1",), graphics_speed=1410, ram_free=100, driver="550.54"):
+    return {
+        "gpu": {
+            "count": len(gpu_uuids),
+            "details": [
+                {
+                    "name": "NVIDIA A100",
+                    "driver": driver,
+                    "capacity": "81920",
+                    "graphics_speed": str(graphics_speed),
+                    "memory_speed": "1593",
+                    "uuid": uuid,
+                }
+                for uuid in gpu_uuids
+            ],
+        },
+        "cpu": {"count": 32, "model": "AMD EPYC", "clocks": [3000.0, 3100.5]},
+        "ram": {"total": 1000, "free": ram_free, "available": ram_free, "used": 1000 - ram_free},
+        "hard_disk": {"total": 5000, "free": 2000, "used": 3000},
+        "os": "Ubuntu 22.04",
+    }
+
+
+def test_specs_digest__ignores_readings():
+    specs = make_specs()
+    assert specs_digest(specs) == specs_digest(make_specs(graphics_speed=210, ram_free=500))
+    assert specs_digest(specs) != specs_digest(make_specs(driver="555.42"))
+
+    broken = {"gpu_scrape_error": "RuntimeError()", "cpu": {"count": 0, "clocks": []}}
+    assert specs_digest(broken) == specs_digest(copy.deepcopy(broken))
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_select_changed_specs():
+    first = [
+        MachineSpecsEntry.from_specs("miner_1", make_specs(["GPU-1"])),
+        # another executor on the same machine
+        MachineSpecsEntry.from_specs("miner_1", make_specs(["GPU-1"], ram_free=50)),
+        MachineSpecsEntry.from_specs("miner_1", make_specs(["GPU-2", "GPU-3"])),
+        MachineSpecsEntry.from_specs("miner_2", make_specs(["GPU-1"])),
+    ]
+    changed = await select_changed_specs(first)
+    assert changed == [first[0], first[2], first[3]]
+    await mark_specs_sent(changed)
+
+    second = [
+        MachineSpecsEntry.from_specs("miner_1", make_specs(["GPU-1"], graphics_speed=300)),
+        MachineSpecsEntry.from_specs("miner_1", make_specs(["GPU-3", "GPU-2"])),
+        MachineSpecsEntry.from_specs("miner_2", make_specs(["GPU-1"], driver="555.42")),
+    ]
+    assert await select_changed_specs(second) == [second[2]]
+    await mark_specs_sent([second[2]])
+    assert await MachineSpecsDigest.objects.acount() == 3
+
+    # sent long ago
+    await MachineSpecsDigest.objects.filter(miner_hotkey="miner_1").aupdate(
+        sent_at=now() - timedelta(days=1)
+    )
+    assert await select_changed_specs(second) == second[:2]
+    assert await MachineSpecsDigest.objects.acount() == 1
+
+
+def make_cpu_specs(cpu_count=32, ram_free=100):
+    specs = make_specs(gpu_uuids=(), ram_free=ram_free)
+    del specs["gpu"]
+    specs["cpu"]["count"] = cpu_count
+    return specs
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_select_changed_specs__cpu_only_machines():
+    assert gpu_set(make_cpu_specs()) == gpu_set(make_cpu_specs(ram_free=500))
+    assert gpu_set(make_cpu_specs()) != gpu_set(make_cpu_specs(cpu_count=64))
+
+    entries = [
+        MachineSpecsEntry.from_specs("miner_1", make_cpu_specs()),
+        MachineSpecsEntry.from_specs("miner_1", make_cpu_specs(cpu_count=64)),
+    ]
+    assert await select_changed_specs(entries) == entries
+    await mark_specs_sent(entries)
+    assert await MachineSpecsDigest.objects.acount() == 2
+
+    assert (
+        await select_changed_specs(
+            [
+                MachineSpecsEntry.from_specs("miner_1", make_cpu_specs(ram_free=500)),
+                MachineSpecsEntry.from_specs("miner_1", make_cpu_specs(cpu_count=64, ram_free=50)),
+            ]
+        )
+        == []
+    )
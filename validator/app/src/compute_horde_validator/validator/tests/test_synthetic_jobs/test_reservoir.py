@@ -0,0 +1,141 @@
+import pytest
+from asgiref.sync import sync_to_async
+from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
+from django.db import connection
+from pytest_mock import MockerFixture
+
+from compute_horde_validator.validator.locks import LockType
+from compute_horde_validator.validator.models import (
+    Miner,
+    MinerManifest,
+    PreparedSyntheticJob,
+    SyntheticJobBatch,
+)
+from compute_horde_validator.validator.synthetic_jobs import job_generation, reservoir
+from compute_horde_validator.validator.synthetic_jobs.generator.factory import (
+    DefaultSyntheticJobGeneratorFactory,
+)
+from compute_horde_validator.validator.tasks import fill_synthetic_job_reservoir
+
+
+@pytest.fixture(autouse=True)
+def _settings(settings):
+    settings.DEBUG_OVERRIDE_WEIGHTS_VERSION = 3
+    settings.SYNTHETIC_JOBS_RESERVOIR_MARGIN = 0.5
+    settings.SYNTHETIC_JOBS_GENERATION_CHUNK_SIZE = 2
+
+
+def _create_manifests(*executor_counts: int):
+    batch = SyntheticJobBatch.objects.create()
+    for i, executor_count in enumerate(executor_counts):
+        miner, _ = Miner.objects.get_or_create(hotkey=f"miner_{i}")
+        MinerManifest.objects.create(miner=miner, batch=batch, executor_count=executor_count)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("processes", [0, 2])
+def test_fill_reservoir(settings, processes: int):
+    settings.SYNTHETIC_JOBS_GENERATION_PROCESSES = processes
+    _create_manifests(10, 5)
+    # only the last batch counts
+    _create_manifests(2, 2)
+
+    assert reservoir.fill_reservoir() == 6
+    assert PreparedSyntheticJob.objects.filter(weights_version=3).count() == 6
+
+    # already full
+    assert reservoir.fill_reservoir() == 0
+
+
+@pytest.mark.django_db
+def test_fill_reservoir__discards_other_weights_versions(settings):
+    settings.SYNTHETIC_JOBS_GENERATION_PROCESSES = 0
+    _create_manifests(2)
+    reservoir.fill_reservoir()
+
+    settings.DEBUG_OVERRIDE_WEIGHTS_VERSION = 2
+    assert reservoir.fill_reservoir() == 3
+    assert set(PreparedSyntheticJob.objects.values_list("weights_version", flat=True)) == {2}
+
+
+@pytest.mark.django_db
+def test_fill_reservoir__does_not_prepare_v0_jobs(settings):
+    settings.SYNTHETIC_JOBS_GENERATION_PROCESSES = 0
+    _create_manifests(2)
+    reservoir.fill_reservoir()
+
+    settings.DEBUG_OVERRIDE_WEIGHTS_VERSION = 0
+    assert reservoir.fill_reservoir() == 0
+    assert not PreparedSyntheticJob.objects.exists()
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_generate_jobs__uses_prepared_jobs(settings, mocker: MockerFixture):
+    settings.SYNTHETIC_JOBS_GENERATION_PROCESSES = 0
+    mocker.patch(
+        "compute_horde_validator.validator.synthetic_jobs.generator.current.synthetic_job_generator_factory",
+        DefaultSyntheticJobGeneratorFactory(),
+    )
+    await sync_to_async(_create_manifests)(2)
+    await sync_to_async(reservoir.fill_reservoir)()
+    stored = await PreparedSyntheticJob.objects.afirst()
+    prepared_jobs = await reservoir.atake_jobs(5)
+    assert len(prepared_jobs) == 3
+    assert await PreparedSyntheticJob.objects.acount() == 0
+
+    # the answers are not stored in plain text
+    hash_job, expected_answer, volume_contents = prepared_jobs[0].result
+    assert expected_answer.encode() not in bytes(stored.data)
+
+    result = await job_generation.generate_jobs(
+        [DEFAULT_EXECUTOR_CLASS] * 5,
+        processes=0,
+        chunk_size=2,
+        prepared_jobs=prepared_jobs,
+    )
+    assert result.prepared_job_count == 3
+    assert len(result.jobs) == 5
+    answers = {job.job_generator.expected_answer for job in result.jobs}
+    assert {prepared_job.result[1] for prepared_job in prepared_jobs} <= answers
+    assert len(answers) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_generate_jobs__returns_unused_prepared_jobs(settings, mocker: MockerFixture):
+    settings.SYNTHETIC_JOBS_GENERATION_PROCESSES = 0
+    mocker.patch(
+        "compute_horde_validator.validator.synthetic_jobs.generator.current.synthetic_job_generator_factory",
+        DefaultSyntheticJobGeneratorFactory(),
+    )
+    await sync_to_async(_create_manifests)(2)
+    await sync_to_async(reservoir.fill_reservoir)()
+    prepared_jobs = await reservoir.atake_jobs(3)
+
+    result = await job_generation.generate_jobs(
+        [DEFAULT_EXECUTOR_CLASS], processes=0, chunk_size=2, prepared_jobs=prepared_jobs
+    )
+    assert result.prepared_job_count == 1
+    assert len(result.unused_prepared_jobs) == 2
+
+    await reservoir.areturn_jobs(result.unused_prepared_jobs)
+    returned = await reservoir.atake_jobs(3)
+    assert {job.result[1] for job in returned} == {
+        job.result[1] for job in result.unused_prepared_jobs
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_fill_synthetic_job_reservoir__commits_and_releases_lock(settings):
+    settings.SYNTHETIC_JOBS_GENERATION_PROCESSES = 0
+    _create_manifests(2)
+
+    fill_synthetic_job_reservoir()
+    assert PreparedSyntheticJob.objects.count() == 3
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' AND objid = %s",
+            [LockType.SYNTHETIC_JOB_RESERVOIR],
+        )
+        assert cursor.fetchone()[0] == 0
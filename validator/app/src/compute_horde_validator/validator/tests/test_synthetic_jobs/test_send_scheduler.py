@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+import pytest
+
+from compute_horde_validator.validator.synthetic_jobs.send_scheduler import SendScheduler
+
+pytestmark = [
+    pytest.mark.asyncio,
+]
+
+
+async def _run(scheduler: SendScheduler, keys: list[str]) -> list[tuple[str, float, float]]:
+    released: list[tuple[str, float, float]] = []
+
+    async def sender(key: str):
+        send_at = await scheduler.wait(key)
+        released.append((key, send_at, time.monotonic()))
+
+    tasks = [asyncio.create_task(sender(key)) for key in keys]
+    await scheduler.run()
+    await asyncio.gather(*tasks)
+    return released
+
+
+async def test_send_scheduler__releases_at_target_instants():
+    scheduler = SendScheduler()
+    start = time.monotonic()
+    scheduler.schedule("late", start + 0.2)
+    scheduler.schedule("now", start)
+    scheduler.schedule("soon", start + 0.1)
+
+    released = await _run(scheduler, ["late", "now", "soon"])
+
+    assert [key for key, _, _ in released] == ["now", "soon", "late"]
+    for _, send_at, release_time in released:
+        assert send_at <= release_time < send_at + 0.05
+    assert len(scheduler) == 0
+
+
+async def test_send_scheduler__interleaves_groups():
+    scheduler = SendScheduler()
+    start = time.monotonic()
+    keys = []
+    for group, count in [("miner_a", 3), ("miner_b", 1), ("miner_c", 2)]:
+        for i in range(count):
+            key = f"{group}_{i}"
+            scheduler.schedule(key, start, group=group)
+            keys.append(key)
+
+    released = await _run(scheduler, keys)
+
+    assert [key for key, _, _ in released] == [
+        "miner_a_0",
+        "miner_b_0",
+        "miner_c_0",
+        "miner_a_1",
+        "miner_c_1",
+        "miner_a_2",
+    ]
+
+
+async def test_send_scheduler__slow_sender_does_not_delay_others():
+    scheduler = SendScheduler()
+    start = time.monotonic()
+    scheduler.schedule("fast", start + 0.05)
+    scheduler.schedule("slow", start + 0.05)
+
+    released: dict[str, float] = {}
+
+    async def fast_sender():
+        await scheduler.wait("fast")
+        released["fast"] = time.monotonic()
+
+    async def slow_sender():
+        # still busy when its send is released
+        await asyncio.sleep(0.3)
+        await scheduler.wait("slow")
+        released["slow"] = time.monotonic()
+
+    await asyncio.gather(fast_sender(), slow_sender(), scheduler.run())
+
+    assert released["fast"] - start < 0.2
+    assert released["slow"] - start >= 0.3
@@ -0,0 +1,213 @@
+import asyncio
+import uuid
+from collections.abc import Callable
+
+import billiard
+import bittensor
+import pytest
+from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
+from compute_horde.mv_protocol import miner_requests
+from pytest_mock import MockerFixture
+
+from compute_horde_validator.validator.models import (
+    JobFinishedReceipt,
+    JobStartedReceipt,
+    Miner,
+    MinerBatchScore,
+    MinerManifest,
+    SyntheticJob,
+    SyntheticJobBatch,
+)
+from compute_horde_validator.validator.synthetic_jobs.batch_run import (
+    BatchContext,
+    MinerClient,
+    execute_synthetic_batch_run,
+)
+from compute_horde_validator.validator.synthetic_jobs.sharded_batch_run import (
+    ShardError,
+    _Channel,
+    _gather_shards,
+    _Shard,
+    execute_sharded_synthetic_batch_run,
+)
+from compute_horde_validator.validator.tests.transport import MinerSimulationTransport
+
+from .mock_generator import MockSyntheticJobGeneratorFactory
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(databases=["default", "default_alias"], transaction=True),
+]
+
+# miner hotkey, executor count, how the jobs end
+MINERS = [
+    ("miner_0", 2, "finished"),
+    ("miner_1", 1, "declined"),
+    ("miner_2", 3, "finished"),
+    ("miner_3", 1, "failed"),
+    ("miner_4", 2, "finished"),
+]
+
+
+async def _add_miner_messages(
+    transport: MinerSimulationTransport, job_uuids: list[str], outcome: str
+) -> None:
+    n = len(job_uuids)
+    manifest = miner_requests.V0ExecutorManifestRequest(
+        manifest=miner_requests.ExecutorManifest(
+            executor_classes=[
+                miner_requests.ExecutorClassManifest(executor_class=DEFAULT_EXECUTOR_CLASS, count=n)
+            ]
+        )
+    )
+    # after the authentication message
+    await transport.add_message(manifest.model_dump_json(), send_before=1)
+
+    if outcome == "declined":
+        for i, job_uuid in enumerate(job_uuids):
+            msg = miner_requests.V0DeclineJobRequest(job_uuid=job_uuid)
+            await transport.add_message(msg.model_dump_json(), send_before=n if i == 0 else 0)
+        return
+
+    # after all the initial job requests
+    for i, job_uuid in enumerate(job_uuids):
+        msg = miner_requests.V0AcceptJobRequest(job_uuid=job_uuid)
+        await transport.add_message(msg.model_dump_json(), send_before=n if i == 0 else 0)
+    for job_uuid in job_uuids:
+        msg = miner_requests.V0ExecutorReadyRequest(job_uuid=job_uuid)
+        await transport.add_message(msg.model_dump_json())
+
+    # after all the job started receipts and job requests
+    for i, job_uuid in enumerate(job_uuids):
+        if outcome == "failed":
+            msg = miner_requests.V0JobFailedRequest(
+                job_uuid=job_uuid,
+                docker_process_exit_status=1,
+                docker_process_stdout="",
+                docker_process_stderr="",
+            )
+        else:
+            msg = miner_requests.V0JobFinishedRequest(
+                job_uuid=job_uuid,
+                docker_process_stdout="",
+                docker_process_stderr="",
+            )
+        await transport.add_message(
+            msg.model_dump_json(), send_before=2 * n if i == 0 else 0, sleep_before=0.01
+        )
+
+
+async def _run_batch(mocker: MockerFixture, execute: Callable) -> dict:
+    await SyntheticJob.objects.all().adelete()
+    await MinerManifest.objects.all().adelete()
+    await SyntheticJobBatch.objects.all().adelete()
+
+    axons: dict[str, bittensor.AxonInfo] = {}
+    miners: list[Miner] = []
+    transports: dict[str, MinerSimulationTransport] = {}
+    job_uuids: list[uuid.UUID] = []
+    for i, (hotkey, executor_count, outcome) in enumerate(MINERS):
+        axons[hotkey] = bittensor.AxonInfo(
+            version=4, ip="ignore", ip_type=4, port=9000 + i, hotkey=hotkey, coldkey=hotkey
+        )
+        miners.append((await Miner.objects.aget_or_create(hotkey=hotkey))[0])
+        miner_job_uuids = [uuid.uuid4() for _ in range(executor_count)]
+        job_uuids.extend(miner_job_uuids)
+        transports[hotkey] = MinerSimulationTransport(hotkey)
+        await _add_miner_messages(
+            transports[hotkey], [str(job_uuid) for job_uuid in miner_job_uuids], outcome
+        )
+
+    mocker.patch(
+        "compute_horde_validator.validator.synthetic_jobs.generator.current.synthetic_job_generator_factory",
+        MockSyntheticJobGeneratorFactory(uuids=job_uuids.copy()),
+    )
+
+    def create_miner_client(ctx: BatchContext, miner_hotkey: str):
+        return MinerClient(ctx=ctx, miner_hotkey=miner_hotkey, transport=transports[miner_hotkey])
+
+    await execute(axons, miners, create_miner_client=create_miner_client)
+
+    # job uuids are different in each run, compare the jobs of each miner in order
+    jobs = [
+        (job.miner.hotkey, job.status, job.score, job.comment)
+        async for job in SyntheticJob.objects.select_related("miner").order_by(
+            "miner__hotkey", "id"
+        )
+    ]
+    manifests = [
+        (manifest.miner.hotkey, manifest.executor_count, manifest.online_executor_count)
+        async for manifest in MinerManifest.objects.select_related("miner").order_by(
+            "miner__hotkey"
+        )
+    ]
+    miner_scores = [
+        (
+            miner_score.miner.hotkey,
+            miner_score.executor_class,
+            miner_score.score_sum,
+            miner_score.job_count,
+        )
+        async for miner_score in MinerBatchScore.objects.select_related("miner").order_by(
+            "miner__hotkey", "executor_class"
+        )
+    ]
+    return dict(
+        jobs=jobs,
+        manifests=manifests,
+        miner_scores=miner_scores,
+        job_started_receipts=await JobStartedReceipt.objects.filter(
+            job_uuid__in=job_uuids
+        ).acount(),
+        job_finished_receipts=await JobFinishedReceipt.objects.filter(
+            job_uuid__in=job_uuids
+        ).acount(),
+    )
+
+
+async def test_sharded_batch_run_matches_single_process(mocker: MockerFixture):
+    # keep the miner and job order, so both runs assign the same jobs to the same miners
+    mocker.patch("random.shuffle")
+
+    single_process = await _run_batch(mocker, execute_synthetic_batch_run)
+
+    async def execute_sharded(axons, miners, create_miner_client):
+        await execute_sharded_synthetic_batch_run(
+            axons, miners, shard_count=2, create_miner_client=create_miner_client
+        )
+
+    sharded = await _run_batch(mocker, execute_sharded)
+
+    assert len(single_process["jobs"]) == 9
+    assert {status for _, status, _, _ in single_process["jobs"]} == {
+        SyntheticJob.Status.COMPLETED,
+        SyntheticJob.Status.FAILED,
+    }
+    assert len(single_process["miner_scores"]) == len(MINERS)
+    assert single_process["job_started_receipts"] == 8
+    assert single_process["job_finished_receipts"] == 8
+    assert sharded == single_process
+
+
+def _silent_shard(conn) -> None:
+    # waits for the coordinator without ever replying
+    conn.recv()
+
+
+async def test_shard_failure_stops_other_shards():
+    mp_context = billiard.get_context("fork")
+    shards = []
+    for index in range(2):
+        parent_conn, child_conn = mp_context.Pipe()
+        process = mp_context.Process(target=_silent_shard, args=(child_conn,), daemon=True)
+        process.start()
+        child_conn.close()
+        shards.append(_Shard(index, [], process, _Channel(f"shard {index}", parent_conn)))
+    # the first shard failed, the second never replies
+    shards[0].process.terminate()
+
+    async with asyncio.timeout(10):
+        with pytest.raises(ShardError):
+            await _gather_shards(shards, lambda shard: shard.channel.recv("manifests"))
+
+    assert all(shard.stopped and not shard.process.is_alive() for shard in shards)
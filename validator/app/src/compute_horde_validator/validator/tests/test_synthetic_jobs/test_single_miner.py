@@ -4,6 +4,7 @@ from collections.abc import Callable
 from unittest.mock import patch
 
 import bittensor
+import prometheus_client
 import pytest
 from asgiref.sync import sync_to_async
 from pytest_mock import MockerFixture
@@ -68,6 +69,46 @@ async def test_execute_miner_synthetic_jobs_success(
     )
 
 
+def _send_skew_count(request_type: str) -> float:
+    value = prometheus_client.REGISTRY.get_sample_value(
+        "validator_synthetic_job_send_skew_seconds_count", {"request_type": request_type}
+    )
+    return value or 0
+
+
+async def test_execute_miner_synthetic_jobs_success__send_skew_observed(
+    miner: Miner,
+    axon_dict: dict[str, bittensor.AxonInfo],
+    manifest_message: str,
+    executor_ready_message: str,
+    accept_job_message: str,
+    job_finish_message: str,
+    create_simulation_miner_client: Callable,
+    transport: MinerSimulationTransport,
+    job_uuid: uuid.UUID,
+):
+    await transport.add_message(manifest_message, send_before=1)
+    await transport.add_message(accept_job_message, send_before=1)
+    await transport.add_message(executor_ready_message, send_before=0)
+    await transport.add_message(job_finish_message, send_before=2)
+
+    initial_job_request_count = _send_skew_count("initial_job_request")
+    job_request_count = _send_skew_count("job_request")
+
+    await asyncio.wait_for(
+        execute_synthetic_batch_run(
+            axon_dict,
+            [miner],
+            create_miner_client=create_simulation_miner_client,
+        ),
+        timeout=1,
+    )
+
+    await check_synthetic_job(job_uuid, miner, SyntheticJob.Status.COMPLETED, MOCK_SCORE)
+    assert _send_skew_count("initial_job_request") == initial_job_request_count + 1
+    assert _send_skew_count("job_request") == job_request_count + 1
+
+
 @patch(
     "compute_horde_validator.validator.synthetic_jobs.batch_run._JOB_RESPONSE_EXTRA_TIMEOUT", 0.05
 )
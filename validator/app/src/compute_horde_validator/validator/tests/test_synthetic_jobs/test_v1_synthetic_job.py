@@ -0,0 +1,46 @@
+import numpy as np
+
+from compute_horde_validator.validator.synthetic_jobs.synthetic_job import (
+    HASHJOB_PARAMS,
+    Algorithm,
+    JobParams,
+)
+from compute_horde_validator.validator.synthetic_jobs.v1_synthetic_job import V1SyntheticJob
+
+
+def test_generate_many():
+    algorithms = Algorithm.get_all_algorithms()
+    params = [HASHJOB_PARAMS[1][algorithm] for algorithm in algorithms]
+
+    jobs = V1SyntheticJob.generate_many(5, algorithms, params, rng=np.random.default_rng(42))
+
+    assert len(jobs) == 5
+    assert jobs == V1SyntheticJob.generate_many(
+        5, algorithms, params, rng=np.random.default_rng(42)
+    )
+    assert len({job.answer for job in jobs}) == 5
+    for job in jobs:
+        assert len(job.salts) == len(algorithms)
+        assert all(len(salt) == 8 for salt in job.salts)
+        for passwords, _params in zip(job.passwords, params):
+            assert len(passwords) == _params.num_hashes
+            assert passwords == sorted(set(passwords))
+            for password in passwords:
+                assert set(password[: _params.num_letters]) <= set(V1SyntheticJob.ALPHABET)
+                assert set(password[_params.num_letters :]) <= set(V1SyntheticJob.DIGITS)
+                assert len(password) == _params.password_length
+        for i, algorithm in enumerate(algorithms):
+            assert job.hash_hexes(i)[0] == (
+                algorithm.hash(job.passwords[i][0].encode("ascii") + job.salts[i]).hexdigest()
+            )
+
+
+def test_generate_many__dedupes_small_password_space():
+    params = JobParams(timeout=1, num_letters=0, num_digits=2, num_hashes=95)
+
+    jobs = V1SyntheticJob.generate_many(
+        10, [Algorithm.SHA256], [params], rng=np.random.default_rng(0)
+    )
+
+    for job in jobs:
+        assert len(set(job.passwords[0])) == 95
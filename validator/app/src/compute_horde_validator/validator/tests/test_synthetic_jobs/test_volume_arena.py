@@ -0,0 +1,122 @@
+import random
+import tracemalloc
+import uuid
+
+from compute_horde.base.volume import InlineVolume
+from compute_horde.executor_class import DEFAULT_EXECUTOR_CLASS
+from compute_horde.mv_protocol.validator_requests import V0JobRequest
+
+from compute_horde_validator.validator.synthetic_jobs.batch_run import (
+    Job,
+    _render_job_request,
+    _render_job_request_envelope,
+)
+from compute_horde_validator.validator.synthetic_jobs.generator.base import PreparedJob
+from compute_horde_validator.validator.synthetic_jobs.generator.gpu_hashcat import (
+    GPUHashcatSyntheticJobGenerator,
+    generate_hash_jobs,
+)
+from compute_horde_validator.validator.synthetic_jobs.volume_arena import VolumeArena
+from compute_horde_validator.validator.utils import single_file_zip
+
+JOB_COUNT = 50
+
+
+def _job_request(job: Job, volume_contents: str) -> V0JobRequest:
+    return V0JobRequest(
+        job_uuid=job.uuid,
+        executor_class=job.executor_class,
+        docker_image_name=job.job_generator.docker_image_name(),
+        docker_run_options_preset=job.job_generator.docker_run_options_preset(),
+        docker_run_cmd=job.job_generator.docker_run_cmd(),
+        raw_script=job.job_generator.raw_script(),
+        volume=InlineVolume(contents=volume_contents),
+        output_upload=None,
+    )
+
+
+def _create_jobs() -> tuple[list[Job], list[bytes]]:
+    jobs = []
+    payloads = []
+    for result in generate_hash_jobs(3, random.getrandbits(64), JOB_COUNT):
+        job_generator = GPUHashcatSyntheticJobGenerator()
+        job_generator.init_prepared(PreparedJob(weights_version=3, result=result))
+        job_uuid = str(job_generator.uuid())
+        jobs.append(
+            Job(
+                ctx=None,
+                uuid=job_uuid,
+                name=job_uuid,
+                miner_hotkey="miner_hotkey",
+                executor_class=DEFAULT_EXECUTOR_CLASS,
+                job_generator=job_generator,
+                volume=None,
+                volume_size=0,
+            )
+        )
+        payloads.append(job_generator.hash_job.payload)
+    return jobs, payloads
+
+
+def test_arena_volume_contents():
+    arena = VolumeArena()
+    contents = [single_file_zip("payload.txt", str(uuid.uuid4()) * i) for i in range(1, 10)]
+    volumes = [arena.add(volume_contents) for volume_contents in contents]
+    assert [volume.contents for volume in volumes] == contents
+    assert len(arena) == sum(volume.size for volume in volumes)
+
+
+def test_job_request_envelope():
+    jobs, payloads = _create_jobs()
+    arena = VolumeArena()
+    for job, payload in zip(jobs, payloads):
+        job.volume = arena.add(single_file_zip("payload.txt", payload))
+        prefix, suffix = _render_job_request_envelope(job)
+        assert (
+            prefix + job.volume.contents + suffix
+            == _job_request(job, job.volume.contents).model_dump_json()
+        )
+
+
+def test_render_job_request():
+    jobs, payloads = _create_jobs()
+    arena = VolumeArena()
+    for job, payload in zip(jobs, payloads):
+        job.volume = arena.add(single_file_zip("payload.txt", payload))
+        job.job_request_envelope = _render_job_request_envelope(job)
+        assert _render_job_request(job) == _job_request(job, job.volume.contents).model_dump_json()
+
+
+def test_volume_arena_lowers_peak_memory():
+    jobs, payloads = _create_jobs()
+
+    # previously, each job kept its base64 encoded volume and, after sending,
+    # its job request JSON, until the job finished
+    tracemalloc.start()
+    volume_contents = [single_file_zip("payload.txt", payload) for payload in payloads]
+    requests_json = [
+        _job_request(job, contents).model_dump_json()
+        for job, contents in zip(jobs, volume_contents)
+    ]
+    _, previous_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del volume_contents, requests_json
+
+    # only the job request envelopes are rendered before the barrier, the volumes are held
+    # in the arena and each job request is rendered at send time and released right after
+    tracemalloc.start()
+    arena = VolumeArena()
+    for job, payload in zip(jobs, payloads):
+        job.volume = arena.add(single_file_zip("payload.txt", payload))
+    for job in jobs:
+        job.job_request_envelope = _render_job_request_envelope(job)
+    for job in jobs:
+        request_json = _render_job_request(job)
+        job.job_request_envelope = None
+        job.volume = None
+        del request_json
+    del arena
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < previous_peak / 2
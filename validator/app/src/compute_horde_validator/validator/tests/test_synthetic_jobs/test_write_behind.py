@@ -0,0 +1,104 @@
+import asyncio
+import uuid
+from collections.abc import Callable
+
+import bittensor
+import pytest
+from pytest_mock import MockerFixture
+
+from compute_horde_validator.validator.models import (
+    JobFinishedReceipt,
+    JobStartedReceipt,
+    Miner,
+    MinerBatchScore,
+    MinerManifest,
+    SyntheticJob,
+    SyntheticJobBatch,
+)
+from compute_horde_validator.validator.synthetic_jobs import write_behind
+from compute_horde_validator.validator.synthetic_jobs.batch_run import execute_synthetic_batch_run
+from compute_horde_validator.validator.synthetic_jobs.write_behind import WriteBehindQueue
+from compute_horde_validator.validator.tests.transport import MinerSimulationTransport
+
+from .mock_generator import MOCK_SCORE, MockSyntheticJobGeneratorFactory
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(databases=["default", "default_alias"], transaction=True),
+]
+
+
+async def test_write_behind_queue__chunks_and_retries(mocker: MockerFixture):
+    miners = [Miner(hotkey=f"miner_{i}") for i in range(7)]
+    bulk_create = write_behind._bulk_create
+    calls = []
+
+    async def flaky_bulk_create(chunk):
+        calls.append(len(chunk.objs))
+        # the second chunk fails once
+        if len(calls) == 2:
+            raise RuntimeError("connection lost")
+        await bulk_create(chunk)
+
+    mocker.patch.object(write_behind, "_bulk_create", flaky_bulk_create)
+
+    queue = WriteBehindQueue(chunk_size=3)
+    queue.put(Miner, miners, ignore_conflicts=True)
+    await queue.drain()
+    queue.close()
+
+    assert calls == [3, 3, 1, 3]
+    assert queue.flushed_count == 7
+    assert await Miner.objects.acount() == 7
+
+
+async def test_write_behind__batch_not_finalized_after_crash(
+    mocker: MockerFixture,
+    miner: Miner,
+    axon_dict: dict[str, bittensor.AxonInfo],
+    manifest_message: str,
+    executor_ready_message: str,
+    accept_job_message: str,
+    job_finish_message: str,
+    create_simulation_miner_client: Callable,
+    transport: MinerSimulationTransport,
+    job_uuid: uuid.UUID,
+):
+    mocker.patch(
+        "compute_horde_validator.validator.synthetic_jobs.generator.current.synthetic_job_generator_factory",
+        MockSyntheticJobGeneratorFactory(uuids=[job_uuid]),
+    )
+    # the worker dies right before the batch is finalized
+    mocker.patch(
+        "compute_horde_validator.validator.synthetic_jobs.batch_run._db_finalize_batch",
+        side_effect=RuntimeError("worker killed"),
+    )
+
+    await transport.add_message(manifest_message, send_before=1)
+    await transport.add_message(accept_job_message, send_before=1)
+    await transport.add_message(executor_ready_message, send_before=0)
+    await transport.add_message(job_finish_message, send_before=2)
+
+    with pytest.raises(RuntimeError, match="worker killed"):
+        await asyncio.wait_for(
+            execute_synthetic_batch_run(
+                axon_dict,
+                [miner],
+                create_miner_client=create_simulation_miner_client,
+            ),
+            timeout=1,
+        )
+
+    # everything flushed so far is kept, but the batch is not eligible for scoring
+    batch = await SyntheticJobBatch.objects.aget()
+    assert batch.accepting_results_until is None
+    job = await SyntheticJob.objects.aget(job_uuid=job_uuid)
+    assert job.batch_id == batch.id
+    assert job.status == SyntheticJob.Status.COMPLETED
+    assert job.score == MOCK_SCORE
+    assert await MinerManifest.objects.filter(batch=batch).acount() == 1
+    miner_score = await MinerBatchScore.objects.aget(batch=batch)
+    assert (miner_score.miner_id, miner_score.executor_class) == (miner.id, job.executor_class)
+    assert (miner_score.score_sum, miner_score.job_count) == (MOCK_SCORE, 1)
+    assert await JobStartedReceipt.objects.filter(job_uuid=job_uuid).acount() == 1
+    assert await JobFinishedReceipt.objects.filter(job_uuid=job_uuid).acount() == 1
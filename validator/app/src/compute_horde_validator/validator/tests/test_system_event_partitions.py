@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils.timezone import now
+from pytest_mock import MockerFixture
+
+from compute_horde_validator.validator.models import SystemEvent
+from compute_horde_validator.validator.system_event_partitions import (
+    create_partitions,
+    drop_expired_partitions,
+    get_partitions,
+)
+
+
+def _create_event(days_from_now: int) -> SystemEvent:
+    event = SystemEvent.objects.create(
+        type=SystemEvent.EventType.VALIDATOR_TELEMETRY,
+        subtype=SystemEvent.EventSubType.CHECKPOINT,
+        data={},
+    )
+    # timestamp is auto_now_add, moving the event across partitions if needed
+    SystemEvent.objects.filter(id=event.id).update(timestamp=now() + timedelta(days=days_from_now))
+    return event
+
+
+def _partition_of(event: SystemEvent) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT tableoid::regclass::text FROM validator_systemevent WHERE id = %s", [event.id]
+        )
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+def test_system_event_partitions__after_migration():
+    partitions = {partition.name: partition for partition in get_partitions()}
+
+    assert set(partitions) == {"validator_systemevent_legacy", "validator_systemevent_default"}
+    assert partitions["validator_systemevent_default"].is_default
+    legacy = partitions["validator_systemevent_legacy"]
+    assert legacy.start is None
+    assert legacy.end is not None and legacy.end > now()
+
+    assert _partition_of(_create_event(0)) == "validator_systemevent_legacy"
+    assert _partition_of(_create_event(5)) == "validator_systemevent_default"
+
+
+@pytest.mark.django_db
+def test_system_event_partitions__create_ahead():
+    legacy_end = {partition.name: partition.end for partition in get_partitions()}[
+        "validator_systemevent_legacy"
+    ]
+
+    created = create_partitions(days_ahead=3)
+
+    # continues right after the legacy partition, which ends tomorrow
+    assert created == [
+        f"validator_systemevent_p{legacy_end.date() + timedelta(days=i):%Y%m%d}" for i in range(3)
+    ]
+    assert create_partitions(days_ahead=3) == []
+
+    event = _create_event(2)
+    assert _partition_of(event) == f"validator_systemevent_p{(now() + timedelta(days=2)):%Y%m%d}"
+    assert SystemEvent.objects.filter(sent=False).count() == 1
+
+
+@pytest.mark.django_db
+def test_system_event_partitions__drop_expired(mocker: MockerFixture):
+    create_partitions(days_ahead=3)
+    kept = _create_event(40)
+    expired = _create_event(2)
+
+    mocker.patch(
+        "compute_horde_validator.validator.system_event_partitions.now",
+        return_value=now() + timedelta(days=40),
+    )
+    dropped = drop_expired_partitions(retention_days=30)
+
+    assert "validator_systemevent_legacy" in dropped
+    assert len(dropped) == 4
+    assert {partition.name for partition in get_partitions()} == {"validator_systemevent_default"}
+    assert list(SystemEvent.objects.values_list("id", flat=True)) == [kept.id]
+    assert not SystemEvent.objects.filter(id=expired.id).exists()
+
+
+@pytest.mark.django_db
+def test_maintain_system_event_partitions_command(capsys):
+    call_command("maintain_system_event_partitions", days_ahead=1, retention_days=30)
+
+    output = capsys.readouterr().out
+    assert "created validator_systemevent_p" in output
+    assert "validator_systemevent_default" in output
+
+
+@pytest.mark.django_db
+def test_system_event_partitions__create_with_events_in_default_partition():
+    legacy_end = {partition.name: partition.end for partition in get_partitions()}[
+        "validator_systemevent_legacy"
+    ]
+    # the day after the legacy partition, and one past the partitions to be created
+    day_after = legacy_end + timedelta(days=1)
+    events = [_create_event(0), _create_event(10)]
+    SystemEvent.objects.filter(id=events[0].id).update(timestamp=day_after)
+    assert [_partition_of(event) for event in events] == ["validator_systemevent_default"] * 2
+
+    created = create_partitions(days_ahead=3)
+
+    assert f"validator_systemevent_p{day_after:%Y%m%d}" in created
+    assert _partition_of(events[0]) == f"validator_systemevent_p{day_after:%Y%m%d}"
+    assert _partition_of(events[1]) == "validator_systemevent_default"
+    assert SystemEvent.objects.get(id=events[0].id).timestamp == day_after
+    assert SystemEvent.objects.count() == 2
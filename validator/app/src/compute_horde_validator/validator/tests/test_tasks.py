@@ -117,8 +117,8 @@ def get_response(status):
 
 
 @patch(
-    "compute_horde_validator.validator.tasks.requests.post",
-    lambda url, json, headers: get_response(201),
+    "compute_horde_validator.validator.event_shipper._get_session",
+    lambda: MagicMock(post=lambda url, data, headers, timeout: get_response(201)),
 )
 @pytest.mark.django_db(databases=["default", "default_alias"])
 def test_send_events_to_facilitator__success():
@@ -128,8 +128,8 @@ def test_send_events_to_facilitator__success():
 
 
 @patch(
-    "compute_horde_validator.validator.tasks.requests.post",
-    lambda url, json, headers: get_response(400),
+    "compute_horde_validator.validator.event_shipper._get_session",
+    lambda: MagicMock(post=lambda url, data, headers, timeout: get_response(400)),
 )
 @pytest.mark.django_db(databases=["default", "default_alias"])
 def test_send_events_to_facilitator__failure():